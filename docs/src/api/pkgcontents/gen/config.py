@@ -225,7 +225,8 @@ _CONFIG_ = {
 		"header": 		"vice.core.dataframe.fromfile",
 		"subs": 		[
 			vice.core.dataframe.fromfile.name,
-			vice.core.dataframe.fromfile.size
+			vice.core.dataframe.fromfile.size,
+			vice.core.dataframe.fromfile.view
 		]
 	},
 	vice.core.dataframe.fromfile.name: {
@@ -238,6 +239,11 @@ _CONFIG_ = {
 		"header": 		"vice.core.dataframe.fromfile.size",
 		"subs": 		[]
 	},
+	vice.core.dataframe.fromfile.view: {
+		"filename": 	"vice.core.dataframe.fromfile.view.rst",
+		"header": 		"vice.core.dataframe.fromfile.view",
+		"subs": 		[]
+	},
 	vice.core.dataframe.noncustomizable: {
 		"filename": 	"vice.core.dataframe.noncustomizable.rst",
 		"header": 		"vice.core.dataframe.noncustomizable",
@@ -294,6 +300,8 @@ _CONFIG_ = {
 		"subs":  		[
 			type(vice.mlr).setting,
 			type(vice.mlr).recognized,
+			type(vice.mlr).tolerance,
+			vice.mlr.turnoff_mass,
 			vice.mlr.powerlaw,
 			vice.mlr.vincenzo2016,
 			vice.mlr.hpt2000,
@@ -313,6 +321,16 @@ _CONFIG_ = {
 		"header": 		"vice.mlr.recognized",
 		"subs": 		[]
 	},
+	type(vice.mlr).tolerance: {
+		"filename": 	"vice.mlr.tolerance.rst",
+		"header": 		"vice.mlr.tolerance",
+		"subs": 		[]
+	},
+	vice.mlr.turnoff_mass: {
+		"filename": 	"vice.mlr.turnoff_mass.rst",
+		"header": 		"vice.mlr.turnoff_mass",
+		"subs": 		[]
+	},
 	vice.mlr.powerlaw: {
 		"filename": 	"vice.mlr.powerlaw.rst",
 		"header": 		"vice.mlr.powerlaw",
@@ -461,8 +479,10 @@ _CONFIG_ = {
 		"header": 		"vice.yields.ccsne",
 		"subs": 		[
 			vice.yields.ccsne.fractional,
+			vice.yields.ccsne.fractional_batch,
 			vice.yields.ccsne.table,
 			vice.yields.ccsne.settings,
+			vice.yields.ccsne.cache,
 			vice.yields.ccsne.engines,
 			vice.yields.ccsne.WW95,
 			vice.yields.ccsne.CL04,
@@ -477,6 +497,11 @@ _CONFIG_ = {
 		"header": 		"vice.yields.ccsne.fractional",
 		"subs": 		[]
 	},
+	vice.yields.ccsne.fractional_batch: {
+		"filename": 	"vice.yields.ccsne.fractional_batch.rst",
+		"header": 		"vice.yields.ccsne.fractional_batch",
+		"subs": 		[]
+	},
 	vice.yields.ccsne.table: {
 		"filename": 	"vice.yields.ccsne.table.rst",
 		"header": 		"vice.yields.ccsne.table",
@@ -518,6 +543,18 @@ _CONFIG_ = {
 		"header": 		"vice.yields.ccsne.settings.save_defaults",
 		"subs": 		[]
 	},
+	vice.yields.ccsne.cache: {
+		"filename": 	"vice.yields.ccsne.cache.rst",
+		"header": 		"vice.yields.ccsne.cache",
+		"subs": 		[
+			vice.yields.ccsne.cache.clear
+		]
+	},
+	vice.yields.ccsne.cache.clear: {
+		"filename": 	"vice.yields.ccsne.cache.clear.rst",
+		"header": 		"vice.yields.ccsne.cache.clear",
+		"subs": 		[]
+	},
 	vice.yields.ccsne.engines: {
 		"filename": 	"vice.yields.ccsne.engines.rst",
 		"header": 		"vice.yields.ccsne.engines",
@@ -932,7 +969,8 @@ _CONFIG_ = {
 		"header": 		"vice.imf",
 		"subs": 		[
 			vice.imf.kroupa,
-			vice.imf.salpeter
+			vice.imf.salpeter,
+			type(vice.imf).tolerance
 		]
 	},
 	vice.imf.kroupa: {
@@ -945,6 +983,11 @@ _CONFIG_ = {
 		"header": 		"vice.imf.salpeter",
 		"subs": 		[]
 	},
+	type(vice.imf).tolerance: {
+		"filename": 	"vice.imf.tolerance.rst",
+		"header": 		"vice.imf.tolerance",
+		"subs": 		[]
+	},
 	vice.singlezone: {
 		"filename": 	"vice.singlezone.rst",
 		"header": 		"vice.singlezone",
@@ -1156,7 +1199,9 @@ _CONFIG_ = {
 			vice.multizone.n_zones,
 			vice.multizone.n_stars,
 			vice.multizone.verbose,
-			vice.multizone.simple
+			vice.multizone.simple,
+			vice.multizone.aggregate,
+			vice.multizone.n_threads
 		]
 	},
 	vice.multizone.run: {
@@ -1204,6 +1249,16 @@ _CONFIG_ = {
 		"header": 		"vice.multizone.simple",
 		"subs": 		[]
 	},
+	vice.multizone.aggregate: {
+		"filename": 	"vice.multizone.aggregate.rst",
+		"header": 		"vice.multizone.aggregate",
+		"subs": 		[]
+	},
+	vice.multizone.n_threads: {
+		"filename": 	"vice.multizone.n_threads.rst",
+		"header": 		"vice.multizone.n_threads",
+		"subs": 		[]
+	},
 	vice.milkyway: {
 		"filename": 	"vice.milkyway.rst",
 		"header": 		"vice.milkyway",
@@ -1354,6 +1409,7 @@ _CONFIG_ = {
 		"header": 		"vice.migration.migration_matrix",
 		"subs": 		[
 			vice.migration.migration_matrix.size,
+			vice.migration.migration_matrix.set_band,
 			vice.migration.migration_matrix.tolist,
 			vice.migration.migration_matrix.tonumpyarray
 		]
@@ -1363,6 +1419,11 @@ _CONFIG_ = {
 		"header": 		"vice.migration.migration_matrix.size",
 		"subs": 		[]
 	},
+	vice.migration.migration_matrix.set_band: {
+		"filename": 	"vice.migration.migration_matrix.set_band.rst",
+		"header": 		"vice.migration.migration_matrix.set_band",
+		"subs": 		[]
+	},
 	vice.migration.migration_matrix.tolist: {
 		"filename": 	"vice.migration.migration_matrix.tolist.rst",
 		"header": 		"vice.migration.migration_matrix.tolist",
@@ -0,0 +1,61 @@
+"""
+Times the main sequence mass fraction of a single stellar population with a
+custom IMF at every timestep for timestep sizes from 1 to 50 Myr, comparing
+numerical quadrature at each timestep to the cumulative integral over
+stellar mass computed once.
+
+ARGV:
+=====
+1)			The name of the output file
+"""
+
+import vice
+import time
+import sys
+
+# The Kroupa (2001) IMF, evaluated from python
+def kroupa(m):
+	if m < 0.08:
+		return m**-0.3
+	elif m < 0.5:
+		return 0.08 * m**-1.3
+	else:
+		return 0.04 * m**-2.3
+
+_TIME_ = 10
+
+with open(sys.argv[1], 'w') as f:
+	print("Timing integrals over the IMF...")
+
+	# write the header
+	f.write("# 1) Timestep size dt [Gyr]\n")
+	f.write("# 2) Number of timesteps N\n")
+	f.write("# 3) Quadrature at each timestep [sec]\n")
+	f.write("# 4) Single stellar population, custom IMF [sec]\n")
+	f.write("# 5) Single stellar population, built-in IMF [sec]\n")
+
+	for dt in [0.05, 0.02, 0.01, 0.005, 0.002, 0.001]:
+		n = int(_TIME_ / dt)
+		f.write("%.3f\t%d" % (dt, n))
+
+		# the calculation each timestep of a simulation used to do
+		start = time.time()
+		for i in range(n): vice.main_sequence_mass_fraction(i * dt,
+			IMF = kroupa)
+		stop = time.time()
+		f.write("\t%.5e" % (stop - start))
+		print("dt = %.3f | N = %d | quadrature : %.5e seconds" % (dt, n,
+			stop - start))
+
+		# the column for the built-in IMF gives the time spent otherwise
+		for imf in [kroupa, "kroupa"]:
+			start = time.time()
+			vice.single_stellar_population("fe", time = _TIME_, dt = dt,
+				IMF = imf)
+			stop = time.time()
+			f.write("\t%.5e" % (stop - start))
+			print("dt = %.3f | N = %d | IMF = %s : %.5e seconds" % (dt, n,
+				"custom" if callable(imf) else imf, stop - start))
+		f.write("\n")
+	f.close()
+
@@ -0,0 +1,42 @@
+"""
+Times singlezone integrations of varying length to determine how the cost
+of SN Ia enrichment scales with the number of timesteps N.
+
+ARGV:
+=====
+1)			The name of the output file
+"""
+
+import vice
+import time
+import sys
+
+# A metallicity-dependent SN Ia yield, evaluated from python at each timestep
+def fe_yield(z):
+	return 0.0017 * (z / 0.014)**0.1
+
+with open(sys.argv[1], 'w') as f:
+	print("Timing SN Ia enrichment...")
+
+	# write the header
+	f.write("# 1) Number of timesteps N\n")
+	f.write("# 2) Execution time with RIa = \"plaw\" [sec]\n")
+	f.write("# 3) Execution time with RIa = \"exp\" [sec]\n")
+
+	vice.yields.sneia.settings['fe'] = fe_yield
+	dt = 0.1
+	while dt >= 0.001:
+		n = int(13.2 / dt)
+		f.write("%d" % (n))
+		for dtd in ["plaw", "exp"]:
+			start = time.time()
+			vice.singlezone(name = "benchmark", elements = ["fe"], dt = dt,
+				RIa = dtd).run([0, 13.2], overwrite = True)
+			stop = time.time()
+			print("N = %d | RIa = %s | T_exec = %.5e seconds" % (n, dtd,
+				stop - start))
+			f.write("\t%.5e" % (stop - start))
+		f.write("\n")
+		dt /= 2
+	f.close()
+
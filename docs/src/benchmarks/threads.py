@@ -0,0 +1,42 @@
+"""
+Times multizone integrations with the zones distributed across varying
+numbers of threads to determine how the execution time scales with the number
+of threads in both simple and full mode.
+
+ARGV:
+=====
+1)			The name of the output file
+"""
+
+import vice
+import time
+import sys
+
+N_ZONES = 64
+
+with open(sys.argv[1], 'w') as f:
+	print("Timing multizone threads...")
+
+	# write the header
+	f.write("# 1) Number of threads\n")
+	f.write("# 2) Execution time with simple = True [sec]\n")
+	f.write("# 3) Execution time with simple = False [sec]\n")
+
+	n_threads = 1
+	while n_threads <= 64:
+		f.write("%d" % (n_threads))
+		for simple in [True, False]:
+			mz = vice.multizone(name = "benchmark", n_zones = N_ZONES,
+				simple = simple, n_threads = n_threads)
+			for i in range(N_ZONES - 1):
+				mz.migration.gas[i][i + 1] = 0.01
+			start = time.time()
+			mz.run([0.01 * i for i in range(1321)], overwrite = True)
+			stop = time.time()
+			print("threads = %d | simple = %s | T_exec = %.5e seconds" % (
+				n_threads, simple, stop - start))
+			f.write("\t%.5e" % (stop - start))
+		f.write("\n")
+		n_threads *= 2
+	f.close()
+
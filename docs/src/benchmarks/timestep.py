@@ -0,0 +1,46 @@
+"""
+Times the timesteps of a multizone integration in full mode with 100 zones
+and 10 elements, reporting the number of timesteps evaluated per second for
+varying numbers of tracer particles per zone per timestep from the fastest
+of N_TRIALS integrations. Stars remain in
+the zone of their birth under the default migration prescription, which is
+evaluated in batches, such that setting up their zone histories takes a
+small fraction of the time.
+
+ARGV:
+=====
+1)			The name of the output file
+"""
+
+import vice
+import time
+import sys
+
+N_ZONES = 100
+ELEMENTS = ["fe", "o", "mg", "c", "n", "si", "ca", "ne", "s", "ni"]
+TIMES = [0.01 * i for i in range(301)]
+N_TRIALS = 3
+
+with open(sys.argv[1], 'w') as f:
+	print("Timing multizone timesteps...")
+
+	# write the header
+	f.write("# 1) Number of tracer particles per zone per timestep\n")
+	f.write("# 2) Timesteps per second\n")
+
+	for n_stars in [1, 2, 4]:
+		mz = vice.multizone(name = "benchmark", n_zones = N_ZONES,
+			simple = False, n_stars = n_stars)
+		mz.elements = ELEMENTS
+		for i in range(N_ZONES - 1):
+			mz.migration.gas[i][i + 1] = 0.01
+			mz.migration.gas[i + 1][i] = 0.01
+		elapsed = []
+		for trial in range(N_TRIALS):
+			start = time.time()
+			mz.run(TIMES, overwrite = True)
+			elapsed.append(time.time() - start)
+		rate = (len(TIMES) - 1) / min(elapsed)
+		print("n_stars = %d | %.2f timesteps per second" % (n_stars, rate))
+		f.write("%d\t%.5e\n" % (n_stars, rate))
+	f.close()
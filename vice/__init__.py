@@ -50,8 +50,10 @@ cumulative_return_fraction : <function>
 	Calculate the cumulative return fraction of a star cluster of known age
 main_sequence_mass_fraction : <function>
 	Calculate the main sequence mass fraction of a star cluster of known age
-imf : <module>
+imf : ``object``
 	Built-in funcitonal forms of popular stellar initial mass functions.
+	Also stores the tolerance on integrals over custom IMFs in chemical
+	evolution models.
 mlr : ``object``
 	Built-in popular function forms of the stellar mass-lifetime relationship.
 	Also stores which form to adopt in chemical evolution models.
@@ -193,6 +193,7 @@ _CFILES_ = {
 		"./vice/src/objects/multizone.c",
 		"./vice/src/objects/migration.c",
 		"./vice/src/objects/tracer.c",
+		"./vice/src/objects/workspace.c",
 		"./vice/src/objects/tests/multizone.c"
 	],
 	"vice.core.objects.tests._singlezone": [
@@ -225,6 +226,10 @@ _CFILES_ = {
 		"./vice/src/objects/tracer.c",
 		"./vice/src/objects/tests/tracer.c"
 	],
+	"vice.core.objects.tests._workspace": [
+		"./vice/src/objects/workspace.c",
+		"./vice/src/objects/tests/workspace.c"
+	],
 	"vice.core.outputs._history": [],
 	"vice.core.outputs._mdf": [],
 	"vice.core.outputs._multioutput": [],
@@ -293,6 +298,19 @@ _CFILES_ = {
 		"./vice/src/yields",
 		"./vice/src"
 	],
+	"vice.core.ssp.tests._cumulative": [
+		"./vice/src/io",
+		"./vice/src/multizone",
+		"./vice/src/objects",
+		"./vice/src/objects/tests",
+		"./vice/src/singlezone",
+		"./vice/src/ssp",
+		"./vice/src/ssp/mlr",
+		"./vice/src/ssp/tests",
+		"./vice/src/toolkit",
+		"./vice/src/yields",
+		"./vice/src"
+	],
 	"vice.core.ssp.tests._msmf": [
 		"./vice/src/io",
 		"./vice/src/multizone",
@@ -351,6 +369,18 @@ _CFILES_ = {
 		"./vice/src/io/tests/utils.c",
 		"./vice/src/io/utils.c"
 	],
+	"vice.src.multizone.tests.cases._aggregate": [
+		"./vice/src/io",
+		"./vice/src/multizone",
+		"./vice/src/multizone/tests",
+		"./vice/src/objects",
+		"./vice/src/singlezone",
+		"./vice/src/ssp",
+		"./vice/src/ssp/mlr",
+		"./vice/src/toolkit",
+		"./vice/src/yields",
+		"./vice/src"
+	],
 	"vice.src.multizone.tests.cases._generic": [
 		"./vice/src/io",
 		"./vice/src/multizone",
@@ -406,6 +436,18 @@ _CFILES_ = {
 		"./vice/src/yields",
 		"./vice/src"
 	],
+	"vice.src.singlezone.tests.cases._exponential_dtd": [
+		"./vice/src/io",
+		"./vice/src/multizone",
+		"./vice/src/objects",
+		"./vice/src/singlezone",
+		"./vice/src/singlezone/tests",
+		"./vice/src/ssp",
+		"./vice/src/ssp/mlr",
+		"./vice/src/toolkit",
+		"./vice/src/yields",
+		"./vice/src"
+	],
 	"vice.src.singlezone.tests.cases._generic": [
 		"./vice/src/io",
 		"./vice/src/multizone",
@@ -111,6 +111,9 @@ def _DEFAULT_STELLAR_MIGRATION_(zone, tform, time):
 	"""
 	return zone
 
+# Equally valid for an array of times (see vice.core.callback.batched)
+_DEFAULT_STELLAR_MIGRATION_.batched = True
+
 
 def _VERSION_ERROR_():
 	r"""
@@ -45,12 +45,13 @@ cdef extern from "../src/objects.h":
 
 cdef void callback_1arg_setup(CALLBACK_1ARG *cb1, value) except *
 cdef void callback_2arg_setup(CALLBACK_2ARG *cb2, value) except *
-cdef double callback_1arg(double x, void *f)
-cdef double callback_2arg(double x, double y, void *f)
+cdef double callback_1arg(double x, void *f) with gil
+cdef double callback_2arg(double x, double y, void *f) with gil
 cdef void setup_imf(IMF_ *imf, IMF) except *
 cdef void set_string(char *dest, pystr) except *
 cdef int *ordinals(pystr) except *
 cdef double *copy_pylist(pylist) except *
+cdef double *copy_pybuffer(const double[::1] buff) except *
 cdef double **copy_2Dpylist(pylist) except *
 cdef double *map_pyfunc_over_array(pyfunc, pyarray) except *
 
@@ -19,6 +19,7 @@ from ..yields import sneia
 import warnings
 import numbers
 import math as m
+import array
 import sys
 if sys.version_info[:2] == (2, 7):
 	strcomp = basestring
@@ -28,7 +29,7 @@ else:
 	_VERSION_ERROR_()
 
 from libc.stdlib cimport malloc, free
-from libc.string cimport strlen
+from libc.string cimport strlen, memcpy
 from . cimport _cutils
 
 
@@ -436,7 +437,7 @@ arguments.""")
 			type(value)))
 
 
-cdef double callback_1arg(double x, void *f):
+cdef double callback_1arg(double x, void *f) with gil:
 	r"""
 	Call a function of one numerical value defined in Python from C.
 
@@ -461,13 +462,17 @@ cdef double callback_1arg(double x, void *f):
 		-	A non-numerical value is returned from the function, forcing it to
 			assume a default value of zero.
 
+	.. note:: This function acquires the global interpreter lock, allowing it
+		to be called from threads other than the one running the python
+		interpreter (see vice/src/multizone/parallel.c).
+
 	.. seealso:: vice/core/callback.py
 	"""
 	# pythonic callback objects handle errors
 	return <double> (<object> f)(x)
 
 
-cdef double callback_2arg(double x, double y, void *f):
+cdef double callback_2arg(double x, double y, void *f) with gil:
 	r"""
 	Call a function of two numerical values defined in Python from C.
 
@@ -493,6 +498,10 @@ cdef double callback_2arg(double x, double y, void *f):
 		-	A non-numerical value is returned from the function, forcing it to
 			assume a default value of zero.
 
+	.. note:: This function acquires the global interpreter lock, allowing it
+		to be called from threads other than the one running the python
+		interpreter (see vice/src/multizone/parallel.c).
+
 	.. seealso:: vice/core/callback.py
 	"""
 	# pythonic callback objects handle errors
@@ -608,7 +617,15 @@ cdef double *copy_pylist(pylist) except *:
 	------
 	* TypeError
 		- ``pylist`` has a non-numerical value
+
+	Notes
+	-----
+	Native python arrays of typecode 'd' are copied via ``copy_pybuffer``
+	rather than element by element.
 	"""
+	if isinstance(pylist, array.array) and pylist.typecode == 'd':
+		return copy_pybuffer(pylist)
+	else: pass
 	cdef double *copy = <double *> malloc (len(pylist) * sizeof(double))
 	for i in range(len(pylist)):
 		if isinstance(pylist[i], numbers.Number):
@@ -619,6 +636,31 @@ cdef double *copy_pylist(pylist) except *:
 	return copy
 	
 
+cdef double *copy_pybuffer(const double[::1] buff) except *:
+	r"""
+	Allocate memory for a double pointer and copy the contents of a python
+	object exposing a 1D, contiguous buffer of doubles into the resultant C
+	array.
+
+	Parameters
+	----------
+	buff : buffer
+		A python object supporting the buffer protocol, such as an
+		``array.array`` of typecode 'd' or a ``numpy.ndarray`` of dtype
+		float64.
+
+	Raises
+	------
+	* ValueError
+		- ``buff`` is not 1-dimensional and contiguous, or does not store
+		  doubles
+	"""
+	cdef Py_ssize_t n = buff.shape[0]
+	cdef double *copy = <double *> malloc (n * sizeof(double))
+	if n: memcpy(copy, &buff[0], n * sizeof(double))
+	return copy
+
+
 cdef double **copy_2Dpylist(pylist) except *:
 	r"""
 	Allocate memory for a 2-D double pointer array and copy each element of a
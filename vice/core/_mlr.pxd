@@ -6,6 +6,13 @@ cdef class _mlr_linker:
 cdef extern from "../src/ssp/mlr.h":
 	unsigned short get_mlr_hashcode()
 	unsigned short set_mlr_hashcode(unsigned short hashcode)
+	double dying_star_mass(double time, double postMS, double Z) nogil
+	unsigned short mlr_table_setup(double max_age, double tolerance)
+	void mlr_table_free()
+	unsigned long mlr_table_size()
+	unsigned short mlr_evaluate_array(unsigned short hashcode,
+		unsigned short which, const double *qty, double postMS,
+		const double *Z, unsigned long n, double *result) nogil
 
 
 
@@ -5,7 +5,17 @@ This file links the mass-lifetime relationship features between Python and C.
 
 from .._globals import _DIRECTORY_
 from .._globals import _VERSION_ERROR_
+try:
+	ModuleNotFoundError
+except NameError:
+	ModuleNotFoundError = ImportError
+try:
+	# NumPy compatible but not NumPy dependent
+	import numpy as np
+except (ModuleNotFoundError, ImportError):
+	pass
 import numbers
+import array
 import sys
 if sys.version_info[:2] == (2, 7):
 	strcomp = basestring
@@ -13,8 +23,14 @@ elif sys.version_info[:2] >= (3, 5):
 	strcomp = str
 else:
 	_VERSION_ERROR_()
+from . import _pyutils
 from . cimport _mlr
 
+# The tolerance on the turnoff mass lookup table (None for no table), and the
+# hashcode, tolerance and maximum age of the table built on this extension.
+_TOLERANCE_ = None
+_TABLE_ = None
+
 
 cdef class _mlr_linker:
 
@@ -64,6 +80,69 @@ cdef class _mlr_linker:
 			raise TypeError("MLR setting must be of type str. Got: %s" % (
 				type(value)))
 
+	@staticmethod
+	def _get_tolerance():
+		# see docstring in vice/core/mlr.py
+		return _TOLERANCE_
+
+	@staticmethod
+	def _set_tolerance(value):
+		global _TOLERANCE_
+		if value is None:
+			_TOLERANCE_ = None
+		elif isinstance(value, numbers.Number):
+			if 0 < value < 1:
+				_TOLERANCE_ = float(value)
+			else:
+				raise ValueError("""MLR tolerance must be between 0 and 1. \
+Got: %g""" % (value))
+		else:
+			raise TypeError("""MLR tolerance must be a numerical value or \
+None. Got: %s""" % (type(value)))
+
+	@staticmethod
+	def _turnoff_mass(age, postMS = 0.1, Z = 0.014):
+		# see docstring in vice/core/mlr.py
+		global _TABLE_
+		cdef const double[::1] ages
+		cdef const double[::1] metallicities
+		cdef double[::1] masses
+		cdef double c_postMS
+		cdef double max_age = 0
+		cdef Py_ssize_t i
+		[buffs, shape] = mlr_broadcast(age, postMS = postMS, Z = Z,
+			which = "age")
+		ages = buffs[0]
+		metallicities = buffs[1]
+		c_postMS = postMS
+		with nogil:
+			for i in range(ages.shape[0]):
+				if ages[i] > max_age: max_age = ages[i]
+
+		if _TOLERANCE_ is None:
+			_mlr.mlr_table_free()
+			_TABLE_ = None
+		elif (_TABLE_ is None or _TABLE_[0] != _mlr.get_mlr_hashcode() or
+			_TABLE_[1] != _TOLERANCE_ or _TABLE_[2] < max_age or
+			not _mlr.mlr_table_size()):
+			if _mlr.mlr_table_setup(max_age, <double> _TOLERANCE_):
+				raise MemoryError("""Could not allocate memory for the \
+turnoff mass lookup table.""")
+			else:
+				_TABLE_ = [_mlr.get_mlr_hashcode(), _TOLERANCE_, max_age]
+		else: pass
+
+		result = array.array('d', [0.]) * ages.shape[0]
+		masses = result
+		with nogil:
+			for i in range(ages.shape[0]):
+				masses[i] = _mlr.dying_star_mass(ages[i], c_postMS,
+					metallicities[i])
+		if isinstance(age, numbers.Number) and isinstance(Z, numbers.Number):
+			return result[0]
+		else:
+			return _pyutils.reshape(result, shape)
+
 
 cdef class _powerlaw:
 
@@ -72,6 +151,10 @@ cdef class _powerlaw:
 	"""
 
 	def __call__(self, qty, postMS = 0.1, which = "mass"):
+		if not isinstance(qty, numbers.Number):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["powerlaw"],
+				qty, postMS = postMS, Z = 0.014, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = postMS, Z = 0.014, which = which)
 		if qty == 0:
 			return float("inf")
@@ -99,7 +182,12 @@ cdef class _vincenzo2016:
 		else: pass
 
 	def __call__(self, qty, Z = 0.014, which = "mass"):
-		if not self._imported: self.__import()
+		self._load()
+		if not (isinstance(qty, numbers.Number) and
+			isinstance(Z, numbers.Number)):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["vincenzo2016"],
+				qty, postMS = 0, Z = Z, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = 0, Z = Z, which = which)
 		if qty == 0:
 			return float("inf")
@@ -110,6 +198,10 @@ cdef class _vincenzo2016:
 				return _mlr.vincenzo2016_turnoffmass(<double> qty, 0.0,
 					<double> Z)
 
+	def _load(self):
+		# import the data if it hasn't been already
+		if not self._imported: self.__import()
+
 	def __import(self):
 		path = "%ssrc/ssp/mlr/vincenzo2016.dat" % (_DIRECTORY_)
 		if _mlr.vincenzo2016_import(path.encode("latin-1")):
@@ -133,7 +225,12 @@ cdef class _hpt2000:
 		else: pass
 
 	def __call__(self, qty, postMS = 0.1, Z = 0.014, which = "mass"):
-		if not self._imported: self.__import()
+		self._load()
+		if not (isinstance(qty, numbers.Number) and
+			isinstance(Z, numbers.Number)):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["hpt2000"],
+				qty, postMS = postMS, Z = Z, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = postMS, Z = Z, which = which)
 		if qty == 0:
 			return float("inf")
@@ -145,6 +242,10 @@ cdef class _hpt2000:
 				return _mlr.hpt2000_turnoffmass(<double> qty, <double> postMS,
 					<double> Z)
 
+	def _load(self):
+		# import the data if it hasn't been already
+		if not self._imported: self.__import()
+
 	def __import(self):
 		path = "%ssrc/ssp/mlr/hpt2000.dat" % (_DIRECTORY_)
 		if _mlr.hpt2000_import(path.encode("latin-1")):
@@ -168,7 +269,12 @@ cdef class _ka1997:
 		else: pass
 
 	def __call__(self, qty, Z = 0.014, which = "mass"):
-		if not self._imported: self.__import()
+		self._load()
+		if not (isinstance(qty, numbers.Number) and
+			isinstance(Z, numbers.Number)):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["ka1997"],
+				qty, postMS = 0, Z = Z, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = 0, Z = Z, which = which)
 		if qty == 0:
 			return float("inf")
@@ -178,6 +284,10 @@ cdef class _ka1997:
 			else:
 				return _mlr.ka1997_turnoffmass(<double> qty, 0.0, <double> Z)
 
+	def _load(self):
+		# import the data if it hasn't been already
+		if not self._imported: self.__import()
+
 	def __import(self):
 		path = "%ssrc/ssp/mlr/ka1997.dat" % (_DIRECTORY_)
 		if _mlr.ka1997_import(path.encode("latin-1")):
@@ -193,6 +303,10 @@ cdef class _pm1993:
 	"""
 
 	def __call__(self, qty, postMS = 0.1, which = "mass"):
+		if not isinstance(qty, numbers.Number):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["pm1993"],
+				qty, postMS = postMS, Z = 0.014, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = postMS, Z = 0.014, which = which)
 		if qty == 0:
 			return float("inf")
@@ -211,6 +325,10 @@ cdef class _mm1989:
 	"""
 
 	def __call__(self, qty, postMS = 0.1, which = "mass"):
+		if not isinstance(qty, numbers.Number):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["mm1989"],
+				qty, postMS = postMS, Z = 0.014, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = postMS, Z = 0.014, which = which)
 		if qty == 0:
 			return float("inf")
@@ -230,6 +348,10 @@ cdef class _larson1974:
 	"""
 
 	def __call__(self, qty, postMS = 0.1, which = "mass"):
+		if not isinstance(qty, numbers.Number):
+			return mlr_array_evaluation(_mlr_linker.__NAMES__["larson1974"],
+				qty, postMS = postMS, Z = 0.014, which = which)
+		else: pass
 		mlr_error_handling(qty, postMS = postMS, Z = 0.014, which = which)
 		if qty == 0:
 			return float("inf")
@@ -293,3 +415,122 @@ Got: %s""" % (type(postMS)))
 	else:
 		pass
 
+
+def mlr_broadcast(qty, postMS = 0.1, Z = 0.014, which = "mass"):
+	r"""
+	Error handling for the mass-lifetime relations implemented here when
+	``qty`` and/or ``Z`` are array-like, broadcasting them against one another.
+
+	Parameters
+	----------
+	qty : float or array-like
+		Either the masses of stars in :math:`M_\odot` or the ages of stellar
+		populations in Gyr. Interpretation set by the keyword argument
+		``which``.
+	postMS : float [default : 0.1]
+		See ``mlr_error_handling``.
+	Z : float or array-like [default : 0.014]
+		The metallicity by mass of the stellar populations.
+	which : str [case-insensitive] [default : "mass"]
+		See ``mlr_error_handling``.
+
+	Returns
+	-------
+	buffs : ``list``
+		Buffers of doubles storing ``qty`` and ``Z``, broadcast against one
+		another.
+	shape : ``tuple`` or ``int``
+		The shape of the broadcast arrays. See
+		``vice.core._pyutils.broadcast_double_buffers``.
+
+	Raises
+	------
+	* TypeError
+		- ``qty`` or ``Z`` is neither a numerical value nor array-like
+	* ValueError
+		- Any element of ``qty`` is negative
+		- Any element of ``Z`` is not between 0 and 1
+		- ``qty`` and ``Z`` cannot be broadcast against one another
+		- See ``mlr_error_handling`` for ``postMS`` and ``which``
+	"""
+	cdef const double[::1] quantities
+	cdef const double[::1] metallicities
+	cdef unsigned short negative = 0
+	cdef unsigned short out_of_range = 0
+	cdef Py_ssize_t i
+	mlr_error_handling(0, postMS = postMS,
+		Z = Z if isinstance(Z, numbers.Number) else 0.014, which = which)
+	try:
+		[buffs, shape] = _pyutils.broadcast_double_buffers(qty, Z)
+	except TypeError:
+		raise TypeError("""Quantity and keyword arg 'Z' must be numerical \
+values or array-like. Got: (%s, %s)""" % (type(qty), type(Z)))
+	quantities = buffs[0]
+	metallicities = buffs[1]
+	with nogil:
+		for i in range(quantities.shape[0]):
+			if quantities[i] < 0: negative = 1
+			if metallicities[i] < 0 or metallicities[i] > 1: out_of_range = 1
+	if negative:
+		raise ValueError("Value must be non-negative.")
+	elif out_of_range:
+		raise ValueError("Keyword arg 'Z' must be between 0 and 1.")
+	else:
+		return [buffs, shape]
+
+
+def mlr_array_evaluation(hashcode, qty, postMS = 0.1, Z = 0.014,
+	which = "mass"):
+	r"""
+	Evaluate one of the mass-lifetime relations implemented here at each
+	element of array-like ``qty`` and/or ``Z`` in one loop in C with the global
+	interpreter lock released.
+
+	Parameters
+	----------
+	hashcode : int
+		The hashcode of the mass-lifetime relation (see
+		``_mlr_linker.__NAMES__``).
+	qty : float or array-like
+		Either the masses of stars in :math:`M_\odot` or the ages of stellar
+		populations in Gyr. Interpretation set by the keyword argument
+		``which``.
+	postMS : float [default : 0.1]
+		See ``mlr_error_handling``.
+	Z : float or array-like [default : 0.014]
+		The metallicity by mass of the stellar populations.
+	which : str [case-insensitive] [default : "mass"]
+		See ``mlr_error_handling``.
+
+	Returns
+	-------
+	x : array-like
+		The lifetime or the mass of dying stars at each element of the
+		broadcast ``qty`` and ``Z``, in the form returned by
+		``vice.core._pyutils.reshape``.
+	"""
+	cdef const double[::1] quantities
+	cdef const double[::1] metallicities
+	cdef double[::1] values
+	cdef unsigned short c_hashcode
+	cdef double c_postMS
+	cdef unsigned short c_which
+	cdef unsigned short status = 0
+	[buffs, shape] = mlr_broadcast(qty, postMS = postMS, Z = Z, which = which)
+	quantities = buffs[0]
+	metallicities = buffs[1]
+	c_hashcode = hashcode
+	c_postMS = postMS
+	c_which = which.lower() == "age"
+	result = array.array('d', [0.]) * quantities.shape[0]
+	values = result
+	if quantities.shape[0]:
+		with nogil:
+			status = _mlr.mlr_evaluate_array(c_hashcode, c_which,
+				&quantities[0], c_postMS, &metallicities[0],
+				quantities.shape[0], &values[0])
+	else: pass
+	if status:
+		raise SystemError("Internal Error.")
+	else:
+		return _pyutils.reshape(result, shape)
@@ -129,6 +129,130 @@ def copy_array_like_object(pyobj):
 	return copy
 
 
+def double_buffer(pyobj):
+	r"""
+	Obtain a flattened, contiguous buffer of doubles from an array-like object
+	or any object supporting the buffer protocol.
+
+	Parameters
+	----------
+	pyobj : array-like
+		Some python array-like object or buffer
+
+	Returns
+	-------
+	buff : ``numpy.ndarray`` or ``array.array``
+		The values of ``pyobj`` as doubles. A NumPy array if NumPy is
+		installed, which shares memory with ``pyobj`` if it is already a
+		contiguous array of doubles.
+
+	Raises
+	------
+	* TypeError
+		- ``pyobj`` is not array-like or contains non-numerical values
+	"""
+	if isinstance(pyobj, strcomp):
+		raise TypeError("Must be an array-like object. Got: %s" % (
+			type(pyobj)))
+	elif "numpy" in sys.modules:
+		try:
+			buff = np.asarray(pyobj, dtype = np.float64)
+		except (TypeError, ValueError):
+			raise TypeError("""Must be an array-like object containing only \
+numerical values.""")
+		if buff.ndim or isinstance(pyobj, np.ndarray):
+			return np.ascontiguousarray(buff).ravel()
+		else:
+			# NumPy converts some objects which aren't array-like to 0-d arrays
+			raise TypeError("Must be an array-like object. Got: %s" % (
+				type(pyobj)))
+	else:
+		try:
+			if isinstance(pyobj, memoryview): pyobj = pyobj.tolist()
+			return array.array('d', pyobj)
+		except TypeError:
+			raise TypeError("""Must be an array-like object containing only \
+numerical values.""")
+
+
+def broadcast_double_buffers(*pyobjs):
+	r"""
+	Obtain buffers of doubles of the same length from any combination of real
+	numbers and array-like objects, broadcasting them against one another.
+
+	Parameters
+	----------
+	pyobjs : real numbers or array-like
+		The values to obtain buffers for.
+
+	Returns
+	-------
+	buffs : ``list``
+		One flattened buffer of doubles for each argument, as in
+		``double_buffer``, all of the same length.
+	shape : ``tuple`` or ``int``
+		The shape of the broadcast arrays if NumPy is installed, and their
+		length otherwise. Pass to ``reshape`` to return values computed from
+		each element of the buffers in the same form.
+
+	Raises
+	------
+	* TypeError
+		- An argument is neither a real number nor array-like
+	* ValueError
+		- The arguments cannot be broadcast against one another. Without
+		  NumPy, all array-like arguments must have the same length.
+	"""
+	buffs = [pyobj if isinstance(pyobj, numbers.Number) else double_buffer(
+		pyobj) for pyobj in pyobjs]
+	if "numpy" in sys.modules:
+		arrays = [np.reshape(buffs[i], np.shape(pyobjs[i])) for i in range(
+			len(buffs))]
+		try:
+			arrays = np.broadcast_arrays(*arrays)
+		except ValueError:
+			raise ValueError("Array shape mismatch. Got: %s" % (
+				", ".join([str(np.shape(_)) for _ in arrays])))
+		shape = arrays[0].shape
+		buffs = [np.ascontiguousarray(_, dtype = np.float64).ravel() for _ in
+			arrays]
+	else:
+		lengths = [len(_) for _ in buffs if not isinstance(_,
+			numbers.Number)]
+		shape = lengths[0] if len(lengths) else 1
+		if any([_ != shape for _ in lengths]):
+			raise ValueError("Array length mismatch. Got: %s" % (
+				", ".join([str(_) for _ in lengths])))
+		else:
+			buffs = [array.array('d', shape * [_]) if isinstance(_,
+				numbers.Number) else _ for _ in buffs]
+	return [buffs, shape]
+
+
+def reshape(values, shape):
+	r"""
+	Return values computed from the elements of broadcast buffers in the same
+	form as the array-like objects they were computed from.
+
+	Parameters
+	----------
+	values : ``numpy.ndarray`` or ``array.array``
+		The values, one for each element of the buffers.
+	shape : ``tuple`` or ``int``
+		The shape returned by ``broadcast_double_buffers``.
+
+	Returns
+	-------
+	reshaped : ``numpy.ndarray`` or ``list``
+		A NumPy array of the given shape if NumPy is installed, and a ``list``
+		otherwise.
+	"""
+	if "numpy" in sys.modules:
+		return np.asarray(values).reshape(shape)
+	else:
+		return list(values)
+
+
 def range_(start, stop, dx):
 	r"""
 	A replacement to numpy.arange and native python range()
@@ -305,3 +429,29 @@ def format_time(seconds):
 	else:
 		raise TypeError("Must be a real number. Got: %s" % (type(seconds)))
 
+
+
+def format_bytes(n):
+	r"""
+	Convert an amount of memory in bytes into a human-readable string.
+
+	Parameters
+	----------
+	n : real number
+		An amount of memory in bytes.
+
+	Returns
+	-------
+	formatted : str
+		The amount of memory in the largest unit (B, kB, MB, GB, or TB) in
+		which it is at least 1, to one decimal place.
+	"""
+	if isinstance(n, numbers.Number):
+		units = ["B", "kB", "MB", "GB", "TB"]
+		i = 0
+		while n >= 1024 and i < len(units) - 1:
+			n /= 1024
+			i += 1
+		return "%.1f %s" % (n, units[i])
+	else:
+		raise TypeError("Must be a real number. Got: %s" % (type(n)))
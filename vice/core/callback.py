@@ -11,6 +11,21 @@ these cases.
 
 Contents
 --------
+vectorized : ``decorator``
+	Flags a function of one numerical value as accepting an array of values.
+is_vectorized : <function>
+	Determine whether or not a function may be evaluated on an array of
+	values in one call.
+evaluate_vectorized : <function>
+	Evaluate an array-aware function on an array of values in one call.
+batched : ``decorator``
+	Flags a stellar migration prescription as accepting an array of times.
+is_batched : <function>
+	Determine whether or not a stellar migration prescription may be evaluated
+	for a group of star particles at all times in one call.
+evaluate_batched : <function>
+	Evaluate a batched stellar migration prescription for a group of star
+	particles at all times in one call.
 numerical : ``decorator``
 	Forces a function to return 0 if it returns a non-numerical value.
 no_nan : ``decorator``
@@ -72,10 +87,294 @@ VICE more user-friendly.
 from __future__ import absolute_import
 from .._globals import ScienceWarning
 from . import _pyutils
+try:
+	ModuleNotFoundError
+except NameError:
+	ModuleNotFoundError = ImportError
+try:
+	# NumPy compatible but not NumPy dependent
+	import numpy as np
+except (ModuleNotFoundError, ImportError):
+	pass
 import functools
 import math as m
 import warnings
 import numbers
+import array
+import sys
+
+
+def vectorized(function):
+	r"""
+	Type : ``decorator``
+
+	Flags a function of one numerical value as array-aware, indicating that
+	it may be called once on an array of values rather than once per value.
+
+	.. versionadded:: 1.4.0
+
+	Notes
+	-----
+	This decorator sets the attribute ``vectorized`` of ``function`` to
+	``True``; user-defined callable classes may equivalently declare a class
+	attribute ``vectorized = True``. When NumPy is installed, the argument
+	passed to a vectorized function is a ``numpy.ndarray``, and a native
+	python ``array.array`` otherwise. The function must return an array-like
+	object of the same length, or a single number which applies to all
+	values. Vectorized functions must still accept a single number, as VICE
+	verifies functional attributes by calling them with a value of 1.
+
+	Example Code
+	------------
+	>>> import numpy as np
+	>>> from vice.core.callback import vectorized
+	>>> @vectorized
+	... def f(t):
+	...     return np.exp(-t / 3)
+	>>> f.vectorized
+	True
+	"""
+	function.vectorized = True
+	return function
+
+
+def is_vectorized(function):
+	r"""
+	Determine whether or not a function of one numerical value may be
+	evaluated on an array of values in one call.
+
+	Parameters
+	----------
+	function : <function>
+		The function to test.
+
+	Returns
+	-------
+	vectorized : ``bool``
+		True if ``function`` has been flagged as array-aware via the attribute
+		``vectorized`` (see ``vectorized`` decorator), or if ``function`` is a
+		NumPy universal function accepting one input. False otherwise.
+	"""
+	if getattr(function, "vectorized", False) is True:
+		return True
+	elif "numpy" in sys.modules and isinstance(function, np.ufunc):
+		return function.nin == 1
+	else:
+		return False
+
+
+def evaluate_vectorized(function, x):
+	r"""
+	Evaluate an array-aware function on an array of values in one call.
+
+	Parameters
+	----------
+	function : <function>
+		The function to evaluate. Assumed to accept an array of values.
+	x : array-like [elements are real numbers]
+		The values at which to evaluate ``function``.
+
+	Returns
+	-------
+	y : ``array.array`` [typecode 'd']
+		The value of ``function`` at each element of ``x``. Returned as a
+		native python array such that it can be copied into C via the buffer
+		protocol.
+
+	Raises
+	------
+	* TypeError
+		- ``function`` returns non-numerical values
+	* ValueError
+		- ``function`` returns an array of a different length than ``x``
+	"""
+	if "numpy" in sys.modules:
+		y = function(np.array(x, dtype = float))
+		try:
+			y = np.asarray(y, dtype = float)
+		except (TypeError, ValueError):
+			raise TypeError("""Function %s evaluated to non-numerical \
+value.""" % (str(function)))
+		if y.ndim == 0: y = np.full(len(x), float(y))
+		if y.shape != (len(x),):
+			raise ValueError("""Function %s returned an array of shape %s \
+when evaluated on an array of length %d.""" % (str(function), str(y.shape),
+				len(x)))
+		else:
+			return array.array('d', np.ascontiguousarray(y).tobytes())
+	else:
+		y = function(array.array('d', x))
+		if isinstance(y, numbers.Number): y = len(x) * [y]
+		try:
+			y = array.array('d', y)
+		except TypeError:
+			raise TypeError("""Function %s evaluated to non-numerical \
+value.""" % (str(function)))
+		if len(y) != len(x):
+			raise ValueError("""Function %s returned an array of length %d \
+when evaluated on an array of length %d.""" % (str(function), len(y), len(x)))
+		else:
+			return y
+
+
+def batched(function):
+	r"""
+	Type : ``decorator``
+
+	Flags a stellar migration prescription (see ``vice.migration.specs.stars``)
+	as array-aware, indicating that it may be called once for all star
+	particles born in a given zone at a given time rather than once per star
+	particle per timestep.
+
+	.. versionadded:: 1.4.0
+
+	Notes
+	-----
+	This decorator sets the attribute ``batched`` of ``function`` to ``True``;
+	user-defined callable classes may equivalently declare a class attribute
+	``batched = True``. Batched prescriptions are called with the zone number
+	and time of formation as usual, but with an array of simulation times as
+	the third parameter, the first of which is always the time of formation.
+	If the prescription accepts the keyword argument ``n``, it is an array of
+	the indices of the star particles. When NumPy is installed, these are
+	``numpy.ndarray`` objects, and a native python ``array.array`` and a
+	``list`` otherwise.
+
+	The prescription must return the zone number of each star particle at
+	each time as a 2-D array-like object, with one row per star particle and
+	one column per time. A 1-D array-like object with one element per time
+	applies to every star particle, and a single integer applies to every
+	star particle at all times.
+
+	Example Code
+	------------
+	>>> import numpy as np
+	>>> from vice.core.callback import batched
+	>>> @batched
+	... def f(zone, tform, time):
+	...     # move one zone outward 1 Gyr after formation
+	...     return zone + (np.asarray(time) - tform > 1)
+	>>> f.batched
+	True
+	"""
+	function.batched = True
+	return function
+
+
+def is_batched(function):
+	r"""
+	Determine whether or not a stellar migration prescription may be evaluated
+	for a group of star particles at all times in one call.
+
+	Parameters
+	----------
+	function : <function>
+		The stellar migration prescription to test.
+
+	Returns
+	-------
+	batched : ``bool``
+		True if ``function`` has been flagged as array-aware via the attribute
+		``batched`` (see ``batched`` decorator). False otherwise.
+	"""
+	return getattr(function, "batched", False) is True
+
+
+def evaluate_batched(function, zone, tform, times, n_particles,
+	takes_keyword = False):
+	r"""
+	Evaluate a batched stellar migration prescription for a group of star
+	particles at all times in one call.
+
+	Parameters
+	----------
+	function : <function>
+		The stellar migration prescription. Assumed to accept an array of
+		times as its third parameter (see ``batched`` decorator).
+	zone : ``int``
+		The zone of formation of the star particles.
+	tform : real number
+		The time of formation of the star particles in Gyr.
+	times : array-like [elements are real numbers]
+		The simulation times in Gyr at which to evaluate ``function``.
+	n_particles : ``int``
+		The number of star particles.
+	takes_keyword : ``bool`` [default : False]
+		Whether or not ``function`` accepts the indices of the star particles
+		as the keyword argument ``n``.
+
+	Returns
+	-------
+	zones : ``array.array`` [typecode 'i']
+		The zone number of each star particle at each time, with the
+		``len(times)`` values of each star particle stored contiguously.
+		Returned as a native python array such that it can be copied into C
+		via the buffer protocol.
+
+	Raises
+	------
+	* TypeError
+		- ``function`` returns non-numerical values
+	* ValueError
+		- ``function`` returns non-integer values
+		- ``function`` returns an array whose shape is not compatible with
+		  ``n_particles`` rows and ``len(times)`` columns
+	"""
+	shape = (n_particles, len(times))
+	if "numpy" in sys.modules:
+		kwargs = {"n": np.arange(n_particles)} if takes_keyword else {}
+		y = function(zone, tform, np.array(times, dtype = float), **kwargs)
+		try:
+			y = np.asarray(y, dtype = float)
+		except (TypeError, ValueError):
+			raise TypeError("""Zone number for star particle mapped to \
+non-numerical value.""")
+		try:
+			y = np.broadcast_to(y, shape)
+		except ValueError:
+			raise ValueError("""Stellar migration prescription %s returned \
+an array of shape %s for %d star particles evaluated at %d times.""" % (
+				str(function), str(y.shape), shape[0], shape[1]))
+		if not np.all(np.isfinite(y) & (y % 1 == 0)):
+			raise ValueError("""Zone number for star particle must be an \
+integer.""")
+		else:
+			# zone numbers outside the range of an int are out of range anyway
+			y = np.clip(y, -1, np.iinfo(np.intc).max)
+			return array.array('i', np.ascontiguousarray(y,
+				dtype = np.intc).tobytes())
+	else:
+		kwargs = {"n": list(range(n_particles))} if takes_keyword else {}
+		y = function(zone, tform, array.array('d', times), **kwargs)
+		if isinstance(y, numbers.Number): y = shape[1] * [y]
+		try:
+			if len(y) == shape[1] and all(map(
+				lambda x: isinstance(x, numbers.Number), y)):
+				y = shape[0] * [y]
+			elif len(y) == 1 and shape[0] != 1:
+				y = shape[0] * [y[0]]
+			else: pass
+			if len(y) != shape[0] or any(map(lambda x: len(x) != shape[1],
+				y)):
+				raise ValueError("""Stellar migration prescription %s \
+returned an array-like object of the wrong shape for %d star particles \
+evaluated at %d times.""" % (str(function), shape[0], shape[1]))
+			else: pass
+		except TypeError:
+			raise TypeError("""Zone number for star particle mapped to \
+non-numerical value.""")
+		zones = array.array('i')
+		for row in y:
+			for x in row:
+				if not isinstance(x, numbers.Number):
+					raise TypeError("""Zone number for star particle mapped \
+to non-numerical value.""")
+				elif m.isinf(x) or m.isnan(x) or x % 1 != 0:
+					raise ValueError("""Zone number for star particle must \
+be an integer.""")
+				else:
+					zones.append(int(max(-1, min(x, 2**31 - 1))))
+		return zones
 
 
 def numerical(function):
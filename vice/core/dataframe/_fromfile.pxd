@@ -9,6 +9,7 @@ from ._base cimport base
 cdef extern from "../../src/dataframe/fromfile.h":
 	unsigned short fromfile_read(FROMFILE *ff)
 	double *fromfile_column(FROMFILE *ff, char *label)
+	double *fromfile_column_pointer(FROMFILE *ff, char *label)
 	unsigned short fromfile_modify_column(FROMFILE *ff, char *label,
 		double *arr)
 	unsigned short fromfile_new_column(FROMFILE *ff, char *label, double *arr)
@@ -16,4 +17,11 @@ cdef extern from "../../src/dataframe/fromfile.h":
 
 cdef class fromfile(base):
 	cdef FROMFILE *_ff
+	cdef double *_column_pointer(self, key) except? NULL
+
+cdef class _column:
+	cdef object owner
+	cdef double *data
+	cdef Py_ssize_t shape[1]
+	cdef Py_ssize_t strides[1]
 
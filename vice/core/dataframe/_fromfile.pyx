@@ -3,13 +3,25 @@
 This file implements the fromfile object, a subclass of the VICE dataframe
 base class. This objects stores data pulled from a square ascii text file
 whose header is delimited with '#'. All files that VICE produces and has
-built-in are of this format.
+built-in are of this format, except for simulation outputs written in binary
+columnar format, which are recognized automatically.
 """
 
 from ..._globals import _VERSION_ERROR_
+from ..outputs import _output_utils
 from .. import _pyutils
 from . import _base
+try:
+	ModuleNotFoundError
+except NameError:
+	ModuleNotFoundError = ImportError
+try:
+	# NumPy compatible but not NumPy dependent
+	import numpy as np
+except (ModuleNotFoundError, ImportError):
+	pass
 import numbers
+import array
 import sys
 import os
 if sys.version_info[:2] == (2, 7):
@@ -18,6 +30,7 @@ elif sys.version_info[:2] >= (3, 5):
 	strcomp = str
 else:
 	_VERSION_ERROR_()
+from cpython.buffer cimport PyBUF_WRITABLE
 from libc.stdlib cimport malloc, free
 from libc.string cimport strlen, strcmp
 from .._cutils cimport set_string
@@ -79,6 +92,7 @@ cdef class fromfile(base):
 	- keys
 	- todict
 	- filter
+	- view
 
 	Example Code
 	------------
@@ -119,7 +133,9 @@ cdef class fromfile(base):
 	filename : ``str`` [default : None]
 		The name of the ascii file containing the output.
 	list : ``list`` of strings [default : None]
-		The strings to assign the column labels.
+		The strings to assign the column labels. If None and the file is a
+		simulation output in binary columnar format, the labels are taken from
+		its header.
 	adopted_solar_z : real number [default : None]
 		The metallicity by mass of the sun :math:`Z_\odot` adopted in the
 		simulation.
@@ -136,9 +152,13 @@ cdef class fromfile(base):
 		super().__init__({})
 		if os.path.exists(filename):
 			# Set the filename and read in the data
+			# Only the header is read here; columns are read as they're accessed
 			set_string(self._ff[0].name, filename)
-			_fromfile.fromfile_read(self._ff)
-			if self._ff[0].data is NULL: # Error reading the file
+			if labels is None and _output_utils._is_binary(filename):
+				labels = _output_utils._load_column_labels_from_file_header(
+					filename)
+			else: pass
+			if _fromfile.fromfile_read(self._ff): # Error reading the file
 				raise IOError("Error reading square data file: %s" % (filename))
 			labels = _pyutils.copy_array_like_object(labels)
 			labels = list(dict.fromkeys(labels))
@@ -180,19 +200,30 @@ Got: %s""" % (type(key)))
 		"""
 		Performs the __getitem__ operation when the key is of type str
 		"""
+		cdef double *item = self._column_pointer(key)
+		if item is not NULL:
+			return [item[i] for i in range(self._ff[0].n_rows)]
+		else:
+			raise KeyError("Unrecognized key: %s" % (key))
+
+	cdef double *_column_pointer(self, key) except? NULL:
+		"""
+		Obtains a pointer to a column of the data as it is stored in C, reading
+		it in from the file if necessary. NULL if the key is not recognized.
+		"""
 		cdef double *item
 		cdef char *copy
 		if _pyutils.is_ascii(key):
 			copy = <char *> malloc ((len(key) + 1) * sizeof(char))
 			set_string(copy, key.lower())
-			item = _fromfile.fromfile_column(self._ff, copy)
+			item = _fromfile.fromfile_column_pointer(self._ff, copy)
 			free(copy)
-			if item is not NULL:
-				x = [item[i] for i in range(self._ff[0].n_rows)]
-				free(item)
-				return x
+			# derived classes may recognize keys not stored in the file
+			if item is NULL and key.lower() in fromfile.keys(self):
+				raise IOError("Error reading square data file: %s" % (
+					self.name))
 			else:
-				raise KeyError("Unrecognized key: %s" % (key))
+				return item
 		else:
 			raise KeyError("All keys and labels must be ascii.")
 
@@ -369,6 +400,73 @@ Got: %s""" % (type(key)))
 			[self.__getitem__(i) for i in self.keys()]))
 
 
+	def view(self, key):
+		r"""
+		Access one of the quantities stored in the dataframe without copying
+		it.
+
+		**Signature**: x.view(key)
+
+		Parameters
+		----------
+		x : ``dataframe``
+			An instance of this class
+		key : ``str`` [case-insensitive]
+			The label of the quantity to access.
+
+		Returns
+		-------
+		arr : ``numpy.ndarray`` or ``memoryview``
+			A read-only NumPy_ array if NumPy_ is installed, and a read-only
+			``memoryview`` of doubles otherwise. For quantities read from the
+			output file, this shares memory with the dataframe, and reflects
+			any later modifications made via item assignment.
+
+			.. _NumPy: https://numpy.org/
+
+		Raises
+		------
+		* KeyError
+			- The key is not recognized.
+
+		.. note:: Indexing the dataframe with a string returns a new list
+			copying each value, which is slower for long outputs.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> example = vice.mdf("example")
+		>>> example.view("bin_edge_left")[:10]
+			array([-3.  , -2.95, -2.9 , -2.85, -2.8 , -2.75, -2.7 , -2.65,
+				-2.6 , -2.55])
+		"""
+		cdef _column column
+		cdef double *item
+		if isinstance(key, strcomp):
+			item = self._column_pointer(key)
+		else:
+			raise KeyError("Dataframe key must be of type str. Got: %s" % (
+				type(key)))
+		if item is not NULL:
+			column = _column.__new__(_column)
+			column.owner = self
+			column.data = item
+			column.shape[0] = <Py_ssize_t> self._ff[0].n_rows
+			column.strides[0] = <Py_ssize_t> sizeof(double)
+			if "numpy" in sys.modules:
+				return np.asarray(column)
+			else:
+				return memoryview(column)
+		else:
+			# quantities calculated by derived classes are copied
+			values = self.__getitem__(key)
+			if "numpy" in sys.modules:
+				values = np.array(values, dtype = np.float64)
+				values.setflags(write = False)
+				return values
+			else:
+				return memoryview(array.array('d', values)).toreadonly()
+
 	def remove(self, key):
 		"""
 		This function throws a TypeError whenever called. This derived class
@@ -377,3 +475,31 @@ Got: %s""" % (type(key)))
 		# data is stored in C -> no keys to delete from
 		raise TypeError("This dataframe does not support item deletion.")
 
+
+cdef class _column:
+
+	r"""
+	A read-only buffer exposing one column of a fromfile object to NumPy or the
+	built-in memoryview without copying it. It holds a reference to the
+	fromfile object, keeping the data alive for as long as any view of it.
+	"""
+
+	def __getbuffer__(self, Py_buffer *buffer, int flags):
+		if flags & PyBUF_WRITABLE:
+			raise BufferError("Dataframe views are read-only.")
+		else: pass
+		buffer.buf = <void *> self.data
+		buffer.format = b"d"
+		buffer.internal = NULL
+		buffer.itemsize = sizeof(double)
+		buffer.len = self.shape[0] * sizeof(double)
+		buffer.ndim = 1
+		buffer.obj = self
+		buffer.readonly = 1
+		buffer.shape = self.shape
+		buffer.strides = self.strides
+		buffer.suboffsets = NULL
+
+	def __releasebuffer__(self, Py_buffer *buffer):
+		pass
+
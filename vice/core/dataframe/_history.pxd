@@ -26,4 +26,6 @@ cdef class history(fromfile):
 	cdef unsigned int _n_elements
 	cdef double *_solar
 	cdef double _Z_solar
+	cdef tuple _element_names
+	cdef dict _derived
 
@@ -19,6 +19,7 @@ else:
 	_VERSION_ERROR_()
 from libc.stdlib cimport malloc, free
 from .._cutils cimport set_string
+from . cimport _fromfile
 from . cimport _history
 
 
@@ -117,6 +118,11 @@ cdef class history(fromfile):
 			In this patch, this book-keeping is adjusted to account for this,
 			and outputs will reflect a non-zero abundance in primordial gas.
 
+		.. note:: Quantities which VICE calculates from those stored in the
+			output file (e.g. 'z(x)', '[x/h]', 'lookback') are calculated the
+			first time they are accessed, and the results are kept until any
+			quantity is re-assigned.
+
 	Functions
 	---------
 	- keys
@@ -211,12 +217,16 @@ cdef class history(fromfile):
 	# cdef unsigned int n_elements
 	# cdef double *solar
 	# cdef double Z_solar
+	# cdef tuple _element_names
+	# cdef dict _derived
 
 	def __init__(self, filename = None, labels = None,
 		adopted_solar_z = None):
+		self._derived = {}
 		super().__init__(filename = filename, labels =
 			_output_utils._load_column_labels_from_file_header(filename))
 		elements = self._load_elements()
+		self._element_names = elements
 		self._n_elements = <unsigned> len(elements)
 		self._elements = <char **> malloc (self._n_elements * sizeof(char *))
 		for i in range(self._n_elements):
@@ -246,13 +256,38 @@ cdef class history(fromfile):
 		scaled total ISM metallicity.
 		"""
 		if isinstance(key, strcomp):
-			return self._subget__str(key)
+			x = self._column(key)
+			# copy calculated quantities such that the stored ones can't change
+			return x[:] if key.lower() in self._derived else x
 		elif isinstance(key, numbers.Number) and key % 1 == 0:
 			return self._subget__int(key)
 		else:
 			# No error yet, other possibilities in super's __getitem__
 			return super().__getitem__(key)
 
+	def __setitem__(self, key, value):
+		"""
+		Performs item assignment via the fromfile class, discarding any
+		quantities calculated from the previous values.
+		"""
+		super().__setitem__(key, value)
+		self._derived.clear()
+
+	def _column(self, key):
+		"""
+		Obtains the values of a quantity without copying those calculated from
+		the quantities stored in the output file, which are calculated only
+		the first time they're requested.
+		"""
+		if key.lower() in self._derived:
+			return self._derived[key.lower()]
+		else:
+			x = self._subget__str(key)
+			if key.lower() not in fromfile.keys(self):
+				self._derived[key.lower()] = x
+			else: pass
+			return x
+
 	def _subget__str(self, key):
 		"""
 		Performs the __getitem__ operation when the key is of type str
@@ -373,23 +408,26 @@ cdef class history(fromfile):
 
 	def _subget__int(self, key):
 		"""
-		Performs the __getitem__ operation when the key is of type int.
+		Performs the __getitem__ operation when the key is of type int. The
+		calculated quantities are taken from the full columns, which are
+		calculated only once for all rows.
 		"""
 		cdef double *item
+		cdef unsigned long row
 		if 0 <= key < self._ff[0].n_rows:
-			item = _history.history_row(self._ff, <unsigned long> key,
-				self._elements, self._n_elements, self._solar, self._Z_solar)
+			row = <unsigned long> key
 		elif abs(key) <= self._ff[0].n_rows:
-			item = _history.history_row(self._ff,
-				self._ff[0].n_rows - <unsigned long> abs(key),
-				self._elements, self._n_elements, self._solar, self._Z_solar)
+			row = self._ff[0].n_rows - <unsigned long> abs(key)
 		else:
 			raise IndexError("Index out of bounds: %d" % (int(key)))
+		item = _fromfile.fromfile_row(self._ff, row)
 		if item is not NULL:
-			x = [item[i] for i in range(_history.history_row_length(self._ff,
-				self._n_elements, self._elements))]
+			x = [item[i] for i in range(self._ff[0].n_cols)]
 			free(item)
-			return _base.base(dict(zip(self.keys(), x)))
+			keys = self.keys()
+			for i in keys[len(x):]:
+				x.append(self._column(i)[row])
+			return _base.base(dict(zip(keys, x)))
 		else:
 			raise SystemError("Internal Error")
 
@@ -427,7 +465,7 @@ cdef class history(fromfile):
 		['a', 'b', 'c']
 		"""
 		keys = super().keys()
-		elements = self._load_elements()
+		elements = self._element_names
 		for i in elements:
 			keys.append("z(%s)" % (i))
 		for i in elements:
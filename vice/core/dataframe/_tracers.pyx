@@ -15,7 +15,6 @@ from libc.stdlib cimport malloc, free
 from libc.string cimport strlen
 from .._cutils cimport set_string
 from . cimport _tracers
-from . cimport _base
 
 
 cdef class tracers(history):
@@ -285,26 +284,6 @@ cdef class tracers(history):
 		else:
 			raise KeyError("Unrecognized dataframe key: %s" % (key))
 
-	def _subget__int(self, key):
-		"""
-		Performs the __getitem__ operation when the key is of type int.
-		"""
-		cdef double *item
-		if 0 <= key < self._ff[0].n_rows:
-			item = _tracers.tracers_row(self._ff, <unsigned long> key,
-				self._elements, self._n_elements, self._solar, self._Z_solar)
-		elif abs(key) <= self._ff[0].n_rows:
-			item = _tracers.tracers_row(self._ff,
-				self._ff[0].n_rows - <unsigned long> abs(key),
-				self._elements, self._n_elements, self._solar, self._Z_solar)
-		else:
-			raise IndexError("Index out of bounds: %d" % (int(key)))
-		if item is not NULL:
-			x = [item[i] for i in range(_tracers.tracers_row_length(self._ff,
-				self._n_elements, self._elements))]
-			free(item)
-			return _base.base(dict(zip(self.keys(), x)))
-
 	def keys(self):
 		r"""
 		Returns the keys to the dataframe in their lower-case format
@@ -342,7 +321,7 @@ cdef class tracers(history):
 		for i in range(self._ff[0].n_cols):
 			labels[i] = "".join([chr(self._ff[0].labels[i][j]) for j in range(
 				strlen(self._ff[0].labels[i]))])
-		elements = self._load_elements()
+		elements = self._element_names
 		for i in elements:
 			labels.append("[%s/h]" % (i))
 		for i in range(1, len(elements)):
@@ -22,7 +22,8 @@ def test():
 			test_name(),
 			test_size(),
 			test_keys(),
-			test_todict()
+			test_todict(),
+			test_view()
 		]
 	]
 
@@ -140,3 +141,27 @@ def test_todict():
 	return ["vice.core.dataframe.fromfile.todict", test]
 
 
+@unittest
+def test_view():
+	r"""
+	vice.core.dataframe.fromfile.view unit test
+	"""
+	def test():
+		try:
+			for i in _TEST_.keys():
+				view = _TEST_.view(i)
+				assert list(view) == _TEST_[i]
+				try:
+					view[0] = 1
+				except (ValueError, TypeError):
+					pass
+				else:
+					return False
+			key = _TEST_.keys()[-1]
+			view = _TEST_.view(key)
+			_TEST_[key] = len(view) * [1.]
+			assert all([j == 1. for j in view])
+		except:
+			return False
+		return True
+	return ["vice.core.dataframe.fromfile.view", test]
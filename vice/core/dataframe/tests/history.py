@@ -38,7 +38,8 @@ def test():
 		[
 			test_initialize(),
 			test_keys(),
-			test_getitem(run = False)
+			test_getitem(run = False),
+			test_derived()
 		]
 	]
 
@@ -137,3 +138,29 @@ def test_getitem_builtins():
 		return True
 	return ["vice.core.dataframe.history.__getitem__.builtins", test]
 
+
+@unittest
+def test_derived():
+	r"""
+	vice.core.dataframe.history derived quantities unit test
+	"""
+	def test():
+		r"""
+		Calculated quantities are stored after they're first accessed, but
+		must reflect any re-assigned quantities they're calculated from.
+		"""
+		try:
+			test_ = history(filename = "test.vice/history.out",
+				adopted_solar_z = 0.014)
+			z = test_["z(fe)"]
+			z[-1] = -1
+			assert test_["z(fe)"][-1] != -1
+			assert test_[-1]["z(fe)"] == test_["z(fe)"][-1]
+			assert test_[-1]["[o/fe]"] == test_["[o/fe]"][-1]
+			test_["mgas"] = [2 * i for i in test_["mgas"]]
+			assert all(map(lambda x, y: x == 0 or abs(2 * x / y - 1) < 1e-12,
+				test_["z(fe)"], z[:-1]))
+		except:
+			return False
+		return True
+	return ["vice.core.dataframe.history.derived", test]
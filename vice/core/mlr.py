@@ -40,6 +40,14 @@ class mlr(_mlr_linker):
 			- "mm1989"
 			- "larson1974"
 
+	tolerance : ``float`` or ``None``
+		The maximum relative error in the turnoff mass interpolated from a
+		lookup table in chemical evolution models. ``None`` to compute the
+		turnoff mass directly.
+	turnoff_mass : <function>
+		The mass of dying stars under the current ``setting``, interpolated
+		from a lookup table of its own if ``tolerance`` is not ``None``.
+
 	powerlaw : <function>
 		The MLR parameterized by a single power-law, a popular exercise in
 		undergraduate astronomy courses.
@@ -203,6 +211,145 @@ class mlr(_mlr_linker):
 		"""
 		return tuple(_mlr_linker.__NAMES__.keys())
 
+	@property
+	def tolerance(self):
+		r"""
+		Type : ``float`` or ``None``
+
+		Default : ``None``
+
+		.. versionadded:: 1.4.0
+
+		The maximum relative error in the turnoff mass when it is interpolated
+		from a lookup table. If ``None``, chemical evolution models compute the
+		turnoff mass from the mass-lifetime relation at every age and
+		metallicity they need it. Otherwise, they build a table of turnoff
+		masses under the current ``setting`` once when they begin, shared by
+		every zone and element, and interpolate from it.
+
+		Allowed values are between 0 and 1.
+
+		.. seealso::
+
+			- vice.mlr.setting
+			- vice.mlr.turnoff_mass
+
+		Notes
+		-----
+		The table stores the main sequence turnoff mass on a grid uniform in
+		the logarithm of age between 1 Myr and the end of the simulation and,
+		for the metallicity-dependent forms, uniform in the logarithm of
+		metallicity between :math:`Z = 10^{-5}` and 0.03. The turnoff mass at
+		each point is found to 1% of the tolerance. Points are added in
+		either dimension until linear interpolation in the logarithms is
+		accurate to within the tolerance halfway between them. For forms
+		which do not quantify the total lifetime *a priori*, the total
+		lifetime is the main sequence lifetime times :math:`1 + p_\text{MS}`
+		(see ``vice.mlr``), so one table serves every value of the parameter
+		``postMS``.
+
+		Outside of the table, and where it cannot be made accurate to within
+		the tolerance with a reasonable number of points (e.g. where the
+		lifetime does not decrease monotonically with mass, or between the
+		metallicities tabulated by Kodama & Arimoto 1997), the turnoff mass is
+		computed directly.
+
+		This greatly speeds up simulations using the forms which must be
+		solved numerically for the turnoff mass ("hpt2000", "ka1997",
+		"mm1989"). Building the table takes longer for smaller tolerances, of
+		order seconds for the metallicity-dependent forms at a tolerance of
+		:math:`10^{-3}`. Setting this attribute does not change the values
+		returned by ``vice.mlr.powerlaw``, ``vice.mlr.vincenzo2016``, etc.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.mlr.tolerance # the default
+		None
+		>>> vice.mlr.setting = "hpt2000"
+		>>> vice.mlr.tolerance = 1.e-3
+		>>> sz = vice.singlezone(name = "example")
+		>>> sz.run([0.01 * i for i in range(1001)])
+		"""
+		return _mlr_linker._get_tolerance()
+
+	@tolerance.setter
+	def tolerance(self, value):
+		_mlr_linker._set_tolerance(value)
+
+	@staticmethod
+	def turnoff_mass(age, postMS = 0.1, Z = 0.014):
+		r"""
+		Compute the mass of dying stars under the current setting of the
+		mass-lifetime relation, interpolating it from a lookup table built at
+		``vice.mlr.tolerance`` if it is not ``None``.
+
+		**Signature**: vice.mlr.turnoff_mass(age, postMS = 0.1, Z = 0.014)
+
+		.. versionadded:: 1.4.0
+
+		Parameters
+		----------
+		age : real number or array-like
+			The age of the stellar population in Gyr. If array-like, the mass
+			is computed at each age in one loop in C.
+		postMS : float [default : 0.1]
+			The ratio of a star's post main sequence lifetime to its main
+			sequence lifetime. Zero for the main sequence turnoff mass. Not
+			relevant for the "vincenzo2016" and "ka1997" forms.
+		Z : float or array-like [default : 0.014]
+			The metallicity by mass of the stellar population. Only relevant
+			for the "vincenzo2016", "hpt2000" and "ka1997" forms. If
+			array-like, broadcast against ``age``.
+
+		Returns
+		-------
+		mass : float or array-like
+			The mass of stars in :math:`M_\odot` whose lifetime is ``age``.
+			If ``age`` or ``Z`` is array-like, a ``numpy.ndarray`` of their
+			broadcast shape if NumPy_ is installed, and a ``list`` otherwise.
+
+			.. _NumPy: https://numpy.org/
+
+		Raises
+		------
+		* TypeError
+			- ``age`` or ``Z`` is neither a number nor array-like
+		* ValueError
+			- Any value of ``age`` is negative
+			- ``postMS`` is negative
+			- Any value of ``Z`` is not between 0 and 1
+			- ``age`` and ``Z`` cannot be broadcast against one another
+
+		Notes
+		-----
+		The first call after changing ``vice.mlr.setting`` or
+		``vice.mlr.tolerance``, or with a larger age than any previous call,
+		builds the lookup table up to the largest age. This table is separate
+		from those built by chemical evolution models, which extend to the
+		end of each simulation, so its grid and therefore the interpolated
+		masses may differ from theirs slightly, though all are accurate to
+		within ``vice.mlr.tolerance``. See ``vice.mlr.tolerance`` for details.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.mlr.setting = "hpt2000"
+		>>> vice.mlr.turnoff_mass([1, 2, 3], Z = 0.007)
+		array([2.0561661 , 1.60698594, 1.3971778 ])
+		>>> vice.mlr.tolerance = 1.e-3
+		>>> vice.mlr.turnoff_mass([1, 2, 3], Z = 0.007)
+		array([2.05632219, 1.60728594, 1.39755245])
+		"""
+		if _mlr_linker._get_setting() in ["vincenzo2016", "hpt2000", "ka1997"]:
+			{
+				"vincenzo2016": __VINCENZO2016__,
+				"hpt2000": __HPT2000__,
+				"ka1997": __KA1997__
+			}[_mlr_linker._get_setting()]._load()
+		else: pass
+		return _mlr_linker._turnoff_mass(age, postMS = postMS, Z = Z)
+
 	@staticmethod
 	def powerlaw(qty, postMS = 0.1, which = "mass"): # metallicity independent
 		r"""
@@ -215,10 +362,14 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretation set by the keyword
 			argument ``which``.
+
+			.. versionchanged:: 1.4.0
+				May be array-like, in which case ``x`` is computed at each
+				element in one loop in C.
 		postMS : float [default : 0.1]
 			The ratio of a star's post main sequence lifetime to its main
 			sequence lifetime. Zero to compute the main sequence lifetime
@@ -233,11 +384,13 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass in Gyr
 			according to the single power law.
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` is array-like, a ``numpy.ndarray`` if NumPy is
+			installed, and a ``list`` otherwise.
 
 		Notes
 		-----
@@ -296,11 +449,16 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretion set by the keyword
 			argument ``which``.
-		Z : float [default : 0.014]
+
+			.. versionchanged:: 1.4.0
+				``qty`` and ``Z`` may be array-like, in which case they are
+				broadcast against one another and ``x`` is computed at each
+				element in one loop in C.
+		Z : float or array-like [default : 0.014]
 			The metallicity by mass of the stellar population.
 		which : str [case-insensitive] [default : "mass"]
 			The interpretation of ``qty``: either ``"mass"`` or ``"age"``
@@ -312,12 +470,14 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass and
 			metallicity in Gyr according to the Vincenzo et al. (2016)
 			relation.
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` or ``Z`` is array-like, a ``numpy.ndarray`` if NumPy
+			is installed, and a ``list`` otherwise.
 
 		Notes
 		-----
@@ -379,15 +539,20 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretion set by the keyword
 			argument ``which``.
+
+			.. versionchanged:: 1.4.0
+				``qty`` and ``Z`` may be array-like, in which case they are
+				broadcast against one another and ``x`` is computed at each
+				element in one loop in C.
 		postMS : float [default : 0.1]
 			The ratio of a star's post main sequence lifetime to its main
 			sequence lifetime. Zero to compute the main sequence lifetime
 			alone, or the main sequence turnoff mass when ``which == "age"``.
-		Z : float [default : 0.014]
+		Z : float or array-like [default : 0.014]
 			The metallicity by mass of the stellar population.
 		which : str [case-insensitive] [default : "mass"]
 			The interpretation of ``qty``: either ``"mass"`` or ``"age"``
@@ -399,12 +564,14 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass and
 			metallicity in Gyr according to the Hurley, Pols & Tout (2000)
 			relation.
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` or ``Z`` is array-like, a ``numpy.ndarray`` if NumPy
+			is installed, and a ``list`` otherwise.
 
 		Notes
 		-----
@@ -471,6 +638,8 @@ class mlr(_mlr_linker):
 		1.4629812650680543
 		>>> vice.mlr.hpt2000(3, postMS = 0, which = "age")
 		1.4181586170196532
+		>>> vice.mlr.hpt2000([1, 2, 3], which = "age")
+		array([2.13532099, 1.67755777, 1.46298127])
 
 		.. [1] Hurley, Pols & Tout (2000), MNRAS, 315, 543
 		.. [2] Press, Teukolsky, Vetterling & Flannery (2007), Numerical
@@ -490,11 +659,16 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretion set by the keyword
 			argument ``which``.
-		Z : float [default : 0.014]
+
+			.. versionchanged:: 1.4.0
+				``qty`` and ``Z`` may be array-like, in which case they are
+				broadcast against one another and ``x`` is computed at each
+				element in one loop in C.
+		Z : float or array-like [default : 0.014]
 			The metallicity by mass of the stellar population.
 		which : str [case-insensitive] [default : "mass"]
 			The interpretation of ``qty``: either ``"mass"`` or ``"age"``
@@ -506,11 +680,13 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass and
 			metallicity in Gyr according to Kodama & Arimoto (1997).
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` or ``Z`` is array-like, a ``numpy.ndarray`` if NumPy
+			is installed, and a ``list`` otherwise.
 
 		Notes
 		-----
@@ -577,10 +753,14 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretion set by the keyword
 			argument ``which``.
+
+			.. versionchanged:: 1.4.0
+				May be array-like, in which case ``x`` is computed at each
+				element in one loop in C.
 		postMS : float [default : 0.1]
 			The ratio of a star's post main sequence lifetime to its main
 			sequence lifetime. Zero to compute the main sequence lifetime
@@ -595,11 +775,13 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass and
 			metallicity in Gyr according to Padovani & Matteucci (1993).
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` is array-like, a ``numpy.ndarray`` if NumPy is
+			installed, and a ``list`` otherwise.
 
 		Notes
 		-----
@@ -677,10 +859,14 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretion set by the keyword
 			argument ``which``.
+
+			.. versionchanged:: 1.4.0
+				May be array-like, in which case ``x`` is computed at each
+				element in one loop in C.
 		postMS : float [default : 0.1]
 			The ratio of a star's post main sequence lifetime to its main
 			sequence lifetime. Zero to compute the main sequence lifetime
@@ -695,11 +881,13 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass and
 			metallicity in Gyr according to Maeder & Meynet (1989).
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` is array-like, a ``numpy.ndarray`` if NumPy is
+			installed, and a ``list`` otherwise.
 
 		Notes
 		-----
@@ -783,10 +971,14 @@ class mlr(_mlr_linker):
 
 		Parameters
 		----------
-		qty : float
+		qty : float or array-like
 			Either the mass of a star in :math:`M_\odot` or the age of a
 			stellar population in Gyr. Interpretion set by the keyword
 			argument ``which``.
+
+			.. versionchanged:: 1.4.0
+				May be array-like, in which case ``x`` is computed at each
+				element in one loop in C.
 		postMS : float [default : 0.1]
 			The ratio of a star's post main sequence lifetime to its main
 			sequence lifetime. Zero to compute the main sequence lifetime
@@ -801,11 +993,13 @@ class mlr(_mlr_linker):
 
 		Returns
 		-------
-		x : float
+		x : float or array-like
 			If ``which == "mass"``, the lifetime of a star of that mass and
 			metallicity in Gyr according to Larson (1974).
 			If ``which == "age"``, the mass of a star in :math:`M_\odot` with
 			the specified lifetime in Gyr.
+			If ``qty`` is array-like, a ``numpy.ndarray`` if NumPy is
+			installed, and a ``list`` otherwise.
 
 		Notes
 		-----
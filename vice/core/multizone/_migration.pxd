@@ -6,9 +6,8 @@ from ..objects._multizone cimport MULTIZONE
 
 cdef extern from "../../src/multizone/migration.h":
 	void malloc_gas_migration(MULTIZONE *mz)
-	unsigned short setup_migration_element(MULTIZONE mz,
-		double ***migration_matrix, unsigned int row, unsigned int column,
-		double *arr)
+	unsigned short setup_migration_element(MULTIZONE *mz, unsigned int row,
+		unsigned int column, double *arr, unsigned short varies)
 
 
 cdef class mig_matrix:
@@ -211,6 +211,15 @@ Got: %d. Required: %d.""" % (value.size, self._gas.size))
 			``n = 2``, and so on up to ``n = n_stars - 1``, where ``n_stars``
 			is the number of star particles per zone per timestep.
 
+		.. tip:: Setting up the star particles calls this function once per
+			star particle per timestep of the simulation. Functions which can
+			instead accept an array of simulation times as their third
+			parameter (and an array of values of ``n``) may be flagged via
+			the decorator ``vice.core.callback.batched``, in which case they
+			are called once for all star particles born in a given zone at a
+			given time. The default setting and the
+			``vice.toolkit.hydrodisk.hydrodiskstars`` object are batched.
+
 		Example Code
 		------------
 		>>> import vice
@@ -288,9 +297,19 @@ cdef class mig_matrix:
 
 	Functions
 	---------
+	- set_band
 	- tolist
 	- tonumpyarray
 
+	Notes
+	-----
+	Only the elements which are not zero are stored and evaluated by
+	multizone simulations, and those which are real numbers are stored as a
+	single value rather than one value per timestep. Models in which gas only
+	moves between neighbouring zones therefore run faster with a large number
+	of zones than models with a dense migration matrix. The function
+	``set_band`` assigns an entire diagonal of the matrix at once.
+
 	Example Code
 	------------
 	>>> import math
@@ -407,6 +426,68 @@ Got: %s""" % (type(key)))
 		"""
 		return self._rows[0].size
 
+	def set_band(self, offset, value):
+		r"""
+		Assign the same value to every element on one diagonal of this
+		migration matrix.
+
+		**Signature**: x.set_band(offset, value)
+
+		.. versionadded:: 1.4.0
+
+		Parameters
+		----------
+		x : ``migration_matrix``
+			An instance of this class.
+		offset : ``int``
+			The diagonal to assign. The elements :math:`G_{i,i + k}` will be
+			assigned for offset :math:`k`. Positive values refer to gas
+			moving from zone :math:`i` to zones with larger indeces, and
+			negative values to zones with smaller indeces.
+		value : real number or <function>
+			The value to assign to each element on that diagonal. Functions
+			must accept time in Gyr as the only parameter.
+
+		Raises
+		------
+		* TypeError
+			- ``offset`` is not an integer.
+			- ``value`` is neither a real number nor a callable function.
+		* ValueError
+			- ``offset`` is zero or does not refer to a diagonal of this
+			  matrix.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> example = vice.migration.migration_matrix(4)
+		>>> example.set_band(1, 0.01)
+		>>> example.set_band(-1, 0.005)
+		>>> example
+			MigrationMatrix{
+				0 ---------> {0.0, 0.01, 0.0, 0.0}
+				1 ---------> {0.005, 0.0, 0.01, 0.0}
+				2 ---------> {0.0, 0.005, 0.0, 0.01}
+				3 ---------> {0.0, 0.0, 0.005, 0.0}
+			}
+		"""
+		if isinstance(offset, numbers.Number) and offset % 1 == 0:
+			offset = int(offset)
+			if offset and abs(offset) < self.size:
+				for i in range(max(0, -offset), min(self.size,
+					self.size - offset)):
+					# row.__setitem__ handles exceptions on the value
+					self._rows[i][i + offset] = value
+			elif offset:
+				raise ValueError("""Offset out of bounds for migration \
+matrix of size %d. Got: %d""" % (self.size, offset))
+			else:
+				raise ValueError("""Elements on the diagonal of the migration \
+matrix are always zero.""")
+		else:
+			raise TypeError("Offset must be an integer. Got: %s" % (
+				type(offset)))
+
 	def tolist(self):
 		r"""
 		Obtain a copy of this migration matrix as a list.
@@ -14,11 +14,17 @@ from ...yields import agb
 from ...yields import ccsne
 from ...yields import sneia
 from ..pickles import jar
+from ..callback import evaluate_vectorized
+from ..callback import is_vectorized
+from ..callback import evaluate_batched
+from ..callback import is_batched
+from ..callback import callback1_nan_inf_positive
 from .._cutils import progressbar
 from .. import _pyutils
 from .. import mlr
 import warnings
 import numbers
+import array
 import time
 import sys
 import os
@@ -77,6 +83,8 @@ cdef class c_multizone:
 		name = "multizonemodel",
 		n_stars = 1,
 		simple = False,
+		aggregate = False,
+		n_threads = 1,
 		verbose = False):
 
 		assert isinstance(n_zones, int), "Internal Error"
@@ -104,6 +112,8 @@ cdef class c_multizone:
 		name = "multizonemodel",
 		n_stars = 1,
 		simple = False,
+		aggregate = False,
+		n_threads = 1,
 		verbose = False):
 
 		assert isinstance(n_zones, int), "Internal Error"
@@ -112,6 +122,8 @@ cdef class c_multizone:
 		self._migration = _migration.mig_specs(n_zones)
 		self.n_tracers = n_stars
 		self.simple = simple
+		self.aggregate = aggregate
+		self.n_threads = n_threads
 		self.verbose = verbose
 
 	def __dealloc__(self):
@@ -273,6 +285,66 @@ migration prescriptions built into this model. """, ScienceWarning)
 			raise TypeError("""Attribute 'simple' must be interpretable as \
 a boolean. Got: %s""" % (type(value)))
 
+	@property
+	def aggregate(self):
+		# docstring in python version
+		return bool(self._mz[0].aggregate)
+
+	@aggregate.setter
+	def aggregate(self, value):
+		"""
+		Whether or not to compute recycling and stellar masses from per-zone
+		aggregates of the tracer particles.
+
+		Allowed Types
+		=============
+		bool
+
+		Allowed Values
+		==============
+		True and False
+		"""
+		if isinstance(value, numbers.Number) or isinstance(value, bool):
+			if value:
+				self._mz[0].aggregate = 1
+			else:
+				self._mz[0].aggregate = 0
+		else:
+			raise TypeError("""Attribute 'aggregate' must be interpretable \
+as a boolean. Got: %s""" % (type(value)))
+
+	@property
+	def n_threads(self):
+		# docstring in python version
+		return self._mz[0].n_threads
+
+	@n_threads.setter
+	def n_threads(self, value):
+		"""
+		The number of threads to distribute the zones across.
+
+		Allowed Types
+		=============
+		real number
+
+		Allowed Values
+		==============
+		Positive integers
+		"""
+		if isinstance(value, numbers.Number):
+			if value > 0:
+				if value % 1 == 0:
+					self._mz[0].n_threads = <unsigned int> value
+				else:
+					raise ValueError("""Attribute 'n_threads' must be \
+interpretable as an integer. Got: %g""" % (value))
+			else:
+				raise ValueError("""Attribute 'n_threads' must be positive. \
+Got: %g""" % (value))
+		else:
+			raise TypeError("""Attribute 'n_threads' must be an integer. \
+Got: %s""" % (type(value)))
+
 	@property
 	def migration(self):
 		# docstring in python version
@@ -303,12 +375,15 @@ migration.specs. Got: %s""" % (type(value)))
 
 
 	def run(self, output_times, capture = False, overwrite = False,
-		pickle = True):
+		pickle = True, binary = False):
 		"""
 		See docstring in python version of this class.
 		"""
 		self.align_name_attributes()
 		self.prep(output_times)
+		self._mz[0].binary = <unsigned short> bool(binary)
+		for i in range(self._mz[0].mig[0].n_zones):
+			self._mz[0].zones[i][0].binary = self._mz[0].binary
 		cdef int enrichment
 		if self.outfile_check(overwrite):
 			os.system("mkdir %s.vice" % (self.name))
@@ -326,9 +401,15 @@ migration.specs. Got: %s""" % (type(value)))
 			# take the current mass-lifetime relation setting
 			self.import_mlr_data()
 			_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
+			self.setup_mlr_table(max(output_times))
 
 			# just do it #nike
-			enrichment = _multizone.multizone_evolve(self._mz)
+			if self._mz[0].n_threads > 1:
+				# python functions re-acquire the GIL when they're called
+				with nogil:
+					enrichment = _multizone.multizone_evolve(self._mz)
+			else:
+				enrichment = _multizone.multizone_evolve(self._mz)
 			if pickle: self.pickle()
 			self.free_mlr_data()
 
@@ -342,6 +423,10 @@ migration.specs. Got: %s""" % (type(value)))
 			canceled = True
 
 		self.dealign_name_attributes()
+		for i in range(self._mz[0].mig[0].n_zones):
+			if isinstance(self._zones[i].IMF, callback1_nan_inf_positive):
+				self._zones[i].IMF = self._zones[i].IMF.function
+			else: pass
 		stop = time.time()
 		if enrichment == 1:
 			_multizone.multizone_cancel(self._mz)
@@ -392,6 +477,18 @@ zone and at least one timestep larger than 1.""")
 		self.zone_alignment_warnings()
 		self.timestep_alignment_error()
 		self.mode_alignment_error()
+		# zones with the same custom IMF share one callback object, allowing
+		# multizone_setup to compute their return fractions only once
+		imfs = {}
+		for i in range(self._mz[0].mig[0].n_zones):
+			imf = self._zones[i].IMF
+			if callable(imf) and not isinstance(imf,
+				callback1_nan_inf_positive):
+				if id(imf) not in imfs.keys():
+					imfs[id(imf)] = callback1_nan_inf_positive(imf)
+				else: pass
+				self._zones[i].IMF = imfs[id(imf)]
+			else: pass
 		for i in range(self._mz[0].mig[0].n_zones):
 			times = self._zones[i]._singlezone__zone_prep(output_times)
 			self._mz[0].zones[i][0].output_times = copy_pylist(
@@ -475,43 +572,49 @@ timesteps. Note that your migration matrix entries will be multiplied by the \
 timestep size and divided by 10 Myr; this ensures that migration does not \
 proceed faster or slower as a function of the timestep size."""
 
+		cdef double *arr
+		cdef double value
+		cdef unsigned short failed
 		for i in range(self._mz[0].mig[0].n_zones):
 			for j in range(self._mz[0].mig[0].n_zones):
 				"""
 				For both gas and stars, look at the i,j'th element of the
-				user-specified migration matrix. Whether it is a number or a
-				function, map it across the known evaluation times of the
-				simulation and pipe it to C
+				user-specified migration matrix. Numbers are piped to C as a
+				single value, while functions are mapped across the known
+				evaluation times of the simulation. Array-aware functions are
+				called once on the full array of evaluation times.
 
 				Notes
 				=====
 				Don't ignore i == j. In this case under-the-hood the migration
-				matrix will ALWAYS be zero.
+				matrix will ALWAYS be zero. Elements which are zero are not
+				stored in C at all, so they're skipped here.
 				"""
 				if isinstance(self.migration.gas[i][j], numbers.Number):
-					arr = length * [self.migration.gas[i][j]]
-					if _migration.setup_migration_element(self._mz[0],
-						self._mz[0].mig[0].gas_migration,
-						i, j, copy_pylist(arr)):
-
-						_multizone.multizone_cancel(self._mz)
-						raise RuntimeError(errmsg)
-					else:
-						pass
-			
+					if not self.migration.gas[i][j]: continue
+					value = self.migration.gas[i][j]
+					failed = _migration.setup_migration_element(self._mz, i, j,
+						&value, 0)
 				elif callable(self.migration.gas[i][j]):
-					arr = list(map(self.migration.gas[i][j], eval_times))
-					if _migration.setup_migration_element(self._mz[0],
-						self._mz[0].mig[0].gas_migration,
-						i, j, copy_pylist(arr)):
-
-						_multizone.multizone_cancel(self._mz)
-						raise RuntimeError(errmsg)
+					if is_vectorized(self.migration.gas[i][j]):
+						arr = copy_pylist(evaluate_vectorized(
+							self.migration.gas[i][j], eval_times))
 					else:
-						pass
+						arr = copy_pylist(list(map(self.migration.gas[i][j],
+							eval_times)))
+					# setup_migration_element copies the values over
+					failed = _migration.setup_migration_element(self._mz, i, j,
+						arr, 1)
+					free(arr)
 				else:
 					raise SystemError("Internal Error")
 
+				if failed:
+					_multizone.multizone_cancel(self._mz)
+					raise RuntimeError(errmsg)
+				else:
+					pass
+
 
 	def setup_tracers(self):
 		"""
@@ -520,14 +623,36 @@ proceed faster or slower as a function of the timestep size."""
 		This will call the function of initial zone number, formation time,
 		and simulation time, and expect an int to be returned describing the
 		zone occupation number of that tracer particle at that time.
+
+		With a hydrodiskstars object whose __call__ function is not
+		overridden by a subclass, the analogs and zone histories of all
+		tracer particles are instead assigned in C with the global
+		interpreter lock released.
 		"""
+		cdef MULTIZONE *mz = self._mz
+		cdef unsigned short failed
 		n = _singlezone.n_timesteps(self._mz[0].zones[0][0])
 		eval_times = [i * self._mz[0].zones[0][0].dt for i in range(n + 1)]
-		takes_keyword = True
-		try: # check for an optional keyword argument 'n'
-			self.migration.stars(0, 0, 0, n = 0)
-		except TypeError:
-			takes_keyword = False
+		batched = is_batched(self.migration.stars)
+		# hydrodiskstars objects not overriding __call__ are handled in C
+		in_c = (isinstance(self.migration.stars, hydrodiskstars) and
+			self.migration.stars.mode is not None and
+			type(self.migration.stars).__call__ is hydrodiskstars.__call__)
+		takes_keyword = not in_c
+		if takes_keyword:
+			try: # check for an optional keyword argument 'n'
+				if batched:
+					self.migration.stars(0, 0, array.array('d', [0]), n = [0])
+				else:
+					self.migration.stars(0, 0, 0, n = 0)
+			except TypeError:
+				takes_keyword = False
+		else: pass
+		if self.verbose:
+			print("Allocating %s of memory for stellar populations...." % (
+				_pyutils.format_bytes(
+					_tracer.tracers_memory_estimate(self._mz[0]))))
+		else: pass
 		_tracer.malloc_tracers(self._mz)
 		if hasattr(self.migration.stars, "write"):
 			# Allow users to write extra data when the function is called.
@@ -558,6 +683,59 @@ None.""" % (self.migration.stars.mode), UserWarning)
 		if self.verbose:
 			print("Setting up stellar populations....")
 			start = time.time() # for printing total setup time
+		else: pass
+		if in_c:
+			"""
+			Calling the object in python only assigns the analogs, so
+			there's no need to call it unless a subclass overrides __call__
+			(e.g. to write extra output), and the whole setup runs in C. The
+			progressbar is printed from C as well.
+			"""
+			with nogil:
+				failed = _hydrodiskstars.setup_hydrodisk_tracers(mz[0])
+			if failed: raise SystemError("Internal Error")
+		else:
+			self.setup_tracers_given_timesteps(n, using_hydrodisk, batched,
+				takes_keyword)
+		if self.verbose:
+			setup_time = time.time() - start
+			days, hours, minutes, seconds = _pyutils.format_time(setup_time)
+			if days:
+				setup_time = "%d days %02dh%02dm%02ds" % (days, hours, minutes,
+					int(seconds))
+			else:
+				setup_time = "%02dh%02dm%02ds" % (hours, minutes, int(seconds))
+				print("Setup time: %s" % (setup_time))
+		else: pass
+
+		if hasattr(self.migration.stars, "write"):
+			# revert write attribute to False
+			try:
+				self.migration.stars.write = False
+			except: pass
+
+
+	def setup_tracers_given_timesteps(self, n, using_hydrodisk, batched,
+		takes_keyword):
+		r"""
+		Setup the zone history of all tracer particles by calling the
+		migration.stars attribute from python.
+
+		Parameters
+		----------
+		n : int
+			The number of timesteps in the simulation.
+		using_hydrodisk : bool
+			Whether or not the migration.stars attribute is a hydrodiskstars
+			object whose attribute 'mode' is not None.
+		batched : bool
+			Whether or not the migration.stars attribute is batched (see
+			vice.core.callback.batched).
+		takes_keyword : bool
+			Whether or not the migration.stars attribute takes the value of
+			'n' as a keyword.
+		"""
+		if self.verbose:
 			pbar = progressbar(maxval = n)
 		else: pass
 		for i in range(n): # for each timestep
@@ -582,11 +760,17 @@ None.""" % (self.migration.stars.mode), UserWarning)
 						# The index of this tracer particle
 						idx = (i * (self.n_zones * self.n_tracers) +
 							j * self.n_tracers + k)
+						# Only used in sudden mode, drawn with the analog
+						migration_time = (
+							self.migration.stars._hydrodiskstars__migration_time())
 						if _hydrodiskstars.setup_hydrodisk_tracer(self._mz[0],
-							self._mz[0].mig[0].tracers[idx], j, i,
-							self.migration.stars.analog_index):
+							idx, j, i, self.migration.stars.analog_index,
+							migration_time):
 							raise SystemError("Internal Error")
 						else: pass
+				elif batched:
+					self.setup_tracers_batched(j, i, n,
+						takes_keyword = takes_keyword)
 				else:
 					self.setup_tracers_given_zone_timestep(j, i, n,
 						takes_keyword = takes_keyword)
@@ -595,23 +779,61 @@ None.""" % (self.migration.stars.mode), UserWarning)
 				pbar.left_hand_side = "Progress: %.2f%%" % (percentage)
 				pbar.update(i + 1)
 			else: pass
-		if self.verbose:
-			pbar.finish()
-			setup_time = time.time() - start
-			days, hours, minutes, seconds = _pyutils.format_time(setup_time)
-			if days:
-				setup_time = "%d days %02dh%02dm%02ds" % (days, hours, minutes,
-					int(seconds))
-			else:
-				setup_time = "%02dh%02dm%02ds" % (hours, minutes, int(seconds))
-				print("Setup time: %s" % (setup_time))
-		else: pass
+		if self.verbose: pbar.finish()
 
-		if hasattr(self.migration.stars, "write"):
-			# revert write attribute to False
-			try:
-				self.migration.stars.write = False
-			except: pass
+
+	def setup_tracers_batched(self, zone, timestep, n_timesteps,
+		takes_keyword = False):
+		r"""
+		Setup the zone history of all tracer particles born in a given zone
+		at a given timestep with one call to a batched stellar migration
+		prescription (see vice.core.callback.batched).
+
+		Parameters
+		----------
+		zone : int
+			The zone of formation
+		timestep : int
+			The timestep of formation
+		n_timesteps : int
+			The number of timesteps in the simulation.
+		takes_keyword : bool [default : False]
+			Whether or not the migration.stars attribute takes the value of
+			'n' as a keyword.
+
+		Notes
+		-----
+		The prescription is evaluated at the same times as in
+		setup_single_tracer, and the zone histories are validated and copied
+		into C in one step by setup_tracer_block.
+		"""
+		cdef double dt = self._mz[0].zones[0][0].dt
+		cdef long last = n_timesteps - _singlezone.BUFFER + 1
+		if timestep > last:
+			times = []
+		elif self.simple:
+			times = [timestep * dt, last * dt]
+		else:
+			times = [l * dt for l in range(timestep, last)]
+		if len(times):
+			zones = evaluate_batched(self.migration.stars, zone,
+				timestep * dt, times, self.n_tracers,
+				takes_keyword = takes_keyword)
+		else:
+			zones = array.array('i')
+
+		cdef int[::1] block = zones
+		cdef int *ptr = &block[0] if len(zones) else NULL
+		cdef unsigned short failed = _tracer.setup_tracer_block(self._mz[0],
+			zone, timestep, ptr, len(times))
+		if failed == 1:
+			raise ValueError("""All zone numbers must be between 0 and \
+self.n_zones - 1 (inclusive).""")
+		elif failed == 2:
+			raise ValueError("""Star particle's zone history, evaluated at \
+its time of formation, must equal its zone of origin.""")
+		else:
+			pass
 
 
 	def setup_tracers_given_zone_timestep(self, zone, timestep, n_timesteps,
@@ -700,7 +922,7 @@ Zone number must always be an integer. Got: %s""" % (type(final)))
 				zone_history[timestep:(n_timesteps - _singlezone.BUFFER + 1)] = [
 					self.migration.stars(zone,
 						timestep * self._mz[0].zones[0][0].dt,
-						l * self._mz[0].zones[0][0].dt) for l in
+						l * self._mz[0].zones[0][0].dt, **kwargs) for l in
 					range(timestep, n_timesteps - _singlezone.BUFFER + 1)
 				]
 
@@ -765,24 +987,18 @@ its time of formation, must equal its zone of origin.""")
 			The number of timesteps the simulation will evaluate at, counting
 			the 10-timestep memory buffer.
 		"""
-		self._mz[0].mig[0].tracers[idx][0].zone_history = <int *> malloc (
-			n_timesteps * sizeof(int))
-		for i in range(n_timesteps):
-			if i < formation_timestep:
-				# zone number is -1 until it forms
-				self._mz[0].mig[0].tracers[idx][0].zone_history[i] = -1
-			else:
-				self._mz[0].mig[0].tracers[idx][0].zone_history[i] = zones[i]
+		# zone number is -1 until it forms
+		cdef int[::1] history = array.array('i', [-1 if i < formation_timestep
+			else int(zones[i]) for i in range(n_timesteps)])
+		_tracer.set_tracer_history(self._mz[0].mig[0].tracers, idx,
+			formation_timestep, &history[0])
 
 		# more bookkeeping
-		self._mz[0].mig[0].tracers[idx][0].timestep_origin = formation_timestep
-		self._mz[0].mig[0].tracers[idx][0].zone_origin = int(
-			zones[formation_timestep])
 		if self.simple:
-			self._mz[0].mig[0].tracers[idx][0].zone_current = int(
+			self._mz[0].mig[0].tracers[0].zone_current[idx] = int(
 				zones[n_timesteps - _singlezone.BUFFER + 1])
 		else:
-			self._mz[0].mig[0].tracers[idx][0].zone_current = int(
+			self._mz[0].mig[0].tracers[0].zone_current[idx] = int(
 				zones[formation_timestep])
 
 
@@ -915,6 +1131,18 @@ its time of formation, must equal its zone of origin.""")
 		else: pass
 
 
+	def setup_mlr_table(self, max_age):
+		# builds the turnoff mass lookup table on this extension, shared by
+		# all zones and elements
+		if mlr.tolerance is not None:
+			if _mlr.mlr_table_setup(<double> max_age, <double> mlr.tolerance):
+				raise MemoryError("""Could not allocate memory for the \
+turnoff mass lookup table.""")
+			else: pass
+		else:
+			_mlr.mlr_table_free()
+
+
 	def free_mlr_data(self):
 		# frees the mass-lifetime relation data on this extension
 		if mlr.setting in ["vincenzo2016", "hpt2000", "ka1997"]:
@@ -925,6 +1153,7 @@ its time of formation, must equal its zone of origin.""")
 			}[mlr.setting]
 			func()
 		else: pass
+		_mlr.mlr_table_free()
 
 
 	def pickle(self):
@@ -950,6 +1179,8 @@ its time of formation, must equal its zone of origin.""")
 			"n_zones": 			self.n_zones,
 			"n_stars": 			self.n_tracers,
 			"simple": 			self.simple,
+			"aggregate": 		self.aggregate,
+			"n_threads": 		self.n_threads,
 			"verbose": 			self.verbose
 		}
 		attrs["zones"] = dict(zip(
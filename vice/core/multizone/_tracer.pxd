@@ -7,5 +7,10 @@ from ..objects._tracer cimport TRACER
 
 cdef extern from "../../src/multizone/tracer.h":
 	void malloc_tracers(MULTIZONE *mz)
+	void set_tracer_history(TRACER *t, unsigned long index,
+		unsigned long birth_timestep, int *zones)
+	unsigned short setup_tracer_block(MULTIZONE mz, unsigned int zone,
+		unsigned long timestep, int *block, unsigned long n_times)
+	double tracers_memory_estimate(MULTIZONE mz)
 
 
@@ -48,7 +48,8 @@ class multizone(object):
 	is an array of ``singlezone`` objects.
 
 	**Signature**: vice.multizone(name = "multizonemodel", n_zones = 10,
-	n_stars = 1, simple = False, verbose = False)
+	n_stars = 1, simple = False, aggregate = False, n_threads = 1,
+	verbose = False)
 
 	.. versionadded:: 1.2.0
 
@@ -62,6 +63,12 @@ class multizone(object):
 		The attribute ``n_stars``, initialized via keyword argument. See below.
 	simple : ``bool`` [default : False]
 		The attribute ``simple``, initialized via keyword argument. See below.
+	aggregate : ``bool`` [default : False]
+		The attribute ``aggregate``, initialized via keyword argument. See
+		below.
+	n_threads : ``int`` [default : 1]
+		The attribute ``n_threads``, initialized via keyword argument. See
+		below.
 	verbose : ``bool`` [default : False]
 		The attribute ``verbose``, initialized via keyword argument. See below.
 
@@ -91,6 +98,18 @@ class multizone(object):
 	simple : ``bool`` [default : False]
 		If True, each individual zone will be simulated as a one-zone model,
 		ignoring all migration prescriptions.
+	aggregate : ``bool`` [default : False]
+		If True, recycling and the stellar mass in each zone will be computed
+		from the number of star particles from each stellar population in each
+		zone rather than from each star particle individually.
+
+		.. versionadded:: 1.4.0
+
+	n_threads : ``int`` [default : 1]
+		The number of threads to distribute the zones across.
+
+		.. versionadded:: 1.4.0
+
 	verbose : ``bool`` [default : False]
 		Whether or not to print to the console as the simulation runs.
 
@@ -170,6 +189,8 @@ class multizone(object):
 			n_stars --------> 1
 			verbose --------> False
 			simple ---------> False
+			aggregate ------> False
+			n_threads ------> 1
 			zones ----------> ['zone0', 'zone1', 'zone2']
 			migration ------> Stars: <function _DEFAULT_STELLAR_MIGRATION_ at 0x10e2150e0>
 							  ISM:     MigrationMatrix{
@@ -215,6 +236,8 @@ Got: %s""" % (type(n_zones)))
 			"n_stars": 			self.n_stars,
 			"verbose": 			self.verbose,
 			"simple": 			self.simple,
+			"aggregate": 		self.aggregate,
+			"n_threads": 		self.n_threads,
 			"zones": 			[self.zones[i].name for i in range(
 									self.n_zones)],
 			"migration": 		self.migration
@@ -315,6 +338,8 @@ Got: %s""" % (type(n_zones)))
 				n_stars --------> 1
 				verbose --------> False
 				simple ---------> False
+				aggregate ------> False
+				n_threads ------> 1
 				zones ----------> ['zone0', 'zone1', 'zone2']
 				migration ------> Stars: <function _DEFAULT_STELLAR_MIGRATION_ at 0x111393f80>
 								  ISM:     MigrationMatrix{
@@ -352,6 +377,8 @@ Got: %s""" % (type(arg)))
 			mz.name = attrs["name"]
 			mz.n_stars = attrs["n_stars"]
 			mz.simple = attrs["simple"]
+			if "aggregate" in attrs.keys(): mz.aggregate = attrs["aggregate"]
+			if "n_threads" in attrs.keys(): mz.n_threads = attrs["n_threads"]
 			mz.verbose = attrs["verbose"]
 			for i in range(mz.n_zones):
 				mz.zones[i] = singlezone.from_output("%s/%s.vice" % (dirname,
@@ -659,13 +686,94 @@ simulation was ran.""" % (i, j), UserWarning)
 	def simple(self, value):
 		self.__c_version.simple = value
 
+	@property
+	def aggregate(self):
+		r"""
+		Type : ``bool``
+
+		Default : ``False``
+
+		.. versionadded:: 1.4.0
+
+		If ``True``, star particles which form in the same zone at the same
+		timestep will be grouped together, and VICE will keep track of the
+		number of particles from each group in each zone as they migrate.
+		Recycling and the stellar mass in each zone will then be computed from
+		these counts rather than from each star particle individually. The
+		results are the same up to floating point round-off.
+
+		.. note:: This is most effective for models with many star particles
+			per zone per timestep (see attribute ``n_stars``), in which case
+			the recycling calculations can dominate the computational cost.
+			It requires a small amount of additional memory, which is included
+			in the estimate printed when ``verbose`` is ``True``.
+
+		.. note:: This attribute has no effect if the attribute ``simple`` is
+			``True``.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> mz = vice.multizone(name = "example", n_stars = 8)
+		>>> mz.aggregate
+			False
+		>>> mz.aggregate = True
+		"""
+		return self.__c_version.aggregate
+
+	@aggregate.setter
+	def aggregate(self, value):
+		self.__c_version.aggregate = value
+
+	@property
+	def n_threads(self):
+		r"""
+		Type : ``int``
+
+		Default : 1
+
+		.. versionadded:: 1.4.0
+
+		The number of threads to distribute the zones across. If the
+		attribute ``simple`` is ``True``, each zone is evolved as a one-zone
+		model on whichever thread becomes available first. Otherwise, the
+		zones are moved forward one timestep at a time on whichever thread
+		becomes available first, once gas migration has been computed for
+		all of them. The results do not depend on this value.
+
+		.. note:: Functions of time are evaluated before the zones are
+			evolved, but python functions which must be called at every
+			timestep (e.g. yields, and ``tau_star`` as a function of time and
+			gas mass) can only be called by one thread at a time. Zones which
+			call them will see less of a speedup. If ``verbose`` is ``True``,
+			the speedup relative to evolving the zones one at a time is
+			printed once they have all finished.
+
+		.. note:: If ``simple`` is ``True`` and the ``verbose`` attribute of
+			any individual zone is ``True``, the zones will be evolved one at
+			a time regardless of this value.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> mz = vice.multizone(name = "example", n_zones = 200)
+		>>> mz.n_threads
+			1
+		>>> mz.n_threads = 8
+		"""
+		return self.__c_version.n_threads
+
+	@n_threads.setter
+	def n_threads(self, value):
+		self.__c_version.n_threads = value
+
 	def run(self, output_times, capture = False, overwrite = False,
-		pickle = True):
+		pickle = True, binary = False):
 		r"""
 		Run the simulation.
 
 		**Signature**: x.run(output_times, capture = False, overwrite = False,
-			pickle = True)
+			pickle = True, binary = False)
 
 		Parameters
 		----------
@@ -683,6 +791,9 @@ simulation was ran.""" % (i, j), UserWarning)
 		pickle : ``bool`` [default : True]
 			If ``True``, VICE will save the attributes of this object with the
 			output. See below.
+		binary : ``bool`` [default : False]
+			If ``True``, VICE will write the history, MDF and star particle output in a
+			binary columnar format rather than as ascii text. See below.
 
 		Returns
 		-------
@@ -749,6 +860,17 @@ simulation was ran.""" % (i, j), UserWarning)
 			storage space required. This will, however, render the
 			vice.multizone.from_output function useless for that output.
 
+		.. note::
+
+			If the keyword argument ``binary == True``, each output file
+			begins with a short ascii header recording the byte order, the
+			number of rows, and the label and data type of each column,
+			followed by the data itself stored one column at a time. These
+			files are smaller and much faster to read than their ascii
+			counterparts, and the output classes detect the format
+			automatically. Each column is read from the file mapped into
+			memory only when it is first accessed.
+
 		Example Code
 		------------
 		>>> import numpy as np
@@ -758,5 +880,5 @@ simulation was ran.""" % (i, j), UserWarning)
 		>>> mz.run(outtimes)
 		"""
 		return self.__c_version.run(output_times, capture = capture,
-			overwrite = overwrite, pickle = pickle)
+			overwrite = overwrite, pickle = pickle, binary = binary)
 
@@ -26,6 +26,7 @@ def test():
 			_TEST_.test_n_stars_setter(),
 			_TEST_.test_verbose_setter(),
 			_TEST_.test_simple_setter(),
+			_TEST_.test_n_threads_setter(),
 			_TEST_.test_migration_setter(),
 			_TEST_.test_prep(),
 			_TEST_.test_outfile_check()
@@ -100,6 +101,23 @@ cdef class multizone_tester:
 		return ["vice.core.multizone.simple.setter", test]
 
 
+	@unittest
+	def test_n_threads_setter(self):
+		r"""
+		vice.core.multizone.n_threads.setter unit test
+		"""
+		def test():
+			try:
+				self.n_threads = 4
+			except:
+				return False
+			status = self.n_threads == 4
+			status &= self._mz[0].n_threads == 4
+			self.n_threads = 1
+			return status
+		return ["vice.core.multizone.n_threads.setter", test]
+
+
 	@unittest
 	def test_migration_setter(self):
 		r"""
@@ -29,6 +29,7 @@ def test():
 			test_getitem(),
 			test_setitem(),
 			test_size(),
+			test_set_band(),
 			test_tolist(),
 			test_tonumpyarray()
 		]
@@ -98,6 +99,35 @@ def test_size():
 	return ["vice.core.multizone.migration.mig_matrix.size", test]
 
 
+@unittest
+def test_set_band():
+	r"""
+	set_band function unit test
+	"""
+	def test():
+		try:
+			for offset in range(1 - _TEST_SIZE_, _TEST_SIZE_):
+				if not offset: continue
+				_TEST_.set_band(offset, 1.)
+				for i in range(_TEST_SIZE_):
+					for j in range(_TEST_SIZE_):
+						assert _TEST_[i, j] == float(j - i == offset)
+				_TEST_.set_band(offset, dummy)
+				assert _TEST_[max(0, -offset), max(0, offset)] == dummy
+				_TEST_.set_band(offset, 0.)
+			for offset in [0, _TEST_SIZE_, -_TEST_SIZE_]:
+				try:
+					_TEST_.set_band(offset, 1.)
+				except ValueError:
+					pass
+				else:
+					return False
+		except:
+			return False
+		return _TEST_.tolist() == _TEST_SIZE_ * [_TEST_SIZE_ * [0.]]
+	return ["vice.core.multizone.migration.mig_matrix.set_band", test]
+
+
 @unittest
 def test_tolist():
 	r"""
@@ -8,6 +8,11 @@ cdef extern from "../../src/objects.h":
 		unsigned long n_rows
 		unsigned long n_cols
 		double **data
+		unsigned long *offsets
+		char *types
+		unsigned short swap
+		void *map
+		unsigned long map_size
 
 
 cdef extern from "../../src/dataframe/fromfile.h":
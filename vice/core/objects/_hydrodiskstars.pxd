@@ -3,6 +3,7 @@
 cdef extern from "../../src/objects.h":
 	ctypedef struct HYDRODISKSTARS:
 		unsigned long n_stars
+		unsigned long *rows
 		unsigned long *ids
 		double *birth_times
 		double *birth_radii
@@ -16,6 +17,14 @@ cdef extern from "../../src/objects.h":
 		unsigned short *decomp
 		unsigned short n_rad_bins
 		char *mode
+		unsigned long *cells
+		unsigned long *cell_offsets
+		unsigned long n_time_cells
+		unsigned long n_radius_cells
+		double min_birth_time
+		double min_birth_radius
+		void *map
+		unsigned long map_size
 
 
 cdef extern from "../../src/objects/hydrodiskstars.h":
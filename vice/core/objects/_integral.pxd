@@ -6,7 +6,8 @@ from ._imf cimport IMF_
 
 cdef extern from "../../src/objects.h":
 	ctypedef struct INTEGRAL:
-		double (*func)(double)
+		double (*func)(double, void *)
+		void *params
 		double a
 		double b
 		double tolerance
@@ -16,6 +17,9 @@ cdef extern from "../../src/objects.h":
 		unsigned long iters
 		double result
 		double error
+		double *breakpoints
+		unsigned long n_breakpoints
+		unsigned long evals
 
 
 cdef extern from "../../src/objects/integral.h":
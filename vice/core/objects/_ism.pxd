@@ -19,6 +19,14 @@ cdef extern from "../../src/objects.h":
 		double mgschmidt
 		double smoothing_time
 		int schmidt
+		int J21
+		double J21_area
+		double J21_present_day_molecular
+		double J21_molecular_index
+		double J21_Sigma_g1
+		double J21_Sigma_g2
+		double J21_index1
+		double J21_index2
 
 cdef extern from "../../src/objects/ism.h":
 	ISM *ism_initialize()
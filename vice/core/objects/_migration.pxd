@@ -11,8 +11,12 @@ cdef extern from "../../src/objects.h":
 		unsigned int n_zones
 		unsigned int n_tracers
 		unsigned long tracer_count
-		double ***gas_migration
-		_tracer.TRACER **tracers
+		unsigned long n_gas_flows
+		unsigned int *gas_origin
+		unsigned int *gas_destination
+		unsigned short *gas_varies
+		double **gas_migration
+		_tracer.TRACER *tracers
 		FILE *tracers_output
 
 
@@ -11,6 +11,9 @@ cdef extern from "../../src/objects.h":
 		_migration.MIGRATION *mig
 		unsigned short verbose
 		unsigned short simple
+		unsigned short aggregate
+		unsigned int n_threads
+		unsigned short binary
 
 
 cdef extern from "../../src/multizone/multizone.h":
@@ -18,6 +21,6 @@ cdef extern from "../../src/multizone/multizone.h":
 	void multizone_free(MULTIZONE *mz)
 	void link_zone(MULTIZONE *mz, unsigned long address,
 		unsigned int zone_index)
-	unsigned short multizone_evolve(MULTIZONE *mz)
+	unsigned short multizone_evolve(MULTIZONE *mz) nogil
 	void multizone_cancel(MULTIZONE *mz)
 
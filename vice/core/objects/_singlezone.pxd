@@ -20,6 +20,9 @@ cdef extern from "../../src/objects.h":
 		double Z_solar
 		unsigned int n_elements
 		unsigned short verbose
+		unsigned short binary
+		double *history_buffer
+		unsigned long history_rows
 		ELEMENT **elements
 		ISM *ism
 		MDF *mdf
@@ -12,6 +12,7 @@ cdef extern from "../../src/objects.h":
 		double postMS
 		double R0
 		int continuous
+		double cumulative_tolerance
 
 cdef extern from "../../src/ssp.h":
 	cdef double MASS_LIFETIME_PLAW_INDEX
@@ -2,11 +2,24 @@
 
 cdef extern from "../../src/objects.h":
 	ctypedef struct TRACER:
-		double mass
-		int *zone_history
-		unsigned int zone_origin
-		unsigned int zone_current
-		unsigned long timestep_origin
+		double *mass
+		unsigned int *zone_origin
+		unsigned int *zone_current
+		unsigned long *timestep_origin
+		void *zone_history
+		unsigned short history_width
+		unsigned long *history_offsets
+		unsigned int *history_lengths
+		unsigned long history_size
+		unsigned long history_capacity
+		unsigned long n_particles
+		unsigned long n_timesteps
+		unsigned int *cohort_zone
+		unsigned int *cohort_count
+		unsigned int *cohort_length
+		unsigned int cohort_width
+		unsigned long *zone_members
+		unsigned long *zone_offsets
 
 
 cdef extern from "../../src/multizone/tracer.h":
@@ -27,7 +27,8 @@ if not __VICE_SETUP__:
 		"singlezone",
 		"sneia",
 		"ssp",
-		"tracer"
+		"tracer",
+		"workspace"
 	]
 
 	from ....testing import moduletest
@@ -51,6 +52,7 @@ if not __VICE_SETUP__:
 	from . import _sneia as sneia
 	from . import _ssp as ssp
 	from . import _tracer as tracer
+	from . import _workspace as workspace
 
 	@moduletest
 	def test():
@@ -98,7 +100,9 @@ if not __VICE_SETUP__:
 				ssp.test_ssp_constructor(),
 				ssp.test_ssp_destructor(),
 				tracer.test_tracer_constructor(),
-				tracer.test_tracer_destructor()
+				tracer.test_tracer_destructor(),
+				workspace.test_workspace_constructor(),
+				workspace.test_workspace_destructor()
 			]
 		]
 
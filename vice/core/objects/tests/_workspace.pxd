@@ -0,0 +1,5 @@
+# cython: language_level = 3, boundscheck = False
+
+cdef extern from "../../../src/objects/tests/workspace.h":
+	unsigned short test_workspace_initialize()
+	unsigned short test_workspace_free()
@@ -0,0 +1,28 @@
+# cython: language_level = 3, boundscheck = False
+
+from __future__ import absolute_import
+__all__ = [
+	"test_workspace_constructor",
+	"test_workspace_destructor"
+]
+from ....testing import unittest
+from . cimport _workspace
+
+
+@unittest
+def test_workspace_constructor():
+	"""
+	Tests the workspace constructor function at vice/src/objects/workspace.h
+	"""
+	return ["vice.src.objects.workspace constructor",
+		_workspace.test_workspace_initialize]
+
+
+@unittest
+def test_workspace_destructor():
+	"""
+	Tests the workspace destructor function at vice/src/objects/workspace.h
+	"""
+	return ["vice.src.objects.workspace destructor",
+		_workspace.test_workspace_free]
+
@@ -91,10 +91,14 @@ cdef fromfile_obj c_mdf(name):
 	"""
 	name = _output_utils._get_name(name)
 	_output_utils._check_singlezone_output(name)
-	with open("%s/mdf.out" % (name), 'r') as f:
-		line = f.readline()
-		keys = [i.lower() for i in line.split()[1:]]
-		f.close()
+	if _output_utils._is_binary("%s/mdf.out" % (name)):
+		keys = _output_utils._load_column_labels_from_file_header(
+			"%s/mdf.out" % (name))
+	else:
+		with open("%s/mdf.out" % (name), 'r') as f:
+			line = f.readline()
+			keys = [i.lower() for i in line.split()[1:]]
+			f.close()
 	return fromfile_obj(
 		filename = "%s/mdf.out" % (name),
 		labels = keys
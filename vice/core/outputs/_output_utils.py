@@ -14,6 +14,10 @@ elif sys.version_info[:2] >= (3, 5):
 else:
 	_VERSION_ERROR_()
 
+# The first line of output files written in binary columnar format. This must
+# match BINARY_OUTPUT_TAG in vice/src/io.h.
+_BINARY_OUTPUT_TAG_ = "# VICE binary output"
+
 
 def _get_name(name):
 	"""
@@ -133,6 +137,10 @@ def _load_column_labels_from_file_header(filename):
 		::	file is not found
 		::	file is not formatted correctly
 	"""
+	if _is_binary(filename):
+		return tuple([label for label, dtype in _load_binary_header(
+			filename)["columns"]])
+	else: pass
 	with open(filename, 'r') as f:
 		line = f.readline()
 		while line[0] == '#':
@@ -151,3 +159,79 @@ def _load_column_labels_from_file_header(filename):
 			raise IOError("Output file not formatted correctly: %s" % (
 				filename))
 
+
+def _is_binary(filename):
+	"""
+	Determines if an output file was written in binary columnar format.
+
+	Args
+	====
+	filename :: str
+		The absolute or relative path to the file
+
+	Returns
+	=======
+	True if the file begins with the tag identifying binary output, False
+	otherwise.
+
+	Raises
+	======
+	IOError ::
+		::	file is not found
+	"""
+	with open(filename, 'rb') as f:
+		line = f.readline()
+		f.close()
+	return line.rstrip(b'\n') == _BINARY_OUTPUT_TAG_.encode()
+
+
+def _load_binary_header(filename):
+	"""
+	Reads the header of an output file in binary columnar format.
+
+	Args
+	====
+	filename :: str
+		The absolute or relative path to the file
+
+	Returns
+	=======
+	A dictionary with the following keys:
+
+		- "byteorder" : The byte order of the data, "little" or "big"
+		- "rows" : The number of rows of data
+		- "columns" : A list of (label, dtype) tuples, one for each column,
+		  where dtype is e.g. "f8" or "u4"
+		- "offset" : The number of bytes in the header
+
+	Raises
+	======
+	IOError ::
+		::	file is not found
+		::	file is not formatted correctly
+	"""
+	header = {"columns": []}
+	with open(filename, 'rb') as f:
+		line = f.readline().decode()
+		if line.rstrip('\n') != _BINARY_OUTPUT_TAG_:
+			raise IOError("Output file not formatted correctly: %s" % (
+				filename))
+		while True:
+			words = f.readline().decode().split()
+			if len(words) < 2 or words[0] != '#':
+				raise IOError("Output file not formatted correctly: %s" % (
+					filename))
+			elif words[1] == "end":
+				break
+			elif words[1] == "byteorder:":
+				header["byteorder"] = words[2]
+			elif words[1] == "rows:":
+				header["rows"] = int(words[2])
+			elif words[1] == "column:":
+				header["columns"].append(tuple([words[2].lower(), words[3]]))
+			else:
+				raise IOError("Output file not formatted correctly: %s" % (
+					filename))
+		header["offset"] = f.tell()
+		f.close()
+	return header
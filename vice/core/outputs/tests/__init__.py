@@ -10,9 +10,9 @@ if not __VICE_SETUP__:
 	__all__ = ["test"]
 	from ....testing import moduletest
 	from . import output
-	from .history import test_history
-	from .mdf import test_mdf
-	from .stars import test_stars
+	from .history import test_history, test_history_binary
+	from .mdf import test_mdf, test_mdf_binary
+	from .stars import test_stars, test_stars_binary
 	from .multioutput import test_multioutput
 
 	@moduletest
@@ -24,8 +24,11 @@ if not __VICE_SETUP__:
 			[
 				output.test(run = False),
 				test_history(),
+				test_history_binary(),
 				test_mdf(),
+				test_mdf_binary(),
 				test_stars(),
+				test_stars_binary(),
 				test_multioutput()
 			]
 		]
@@ -1,10 +1,11 @@
 
 from __future__ import absolute_import
-__all__ = ["test_history"]
+__all__ = ["test_history", "test_history_binary"]
 from ....testing import unittest
 from ...dataframe import base as dataframe
 from ...singlezone import singlezone
 from .. import history
+import math
 
 @unittest
 def test_history():
@@ -23,3 +24,42 @@ def test_history():
 		return isinstance(test_, dataframe)
 	return ["vice.history", test]
 
+
+@unittest
+def test_history_binary():
+	r"""
+	vice.history unit test with output in binary columnar format
+	"""
+	def test():
+		try:
+			sz = singlezone.singlezone(name = "test")
+			sz.run([0.01 * i for i in range(1001)], overwrite = True)
+			ascii = history("test")
+			sz.run([0.01 * i for i in range(1001)], overwrite = True,
+				binary = True)
+			binary = history("test")
+		except:
+			return False
+		return isinstance(binary, dataframe) and columns_agree(ascii, binary,
+			["time", "mgas", "mstar", "sfr", "ifr", "ofr", "eta_0", "r_eff",
+			"mass(fe)", "z(fe)", "z"])
+	return ["vice.history [binary]", test]
+
+
+def columns_agree(ascii, binary, keys):
+	r"""
+	Determines whether or not the columns of the same output written in
+	ascii and binary formats agree with one another, allowing for the six
+	digits of precision in the ascii format. Logarithmic abundances are
+	best left out, as this rounding is amplified near zero.
+	"""
+	for key in keys:
+		if len(ascii[key]) != len(binary[key]): return False
+		for i in range(len(ascii[key])):
+			if math.isnan(ascii[key][i]) and math.isnan(binary[key][i]):
+				continue
+			elif abs(ascii[key][i] - binary[key][i]) > 1.e-5 * abs(
+				binary[key][i]) + 1.e-30:
+				return False
+			else: pass
+	return True
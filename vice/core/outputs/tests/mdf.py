@@ -1,9 +1,10 @@
 
 from __future__ import absolute_import
-__all__ = ["test_mdf"]
+__all__ = ["test_mdf", "test_mdf_binary"]
 from ....testing import unittest
 from ...dataframe import base as dataframe
 from ...singlezone import singlezone
+from .history import columns_agree
 from .. import mdf
 
 
@@ -24,3 +25,23 @@ def test_mdf():
 		return isinstance(test_, dataframe)
 	return ["vice.mdf", test]
 
+
+@unittest
+def test_mdf_binary():
+	r"""
+	vice.mdf unit test with output in binary columnar format
+	"""
+	def test():
+		try:
+			sz = singlezone.singlezone(name = "test")
+			sz.run([0.01 * i for i in range(1001)], overwrite = True)
+			ascii = mdf("test")
+			sz.run([0.01 * i for i in range(1001)], overwrite = True,
+				binary = True)
+			binary = mdf("test")
+		except:
+			return False
+		return (isinstance(binary, dataframe) and
+			ascii.keys() == binary.keys() and
+			columns_agree(ascii, binary, ascii.keys()))
+	return ["vice.mdf [binary]", test]
@@ -1,9 +1,10 @@
 
 from __future__ import absolute_import
-__all__ = ["test_stars"]
+__all__ = ["test_stars", "test_stars_binary"]
 from ....testing import unittest
 from ...dataframe import base as dataframe
 from .._tracers import tracers
+from .history import columns_agree
 
 
 @unittest
@@ -24,3 +25,24 @@ def test_stars():
 		return isinstance(test_, dataframe)
 	return ["vice.stars", test]
 
+
+@unittest
+def test_stars_binary():
+	r"""
+	vice.stars unit test with output in binary columnar format
+	"""
+	from ...multizone import multizone
+	def test():
+		try:
+			mz = multizone(name = "test", n_zones = 3)
+			mz.run([0.01 * i for i in range(1001)], overwrite = True)
+			ascii = tracers("test")
+			mz.run([0.01 * i for i in range(1001)], overwrite = True,
+				binary = True)
+			binary = tracers("test")
+		except:
+			return False
+		return isinstance(binary, dataframe) and columns_agree(ascii, binary,
+			["formation_time", "zone_origin", "zone_final", "mass", "z(fe)",
+			"z(o)", "z"])
+	return ["vice.stars [binary]", test]
@@ -22,6 +22,8 @@ from ..callback import callback1_nan_inf_positive
 from ..callback import callback1_nan_inf
 from ..callback import callback2_nan_inf
 from ..callback import callback2_nan_positive
+from ..callback import evaluate_vectorized
+from ..callback import is_vectorized
 from ..dataframe import evolutionary_settings
 from ..dataframe import atomic_number
 from ..dataframe import primordial
@@ -35,6 +37,7 @@ from ...yields import ccsne
 from ...yields import sneia
 from .. import _pyutils
 from ..mlr import mlr
+from ...toolkit.J21_sf_law import J21_sf_law
 import math as m
 import warnings
 import numbers
@@ -1297,13 +1300,15 @@ All elemental yields in the current simulation will be set to the table of \
 
 
 	# ------------------------ RUN THE SIMULATION ------------------------ #
-	def run(self, output_times, capture = False, overwrite = False):
+	def run(self, output_times, capture = False, overwrite = False,
+		binary = False):
 		
 		r"""
 		See docstring in singlezone.py.
 		"""
 
 		output_times = self.prep(output_times)
+		self._sz[0].binary = <unsigned short> bool(binary)
 		cdef int enrichment
 		if self.open_output_dir(overwrite):
 
@@ -1316,6 +1321,7 @@ All elemental yields in the current simulation will be set to the table of \
 			# take the current mass-lifetime relation setting
 			self.import_mlr_data()
 			_mlr.set_mlr_hashcode(_mlr._mlr_linker.__NAMES__[mlr.setting])
+			self.setup_mlr_table(output_times[-1])
 
 			# just do it #nike
 			self._sz[0].output_times = copy_pylist(output_times)
@@ -1364,10 +1370,17 @@ All elemental yields in the current simulation will be set to the table of \
 		# Make sure the output times are as they should be
 		output_times = self.output_times_check(output_times)
 		self._sz[0].ism[0].mass = self._Mg0 # reset initial gas supply
-		if callable(self._imf):
+		if callable(self._imf) and not isinstance(self._imf,
+			callback1_nan_inf_positive):
 			self._imf = callback1_nan_inf_positive(self._imf)
 		else: pass
 		setup_imf(self._sz[0].ssp[0].imf, self._imf)
+		# vice.core.ssp imports this module, so it can't be imported above
+		from ..ssp.imf import imf
+		if imf.tolerance is None:
+			self._sz[0].ssp[0].cumulative_tolerance = 0
+		else:
+			self._sz[0].ssp[0].cumulative_tolerance = imf.tolerance
 		self.setup_elements()
 
 		"""
@@ -1405,7 +1418,15 @@ to negative value for at least one timestep.""" % (name))
 				Currently only the case for attribute 'tau_star'
 			"""
 			if callable(attr):
-				arr = list(map(attr, evaltimes))
+				if is_vectorized(attr):
+					# one call on the full array of times
+					try:
+						arr = evaluate_vectorized(attr, evaltimes)
+					except TypeError:
+						raise ArithmeticError("""Functional attribute '%s' \
+evaluated to non-numerical value for at least one timestep.""" % (name))
+				else:
+					arr = list(map(attr, evaltimes))
 				_pyutils.numeric_check(arr, ArithmeticError, """Functional \
 attribute '%s' evaluated to non-numerical value for at least one \
 timestep.""" % (name))
@@ -1427,11 +1448,12 @@ attribute '%s' evaluated to inf or NaN for at least one timestep.""" % (name))
 		self._sz[0].ism[0].eta = copy_pylist(mapper(self._eta, "eta"))
 		self._sz[0].ism[0].enh = copy_pylist(mapper(
 			self._enhancement, "enhancement"))
+		self._sz[0].ism[0].J21 = 0
 		if isinstance(self._tau_star, callback2_nan_positive):
 			# tau_star function of time and gas mass -> don't map across time,
-			# instead setup callback object.
-			callback_2arg_setup(self._sz[0].ism[0].functional_tau_star,
-				self._tau_star)
+			# instead setup callback object unless it can be evaluated in C.
+			if not self.setup_J21_sf_law(): callback_2arg_setup(
+				self._sz[0].ism[0].functional_tau_star, self._tau_star)
 		else:
 			# Allow inf for tau_star if in infall or gas mode, but not sfr mode
 			self._sz[0].ism[0].tau_star = copy_pylist(mapper(
@@ -1440,6 +1462,12 @@ attribute '%s' evaluated to inf or NaN for at least one timestep.""" % (name))
 		if self.mode == "gas":
 			self._sz[0].ism[0].specified = copy_pylist(mapper(
 				self._func, "func"))
+		elif is_vectorized(self._func):
+			# 1.e9 converts from Msun yr^-1 to Msun Gyr^-1
+			self._sz[0].ism[0].specified = copy_pylist(mapper(
+				self._func, "func"))
+			for i in range(len(evaltimes)):
+				self._sz[0].ism[0].specified[i] *= 1.e9
 		else:
 			# 1.e9 converts from Msun yr^-1 to Msun Gyr^-1
 			self._sz[0].ism[0].specified = copy_pylist(mapper(
@@ -1640,17 +1668,59 @@ especially for fine timestepping.""", VisibleRuntimeWarning)
 					self._sz[0].elements[i][0].agb_grid[0].custom_yield,
 					self._callback_agb[i]
 				)
-				warnings.warn("""Functions of stellar mass and metallicity \
-for asymptotic giant branch star yields may significantly increase the \
-required integration time, especially for fine \
-timestepping.""", VisibleRuntimeWarning)
+				if isinstance(agb.settings[self.elements[i]], agb.tabulated):
+					# evaluated on this grid once in setup_AGB in agb.c
+					self._sz[0].elements[i][0].agb_grid[0].tabulate = 1
+					self._sz[0].elements[i][0].agb_grid[0].interpolator[0].ycoords = (
+						copy_pylist(
+							agb.settings[self.elements[i]].metallicities))
+					self._sz[0].elements[i][0].agb_grid[0].interpolator[0].n_y_values = (
+						len(agb.settings[self.elements[i]].metallicities))
+				else:
+					self._sz[0].elements[i][0].agb_grid[0].tabulate = 0
+					warnings.warn("""Functions of stellar mass and \
+metallicity for asymptotic giant branch star yields may significantly \
+increase the required integration time, especially for fine timestepping. \
+See vice.yields.agb.tabulated for a faster alternative.""",
+						VisibleRuntimeWarning)
 			else:
+				self._sz[0].elements[i][0].agb_grid[0].tabulate = 0
 				agbfile = agb._grid_reader.find_yield_file(self.elements[i],
 					agb.settings[self.elements[i]])
 				_agb.import_agb_grid(self._sz[0].elements[i],
 					agbfile.encode("latin-1"))
 
 
+	def setup_J21_sf_law(self):
+		"""
+		Copies the parameters of a vice.toolkit.J21_sf_law object assigned as
+		the attribute tau_star into the ISM, such that the star formation law
+		is evaluated in C rather than called from C at every timestep.
+
+		Returns
+		=======
+		True if the star formation law will be evaluated in C. This is the
+		case unless a subclass overrides __call__ or molecular, or the mode
+		of the star formation law does not match that of the simulation, in
+		which case it is called as any other function.
+		"""
+		law = self._tau_star.function
+		if not (isinstance(law, J21_sf_law) and
+			type(law).__call__ is J21_sf_law.__call__ and
+			type(law).molecular is J21_sf_law.molecular and
+			(law.mode == "sfr") == (self.mode == "sfr")): return False
+		self._sz[0].ism[0].J21 = 1
+		self._sz[0].ism[0].J21_area = law.area
+		self._sz[0].ism[0].J21_present_day_molecular = (
+			law.present_day_molecular)
+		self._sz[0].ism[0].J21_molecular_index = law.molecular_index
+		self._sz[0].ism[0].J21_Sigma_g1 = law.Sigma_g1
+		self._sz[0].ism[0].J21_Sigma_g2 = law.Sigma_g2
+		# the indices of the tau_star - Sigma_gas relation, as stored by law
+		self._sz[0].ism[0].J21_index1 = law._index1
+		self._sz[0].ism[0].J21_index2 = law._index2
+		return True
+
 	def set_ria(self):
 		"""
 		Maps a custom SNe Ia DTD across the evalutation times of the
@@ -1707,7 +1777,14 @@ negative, NaN, or inf for at least one timestep.""")
 			# sanity checks on what it evaluates to
 			_pyutils.args(func, """Infall metallicity, when callable, must \
 accept only one numerical parameter.""")
-			arr = list(map(func, evaltimes))
+			if is_vectorized(func):
+				try:
+					arr = evaluate_vectorized(func, evaltimes)
+				except TypeError:
+					raise ArithmeticError("""Infall metallicity evaluated to \
+non-numerical value for at least one timestep.""")
+			else:
+				arr = list(map(func, evaltimes))
 			_pyutils.numeric_check(arr, ArithmeticError, """Infall \
 metallicity evaluated to non-numerical value for at least one timestep.""")
 			_pyutils.inf_nan_check(arr, ArithmeticError, """Infall \
@@ -1856,6 +1933,18 @@ timestepping.""" % (names[mlr.setting])
 		else: pass
 
 
+	def setup_mlr_table(self, max_age):
+		# builds the turnoff mass lookup table on this extension, shared by
+		# all elements
+		if mlr.tolerance is not None:
+			if _mlr.mlr_table_setup(<double> max_age, <double> mlr.tolerance):
+				raise MemoryError("""Could not allocate memory for the \
+turnoff mass lookup table.""")
+			else: pass
+		else:
+			_mlr.mlr_table_free()
+
+
 	def free_mlr_data(self):
 		# frees the mass-lifetime relation data on this extension
 		if mlr.setting in ["vincenzo2016", "hpt2000", "ka1997"]:
@@ -1866,6 +1955,7 @@ timestepping.""" % (names[mlr.setting])
 			}[mlr.setting]
 			func()
 		else: pass
+		_mlr.mlr_table_free()
 
 
 	def pickle(self):
@@ -1704,11 +1704,13 @@ ran.""" % (i, j), UserWarning)
 	def agb_model(self, value):
 		self.__c_version.agb_model = value
 
-	def run(self, output_times, capture = False, overwrite = False):
+	def run(self, output_times, capture = False, overwrite = False,
+		binary = False):
 		r"""
 		Run the simulation.
 
-		**Signature**: x.run(output_times, capture = False, overwrite = False)
+		**Signature**: x.run(output_times, capture = False, overwrite = False,
+			binary = False)
 
 		Parameters
 		----------
@@ -1723,6 +1725,9 @@ ran.""" % (i, j), UserWarning)
 		overwrite : ``bool`` [default : False]
 			If ``True``, will force overwrite any files with the same name as
 			the simulation output files.
+		binary : ``bool`` [default : False]
+			If ``True``, VICE will write the history and MDF output in a
+			binary columnar format rather than as ascii text. See below.
 
 		Returns
 		-------
@@ -1786,6 +1791,17 @@ ran.""" % (i, j), UserWarning)
 			simulation. This may be one timestep beyond the last element of
 			the specified ``output_times`` array.
 
+		.. note::
+
+			If the keyword argument ``binary == True``, each output file
+			begins with a short ascii header recording the byte order, the
+			number of rows, and the label and data type of each column,
+			followed by the data itself stored one column at a time. These
+			files are smaller and much faster to read than their ascii
+			counterparts, and the output classes detect the format
+			automatically. Each column is read from the file mapped into
+			memory only when it is first accessed.
+
 		Example Code
 		------------
 		>>> import numpy as np
@@ -1795,5 +1811,5 @@ ran.""" % (i, j), UserWarning)
 		>>> sz.run(outtimes)
 		"""
 		return self.__c_version.run(output_times, capture = capture,
-			overwrite = overwrite)
+			overwrite = overwrite, binary = binary)
 
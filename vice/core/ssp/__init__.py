@@ -16,7 +16,7 @@ if not __VICE_SETUP__:
 	from ._ssp import single_stellar_population
 	from ._crf import cumulative_return_fraction
 	from ._msmf import main_sequence_mass_fraction
-	from . import _imf as imf
+	from .imf import imf
 	from .tests import test
 else:
 	pass
@@ -2,6 +2,9 @@
 
 
 cdef extern from "../../src/imf.h":
-	double salpeter55(double m)
-	double kroupa01(double m)
+	double salpeter55(double m) nogil
+	double kroupa01(double m) nogil
+
+cdef extern from "../../src/ssp.h":
+	cdef double SSP_CUMULATIVE_TOLERANCE
 
@@ -1,26 +1,50 @@
 # cython: language_level = 3, boundscheck = False
 r"""
-Built-in functional forms of popular stellar initial mass functions (IMFs).
-
-.. versionadded:: 1.1.0
-
-Contains
---------
-Kroupa : <function>
-	The Kroupa (2001) IMF [1]_.
-Salpeter : <function>
-	The Salpeter (1955) IMF [2]_.
-
-.. [1] Kroupa (2001), MNRAS, 322, 231
-.. [2] Salpeter (1955), ApJ, 121, 161
+Built-in functional forms of popular stellar initial mass functions (IMFs)
+and the tolerance on the integrals over custom IMFs in chemical evolution
+models. See the docstring of the imf object in vice/core/ssp/imf.py.
 """
 
 from __future__ import absolute_import
 from ..._globals import _RECOGNIZED_IMFS_
 __all__ = list(_RECOGNIZED_IMFS_)
 import numbers as numbers
+import array
+from .. import _pyutils
 from . cimport _imf
 
+# The tolerance on the cumulative integrals over custom IMFs in chemical
+# evolution models (None to integrate the IMF at each timestep).
+_TOLERANCE_ = _imf.SSP_CUMULATIVE_TOLERANCE
+
+
+cdef class _imf_linker:
+
+	r"""
+	Stores the tolerance on the integrals over custom IMFs adopted in
+	chemical evolution models.
+	"""
+
+	@staticmethod
+	def _get_tolerance():
+		# see docstring in vice/core/ssp/imf.py
+		return _TOLERANCE_
+
+	@staticmethod
+	def _set_tolerance(value):
+		global _TOLERANCE_
+		if value is None:
+			_TOLERANCE_ = None
+		elif isinstance(value, numbers.Number):
+			if 0 < value < 1:
+				_TOLERANCE_ = float(value)
+			else:
+				raise ValueError("""IMF tolerance must be between 0 and 1. \
+Got: %g""" % (value))
+		else:
+			raise TypeError("""IMF tolerance must be a numerical value or \
+None. Got: %s""" % (type(value)))
+
 
 def kroupa(mass):
 	r"""
@@ -32,12 +56,16 @@ def kroupa(mass):
 
 	Parameters
 	----------
-	mass : real number
+	mass : real number or array-like
 		The stellar mass in solar masses.
 
+		.. versionchanged:: 1.4.0
+			May be array-like, in which case the IMF is evaluated at each
+			mass in one loop in C.
+
 	Returns
 	-------
-	dndm : real number
+	dndm : real number or array-like
 		The unnormalized value of the Kroupa IMF at that stellar mass,
 		defined by:
 
@@ -49,7 +77,7 @@ def kroupa(mass):
 	Raises
 	------
 	* TypeError
-		- mass is not a real number
+		- mass is neither a real number nor array-like
 	* ValueError
 		- mass is non-positive
 
@@ -61,10 +89,12 @@ def kroupa(mass):
 		0.1969831061351866
 	>>> vice.imf.kroupa(2)
 		0.008122523963562356
+	>>> vice.imf.kroupa([0.5, 1, 2])
+		array([0.19698311, 0.04      , 0.00812252])
 
 	.. [1] Kroupa (2001), MNRAS, 322, 231
 	"""
-	return _common(mass, _imf.kroupa01)
+	return _common(mass, "kroupa")
 
 
 def salpeter(mass):
@@ -78,12 +108,16 @@ def salpeter(mass):
 
 	Parameters
 	----------
-	mass : real number
+	mass : real number or array-like
 		The stellar mass in solar masses.
 
+		.. versionchanged:: 1.4.0
+			May be array-like, in which case the IMF is evaluated at each
+			mass in one loop in C.
+
 	Returns
 	-------
-	dndm : real number
+	dndm : real number or array-like
 		The unnormalized value of the Salpeter IMF at that stellar mass,
 		defined by:
 
@@ -94,7 +128,7 @@ def salpeter(mass):
 	Raises
 	------
 	* TypeError
-		- mass is not a real number
+		- mass is neither a real number nor array-like
 	* ValueError
 		- mass is non-positive
 
@@ -106,10 +140,12 @@ def salpeter(mass):
 		5.098242509277049
 	>>> vice.imf.salpeter(2)
 		0.19614602447418766
+	>>> vice.imf.salpeter([0.5, 1, 2])
+		array([5.09824251, 1.        , 0.19614602])
 
 	.. [1] Salpeter (1955), ApJ, 121, 161
 	"""
-	return _common(mass, _imf.salpeter55)
+	return _common(mass, "salpeter")
 
 
 def _common(mass, builtin_imf):
@@ -118,29 +154,57 @@ def _common(mass, builtin_imf):
 
 	Parameters
 	==========
-	mass :: real number
+	mass :: real number or array-like
 		The stellar mass in Msun
-	builtin_IMF :: <function>
-		The function to send the mass to which will evaluate the IMF
+	builtin_IMF :: str
+		The name of the built-in IMF to evaluate: "kroupa" or "salpeter"
 
 	Returns
 	=======
-	dndm :: real number
+	dndm :: real number or array-like
 		The unnormalized value of the IMF at that stellar mass, defined as
-		dN/dm
+		dN/dm. If mass is array-like, the IMF is evaluated at each element
+		in one loop with the GIL released, returning a NumPy array of the same
+		shape if NumPy is installed and a list otherwise.
 
 	Raises
 	======
 	TypeError ::
-		::	mass is not a real number
-	ValueError :: 	
+		::	mass is neither a real number nor array-like
+	ValueError ::
 		::	mass is non-positive
 	"""
+	cdef const double[::1] masses
+	cdef double[::1] dndm
+	cdef unsigned short kroupa = builtin_imf == "kroupa"
+	cdef unsigned short nonpositive = 0
+	cdef Py_ssize_t i
 	if isinstance(mass, numbers.Number):
 		if mass > 0:
-			return builtin_imf(<double> mass)
+			if kroupa:
+				return _imf.kroupa01(<double> mass)
+			else:
+				return _imf.salpeter55(<double> mass)
 		else:
 			raise ValueError("Mass must be positive. Got: %g" % (mass))
 	else:
-		raise TypeError("Mass must be a real number. Got: %s" % (type(mass)))
-
+		try:
+			[buffs, shape] = _pyutils.broadcast_double_buffers(mass)
+		except TypeError:
+			raise TypeError("""Mass must be a real number or array-like. \
+Got: %s""" % (type(mass)))
+		masses = buffs[0]
+		result = array.array('d', [0.]) * masses.shape[0]
+		dndm = result
+		with nogil:
+			for i in range(masses.shape[0]):
+				if not masses[i] > 0:
+					nonpositive = 1
+				elif kroupa:
+					dndm[i] = _imf.kroupa01(masses[i])
+				else:
+					dndm[i] = _imf.salpeter55(masses[i])
+		if nonpositive:
+			raise ValueError("Mass must be positive.")
+		else:
+			return _pyutils.reshape(result, shape)
@@ -15,6 +15,7 @@ from ...yields import sneia
 from . import _ssp_utils
 from .. import _pyutils
 from .. import mlr
+from .imf import imf
 from ..callback import callback1_nan_inf_positive
 from ..callback import callback1_nan_inf
 from ..callback import callback2_nan_inf
@@ -298,6 +299,10 @@ This feature will be removed in a future release of VICE.
 		setup_imf(ssp[0].imf, callback_imf)
 	else:
 		setup_imf(ssp[0].imf, IMF)
+	if imf.tolerance is None:
+		ssp[0].cumulative_tolerance = 0
+	else:
+		ssp[0].cumulative_tolerance = imf.tolerance
 
 	# Set up any mass-lifetime relation data on this extension
 	# other forms don't have required data
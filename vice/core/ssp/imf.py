@@ -0,0 +1,99 @@
+from ._imf import _imf_linker, kroupa, salpeter
+
+
+class imf(_imf_linker):
+
+	r"""
+	Built-in functional forms of popular stellar initial mass functions (IMFs)
+	and the accuracy to which chemical evolution models integrate over custom
+	IMFs.
+
+	**Signature**: vice.imf
+
+	.. versionadded:: 1.1.0
+
+	Contents
+	--------
+	kroupa : <function>
+		The Kroupa (2001) IMF [1]_.
+	salpeter : <function>
+		The Salpeter (1955) IMF [2]_.
+	tolerance : ``float`` or ``None``
+		The tolerance on the integrals over custom IMFs from which chemical
+		evolution models compute the cumulative return fraction and main
+		sequence mass fraction. ``None`` to integrate the IMF numerically at
+		each timestep.
+
+	.. versionchanged:: 1.4.0
+		This set of functions is no longer a module but an object, in order
+		to store the attribute ``tolerance``. Consequently, importing them
+		with ``from vice import imf`` will work fine, but for example
+		``from vice.imf import kroupa`` will produce a
+		``ModuleNotFoundError``, as it did in previous versions.
+
+	.. [1] Kroupa (2001), MNRAS, 322, 231
+	.. [2] Salpeter (1955), ApJ, 121, 161
+	"""
+
+	kroupa = staticmethod(kroupa)
+	salpeter = staticmethod(salpeter)
+
+	@property
+	def tolerance(self):
+		r"""
+		Type : ``float`` or ``None``
+
+		Default : 1.e-6
+
+		.. versionadded:: 1.4.0
+
+		The tolerance on the cumulative integrals over stellar mass from which
+		``singlezone``, ``multizone`` and ``single_stellar_population`` compute
+		the cumulative return fraction (CRF) and main sequence mass fraction
+		(MSMF) at every timestep when the IMF is a custom function. ``None``
+		to integrate the IMF numerically at each timestep instead, as versions
+		prior to 1.4.0 did.
+
+		Allowed Values
+		--------------
+		- ``None``
+		- A real number between 0 and 1
+
+		Raises
+		------
+		* TypeError
+			- Assigned a value which is neither a number nor ``None``
+		* ValueError
+			- Assigned a number not between 0 and 1
+
+		Notes
+		-----
+		With a numerical tolerance, the IMF is integrated once from the lower
+		mass limit by adaptive Simpson's rule in the logarithm of stellar
+		mass, and the CRF and MSMF at every timestep are interpolated from
+		this running integral. A custom IMF is then evaluated a few hundred
+		times in total rather than many times at each timestep. If the
+		integral does not converge, the IMF is integrated at each timestep
+		anyway. Built-in IMFs are unaffected by this setting.
+
+		Setting this attribute to ``None`` can slow down simulations with a
+		custom IMF considerably, particularly for fine timestepping.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.imf.tolerance # the default
+		1e-06
+		>>> vice.imf.tolerance = None
+		>>> sz = vice.singlezone(name = "example", IMF = lambda m: m**-2.3)
+		>>> sz.run([0.01 * i for i in range(1001)])
+		"""
+		return _imf_linker._get_tolerance()
+
+	@tolerance.setter
+	def tolerance(self, value):
+		_imf_linker._set_tolerance(value)
+
+
+imf = imf()
+
@@ -8,11 +8,13 @@ except NameError:
 if not __VICE_SETUP__:
 	__all__ = [
 		"crf",
+		"cumulative",
 		"msmf",
 		"test"
 	]
 	from ....testing import moduletest
 	from . import _crf as crf
+	from . import _cumulative as cumulative
 	from . import _msmf as msmf
 	from . import _remnants as remnants
 	from . import ssp
@@ -26,6 +28,7 @@ if not __VICE_SETUP__:
 			[
 				remnants.test_kalirai08(),
 				crf.test(run = False),
+				cumulative.test(run = False),
 				msmf.test(run = False),
 				ssp.test(run = False)
 			]
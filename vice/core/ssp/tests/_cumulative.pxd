@@ -0,0 +1,6 @@
+# cython: language_level = 3, boundscheck = False
+
+cdef extern from "../../../src/ssp/tests/cumulative.h":
+	unsigned short test_cumulative_CRF()
+	unsigned short test_cumulative_MSMF()
+
@@ -0,0 +1,43 @@
+# cython: language_level = 3, boundscheck = False
+
+from __future__ import absolute_import
+__all__ = ["test"]
+from ....testing import moduletest
+from ....testing import unittest
+from . cimport _cumulative
+
+
+@moduletest
+def test():
+	r"""
+	Run the tests on the cumulative integrals over stellar mass from which
+	the cumulative return fraction and main sequence mass fraction are
+	computed with custom IMFs.
+	"""
+	return ["vice.src.ssp.cumulative",
+		[
+			test_cumulative_return_fraction(),
+			test_cumulative_main_sequence_mass_fraction()
+		]
+	]
+
+
+@unittest
+def test_cumulative_return_fraction():
+	"""
+	Test the cumulative return fraction from the cumulative integral over
+	stellar mass at vice/src/ssp/cumulative.h
+	"""
+	return ["vice.src.ssp.cumulative.cumulative_CRF",
+		_cumulative.test_cumulative_CRF]
+
+
+@unittest
+def test_cumulative_main_sequence_mass_fraction():
+	"""
+	Test the main sequence mass fraction from the cumulative integral over
+	stellar mass at vice/src/ssp/cumulative.h
+	"""
+	return ["vice.src.ssp.cumulative.cumulative_MSMF",
+		_cumulative.test_cumulative_MSMF]
+
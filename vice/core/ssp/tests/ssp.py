@@ -17,6 +17,7 @@ from ....testing import moduletest
 from ....testing import unittest
 from ....testing import generator
 from ...mlr import mlr
+from ..imf import imf
 import math
 import sys
 if sys.version_info[:2] == (2, 7):
@@ -101,6 +102,40 @@ class mlr_generator(generator):
 		return [self.msg, test]
 
 
+@unittest
+def test_imf_tolerance():
+	"""
+	Test that the single_stellar_population function gives the same result
+	with a custom IMF whether it is integrated cumulatively or at each
+	timestep, and that the tolerance is validated
+	"""
+	def test():
+		current = imf.tolerance
+		try:
+			success = True
+			results = []
+			for tolerance in [1.e-6, None]:
+				imf.tolerance = tolerance
+				mass, times = single_stellar_population("c", time = 3,
+					IMF = _IMF_[-1])
+				results.append(mass)
+			success &= all([abs(a - b) <= 1.e-3 * abs(b) for a, b in zip(
+				results[0], results[1])])
+			for value in [0, 1, "foo"]:
+				try:
+					imf.tolerance = value
+					success = False
+				except (TypeError, ValueError):
+					pass
+			success &= imf.tolerance is None
+		except:
+			return False
+		finally:
+			imf.tolerance = current
+		return success
+	return ["vice.imf.tolerance", test]
+
+
 @moduletest
 def test():
 	"""
@@ -116,5 +151,6 @@ def test():
 			"vice.core.single_stellar_population [RIa :: %s]" % (str(i)),
 			RIa = i, time = 3)())
 	for i in mlr.recognized: trials.append(mlr_generator(mlr = i)())
+	trials.append(test_imf_tolerance())
 	return ["vice.core.single_stellar_population trial tests", trials]
 
@@ -10,6 +10,7 @@ from .._cutils import progressbar
 from .utils import dummy1, dummy2, dummy3
 from .progressbar import test_progressbar
 import random
+import array
 import sys
 import os
 if sys.version_info[:2] == (2, 7):
@@ -27,6 +28,7 @@ from .._cutils cimport setup_imf
 from .._cutils cimport set_string
 from .._cutils cimport ordinals
 from .._cutils cimport copy_pylist
+from .._cutils cimport copy_pybuffer
 from .._cutils cimport copy_2Dpylist
 from .._cutils cimport map_pyfunc_over_array
 from ..objects._callback_1arg cimport CALLBACK_1ARG
@@ -50,6 +52,7 @@ def test():
 			test_set_string(),
 			test_ordinals(),
 			test_copy_pylist(),
+			test_copy_pybuffer(),
 			test_copy_2Dpylist(),
 			test_map_pyfunc_over_array(),
 			test_progressbar()(run = False)
@@ -212,6 +215,29 @@ def test_copy_pylist():
 	return ["vice.core._cutils.copy_pylist", test]
 
 
+@unittest
+def test_copy_pybuffer():
+	r"""
+	vice.core._cutils.copy_pybuffer unit test
+	"""
+	cdef double *copy
+	def test():
+		test_ = array.array('d', [random.random() for i in range(1000)])
+		try:
+			copy = copy_pybuffer(test_)
+		except:
+			return False
+		if copy is not NULL:
+			status = True
+			for i in range(len(test_)):
+				status &= copy[i] == test_[i]
+			free(copy)
+			return status
+		else:
+			return False
+	return ["vice.core._cutils.copy_pybuffer", test]
+
+
 @unittest
 def test_copy_2Dpylist():
 	r"""
@@ -9,6 +9,7 @@ from .._pyutils import range_
 from .._pyutils import args
 from .._pyutils import arg_count
 from .._pyutils import is_ascii
+from .._pyutils import format_bytes
 try:
 	ModuleNotFoundError
 except NameError:
@@ -40,7 +41,8 @@ def test():
 			test_range_(),
 			test_args(),
 			test_arg_count(),
-			test_is_ascii()
+			test_is_ascii(),
+			test_format_bytes()
 		]
 	]
 
@@ -180,3 +182,15 @@ def test_is_ascii():
 		return is_ascii("test") and not is_ascii(chr(129))
 	return ["vice.core._pyutils.is_ascii", test]
 
+
+@unittest
+def test_format_bytes():
+	r"""
+	vice.core._pyutils.format_bytes unit test
+	"""
+	def test():
+		return (format_bytes(512) == "512.0 B" and
+			format_bytes(1536) == "1.5 kB" and
+			format_bytes(3 * 1024**3) == "3.0 GB")
+	return ["vice.core._pyutils.format_bytes", test]
+
@@ -6,6 +6,12 @@ from __future__ import absolute_import
 __all__ = ["test"]
 from ...testing import moduletest
 from ...testing import unittest
+from ..callback import vectorized
+from ..callback import is_vectorized
+from ..callback import evaluate_vectorized
+from ..callback import batched
+from ..callback import is_batched
+from ..callback import evaluate_batched
 from ..callback import numerical
 from ..callback import no_nan
 from ..callback import no_inf
@@ -29,6 +35,10 @@ def test():
 	"""
 	return ["vice.core.callback",
 		[
+			test_vectorized(),
+			test_evaluate_vectorized(),
+			test_batched(),
+			test_evaluate_batched(),
 			test_numerical(),
 			test_no_nan(),
 			test_no_inf(),
@@ -47,6 +57,106 @@ def test():
 	]
 
 
+@unittest
+def test_vectorized():
+	r"""
+	vice.core.callback.vectorized unit test
+	"""
+	def test():
+		@vectorized
+		def dummy(x):
+			return x
+		return is_vectorized(dummy) and not is_vectorized(dummy1)
+	return ["vice.core.callback.vectorized", test]
+
+
+@unittest
+def test_evaluate_vectorized():
+	r"""
+	vice.core.callback.evaluate_vectorized unit test
+	"""
+	def test():
+		@vectorized
+		def dummy(x):
+			return [1 + _**2 for _ in x]
+		@vectorized
+		def constant(x):
+			return 3
+		@vectorized
+		def wrong_length(x):
+			return [0]
+		x = [0.1 * _ for _ in range(100)]
+		try:
+			status = list(evaluate_vectorized(dummy, x)) == [
+				dummy1(_) for _ in x]
+			status &= list(evaluate_vectorized(constant, x)) == len(x) * [3.]
+		except:
+			return False
+		try:
+			evaluate_vectorized(wrong_length, x)
+		except ValueError:
+			pass
+		except:
+			return False
+		else:
+			return False
+		return status
+	return ["vice.core.callback.evaluate_vectorized", test]
+
+
+@unittest
+def test_batched():
+	r"""
+	vice.core.callback.batched unit test
+	"""
+	def test():
+		@batched
+		def dummy(zone, tform, time):
+			return zone
+		return is_batched(dummy) and not is_batched(dummy2)
+	return ["vice.core.callback.batched", test]
+
+
+@unittest
+def test_evaluate_batched():
+	r"""
+	vice.core.callback.evaluate_batched unit test
+	"""
+	def test():
+		@batched
+		def dummy(zone, tform, time, n = [0]):
+			return [[zone + k + int(t - tform) for t in time] for k in n]
+		@batched
+		def constant(zone, tform, time):
+			return zone
+		@batched
+		def non_integer(zone, tform, time):
+			return [zone + 0.5 for t in time]
+		@batched
+		def wrong_shape(zone, tform, time):
+			return [zone, zone]
+		times = [0.5 * _ for _ in range(2, 10)]
+		try:
+			status = list(evaluate_batched(dummy, 1, 1, times, 3,
+				takes_keyword = True)) == [1 + k + int(t - 1) for k in
+				range(3) for t in times]
+			status &= list(evaluate_batched(constant, 1, 1, times, 3)) == (
+				3 * len(times) * [1])
+		except:
+			return False
+		for func in [non_integer, wrong_shape]:
+			try:
+				evaluate_batched(func, 1, 1, times, 3)
+			except ValueError:
+				pass
+			except:
+				return False
+			else:
+				return False
+		return status
+	return ["vice.core.callback.evaluate_batched", test]
+
+
 @unittest
 def test_numerical():
 	r"""
@@ -1,6 +1,8 @@
 
 __all__ = [
 	"test",
+	"test_turnoff_mass",
+	"test_array_evaluation",
 	"test_powerlaw",
 	"test_vincenzo2016",
 	"test_hpt2000",
@@ -27,6 +29,8 @@ def test():
 	return ["vice.mlr",
 		[
 			test_setting(),
+			test_turnoff_mass(),
+			test_array_evaluation(),
 			test_powerlaw(run = False),
 			test_vincenzo2016(run = False),
 			test_hpt2000(run = False),
@@ -64,6 +68,93 @@ def test_setting():
 	return ["vice.mlr.setting", test]
 
 
+@unittest
+def test_turnoff_mass():
+	r"""
+	Tests the turnoff mass under each mass-lifetime relation setting computed
+	directly and interpolated from the lookup table against the individual
+	functions.
+	"""
+	def test():
+		result = True
+		try:
+			# don't modify the current settings
+			current = [mlr.setting, mlr.tolerance]
+		except:
+			return False
+		ages = _TEST_TIMES_[1:]
+		for setting in mlr.recognized:
+			try:
+				mlr.setting = setting
+				for tolerance in [None, 1.e-3]:
+					mlr.tolerance = tolerance
+					masses = mlr.turnoff_mass(ages, postMS = 0.05, Z = 0.007)
+					for i in range(len(ages)):
+						kwargs = {}
+						if setting not in ["vincenzo2016", "ka1997"]:
+							kwargs["postMS"] = 0.05
+						if setting in ["vincenzo2016", "hpt2000", "ka1997"]:
+							kwargs["Z"] = 0.007
+						direct = getattr(mlr, setting)(ages[i], which = "age",
+							**kwargs)
+						if tolerance is None:
+							result &= masses[i] == direct
+						else:
+							# direct root-finding is accurate to ~1e-3
+							result &= abs(masses[i] / direct - 1) < 3.e-3
+						if not result: break
+					if not result: break
+				result &= mlr.turnoff_mass(1) == mlr.turnoff_mass([1])[0]
+			except:
+				return False
+			if not result: break
+		try:
+			mlr.setting, mlr.tolerance = current
+		except:
+			return False
+		return result
+	return ["vice.mlr.turnoff_mass", test]
+
+
+@unittest
+def test_array_evaluation():
+	r"""
+	Tests each of the mass-lifetime relations evaluated at arrays of masses,
+	ages and metallicities against the same values computed one at a time.
+	"""
+	def test():
+		result = True
+		masses = _TEST_MASSES_[::10]
+		ages = _TEST_TIMES_[::10]
+		metallicities = [_Z_TEST_VALUES_[i % len(_Z_TEST_VALUES_)] for i in
+			range(len(masses))]
+		for setting in mlr.recognized:
+			func = getattr(mlr, setting)
+			for which, values in zip(["mass", "age"], [masses, ages]):
+				kwargs = [{"which": which} for _ in range(len(values))]
+				if setting in ["vincenzo2016", "hpt2000", "ka1997"]:
+					for i in range(len(values)):
+						kwargs[i]["Z"] = metallicities[i]
+					Z = metallicities[:len(values)]
+				else:
+					Z = None
+				try:
+					if Z is None:
+						batch = func(values, which = which)
+					else:
+						batch = func(values, Z = Z, which = which)
+					individual = [func(values[i], **kwargs[i]) for i in range(
+						len(values))]
+				except:
+					return False
+				result &= len(batch) == len(individual)
+				result &= all([a == b for a, b in zip(batch, individual)])
+				if not result: break
+			if not result: break
+		return result
+	return ["vice.mlr [array evaluation]", test]
+
+
 @moduletest
 def test_powerlaw():
 	r"""
@@ -1,19 +1,46 @@
 /*
  * This file implements the functionality of the fromfile objects, a
  * subclass of the VICE dataframe.
+ *
+ * Notes
+ * =====
+ * Only the header of the file is read when the object is constructed, at
+ * which point the file is also mapped into memory. The data are stored
+ * column-major and read in from the mapping the first time that any column is
+ * accessed. For ascii files this parses the whole file, after which the
+ * mapping is released; for files in binary columnar format only the requested
+ * column is read, and columns of doubles in the machine's byte order are used
+ * in place. Since VICE removes output directories before overwriting them,
+ * the mapping preserves the data as they were when the object was
+ * constructed.
  */
 
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
+#include <ctype.h>
+#include <sys/mman.h>
 #include "../dataframe.h"
 #include "../io.h"
 #include "fromfile.h"
 #include "utils.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned short is_binary_file(char *name);
+static unsigned short read_binary_header(FROMFILE *ff);
+static unsigned short binary_column_size(char type);
+static void map_file(FROMFILE *ff);
+static double *load_column(FROMFILE *ff, unsigned int col);
+static unsigned short load_ascii_data(FROMFILE *ff);
+static unsigned short parse_mapped_ascii(FROMFILE *ff, unsigned int *cols,
+	unsigned int n);
+static unsigned short read_ascii(FROMFILE *ff, unsigned int *cols,
+	unsigned int n);
+static double *load_binary_column(FROMFILE *ff, unsigned int col);
+
 
 /*
- * Read in the data in a file into the fromfile object
+ * Read in the header of a file into the fromfile object
  *
  * Parameters
  * ==========
@@ -27,6 +54,8 @@
  */
 extern unsigned short fromfile_read(FROMFILE *ff) {
 
+	if (is_binary_file((*ff).name)) return read_binary_header(ff);
+
 	/* Use file I/O subroutines in io.h to error check the file */
 	int dimension = file_dimension((*ff).name);
 
@@ -46,8 +75,11 @@ extern unsigned short fromfile_read(FROMFILE *ff) {
 					ff -> n_cols = 0;
 					return 1;
 				default:
-					ff -> data = read_square_ascii_file((*ff).name);
-					return 0;
+					ff -> data = (double **) calloc ((*ff).n_cols,
+						sizeof(double *));
+					/* read the data now if the file can't be mapped */
+					map_file(ff);
+					return (*ff).map == NULL ? load_ascii_data(ff) : 0;
 			}
 
 	}
@@ -65,27 +97,53 @@ extern unsigned short fromfile_read(FROMFILE *ff) {
  *
  * Returns
  * =======
- * A double pointer to that column of the data; NULL if the label is not found.
+ * A double pointer to a copy of that column of the data; NULL if the label is
+ * not found or the data could not be read.
  *
  * header: fromfile.h
  */
 extern double *fromfile_column(FROMFILE *ff, char *label) {
 
-	int col = column_number(ff, label);
-	unsigned long i;
-	double *column;
+	double *column = fromfile_column_pointer(ff, label);
+	if (column != NULL) {
+		double *copy = (double *) malloc ((*ff).n_rows * sizeof(double));
+		memcpy(copy, column, (*ff).n_rows * sizeof(double));
+		return copy;
+	} else {
+		return NULL;
+	}
+
+}
+
+
+/*
+ * Access a column of the fromfile object based on its label without copying
+ * it.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ * label: 	The label of the column to access
+ *
+ * Returns
+ * =======
+ * A pointer to the column as it is stored in the fromfile object, reading it
+ * in from the file if it has not been already; NULL if the label is not found
+ * or the data could not be read. This memory belongs to the fromfile object
+ * and must not be freed or modified by the caller.
+ *
+ * header: fromfile.h
+ */
+extern double *fromfile_column_pointer(FROMFILE *ff, char *label) {
 
+	int col = column_number(ff, label);
 	switch (col) {
 
 		case -1:
 			return NULL;
 
 		default:
-			column = (double *) malloc ((*ff).n_rows * sizeof(double));
-			for (i = 0l; i < (*ff).n_rows; i++) {
-				column[i] = (*ff).data[i][col];
-			}
-			return column;
+			return load_column(ff, (unsigned) col);
 
 	}
 
@@ -112,7 +170,6 @@ extern unsigned short fromfile_modify_column(FROMFILE *ff, char *label,
 	double *arr) {
 
 	int column = column_number(ff, label);
-	unsigned long i;
 
 	switch (column) {
 
@@ -121,9 +178,12 @@ extern unsigned short fromfile_modify_column(FROMFILE *ff, char *label,
 			return fromfile_new_column(ff, label, arr);
 
 		default:
-			for (i = 0l; i < (*ff).n_rows; i++) {
-				ff -> data[i][column] = arr[i];
-			}
+			/*
+			 * Columns pointing into a mapped binary file are modified in
+			 * place; the mapping is private, so the file itself is not.
+			 */
+			if (load_column(ff, (unsigned) column) == NULL) return 1;
+			memcpy(ff -> data[column], arr, (*ff).n_rows * sizeof(double));
 			return 0;
 
 	}
@@ -149,7 +209,6 @@ extern unsigned short fromfile_modify_column(FROMFILE *ff, char *label,
 extern unsigned short fromfile_new_column(FROMFILE *ff, char *label,
 	double *arr) {
 
-	unsigned long i;
 	switch (column_number(ff, label)) {
 
 		case -1:
@@ -159,11 +218,12 @@ extern unsigned short fromfile_new_column(FROMFILE *ff, char *label,
 			ff -> labels[(*ff).n_cols] = (char *) malloc ((strlen(label) + 1) *
 				sizeof(char));
 			strcpy(ff -> labels[(*ff).n_cols], label);
-			for (i = 0l; i < (*ff).n_rows; i++) {
-				ff -> data[i] = (double *) realloc (ff -> data[i],
-					((*ff).n_cols + 1) * sizeof(double));
-				ff -> data[i][(*ff).n_cols] = arr[i];
-			}
+			ff -> data = (double **) realloc (ff -> data,
+				((*ff).n_cols + 1) * sizeof(double *));
+			ff -> data[(*ff).n_cols] = (double *) malloc ((*ff).n_rows *
+				sizeof(double));
+			memcpy(ff -> data[(*ff).n_cols], arr, (*ff).n_rows *
+				sizeof(double));
 			ff -> n_cols++;
 			return 0;
 
@@ -186,7 +246,7 @@ extern unsigned short fromfile_new_column(FROMFILE *ff, char *label,
  * Returns
  * =======
  * A double pointer to that row of the data; NULL if the row number is outside
- * the allowed range.
+ * the allowed range or the data could not be read.
  *
  * header: fromfile.h
  */
@@ -196,7 +256,12 @@ extern double *fromfile_row(FROMFILE *ff, unsigned long row) {
 		unsigned int i;
 		double *data = (double *) malloc ((*ff).n_cols * sizeof(double));
 		for (i = 0; i < (*ff).n_cols; i++) {
-			data[i] = (*ff).data[row][i];
+			if (load_column(ff, i) == NULL) {
+				free(data);
+				return NULL;
+			} else {
+				data[i] = (*ff).data[i][row];
+			}
 		}
 		return data;
 	} else {
@@ -205,3 +270,394 @@ extern double *fromfile_row(FROMFILE *ff, unsigned long row) {
 
 }
 
+
+/*
+ * Determine whether or not a file is in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * name: 	The name of the file
+ *
+ * Returns
+ * =======
+ * 1 if the first line of the file is BINARY_OUTPUT_TAG, 0 otherwise.
+ */
+static unsigned short is_binary_file(char *name) {
+
+	FILE *in = fopen(name, "rb");
+	if (in == NULL) return 0u;
+	char line[MAX_LABEL_SIZE];
+	unsigned short binary = (fgets(line, MAX_LABEL_SIZE, in) != NULL &&
+		!strcmp(line, BINARY_OUTPUT_TAG "\n"));
+	fclose(in);
+	return binary;
+
+}
+
+
+/*
+ * Read the header of a file in binary columnar format into the fromfile
+ * object and map the file into memory.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ *
+ * Returns
+ * =======
+ * 0 on success; 1 if the header is not formatted correctly, the file contains
+ * no data, or the file is shorter than the header says.
+ *
+ * Notes
+ * =====
+ * See write_binary_header in vice/src/io/utils.h for details on the format.
+ */
+static unsigned short read_binary_header(FROMFILE *ff) {
+
+	FILE *in = fopen((*ff).name, "rb");
+	if (in == NULL) return 1u;
+
+	unsigned short status = 1u, native = 1u;
+	unsigned int size;
+	char *line = (char *) malloc (LINESIZE * sizeof(char));
+	char *word = (char *) malloc (LINESIZE * sizeof(char));
+	char type;
+	ff -> n_cols = 0u;
+	ff -> n_rows = 0ul;
+	while (fgets(line, LINESIZE, in) != NULL) {
+		if (!strncmp(line, "# end", 5)) {
+			status = 0u;
+			break;
+		} else if (sscanf(line, "# byteorder: %s", word) == 1) {
+			native = !strcmp(word, little_endian() ? "little" : "big");
+		} else if (sscanf(line, "# rows: %lu", &(ff -> n_rows)) == 1) {
+			continue;
+		} else if (sscanf(line, "# column: %*s %c%u", &type, &size) == 2) {
+			/* only the types VICE writes are recognized */
+			if (type == 'f' && size == sizeof(double)) {
+				type = 'd';
+			} else if (type == 'u' && size == sizeof(unsigned int)) {
+				type = 'u';
+			} else break;
+			ff -> types = (char *) realloc (ff -> types,
+				((*ff).n_cols + 1u) * sizeof(char));
+			ff -> types[ff -> n_cols++] = type;
+		} else if (line[0] != '#') {
+			break;
+		} else {}
+	}
+	free(line);
+	free(word);
+	if (status || !(*ff).n_rows || !(*ff).n_cols) {
+		fclose(in);
+		ff -> n_cols = 0u;
+		return 1u;
+	} else {}
+
+	unsigned int i;
+	ff -> swap = !native;
+	ff -> offsets = (unsigned long *) malloc ((*ff).n_cols *
+		sizeof(unsigned long));
+	ff -> offsets[0] = (unsigned long) ftell(in);
+	for (i = 1u; i < (*ff).n_cols; i++) {
+		ff -> offsets[i] = (*ff).offsets[i - 1u] + (*ff).n_rows *
+			binary_column_size((*ff).types[i - 1u]);
+	}
+
+	/* Make sure the data are all there */
+	fseek(in, 0l, SEEK_END);
+	if ((unsigned long) ftell(in) < (*ff).offsets[(*ff).n_cols - 1u] +
+		(*ff).n_rows * binary_column_size((*ff).types[(*ff).n_cols - 1u])) {
+		fclose(in);
+		ff -> n_cols = 0u;
+		return 1u;
+	} else {}
+
+	fclose(in);
+	map_file(ff);
+	ff -> data = (double **) calloc ((*ff).n_cols, sizeof(double *));
+	return 0u;
+
+}
+
+
+/*
+ * Determine the number of bytes taken up by each value in a column of a file
+ * in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * type: 	The type of the column, as stored in the fromfile object
+ *
+ * Returns
+ * =======
+ * sizeof(unsigned int) for type 'u' and sizeof(double) otherwise
+ */
+static unsigned short binary_column_size(char type) {
+
+	return type == 'u' ? sizeof(unsigned int) : sizeof(double);
+
+}
+
+
+/*
+ * Map the file associated with a fromfile object into memory.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ *
+ * Notes
+ * =====
+ * The mapping is private and writable, such that columns of binary files can
+ * be modified in place without changing the file. If the file cannot be
+ * mapped, ff -> map is left NULL and the data are read from the file instead.
+ */
+static void map_file(FROMFILE *ff) {
+
+	ff -> map = NULL;
+	ff -> map_size = 0ul;
+	FILE *in = fopen((*ff).name, "rb");
+	if (in == NULL) return;
+	fseek(in, 0l, SEEK_END);
+	long size = ftell(in);
+	if (size > 0l) {
+		void *map = mmap(NULL, (size_t) size, PROT_READ | PROT_WRITE,
+			MAP_PRIVATE, fileno(in), 0);
+		if (map != MAP_FAILED) {
+			ff -> map = map;
+			ff -> map_size = (unsigned long) size;
+		} else {}
+	} else {}
+	fclose(in);
+
+}
+
+
+/*
+ * Obtain a column of the fromfile object, reading it in if it has not been
+ * already.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ * col: 	The index of the column
+ *
+ * Returns
+ * =======
+ * (*ff).data[col], or NULL if the data could not be read
+ */
+static double *load_column(FROMFILE *ff, unsigned int col) {
+
+	if ((*ff).data[col] != NULL) {
+		return (*ff).data[col];
+	} else if ((*ff).offsets == NULL) {
+		return load_ascii_data(ff) ? NULL : (*ff).data[col];
+	} else {
+		return load_binary_column(ff, col);
+	}
+
+}
+
+
+/*
+ * Read in the data from an ascii file, storing each column that has not been
+ * assigned already.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * Notes
+ * =====
+ * The columns which have not been assigned are those in the file, since
+ * those added by fromfile_new_column are stored as they are created.
+ */
+static unsigned short load_ascii_data(FROMFILE *ff) {
+
+	unsigned int i, n = 0u;
+	unsigned int *cols = (unsigned int *) malloc ((*ff).n_cols *
+		sizeof(unsigned int));
+	for (i = 0u; i < (*ff).n_cols; i++) {
+		if ((*ff).data[i] == NULL) {
+			ff -> data[i] = (double *) malloc ((*ff).n_rows * sizeof(double));
+			cols[n++] = i;
+		} else {}
+	}
+
+	unsigned short status;
+	if ((*ff).map != NULL) {
+		status = parse_mapped_ascii(ff, cols, n);
+		if (!status) {
+			/* Nothing points into the mapping of an ascii file */
+			munmap(ff -> map, (*ff).map_size);
+			ff -> map = NULL;
+			ff -> map_size = 0ul;
+		} else {}
+	} else {
+		status = read_ascii(ff, cols, n);
+	}
+
+	if (status) {
+		for (i = 0u; i < n; i++) {
+			free(ff -> data[cols[i]]);
+			ff -> data[cols[i]] = NULL;
+		}
+	} else {}
+	free(cols);
+	return status;
+
+}
+
+
+/*
+ * Parse the data from an ascii file mapped into memory.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ * cols: 	The indices of the columns of the fromfile object to store each
+ * 			column of the file in
+ * n: 		The number of columns in the file
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if there are fewer values in the file than expected
+ */
+static unsigned short parse_mapped_ascii(FROMFILE *ff, unsigned int *cols,
+	unsigned int n) {
+
+	/*
+	 * The mapping is not null-terminated, so each value is copied into a
+	 * buffer before being converted. None of the values VICE reads are
+	 * anywhere near this long.
+	 */
+	char token[MAX_LABEL_SIZE];
+	char *p = (char *) (*ff).map, *end = p + (*ff).map_size, *tail;
+
+	/* Read passed the header */
+	while (p < end && *p == '#') {
+		p = (char *) memchr(p, '\n', (size_t) (end - p));
+		if (p == NULL) return 1u;
+		p++;
+	}
+
+	unsigned long i;
+	unsigned int j, length;
+	for (i = 0ul; i < (*ff).n_rows; i++) {
+		for (j = 0u; j < n; j++) {
+			while (p < end && isspace(*p)) p++;
+			length = 0u;
+			while (p < end && !isspace(*p) && length < MAX_LABEL_SIZE - 1l) {
+				token[length++] = *p++;
+			}
+			token[length] = '\0';
+			ff -> data[cols[j]][i] = strtod(token, &tail);
+			if (tail == token) return 1u;
+		}
+	}
+	return 0u;
+
+}
+
+
+/*
+ * Read in the data from an ascii file which could not be mapped into memory.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ * cols: 	The indices of the columns of the fromfile object to store each
+ * 			column of the file in
+ * n: 		The number of columns in the file
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ */
+static unsigned short read_ascii(FROMFILE *ff, unsigned int *cols,
+	unsigned int n) {
+
+	double **rows = read_square_ascii_file((*ff).name);
+	if (rows == NULL) return 1u;
+	unsigned long i;
+	unsigned int j;
+	for (i = 0ul; i < (*ff).n_rows; i++) {
+		for (j = 0u; j < n; j++) ff -> data[cols[j]][i] = rows[i][j];
+		free(rows[i]);
+	}
+	free(rows);
+	return 0u;
+
+}
+
+
+/*
+ * Read in a single column from a file in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ * col: 	The index of the column
+ *
+ * Returns
+ * =======
+ * (*ff).data[col], or NULL if the data could not be read
+ */
+static double *load_binary_column(FROMFILE *ff, unsigned int col) {
+
+	unsigned short size = binary_column_size((*ff).types[col]);
+	unsigned long i, n_bytes = (*ff).n_rows * size;
+
+	if ((*ff).map != NULL && (*ff).types[col] == 'd' && !(*ff).swap &&
+		!((*ff).offsets[col] % sizeof(double))) {
+		/* No copy required */
+		ff -> data[col] = (double *) ((char *) (*ff).map + (*ff).offsets[col]);
+		return (*ff).data[col];
+	} else {}
+
+	unsigned char *raw = (unsigned char *) malloc (n_bytes);
+	if ((*ff).map != NULL) {
+		memcpy(raw, (char *) (*ff).map + (*ff).offsets[col], n_bytes);
+	} else {
+		FILE *in = fopen((*ff).name, "rb");
+		if (in == NULL || fseek(in, (long) (*ff).offsets[col], SEEK_SET) ||
+			fread(raw, size, (*ff).n_rows, in) != (*ff).n_rows) {
+			if (in != NULL) fclose(in);
+			free(raw);
+			return NULL;
+		} else {
+			fclose(in);
+		}
+	}
+
+	if ((*ff).swap) {
+		unsigned short j;
+		for (i = 0ul; i < (*ff).n_rows; i++) {
+			for (j = 0u; j < size / 2u; j++) {
+				unsigned char byte = raw[i * size + j];
+				raw[i * size + j] = raw[i * size + size - 1u - j];
+				raw[i * size + size - 1u - j] = byte;
+			}
+		}
+	} else {}
+
+	ff -> data[col] = (double *) malloc ((*ff).n_rows * sizeof(double));
+	for (i = 0ul; i < (*ff).n_rows; i++) {
+		if ((*ff).types[col] == 'u') {
+			unsigned int value;
+			memcpy(&value, raw + i * size, size);
+			ff -> data[col][i] = (double) value;
+		} else {
+			memcpy(&(ff -> data[col][i]), raw + i * size, size);
+		}
+	}
+	free(raw);
+	return (*ff).data[col];
+
+}
+
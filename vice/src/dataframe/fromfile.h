@@ -9,7 +9,7 @@ extern "C" {
 #include "../objects.h"
 
 /*
- * Read in the data in a file into the fromfile object
+ * Read in the header of a file into the fromfile object
  *
  * Parameters
  * ==========
@@ -19,6 +19,12 @@ extern "C" {
  * =======
  * 0 on success from reading the file; 1 on failure
  *
+ * Notes
+ * =====
+ * The data themselves are read in as columns are accessed. Files in binary
+ * columnar format are recognized by their first line (see BINARY_OUTPUT_TAG
+ * in vice/src/io.h).
+ *
  * source: fromfile.c
  */
 extern unsigned short fromfile_read(FROMFILE *ff);
@@ -33,12 +39,33 @@ extern unsigned short fromfile_read(FROMFILE *ff);
  *
  * Returns
  * =======
- * A double pointer to that column of the data; NULL if the label is not found.
+ * A double pointer to a copy of that column of the data; NULL if the label is
+ * not found or the data could not be read.
  *
  * source: fromfile.c
  */
 extern double *fromfile_column(FROMFILE *ff, char *label);
 
+/*
+ * Access a column of the fromfile object based on its label without copying
+ * it.
+ *
+ * Parameters
+ * ==========
+ * ff: 		A pointer to the fromfile object
+ * label: 	The label of the column to access
+ *
+ * Returns
+ * =======
+ * A pointer to the column as it is stored in the fromfile object, reading it
+ * in from the file if it has not been already; NULL if the label is not found
+ * or the data could not be read. This memory belongs to the fromfile object
+ * and must not be freed or modified by the caller.
+ *
+ * source: fromfile.c
+ */
+extern double *fromfile_column_pointer(FROMFILE *ff, char *label);
+
 /*
  * Modify a column of the data in a fromfile object
  *
@@ -87,7 +114,7 @@ extern unsigned short fromfile_new_column(FROMFILE *ff, char *label,
  * Returns
  * =======
  * A double pointer to that row of the data; NULL if the row number is outside
- * the allowed range.
+ * the allowed range or the data could not be read.
  *
  * source: fromfile.c
  */
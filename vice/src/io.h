@@ -15,6 +15,16 @@ extern "C" {
 #define MAX_FILENAME_SIZE 10000l
 #endif /* MAX_FILENAME_SIZE */
 
+/* The maximum number of characters in the column labels of output files */
+#ifndef MAX_LABEL_SIZE
+#define MAX_LABEL_SIZE 100l
+#endif /* MAX_LABEL_SIZE */
+
+/* The first line of output files written in binary columnar format */
+#ifndef BINARY_OUTPUT_TAG
+#define BINARY_OUTPUT_TAG "# VICE binary output"
+#endif /* BINARY_OUTPUT_TAG */
+
 #include "objects.h"
 #include "io/agb.h"
 #include "io/ccsne.h"
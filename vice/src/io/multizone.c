@@ -12,6 +12,9 @@
 #include "multizone.h"
 #include "progressbar.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned short tracer_in_output(MULTIZONE mz, unsigned long index);
+
 /*
  * Writes history output for each zone in a multizone simulation
  *
@@ -24,15 +27,12 @@
 extern void write_multizone_history(MULTIZONE mz) {
 
 	unsigned int i;
-	double *mstar = multizone_stellar_mass(mz);
-	double *recycled = gas_recycled_in_zones(mz);
-	double **unretained = multizone_unretained(mz);
+	double *mstar = multizone_stellar_mass(mz, (*mz.ws).mstar);
+	double *recycled = gas_recycled_in_zones(mz, (*mz.ws).gas_recycled);
+	double **unretained = multizone_unretained(mz, (*mz.ws).unretained);
 	for (i = 0u; i < (*mz.mig).n_zones; i++) {
-		write_zone_history(*mz.zones[i], mstar[i], recycled[i], unretained[i]);
+		write_zone_history(mz.zones[i], mstar[i], recycled[i], unretained[i]);
 	}
-	free(unretained);
-	free(mstar);
-	free(recycled);
 
 }
 
@@ -99,6 +99,9 @@ extern void write_tracers_header(MULTIZONE mz) {
 	 * zone numbers.
 	 */
 
+	/* The binary header is written along with the data */
+	if (mz.binary) return;
+
 	fprintf((*mz.mig).tracers_output, "# COLUMN NUMBERS: \n");
 	fprintf((*mz.mig).tracers_output, "#\t0: Formation_time [Gyr]\n");
 	fprintf((*mz.mig).tracers_output, "#\t1: Zone_origin\n");
@@ -134,35 +137,39 @@ extern void write_tracers_output(MULTIZONE mz) {
 	 * zone numbers.
 	 */
 
+	if (mz.binary) {
+		write_tracers_binary(mz);
+		return;
+	} else {}
+
 	PROGRESSBAR *pb;
 	if (mz.verbose) {
 		printf("Saving star particle data....\n");
 		pb = progressbar_initialize((*mz.mig).tracer_count);
 	} else {}
 	unsigned long i;
+	TRACER t = *(*mz.mig).tracers;
 	for (i = 0l; i < (*mz.mig).tracer_count; i++) {
 		FILE *out = (*mz.mig).tracers_output;
-		TRACER t = *(*mz.mig).tracers[i];
-		SINGLEZONE origin = *(mz.zones[t.zone_origin]);
+		SINGLEZONE origin = *(mz.zones[t.zone_origin[i]]);
 
 		/*
 		 * If the tracer particle formed **before** the user's specified
 		 * final output time.
 		 */
-		if (t.timestep_origin * origin.dt <=
-			origin.output_times[origin.n_outputs - 1l]) {
+		if (tracer_in_output(mz, i)) {
 
 			/* Formation time, final and origin zones, and mass in Msun */
-			fprintf(out, "%e\t", t.timestep_origin * origin.dt);
-			fprintf(out, "%u\t", t.zone_origin);
-			fprintf(out, "%u\t", t.zone_current);
-			fprintf(out, "%e\t", t.mass);
+			fprintf(out, "%e\t", t.timestep_origin[i] * origin.dt);
+			fprintf(out, "%u\t", t.zone_origin[i]);
+			fprintf(out, "%u\t", t.zone_current[i]);
+			fprintf(out, "%e\t", t.mass[i]);
 
 			/* Metallicity by mass of each element in the simulation */
 			unsigned int j;
 			for (j = 0; j < origin.n_elements; j++) {
 				fprintf(out, "%e\t",
-					(*origin.elements[j]).Z[t.timestep_origin]);
+					(*origin.elements[j]).Z[t.timestep_origin[i]]);
 			}
 			fprintf(out, "\n");
 
@@ -198,3 +205,110 @@ extern void multizone_close_tracer_file(MULTIZONE *mz) {
 
 }
 
+/*
+ * Writes the tracer data to the output file in binary columnar format at the
+ * end of a multizone simulation
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object
+ *
+ * header: multizone.h
+ */
+extern void write_tracers_binary(MULTIZONE mz) {
+
+	/*
+	 * The same columns as the ascii output, with the zone numbers stored as
+	 * unsigned integers. Only tracer particles which formed before the final
+	 * output time are included, as in the ascii output.
+	 */
+	unsigned int i, n_cols = 4u + (*mz.zones[0]).n_elements;
+	unsigned long j, n_rows = 0ul;
+	TRACER t = *(*mz.mig).tracers;
+	FILE *out = (*mz.mig).tracers_output;
+	for (j = 0ul; j < (*mz.mig).tracer_count; j++) {
+		n_rows += tracer_in_output(mz, j);
+	}
+	if (mz.verbose) printf("Saving star particle data....\n");
+
+	char **labels = (char **) malloc (n_cols * sizeof(char *));
+	char *types = (char *) malloc ((n_cols + 1u) * sizeof(char));
+	char *base[4] = {"formation_time", "zone_origin", "zone_final", "mass"};
+	for (i = 0u; i < n_cols; i++) {
+		labels[i] = (char *) malloc (MAX_LABEL_SIZE * sizeof(char));
+		if (i < 4u) {
+			strcpy(labels[i], base[i]);
+		} else {
+			sprintf(labels[i], "z(%s)",
+				(*(*mz.zones[0]).elements[i - 4u]).symbol);
+		}
+		types[i] = (i == 1u || i == 2u) ? 'u' : 'd';
+	}
+	types[n_cols] = '\0';
+	write_binary_header(out, labels, types, n_cols, n_rows);
+
+	double *column = (double *) malloc (n_rows * sizeof(double));
+	unsigned int *zones = (unsigned int *) malloc (n_rows * sizeof(
+		unsigned int));
+	for (i = 0u; i < n_cols; i++) {
+		unsigned long n = 0ul;
+		for (j = 0ul; j < (*mz.mig).tracer_count; j++) {
+			if (!tracer_in_output(mz, j)) continue;
+			SINGLEZONE origin = *(mz.zones[t.zone_origin[j]]);
+			switch (i) {
+				case 0:
+					column[n] = t.timestep_origin[j] * origin.dt;
+					break;
+				case 1:
+					zones[n] = t.zone_origin[j];
+					break;
+				case 2:
+					zones[n] = t.zone_current[j];
+					break;
+				case 3:
+					column[n] = t.mass[j];
+					break;
+				default:
+					column[n] = (*origin.elements[i - 4u]).Z[
+						t.timestep_origin[j]];
+					break;
+			}
+			n++;
+		}
+		if (types[i] == 'u') {
+			fwrite(zones, sizeof(unsigned int), n_rows, out);
+		} else {
+			fwrite(column, sizeof(double), n_rows, out);
+		}
+		free(labels[i]);
+	}
+
+	free(column);
+	free(zones);
+	free(labels);
+	free(types);
+
+}
+
+/*
+ * Determine whether or not a tracer particle is included in the output.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object
+ * index: 		The index of the tracer particle
+ *
+ * Returns
+ * =======
+ * 1 if the tracer particle formed before the user's specified final output
+ * time, 0 otherwise.
+ */
+static unsigned short tracer_in_output(MULTIZONE mz, unsigned long index) {
+
+	TRACER t = *(*mz.mig).tracers;
+	SINGLEZONE origin = *(mz.zones[t.zone_origin[index]]);
+	return t.timestep_origin[index] * origin.dt <=
+		origin.output_times[origin.n_outputs - 1l];
+
+}
+
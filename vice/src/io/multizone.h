@@ -69,6 +69,18 @@ extern void write_tracers_header(MULTIZONE mz);
  */
 extern void write_tracers_output(MULTIZONE mz);
 
+/*
+ * Writes the tracer data to the output file in binary columnar format at the
+ * end of a multizone simulation
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object
+ *
+ * source: multizone.c
+ */
+extern void write_tracers_binary(MULTIZONE mz);
+
 /*
  * Closes the tracer output file at the end of a multizone simulation
  *
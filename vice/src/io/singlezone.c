@@ -12,6 +12,10 @@
 #include "../io.h"
 #include "singlezone.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned int history_n_cols(SINGLEZONE sz);
+static void write_mdf_binary(SINGLEZONE sz);
+
 /*
  * Open the history.out and mdf.out output files associated with a SINGLEZONE
  * object.
@@ -48,16 +52,23 @@ extern unsigned short singlezone_open_files(SINGLEZONE *sz) {
 
 /*
  * Close the history.out and mdf.out output files associated with a SINGLEZONE
- * object and sets their values back to NULL.
+ * object and sets their values back to NULL. In binary mode, the history
+ * output recorded over the course of the simulation is written first.
  *
  * header: singlezone.h
  */
 extern void singlezone_close_files(SINGLEZONE *sz) {
 
 	if ((*sz).history_writer != NULL) {
+		if ((*sz).binary) write_history_binary(*sz);
 		fclose(sz -> history_writer);
 		sz -> history_writer = NULL;
 	} else {}
+	if ((*sz).history_buffer != NULL) {
+		free(sz -> history_buffer);
+		sz -> history_buffer = NULL;
+		sz -> history_rows = 0ul;
+	} else {}
 	if ((*sz).mdf_writer != NULL) {
 		fclose(sz -> mdf_writer);
 		sz -> mdf_writer = NULL;
@@ -87,6 +98,9 @@ extern void write_history_header(SINGLEZONE sz) {
 	 * high n_elements.
 	 */
 
+	/* The binary header is written along with the data at the end */
+	if (sz.binary) return;
+
 	fprintf(sz.history_writer, "# COLUMN NUMBERS: \n");
 	fprintf(sz.history_writer, "#\t0: time [Gyr]\n");
 	fprintf(sz.history_writer, "#\t1: mgas [Msun]\t\t\tISM gas mass\n");
@@ -128,17 +142,15 @@ extern void write_history_header(SINGLEZONE sz) {
  *
  * Parameters
  * ==========
- * sz: 		The SINGLEZONE struct for the current simulation
- * mstar: 	The stellar mass in the zone. This will differ between singlezone
- * 			and multizone simulations due to stellar migration.
+ * sz: 		A pointer to the SINGLEZONE struct for the current simulation
  *
  * header: singlezone.h
  */
-extern void write_singlezone_history(SINGLEZONE sz) {
+extern void write_singlezone_history(SINGLEZONE *sz) {
 
-	double *unretained = singlezone_unretained(sz);
-	write_zone_history(sz, singlezone_stellar_mass(sz), mass_recycled(sz, NULL),
-		unretained);
+	double *unretained = singlezone_unretained(*sz);
+	write_zone_history(sz, singlezone_stellar_mass(*sz),
+		mass_recycled(*sz, NULL), unretained);
 	free(unretained);
 
 }
@@ -149,7 +161,7 @@ extern void write_singlezone_history(SINGLEZONE sz) {
  *
  * Parameters
  * ==========
- * sz: 				The singlezone object associated with the zone
+ * sz: 				A pointer to the singlezone object associated with the zone
  * mstar: 			The stellar mass in the zone
  * mass_recycled: 	The recycled mass in the zone
  * unretained: 		The amount of mass unretained in the given zone for each
@@ -157,7 +169,7 @@ extern void write_singlezone_history(SINGLEZONE sz) {
  *
  * header: singlezone.h
  */
-extern void write_zone_history(SINGLEZONE sz, double mstar,
+extern void write_zone_history(SINGLEZONE *sz, double mstar,
 	double mass_recycled, double *unretained) {
 
 	/*
@@ -186,7 +198,8 @@ extern void write_zone_history(SINGLEZONE sz, double mstar,
 	 * units.
 	 */
 
-	if (sz.current_time < sz.output_times[sz.n_outputs - 1l] + sz.dt) {
+	SINGLEZONE z = *sz;
+	if (z.current_time < z.output_times[z.n_outputs - 1l] + z.dt) {
 
 		/*
 		 * Only write output if the time is actually in the window the user
@@ -194,46 +207,128 @@ extern void write_zone_history(SINGLEZONE sz, double mstar,
 		 * timesteps from being written to the output file.
 		 */
 
-		fprintf(sz.history_writer, "%e\t", sz.current_time);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).mass);
-		fprintf(sz.history_writer, "%e\t", mstar);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).star_formation_rate / 1e9);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).infall_rate / 1e9);
-		fprintf(sz.history_writer, "%e\t",
-			(get_outflow_rate(sz) + sum(unretained, sz.n_elements)) / 1e9);
-		fprintf(sz.history_writer, "%e\t", (*sz.ism).eta[sz.timestep]);
-		if ((*sz.ssp).continuous) {
+		unsigned int i, n = 0u;
+		double *row = (double *) malloc (history_n_cols(z) * sizeof(double));
+		row[n++] = z.current_time;
+		row[n++] = (*z.ism).mass;
+		row[n++] = mstar;
+		row[n++] = (*z.ism).star_formation_rate / 1e9;
+		row[n++] = (*z.ism).infall_rate / 1e9;
+		row[n++] = (get_outflow_rate(z) + sum(unretained, z.n_elements)) / 1e9;
+		row[n++] = (*z.ism).eta[z.timestep];
+		if ((*z.ssp).continuous) {
 			/* effective recycling factor in case of continuous recycling */
-			fprintf(sz.history_writer, "%e\t", mass_recycled /
-				((*sz.ism).star_formation_rate * sz.dt));
+			row[n++] = mass_recycled / ((*z.ism).star_formation_rate * z.dt);
 		} else {
 			/* instantaneous recycling parameter otherwise */
-			fprintf(sz.history_writer, "%e\t", (*sz.ssp).R0);
+			row[n++] = (*z.ssp).R0;
 		}
-		unsigned int i;
-		for (i = 0; i < sz.n_elements; i++) {
+		for (i = 0; i < z.n_elements; i++) {
 			/* infall metallicity */
-			fprintf(sz.history_writer, "%e\t",
-				(*sz.elements[i]).Zin[sz.timestep] +
-				(*sz.elements[i]).primordial);
+			row[n++] = (*z.elements[i]).Zin[z.timestep] + (
+				*z.elements[i]).primordial;
 		}
-		for (i = 0; i < sz.n_elements; i++) {
+		for (i = 0; i < z.n_elements; i++) {
 			/* outflow metallicity = enhancement factor x ISM metallicity */
-			fprintf(sz.history_writer, "%e\t",
-				((*sz.ism).enh[sz.timestep] * (*sz.elements[i]).Z[sz.timestep] *
-					get_outflow_rate(sz) + unretained[i]) /
-				(get_outflow_rate(sz) + sum(unretained, sz.n_elements)));
+			row[n++] = ((*z.ism).enh[z.timestep] * (*z.elements[i]).Z[
+				z.timestep] * get_outflow_rate(z) + unretained[i]) / (
+				get_outflow_rate(z) + sum(unretained, z.n_elements));
 		}
-		for (i = 0; i < sz.n_elements; i++) {
+		for (i = 0; i < z.n_elements; i++) {
 			/* total ISM mass of each element */
-			fprintf(sz.history_writer, "%e\t", (*sz.elements[i]).mass);
+			row[n++] = (*z.elements[i]).mass;
 		}
-		fprintf(sz.history_writer, "\n");
+
+		if (z.binary) {
+			/*
+			 * Keep the row until the end of the simulation, doubling the
+			 * size of the buffer whenever the number of rows reaches a power
+			 * of two.
+			 */
+			if (!(z.history_rows & (z.history_rows - 1ul))) {
+				sz -> history_buffer = (double *) realloc (sz -> history_buffer,
+					(z.history_rows ? 2ul * z.history_rows : 1ul) * n *
+					sizeof(double));
+			} else {}
+			for (i = 0u; i < n; i++) {
+				sz -> history_buffer[z.history_rows * n + i] = row[i];
+			}
+			sz -> history_rows++;
+		} else {
+			for (i = 0u; i < n; i++) fprintf(z.history_writer, "%e\t", row[i]);
+			fprintf(z.history_writer, "\n");
+		}
+		free(row);
 
 	} else {}
 
 }
 
+/*
+ * Write the history output recorded over the course of a simulation to the
+ * history.out file in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation
+ *
+ * header: singlezone.h
+ */
+extern void write_history_binary(SINGLEZONE sz) {
+
+	unsigned int i, n_cols = history_n_cols(sz);
+	unsigned long j;
+	char **labels = (char **) malloc (n_cols * sizeof(char *));
+	char *types = (char *) malloc ((n_cols + 1u) * sizeof(char));
+	char *base[8] = {"time", "mgas", "mstar", "sfr", "ifr", "ofr", "eta_0",
+		"r_eff"};
+	char *prefixes[3] = {"z_in", "z_out", "mass"};
+	for (i = 0u; i < n_cols; i++) {
+		labels[i] = (char *) malloc (MAX_LABEL_SIZE * sizeof(char));
+		if (i < 8u) {
+			strcpy(labels[i], base[i]);
+		} else {
+			sprintf(labels[i], "%s(%s)", prefixes[(i - 8u) / sz.n_elements],
+				(*sz.elements[(i - 8u) % sz.n_elements]).symbol);
+		}
+		types[i] = 'd';
+	}
+	types[n_cols] = '\0';
+	write_binary_header(sz.history_writer, labels, types, n_cols,
+		sz.history_rows);
+
+	double *column = (double *) malloc (sz.history_rows * sizeof(double));
+	for (i = 0u; i < n_cols; i++) {
+		for (j = 0ul; j < sz.history_rows; j++) {
+			column[j] = sz.history_buffer[j * n_cols + i];
+		}
+		fwrite(column, sizeof(double), sz.history_rows, sz.history_writer);
+		free(labels[i]);
+	}
+	free(column);
+	free(labels);
+	free(types);
+
+}
+
+/*
+ * Determine the number of columns in a zone's history output.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation
+ *
+ * Returns
+ * =======
+ * The eight evolutionary parameters plus the inflow metallicity, outflow
+ * metallicity, and ISM mass of each element.
+ */
+static unsigned int history_n_cols(SINGLEZONE sz) {
+
+	return 8u + 3u * sz.n_elements;
+
+}
+
 /*
  * Writes the header to the mdf output file.
  *
@@ -250,8 +345,10 @@ extern void write_mdf_header(SINGLEZONE sz) {
 	 * probability densities of stars in that [X/H] logarithmic abundance, and
 	 * subsequent columns thereafter are the probability densities of stars in
 	 * that [X/Y] logarithmic abundance ratio for each combination of elements.
+	 * The binary header is written along with the data at the end.
 	 */
 
+	if (sz.binary) return;
 	unsigned int i, j;
 	fprintf(sz.mdf_writer, "# bin_edge_left\tbin_edge_right\t");
 	for (i = 0; i < sz.n_elements; i++) {
@@ -278,6 +375,11 @@ extern void write_mdf_header(SINGLEZONE sz) {
  */
 extern void write_mdf_output(SINGLEZONE sz) {
 
+	if (sz.binary) {
+		write_mdf_binary(sz);
+		return;
+	} else {}
+
  	/* n: The number of abundance ratios reported */
 	unsigned int j;
 	unsigned long i, n = (unsigned long) (sz.n_elements *
@@ -298,3 +400,54 @@ extern void write_mdf_output(SINGLEZONE sz) {
 
 }
 
+/*
+ * Write the mdf.out output file in binary columnar format at the final
+ * timestep.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation
+ */
+static void write_mdf_binary(SINGLEZONE sz) {
+
+	/* The bin edges, then each [X/H] and each [X/Y] as in the ascii header */
+	unsigned int i, j, n = 2u + sz.n_elements * (sz.n_elements + 1u) / 2u;
+	char **labels = (char **) malloc (n * sizeof(char *));
+	char *types = (char *) malloc ((n + 1u) * sizeof(char));
+	for (i = 0u; i < n; i++) {
+		labels[i] = (char *) malloc (MAX_LABEL_SIZE * sizeof(char));
+		types[i] = 'd';
+	}
+	types[n] = '\0';
+	strcpy(labels[0], "bin_edge_left");
+	strcpy(labels[1], "bin_edge_right");
+	n = 2u;
+	for (i = 0u; i < sz.n_elements; i++) {
+		sprintf(labels[n++], "dn/d[%s/h]", (*sz.elements[i]).symbol);
+	}
+	for (i = 1u; i < sz.n_elements; i++) {
+		for (j = 0u; j < i; j++) {
+			sprintf(labels[n++], "dn/d[%s/%s]", (*sz.elements[i]).symbol,
+				(*sz.elements[j]).symbol);
+		}
+	}
+	write_binary_header(sz.mdf_writer, labels, types, n, (*sz.mdf).n_bins);
+
+	fwrite((*sz.mdf).bins, sizeof(double), (*sz.mdf).n_bins, sz.mdf_writer);
+	fwrite((*sz.mdf).bins + 1ul, sizeof(double), (*sz.mdf).n_bins,
+		sz.mdf_writer);
+	for (i = 0u; i < sz.n_elements; i++) {
+		fwrite((*sz.mdf).abundance_distributions[i], sizeof(double),
+			(*sz.mdf).n_bins, sz.mdf_writer);
+	}
+	for (i = 0u; i < n - 2u - sz.n_elements; i++) {
+		fwrite((*sz.mdf).ratio_distributions[i], sizeof(double),
+			(*sz.mdf).n_bins, sz.mdf_writer);
+	}
+
+	for (i = 0u; i < n; i++) free(labels[i]);
+	free(labels);
+	free(types);
+
+}
+
@@ -22,7 +22,8 @@ extern unsigned short singlezone_open_files(SINGLEZONE *sz);
 
 /*
  * Close the history.out and mdf.out output files associated with a SINGLEZONE
- * object.
+ * object and sets their values back to NULL. In binary mode, the history
+ * output recorded over the course of the simulation is written first.
  *
  * source: singlezone.c
  */
@@ -44,11 +45,11 @@ extern void write_history_header(SINGLEZONE sz);
  *
  * Parameters
  * ==========
- * sz: 		The SINGLEZONE struct for the current simulation
+ * sz: 		A pointer to the SINGLEZONE struct for the current simulation
  *
  * source: singlezone.c
  */
-extern void write_singlezone_history(SINGLEZONE sz);
+extern void write_singlezone_history(SINGLEZONE *sz);
 
 /*
  * Write a zone's history output, either in a singlezone simulation or
@@ -56,7 +57,7 @@ extern void write_singlezone_history(SINGLEZONE sz);
  *
  * Parameters
  * ==========
- * sz: 				The singlezone object associated with the zone
+ * sz: 				A pointer to the singlezone object associated with the zone
  * mstar: 			The stellar mass in the zone
  * mass_recycled: 	The recycled mass in the zone
  * unretained: 		The amount of mass unretained in the given zone for each
@@ -64,9 +65,21 @@ extern void write_singlezone_history(SINGLEZONE sz);
  *
  * source: singlezone.c
  */
-extern void write_zone_history(SINGLEZONE sz, double mstar,
+extern void write_zone_history(SINGLEZONE *sz, double mstar,
 	double mass_recycled, double *unretained);
 
+/*
+ * Write the history output recorded over the course of a simulation to the
+ * history.out file in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The singlezone object for the current simulation
+ *
+ * source: singlezone.c
+ */
+extern void write_history_binary(SINGLEZONE sz);
+
 /*
  * Writes the header to the mdf output file.
  *
@@ -217,3 +217,85 @@ extern long line_count(char *file) {
 
 }
 
+
+/*
+ * Write the header of an output file in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * out: 		The file to write to, positioned at its beginning
+ * labels: 		The label of each column
+ * types: 		The type of each column as one character per column: 'd' for
+ * 				double, 'u' for unsigned int, 'l' for unsigned long, and 'h'
+ * 				for unsigned short
+ * n_cols: 		The number of columns
+ * n_rows: 		The number of rows
+ *
+ * Notes
+ * =====
+ * The header is a series of lines of text, each beginning with '#':
+ *
+ * # VICE binary output
+ * # byteorder: <little or big>
+ * # rows: <n_rows>
+ * # column: <label> <dtype>
+ * ...
+ * # end
+ *
+ * with one line for each column, where dtype is e.g. f8 for 8-byte floating
+ * point and u4 for 4-byte unsigned integers. The final line is padded with
+ * spaces such that the data begins at a multiple of 8 bytes. Each column
+ * then follows the previous as n_rows contiguous values in the byte order of
+ * the machine that wrote them, which the caller writes with fwrite.
+ *
+ * header: utils.h
+ */
+extern void write_binary_header(FILE *out, char **labels, char *types,
+	unsigned int n_cols, unsigned long n_rows) {
+
+	unsigned int i;
+	fprintf(out, "%s\n", BINARY_OUTPUT_TAG);
+	fprintf(out, "# byteorder: %s\n", little_endian() ? "little" : "big");
+	fprintf(out, "# rows: %lu\n", n_rows);
+	for (i = 0u; i < n_cols; i++) {
+		if (types[i] == 'u') {
+			fprintf(out, "# column: %s u%lu\n", labels[i],
+				(unsigned long) sizeof(unsigned int));
+		} else if (types[i] == 'l') {
+			fprintf(out, "# column: %s u%lu\n", labels[i],
+				(unsigned long) sizeof(unsigned long));
+		} else if (types[i] == 'h') {
+			fprintf(out, "# column: %s u%lu\n", labels[i],
+				(unsigned long) sizeof(unsigned short));
+		} else {
+			fprintf(out, "# column: %s f%lu\n", labels[i],
+				(unsigned long) sizeof(double));
+		}
+	}
+	fprintf(out, "# end");
+	long length = ftell(out) + 1l;
+	while (length % 8l) {
+		fprintf(out, " ");
+		length++;
+	}
+	fprintf(out, "\n");
+
+}
+
+
+/*
+ * Determine the byte order of the machine.
+ *
+ * Returns
+ * =======
+ * 1 if the least significant byte is stored first, 0 otherwise.
+ *
+ * header: utils.h
+ */
+extern unsigned short little_endian(void) {
+
+	unsigned int x = 1u;
+	return *((unsigned char *) &x) == 1u;
+
+}
+
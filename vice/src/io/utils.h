@@ -6,6 +6,8 @@
 extern "C" {
 #endif /* __cplusplus */
 
+#include <stdio.h>
+
 /*
  * Reads in a square ascii file given the name of the file.
  *
@@ -71,6 +73,52 @@ extern int file_dimension(char *file);
  */
 extern long line_count(char *file);
 
+/*
+ * Write the header of an output file in binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * out: 		The file to write to, positioned at its beginning
+ * labels: 		The label of each column
+ * types: 		The type of each column as one character per column: 'd' for
+ * 				double, 'u' for unsigned int, 'l' for unsigned long, and 'h'
+ * 				for unsigned short
+ * n_cols: 		The number of columns
+ * n_rows: 		The number of rows
+ *
+ * Notes
+ * =====
+ * The header is a series of lines of text, each beginning with '#':
+ *
+ * # VICE binary output
+ * # byteorder: <little or big>
+ * # rows: <n_rows>
+ * # column: <label> <dtype>
+ * ...
+ * # end
+ *
+ * with one line for each column, where dtype is e.g. f8 for 8-byte floating
+ * point and u4 for 4-byte unsigned integers. The final line is padded with
+ * spaces such that the data begins at a multiple of 8 bytes. Each column
+ * then follows the previous as n_rows contiguous values in the byte order of
+ * the machine that wrote them, which the caller writes with fwrite.
+ *
+ * source: utils.c
+ */
+extern void write_binary_header(FILE *out, char **labels, char *types,
+	unsigned int n_cols, unsigned long n_rows);
+
+/*
+ * Determine the byte order of the machine.
+ *
+ * Returns
+ * =======
+ * 1 if the least significant byte is stored first, 0 otherwise.
+ *
+ * source: utils.c
+ */
+extern unsigned short little_endian(void);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
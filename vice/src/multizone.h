@@ -10,11 +10,13 @@ extern "C"{
 #include "objects/multizone.h"
 #include "multizone/agb.h"
 #include "multizone/channel.h"
+#include "multizone/cohorts.h"
 #include "multizone/element.h"
 #include "multizone/ism.h"
 #include "multizone/mdf.h"
 #include "multizone/migration.h"
 #include "multizone/multizone.h"
+#include "multizone/parallel.h"
 #include "multizone/recycling.h"
 #include "multizone/sneia.h"
 #include "multizone/tracer.h"
@@ -11,6 +11,11 @@
 #include "agb.h"
 #include "tracer.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static double tracer_AGB_mass(MULTIZONE mz, unsigned short index,
+	unsigned long i);
+
+
 /*
  * Determine the mass of a given element produced by AGB stars in each
  * zone.
@@ -29,32 +34,90 @@
  */
 extern double *m_AGB_from_tracers(MULTIZONE mz, unsigned short index) {
 
-	unsigned long i, timestep = (*mz.zones[0]).timestep;
+	unsigned long i;
+	TRACER *t = mz.mig -> tracers;
 	double *mass = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
 	for (i = 0l; i < (*mz.mig).n_zones; i++) {
 		mass[i] = 0;
 	}
 	for (i = 0l; i < (*mz.mig).tracer_count; i++) {
-		/*
-		 * Get the tracer particle's current zone and metallicity. Use the SSP
-		 * evolutionary parameters from the zone in which the tracer particle
-		 * was born.
-		 *
-		 * n: The number of timesteps ago the tracer particle formed.
-		 */
-		TRACER *t = mz.mig -> tracers[i];
-		SINGLEZONE *sz = mz.zones[(*t).zone_current];
-		SSP *ssp = mz.zones[(*t).zone_origin] -> ssp;
-		double Z = tracer_metallicity(mz, *t);
-		unsigned long n = timestep - (*t).timestep_origin;
-		mass[(*t).zone_current] += (
-			get_AGB_yield( *(*mz.zones[(*t).zone_origin]).elements[index],
-				Z, dying_star_mass(n * (*sz).dt, (*ssp).postMS, Z)) *
-			(*t).mass *
-			((*ssp).msmf[n] - (*ssp).msmf[n + 1l])
-		);
+		mass[(*t).zone_current[i]] += tracer_AGB_mass(mz, index, i);
 	}
 	return mass;
 
 }
 
+
+/*
+ * Determine the mass of a given element produced by AGB stars in one zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for the current simulation
+ * index: 		The index of the element to determine the mass production for
+ * zone: 		The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass of the given element produced in that zone in the next timestep by
+ * AGB stars. This is identical to the corresponding element of the array
+ * returned by m_AGB_from_tracers.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * header: agb.h
+ */
+extern double m_AGB_in_zone(MULTIZONE mz, unsigned short index,
+	unsigned int zone) {
+
+	unsigned long i;
+	TRACER *t = mz.mig -> tracers;
+	double mass = 0;
+	for (i = (*t).zone_offsets[zone]; i < (*t).zone_offsets[zone + 1u]; i++) {
+		mass += tracer_AGB_mass(mz, index, (*t).zone_members[i]);
+	}
+	return mass;
+
+}
+
+
+/*
+ * Determine the mass of a given element produced by AGB stars from one tracer
+ * particle.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for the current simulation
+ * index: 		The index of the element to determine the mass production for
+ * i: 			The index of the tracer particle
+ *
+ * Returns
+ * =======
+ * The mass of the given element produced in the next timestep by AGB stars
+ * from the stellar population the tracer particle represents.
+ */
+static double tracer_AGB_mass(MULTIZONE mz, unsigned short index,
+	unsigned long i) {
+
+	/*
+	 * Get the tracer particle's metallicity. Use the SSP evolutionary
+	 * parameters and the AGB star yields tabulated by setup_AGB in the zone
+	 * in which the tracer particle was born.
+	 *
+	 * n: The number of timesteps ago the tracer particle formed.
+	 */
+	TRACER *t = mz.mig -> tracers;
+	SINGLEZONE *origin = mz.zones[(*t).zone_origin[i]];
+	double Z = tracer_metallicity(mz, i);
+	unsigned long n = (*mz.zones[0]).timestep - (*t).timestep_origin[i];
+	return (
+		population_AGB_yield(*origin, *(*origin).elements[index], n, Z) *
+		(*t).mass[i] *
+		((*(*origin).ssp).msmf[n] - (*(*origin).ssp).msmf[n + 1l])
+	);
+
+}
+
@@ -26,6 +26,31 @@ extern "C" {
  */
 extern double *m_AGB_from_tracers(MULTIZONE mz, unsigned short index);
 
+/*
+ * Determine the mass of a given element produced by AGB stars in one zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for the current simulation
+ * index: 		The index of the element to determine the mass production for
+ * zone: 		The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass of the given element produced in that zone in the next timestep by
+ * AGB stars. This is identical to the corresponding element of the array
+ * returned by m_AGB_from_tracers.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * source: agb.c
+ */
+extern double m_AGB_in_zone(MULTIZONE mz, unsigned short index,
+	unsigned int zone);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -0,0 +1,276 @@
+/*
+ * This file implements per-zone aggregates of the tracer particles in VICE's
+ * multizone simulations.
+ *
+ * Notes
+ * =====
+ * Tracer particles born in the same zone at the same timestep form a cohort:
+ * they have the same mass, age, and metallicity, and differ only in the zone
+ * they currently reside in. Recycling and the stellar mass in each zone can
+ * therefore be computed from the number of particles from each cohort in each
+ * zone, which changes only when particles migrate. These sums then scale with
+ * the number of occupied zones per cohort rather than with the number of
+ * tracer particles.
+ */
+
+#include <stdlib.h>
+#include "../multizone.h"
+#include "../tracer.h"
+#include "cohorts.h"
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned long n_cohorts(MULTIZONE mz);
+
+
+/*
+ * Allocate memory for the cohort aggregates of the tracer particles. This
+ * must be called after malloc_tracers.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object for this simulation
+ *
+ * header: cohorts.h
+ */
+extern void malloc_cohorts(MULTIZONE *mz) {
+
+	TRACER *t = mz -> mig -> tracers;
+	unsigned long i, length = (*t).n_particles / (*(*mz).mig).n_tracers;
+	t -> cohort_width = (*(*mz).mig).n_tracers;
+	t -> cohort_zone = (unsigned int *) malloc ((*t).n_particles *
+		sizeof(unsigned int));
+	t -> cohort_count = (unsigned int *) malloc ((*t).n_particles *
+		sizeof(unsigned int));
+	t -> cohort_length = (unsigned int *) malloc (length *
+		sizeof(unsigned int));
+	for (i = 0ul; i < length; i++) t -> cohort_length[i] = 0u;
+
+}
+
+/*
+ * Add a tracer particle to the aggregate of its cohort.
+ *
+ * Parameters
+ * ==========
+ * t: 			A pointer to the tracer particles
+ * cohort: 		The index of the particle's cohort
+ * zone: 		The zone the particle currently resides in
+ *
+ * header: cohorts.h
+ */
+extern void cohort_add_tracer(TRACER *t, unsigned long cohort,
+	unsigned int zone) {
+
+	unsigned int i;
+	unsigned long start = cohort * (*t).cohort_width;
+	for (i = 0u; i < (*t).cohort_length[cohort]; i++) {
+		if ((*t).cohort_zone[start + i] == zone) {
+			t -> cohort_count[start + i]++;
+			return;
+		} else {}
+	}
+
+	/* First particle from this cohort in this zone -> new entry */
+	t -> cohort_zone[start + i] = zone;
+	t -> cohort_count[start + i] = 1u;
+	t -> cohort_length[cohort]++;
+
+}
+
+/*
+ * Move a tracer particle between zones in the aggregate of its cohort.
+ *
+ * Parameters
+ * ==========
+ * t: 			A pointer to the tracer particles
+ * cohort: 		The index of the particle's cohort
+ * from: 		The zone the particle is leaving
+ * to: 			The zone the particle is moving to
+ *
+ * header: cohorts.h
+ */
+extern void cohort_move_tracer(TRACER *t, unsigned long cohort,
+	unsigned int from, unsigned int to) {
+
+	unsigned int i;
+	unsigned long start = cohort * (*t).cohort_width;
+	for (i = 0u; i < (*t).cohort_length[cohort]; i++) {
+		if ((*t).cohort_zone[start + i] == from) {
+			t -> cohort_count[start + i]--;
+			if (!(*t).cohort_count[start + i]) {
+				/* Zone vacated -> move the last entry into its place */
+				unsigned long last = start + (*t).cohort_length[cohort] - 1ul;
+				t -> cohort_zone[start + i] = (*t).cohort_zone[last];
+				t -> cohort_count[start + i] = (*t).cohort_count[last];
+				t -> cohort_length[cohort]--;
+			} else {}
+			break;
+		} else {}
+	}
+	cohort_add_tracer(t, cohort, to);
+
+}
+
+/*
+ * Compute the mass of the index'th element returned to the ISM of each zone
+ * by continuous recycling from the cohort aggregates.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for this simulation
+ * index: 		The element's index in each of mz's singlezone objects
+ * recycled: 	The array to store the mass recycled into each zone in, or
+ * 				NULL to allocate a new one
+ *
+ * Returns
+ * =======
+ * An array of doubles, each element is the mass in Msun of the index'th
+ * element recycled into each zone at the current timestep by tracer
+ * particles born in zones with continuous recycling.
+ *
+ * header: cohorts.h
+ */
+extern double *cohort_recycled_mass(MULTIZONE mz, unsigned int index,
+	double *recycled) {
+
+	unsigned long i, length = n_cohorts(mz);
+	TRACER *t = (*mz.mig).tracers;
+	if (recycled == NULL) recycled = (double *) malloc ((*mz.mig).n_zones *
+		sizeof(double));
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) recycled[i] = 0;
+	for (i = 0ul; i < length; i++) {
+		unsigned long first = i * (*t).cohort_width;
+		SSP *ssp = mz.zones[(*t).zone_origin[first]] -> ssp;
+
+		if ((*ssp).continuous) {
+			/* Same arithmetic as recycled_mass for a single particle */
+			double Z = (
+				(*(*mz.zones[(*t).zone_origin[first]]).elements[index]).Z[(
+					*t).timestep_origin[first]]
+			);
+			unsigned long n = (*mz.zones[0]).timestep - (
+				*t).timestep_origin[first];
+			double per_tracer = Z * (*t).mass[first] * (
+				((*ssp).crf[n + 1ul] - (*ssp).crf[n])
+			);
+			unsigned int j;
+			for (j = 0u; j < (*t).cohort_length[i]; j++) {
+				recycled[(*t).cohort_zone[first + j]] += (
+					(*t).cohort_count[first + j] * per_tracer
+				);
+			}
+		} else {}
+
+	}
+
+	return recycled;
+
+}
+
+/*
+ * Compute the mass of ISM gas returned to each zone by continuous recycling
+ * from the cohort aggregates.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * mass: 	The array to store the mass recycled into each zone in, or NULL
+ * 			to allocate a new one
+ *
+ * Returns
+ * =======
+ * An array of doubles, each element is the mass in Msun of ISM gas recycled
+ * into each zone at the current timestep by tracer particles born in zones
+ * with continuous recycling.
+ *
+ * header: cohorts.h
+ */
+extern double *cohort_gas_recycled(MULTIZONE mz, double *mass) {
+
+	unsigned long i, length = n_cohorts(mz);
+	TRACER *t = (*mz.mig).tracers;
+	if (mass == NULL) mass = (double *) malloc ((*mz.mig).n_zones *
+		sizeof(double));
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) mass[i] = 0;
+	for (i = 0ul; i < length; i++) {
+		unsigned long first = i * (*t).cohort_width;
+		SSP *ssp = mz.zones[(*t).zone_origin[first]] -> ssp;
+
+		if ((*ssp).continuous) {
+			unsigned long n = (*mz.zones[0]).timestep - (
+				*t).timestep_origin[first];
+			double per_tracer = (*t).mass[first] * ((*ssp).crf[n + 1l] -
+				(*ssp).crf[n]);
+			unsigned int j;
+			for (j = 0u; j < (*t).cohort_length[i]; j++) {
+				mass[(*t).cohort_zone[first + j]] += (
+					(*t).cohort_count[first + j] * per_tracer
+				);
+			}
+		} else {}
+
+	}
+
+	return mass;
+
+}
+
+/*
+ * Determine the stellar mass in each zone from the cohort aggregates.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * mstar: 	The array to store the stellar mass in each zone in, or NULL to
+ * 			allocate a new one
+ *
+ * Returns
+ * =======
+ * A pointer to the present-day stellar mass in each zone.
+ *
+ * header: cohorts.h
+ */
+extern double *cohort_stellar_mass(MULTIZONE mz, double *mstar) {
+
+	unsigned long i, length = n_cohorts(mz);
+	unsigned long timestep = (*mz.zones[0]).timestep;
+	TRACER *t = (*mz.mig).tracers;
+	if (mstar == NULL) mstar = (double *) malloc ((*mz.mig).n_zones *
+		sizeof(double));
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) mstar[i] = 0;
+	for (i = 0ul; i < length; i++) {
+		unsigned long first = i * (*t).cohort_width;
+		double per_tracer = (*t).mass[first] * (1 -
+			(*(*mz.zones[(*t).zone_origin[first]]).ssp).crf[
+				timestep - (*t).timestep_origin[first] + 1l
+			]);
+		unsigned int j;
+		for (j = 0u; j < (*t).cohort_length[i]; j++) {
+			mstar[(*t).cohort_zone[first + j]] += (
+				(*t).cohort_count[first + j] * per_tracer
+			);
+		}
+	}
+
+	return mstar;
+
+}
+
+/*
+ * Determine the number of cohorts of tracer particles that have been injected
+ * into a multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ *
+ * Returns
+ * =======
+ * The number of active cohorts.
+ */
+static unsigned long n_cohorts(MULTIZONE mz) {
+
+	return (*mz.mig).tracer_count / (*mz.mig).n_tracers;
+
+}
+
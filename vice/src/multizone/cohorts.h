@@ -0,0 +1,115 @@
+#ifndef MULTIZONE_COHORTS_H
+#define MULTIZONE_COHORTS_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../objects.h"
+
+/*
+ * Allocate memory for the cohort aggregates of the tracer particles. This
+ * must be called after malloc_tracers.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object for this simulation
+ *
+ * source: cohorts.c
+ */
+extern void malloc_cohorts(MULTIZONE *mz);
+
+/*
+ * Add a tracer particle to the aggregate of its cohort.
+ *
+ * Parameters
+ * ==========
+ * t: 			A pointer to the tracer particles
+ * cohort: 		The index of the particle's cohort
+ * zone: 		The zone the particle currently resides in
+ *
+ * source: cohorts.c
+ */
+extern void cohort_add_tracer(TRACER *t, unsigned long cohort,
+	unsigned int zone);
+
+/*
+ * Move a tracer particle between zones in the aggregate of its cohort.
+ *
+ * Parameters
+ * ==========
+ * t: 			A pointer to the tracer particles
+ * cohort: 		The index of the particle's cohort
+ * from: 		The zone the particle is leaving
+ * to: 			The zone the particle is moving to
+ *
+ * source: cohorts.c
+ */
+extern void cohort_move_tracer(TRACER *t, unsigned long cohort,
+	unsigned int from, unsigned int to);
+
+/*
+ * Compute the mass of the index'th element returned to the ISM of each zone
+ * by continuous recycling from the cohort aggregates.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for this simulation
+ * index: 		The element's index in each of mz's singlezone objects
+ * recycled: 	The array to store the mass recycled into each zone in, or
+ * 				NULL to allocate a new one
+ *
+ * Returns
+ * =======
+ * An array of doubles, each element is the mass in Msun of the index'th
+ * element recycled into each zone at the current timestep by tracer
+ * particles born in zones with continuous recycling.
+ *
+ * source: cohorts.c
+ */
+extern double *cohort_recycled_mass(MULTIZONE mz, unsigned int index,
+	double *recycled);
+
+/*
+ * Compute the mass of ISM gas returned to each zone by continuous recycling
+ * from the cohort aggregates.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * mass: 	The array to store the mass recycled into each zone in, or NULL
+ * 			to allocate a new one
+ *
+ * Returns
+ * =======
+ * An array of doubles, each element is the mass in Msun of ISM gas recycled
+ * into each zone at the current timestep by tracer particles born in zones
+ * with continuous recycling.
+ *
+ * source: cohorts.c
+ */
+extern double *cohort_gas_recycled(MULTIZONE mz, double *mass);
+
+/*
+ * Determine the stellar mass in each zone from the cohort aggregates.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * mstar: 	The array to store the stellar mass in each zone in, or NULL to
+ * 			allocate a new one
+ *
+ * Returns
+ * =======
+ * A pointer to the present-day stellar mass in each zone.
+ *
+ * source: cohorts.c
+ */
+extern double *cohort_stellar_mass(MULTIZONE mz, double *mstar);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* MULTIZONE_COHORTS_H */
+
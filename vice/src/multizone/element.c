@@ -46,73 +46,7 @@ extern void update_elements(MULTIZONE *mz) {
 		double *recycled = recycled_mass(*mz, i);
 
 		for (j = 0u; j < (*(*mz).mig).n_zones; j++) {
-
-			/*
-			 * These instantaneous pieces don't require tracer particles and
-			 * can be taken straight from the birth zone:
-			 *
-			 * Enrichment from core collapse supernovae
-			 * Depletion from star formation
-			 * Depletion from outflows
-			 * Metal-rich infall (or anything present in primordial gas)
-			 */
-
-			SINGLEZONE sz = *(*mz).zones[j];
-			ELEMENT *e = mz -> zones[j] -> elements[i];
-
-			double dm = 0;
-			double m_cc = mdot_ccsne(sz, *e) * sz.dt;
-			double m_ia = sneia[j];
-			double m_agb = agb[j];
-
-			/* 
-			 * Enrichment immediately lost to outflows. For the enrichment
-			 * channels requiring tracer particles, this uses the entrainment
-			 * fraction from the CURRENT zone as opposed to the BIRTH zone,
-			 * a choice which is likely more physical since whether or not, e.g.
-			 * a fluid element from a SN Ia or an AGB star is included in an
-			 * outflow likely has more to do with its current location than
-			 * where it was born.
-			 */
-			e -> unretained = 0;
-			e -> unretained += (1 - (*(*e).ccsne_yields).entrainment) * m_cc;
-			e -> unretained += (1 - (*(*e).sneia_yields).entrainment) * m_ia;
-			e -> unretained += (1 - (*(*e).agb_grid).entrainment) * m_agb;
-
-			/* Enrichment entrained within the ISM */
-			dm += (*(*e).ccsne_yields).entrainment * m_cc;
-			dm += (*(*e).sneia_yields).entrainment * m_ia;
-			dm += (*(*e).agb_grid).entrainment * m_agb;
-
-			/*
-			 * Subsequent terms in the enrichmen tequation - star formation and
-			 * outflows proceed at the abundance by mass Z in the current zone.
-			 */
-			double Z = (*e).mass / (*sz.ism).mass;
-			dm += recycled[j];
-			dm -= (*sz.ism).star_formation_rate * sz.dt * Z;
-			if (strcmp((*e).symbol, "he")) {
-				dm -= (
-					(*sz.ism).enh[sz.timestep] * get_outflow_rate(sz) *
-					sz.dt * Z
-				);
-			} else {
-				/* Don't eject helium at an enhanced abundance */
-				dm -= get_outflow_rate(sz) * sz.dt * Z;
-			}
-
-			if ((*sz.ism).infall_rate > 0) {
-				/*
-				 * Safeguard against the infall rate being set to NaN, see
-				 * comment on same if-statement in src/singlezone/element.c.
-				 */
-				double Zin = (*e).Zin[sz.timestep] + (*e).primordial;
-				dm += (*sz.ism).infall_rate * (sz).dt * Zin;
-			} else {}
-
-			e -> mass += dm;
-			update_element_mass_sanitycheck(e);
-
+			update_element_in_zone(mz, j, i, sneia[j], agb[j], recycled[j]);
 		}
 
 		free(sneia);
@@ -123,3 +57,99 @@ extern void update_elements(MULTIZONE *mz) {
 
 }
 
+
+/*
+ * Updates the mass of one element in one zone to the proper value at the next
+ * timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object for the current simulation
+ * zone: 		The index of the zone to update
+ * index: 		The element's index in each of mz's singlezone objects
+ * m_ia: 		The mass of the element in Msun produced by SNe Ia in the zone
+ * 				at this timestep
+ * m_agb: 		The mass of the element in Msun produced by AGB stars in the
+ * 				zone at this timestep
+ * recycled: 	The mass of the element in Msun returned to the zone by
+ * 				recycling at this timestep
+ *
+ * Notes
+ * =====
+ * The enrichment channels which require tracer particles are taken as
+ * parameters, leaving only those which can be taken straight from the zone
+ * itself to compute here. This function only modifies the zone it is
+ * updating, so it may be called for different zones concurrently.
+ *
+ * header: element.h
+ */
+extern void update_element_in_zone(MULTIZONE *mz, unsigned int zone,
+	unsigned int index, double m_ia, double m_agb, double recycled) {
+
+	/*
+	 * These instantaneous pieces don't require tracer particles and
+	 * can be taken straight from the birth zone:
+	 *
+	 * Enrichment from core collapse supernovae
+	 * Depletion from star formation
+	 * Depletion from outflows
+	 * Metal-rich infall (or anything present in primordial gas)
+	 */
+
+	SINGLEZONE sz = *(*mz).zones[zone];
+	ELEMENT *e = mz -> zones[zone] -> elements[index];
+
+	double dm = 0;
+	double m_cc = mdot_ccsne(sz, *e) * sz.dt;
+
+	/* 
+	 * Enrichment immediately lost to outflows. For the enrichment
+	 * channels requiring tracer particles, this uses the entrainment
+	 * fraction from the CURRENT zone as opposed to the BIRTH zone,
+	 * a choice which is likely more physical since whether or not, e.g.
+	 * a fluid element from a SN Ia or an AGB star is included in an
+	 * outflow likely has more to do with its current location than
+	 * where it was born.
+	 */
+	e -> unretained = 0;
+	e -> unretained += (1 - (*(*e).ccsne_yields).entrainment) * m_cc;
+	e -> unretained += (1 - (*(*e).sneia_yields).entrainment) * m_ia;
+	e -> unretained += (1 - (*(*e).agb_grid).entrainment) * m_agb;
+
+	/* Enrichment entrained within the ISM */
+	dm += (*(*e).ccsne_yields).entrainment * m_cc;
+	dm += (*(*e).sneia_yields).entrainment * m_ia;
+	dm += (*(*e).agb_grid).entrainment * m_agb;
+
+	/*
+	 * Subsequent terms in the enrichmen tequation - star formation and
+	 * outflows proceed at the abundance by mass Z in the current zone.
+	 */
+	double Z = (*e).mass / (*sz.ism).mass;
+	dm += recycled;
+	dm -= (*sz.ism).star_formation_rate * sz.dt * Z;
+	if (strcmp((*e).symbol, "he")) {
+		dm -= (
+			(*sz.ism).enh[sz.timestep] * get_outflow_rate(sz) *
+			sz.dt * Z
+		);
+	} else {
+		/* Don't eject helium at an enhanced abundance */
+		dm -= get_outflow_rate(sz) * sz.dt * Z;
+	}
+
+	if ((*sz.ism).infall_rate > 0) {
+		/*
+		 * Safeguard against the infall rate being set to NaN, see
+		 * comment on same if-statement in src/singlezone/element.c.
+		 */
+		double Zin = (*e).Zin[sz.timestep] + (*e).primordial;
+		dm += (*sz.ism).infall_rate * (sz).dt * Zin;
+	} else {}
+
+	e -> mass += dm;
+	update_element_mass_sanitycheck(e);
+
+}
+
+
@@ -20,6 +20,34 @@ extern "C" {
  */
 extern void update_elements(MULTIZONE *mz);
 
+/*
+ * Updates the mass of one element in one zone to the proper value at the next
+ * timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object for the current simulation
+ * zone: 		The index of the zone to update
+ * index: 		The element's index in each of mz's singlezone objects
+ * m_ia: 		The mass of the element in Msun produced by SNe Ia in the zone
+ * 				at this timestep
+ * m_agb: 		The mass of the element in Msun produced by AGB stars in the
+ * 				zone at this timestep
+ * recycled: 	The mass of the element in Msun returned to the zone by
+ * 				recycling at this timestep
+ *
+ * Notes
+ * =====
+ * The enrichment channels which require tracer particles are taken as
+ * parameters, leaving only those which can be taken straight from the zone
+ * itself to compute here. This function only modifies the zone it is
+ * updating, so it may be called for different zones concurrently.
+ *
+ * source: element.c
+ */
+extern void update_element_in_zone(MULTIZONE *mz, unsigned int zone,
+	unsigned int index, double m_ia, double m_agb, double recycled);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -5,10 +5,13 @@
 
 
 #include <stdlib.h>
+#include <stdio.h>
 #include "hydrodiskstars.h"
 #include "../toolkit/hydrodiskstars.h"
 #include "../utils.h"
+#include "../io.h"
 #include "../singlezone.h"
+#include "../tracer.h"
 
 /* The hydrodiskstars object that drives this module */
 static HYDRODISKSTARS *HDS;
@@ -36,6 +39,76 @@ extern void set_hydrodiskstars_object(unsigned long address) {
 }
 
 
+/*
+ * Setup the zone histories of all tracer particles, assigning each an analog
+ * star particle and its zone at each timestep according to the migration
+ * mode of the hydrodiskstars object.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure.
+ *
+ * header: hydrodiskstars.h
+ */
+extern unsigned short setup_hydrodisk_tracers(MULTIZONE mz) {
+
+	double dt = (*mz.zones[0]).dt;
+	unsigned long i, n = n_timesteps(*mz.zones[0]);
+	unsigned int j, k;
+	long analog_index = -1l;
+	double migration_time = 0;
+	char lhs[30];
+
+	/*
+	 * Allocate memory for the progressbar regardless of verbosity to avoid it
+	 * being used uninitialized as a failsafe.
+	 */
+	PROGRESSBAR *pb = progressbar_initialize(n);
+	for (i = 0ul; i < n; i++) {
+		for (j = 0u; j < (*mz.mig).n_zones; j++) {
+			double birth_radius = (
+				((*HDS).rad_bins[j] + (*HDS).rad_bins[j + 1u]) / 2
+			);
+			for (k = 0u; k < (*mz.mig).n_tracers; k++) {
+				/*
+				 * Assign a new analog and, in case of sudden migration, a
+				 * new time of migration as calling the hydrodiskstars object
+				 * with the time of formation and simulation time equal would,
+				 * except in the buffer where the previous ones are retained.
+				 */
+				if (i <= n - BUFFER + 1l) {
+					analog_index = hydrodiskstars_find_analog(*HDS,
+						birth_radius, i * dt);
+					if (checksum((*HDS).mode) == SUDDEN_MIGRATION) {
+						migration_time = rand_range(i * dt,
+							HYDRODISK_END_TIME);
+					} else {}
+				} else {}
+				if (setup_hydrodisk_tracer(mz, i * (*mz.mig).n_zones *
+					(*mz.mig).n_tracers + j * (*mz.mig).n_tracers + k, j, i,
+					analog_index, migration_time)) {
+					progressbar_free(pb);
+					return 1u;
+				} else {}
+			}
+		}
+		if (mz.verbose) {
+			sprintf(lhs, "Progress: %.2f%%", 100.0 * (i + 1ul) / n);
+			progressbar_set_left_hand_side(pb, lhs);
+			progressbar_update(pb, i + 1ul);
+		} else {}
+	}
+	if (mz.verbose) progressbar_finish(pb);
+	progressbar_free(pb);
+	return 0u;
+
+}
+
+
 /*
  * Setup the zone history for a single tracer object born in a given zone and
  * at a given timestep.
@@ -44,10 +117,12 @@ extern void set_hydrodiskstars_object(unsigned long address) {
  * ==========
  * mz: 				The multizone object
  * hds: 			The hydrodiskstars object
- * t: 				A pointer to the tracer object being set up
+ * index: 			The index of the tracer particle being set up
  * birth_zone: 		The zone of birth
  * birth_timestep: 	The timestep of birth
  * analog_index: 	The index of the analog star particle in the hds data
+ * migration_time: 	The time in Gyr at which the star particle migrates, used
+ * 					only in case of sudden migration
  *
  * Returns
  * =======
@@ -55,8 +130,9 @@ extern void set_hydrodiskstars_object(unsigned long address) {
  *
  * header: hydrodiskstars.h
  */
-extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
-	unsigned int birth_zone, unsigned long birth_timestep, long analog_index) {
+extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz,
+	unsigned long index, unsigned int birth_zone, unsigned long birth_timestep,
+	long analog_index, double migration_time) {
 
 	/* The timestep size plus time and radius at which the star is born */
 	double dt = (*mz.zones[0]).dt;
@@ -65,22 +141,21 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 		((*HDS).rad_bins[birth_zone] + (*HDS).rad_bins[birth_zone + 1u]) / 2
 	);
 
-	/* In case of sudden migration, this can't be done in the for-loop */
-	double migration_time = rand_range(birth_time, HYDRODISK_END_TIME);
-
 	/*
-	 * The analog star particle will already be assigned by calling the
-	 * hydrodiskstars object in python, retaining the user's ability to write
-	 * additional output when subclassing the hydrodiskstars object.
+	 * The analog star particle and time of migration will already be
+	 * assigned by calling the hydrodiskstars object in python, retaining the
+	 * user's ability to write additional output when subclassing the
+	 * hydrodiskstars object.
 	 */
 	unsigned long i, N = n_timesteps(*mz.zones[0]);
-	t -> zone_history = (int *) malloc (N * sizeof(int));
+	TRACER *t = (*mz.mig).tracers;
+	int *zones = (int *) malloc (N * sizeof(int));
 
 	for (i = 0ul; i < N; i++) {
 
 		if (i < birth_timestep) {
 			/* Zone number is always -1 until it is born */
-			t -> zone_history[i] = -1;
+			zones[i] = -1;
 
 		} else if (i == birth_timestep || birth_timestep >= N - BUFFER) {
 			/*
@@ -88,14 +163,14 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 			 * buffer timesteps. In either case, the zone number must be the
 			 * birth zone.
 			 */
-			t -> zone_history[i] = (signed) birth_zone;
+			zones[i] = (signed) birth_zone;
 
 		} else if (i >= N - BUFFER) {
 			/*
 			 * If this timestep is in the buffer, assign it to value from
 			 * just outside the buffer.
 			 */
-			t -> zone_history[i] = (*t).zone_history[N - BUFFER - 1ul];
+			zones[i] = zones[N - BUFFER - 1ul];
 
 		} else if (mz.simple && i != N - BUFFER - 1ul) {
 			/*
@@ -106,7 +181,7 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 			 * below in the else-condition for exactly one iteration of the
 			 * for-loop to achieve this.
 			 */
-			t -> zone_history[i] = (signed) birth_zone;
+			zones[i] = (signed) birth_zone;
 
 		} else {
 			/*
@@ -118,23 +193,24 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 			switch(checksum((*HDS).mode)) {
 
 				case LINEAR_MIGRATION:
-					t -> zone_history[i] = (int) calczone_linear(*HDS,
+					zones[i] = (int) calczone_linear(*HDS,
 						birth_time, birth_radius, HYDRODISK_END_TIME,
 						analog_index, i * dt);
 					break;
 
 				case SUDDEN_MIGRATION:
-					t -> zone_history[i] = (int) calczone_sudden(*HDS,
+					zones[i] = (int) calczone_sudden(*HDS,
 						migration_time, birth_radius, analog_index, i * dt);
 					break;
 
 				case DIFFUSION_MIGRATION:
-					t -> zone_history[i] = (int) calczone_diffusive(*HDS,
+					zones[i] = (int) calczone_diffusive(*HDS,
 						birth_time, birth_radius, HYDRODISK_END_TIME,
 						analog_index, i * dt);
 					break;
 
 				default:
+					free(zones);
 					return 1u; /* error handling */
 
 			}
@@ -143,13 +219,13 @@ extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
 
 	}
 
-	t -> timestep_origin = birth_timestep;
-	t -> zone_origin = birth_zone;
+	set_tracer_history(t, index, birth_timestep, zones);
 	if (mz.simple) {
-		t -> zone_current = (unsigned) t -> zone_history[N - BUFFER];
+		t -> zone_current[index] = (unsigned) zones[N - BUFFER];
 	} else {
-		t -> zone_current = birth_zone;
+		t -> zone_current[index] = birth_zone;
 	}
+	free(zones);
 	return 0u;
 
 }
@@ -40,6 +40,33 @@ extern "C" {
  */
 extern void set_hydrodiskstars_object(unsigned long address);
 
+/*
+ * Setup the zone histories of all tracer particles, assigning each an analog
+ * star particle and its zone at each timestep according to the migration
+ * mode of the hydrodiskstars object.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure.
+ *
+ * Notes
+ * =====
+ * This is equivalent to calling the hydrodiskstars object in python to
+ * assign the analog of each tracer particle followed by
+ * setup_hydrodisk_tracer, drawing the same random numbers in the same order.
+ * As it does not call python, multizone objects call this function with the
+ * global interpreter lock released, unless a subclass of the hydrodiskstars
+ * object overrides the __call__ function, in which case the python function
+ * must still be called for each tracer particle.
+ *
+ * source: hydrodiskstars.c
+ */
+extern unsigned short setup_hydrodisk_tracers(MULTIZONE mz);
+
 /*
  * Setup the zone history for a single tracer object born in a given zone and
  * at a given timestep.
@@ -48,10 +75,12 @@ extern void set_hydrodiskstars_object(unsigned long address);
  * ==========
  * mz: 				The multizone object
  * hds: 			The hydrodiskstars object
- * t: 				A pointer to the tracer object being set up
+ * index: 			The index of the tracer particle being set up
  * birth_zone: 		The zone of birth
  * birth_timestep: 	The timestep of birth
  * analog_index: 	The index of the analog star particle in the hds data
+ * migration_time: 	The time in Gyr at which the star particle migrates, used
+ * 					only in case of sudden migration
  *
  * Returns
  * =======
@@ -59,8 +88,9 @@ extern void set_hydrodiskstars_object(unsigned long address);
  *
  * source: hydrodiskstars.c
  */
-extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz, TRACER *t,
-	unsigned int birth_zone, unsigned long birth_timestep, long analog_index);
+extern unsigned short setup_hydrodisk_tracer(MULTIZONE mz,
+	unsigned long index, unsigned int birth_zone, unsigned long birth_timestep,
+	long analog_index, double migration_time);
 
 #ifdef __cplusplus
 }
@@ -50,80 +50,114 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz) {
 	 */
 	
 	unsigned int i;
-	double *mass_recycled = gas_recycled_in_zones(*mz);
+	unsigned short status = 0u;
+	double *mass_recycled = gas_recycled_in_zones(*mz,
+		(*(*mz).ws).gas_recycled);
 	double *migration_deltas = migration_gas_changes_by_zone(*mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
-		SINGLEZONE *sz = mz -> zones[i];
-
-		/*
-		 * Change Note: version 1.3.0
-		 *
-		 * Primordial inflow added prior to updating parameters in infall mode
-		 * as before, but now after updating in star formation and gas modes.
-		 * In practice, this caused models to miss one timestep's worth of
-		 * primordial inflow at the very beginning due to the temporary
-		 * assignment of the infall rate to NaN. This change ensures that the
-		 * infall rate will not be NaN by the time primordial_inflow is called
-		 * after one timestep has passed.
-		 *
-		 * Change Note: version 1.3.2
-		 *
-		 * The mass added to the ISM by migration is now taken into account when
-		 * computing the infall rate in gas and star formation mode. This small
-		 * correction was previously unaccounted for.
-		 */
-
-		switch (checksum((*(*sz).ism).mode)) {
-
-			case GAS:
-				sz -> ism -> mass = (*(*sz).ism).specified[(*sz).timestep + 1l];
-				sz -> ism -> star_formation_rate = (
-					(*(*sz).ism).mass / get_SFE_timescale(*sz, 0u)
-				);
-				sz -> ism -> infall_rate = (
-					((*(*sz).ism).mass - (*(*sz).ism).specified[(*sz).timestep]
-						- mass_recycled[i] - migration_deltas[i]) / (*sz).dt +
-					(*(*sz).ism).star_formation_rate + get_outflow_rate(*sz)
-				);
-				break;
-
-			case IFR:
-				sz -> ism -> mass += (
-					((*(*sz).ism).infall_rate -
-						(*(*sz).ism).star_formation_rate -
-						get_outflow_rate(*sz)) * (*sz).dt + mass_recycled[i]
-				);
-				sz -> ism -> infall_rate = (
-					*(*sz).ism).specified[(*sz).timestep + 1l];
-				sz -> ism -> star_formation_rate = (
-					(*(*sz).ism).mass / get_SFE_timescale(*sz, 0u)
-				);
-				break;
-
-			case SFR:
-				sz -> ism -> star_formation_rate = (
-					*(*sz).ism).specified[(*sz).timestep + 1l];
-				double dMg = get_ism_mass_SFRmode(*sz, 0u) - (*(*sz).ism).mass;
-				sz -> ism -> infall_rate = (
-					(dMg - mass_recycled[i] - migration_deltas[i]) / (*sz).dt +
-					(*(*sz).ism).star_formation_rate + get_outflow_rate(*sz)
-				);
-				sz -> ism -> mass += dMg;
-				break;
-
-			default:
-				free(mass_recycled);
-				return 1;
+		status |= update_zone_ism(mz, i, mass_recycled[i],
+			migration_deltas[i]);
+		if (status) break;
+	}
 
-		}
+	return status;
+
+}
+
+
+/*
+ * Moves the infall rate, total gas mass, and star formation rate in one zone
+ * of a multizone simulation forward one timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 					A pointer to the multizone object for this simulation
+ * zone: 				The index of the zone to move forward
+ * mass_recycled: 		The mass of gas in Msun returned to the zone by
+ * 						recycling at this timestep
+ * migration_delta: 	The net mass of gas in Msun the zone loses to migration
+ * 						at this timestep
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an unrecognized mode
+ *
+ * Notes
+ * =====
+ * This function only modifies the zone it is moving forward, so it may be
+ * called for different zones concurrently.
+ *
+ * header: ism.h
+ */
+extern unsigned short update_zone_ism(MULTIZONE *mz, unsigned int zone,
+	double mass_recycled, double migration_delta) {
+
+	SINGLEZONE *sz = mz -> zones[zone];
+
+	/*
+	 * Change Note: version 1.3.0
+	 *
+	 * Primordial inflow added prior to updating parameters in infall mode
+	 * as before, but now after updating in star formation and gas modes.
+	 * In practice, this caused models to miss one timestep's worth of
+	 * primordial inflow at the very beginning due to the temporary
+	 * assignment of the infall rate to NaN. This change ensures that the
+	 * infall rate will not be NaN by the time primordial_inflow is called
+	 * after one timestep has passed.
+	 *
+	 * Change Note: version 1.3.2
+	 *
+	 * The mass added to the ISM by migration is now taken into account when
+	 * computing the infall rate in gas and star formation mode. This small
+	 * correction was previously unaccounted for.
+	 */
 
-		update_gas_evolution_sanitycheck(sz);
-		sz -> ism -> star_formation_history[(*sz).timestep + 1l] = (
-			*(*sz).ism).star_formation_rate;
+	switch (checksum((*(*sz).ism).mode)) {
+
+		case GAS:
+			sz -> ism -> mass = (*(*sz).ism).specified[(*sz).timestep + 1l];
+			sz -> ism -> star_formation_rate = (
+				(*(*sz).ism).mass / get_SFE_timescale(*sz, 0u)
+			);
+			sz -> ism -> infall_rate = (
+				((*(*sz).ism).mass - (*(*sz).ism).specified[(*sz).timestep]
+					- mass_recycled - migration_delta) / (*sz).dt +
+				(*(*sz).ism).star_formation_rate + get_outflow_rate(*sz)
+			);
+			break;
+
+		case IFR:
+			sz -> ism -> mass += (
+				((*(*sz).ism).infall_rate -
+					(*(*sz).ism).star_formation_rate -
+					get_outflow_rate(*sz)) * (*sz).dt + mass_recycled
+			);
+			sz -> ism -> infall_rate = (
+				*(*sz).ism).specified[(*sz).timestep + 1l];
+			sz -> ism -> star_formation_rate = (
+				(*(*sz).ism).mass / get_SFE_timescale(*sz, 0u)
+			);
+			break;
+
+		case SFR:
+			sz -> ism -> star_formation_rate = (
+				*(*sz).ism).specified[(*sz).timestep + 1l];
+			double dMg = get_ism_mass_SFRmode(*sz, 0u) - (*(*sz).ism).mass;
+			sz -> ism -> infall_rate = (
+				(dMg - mass_recycled - migration_delta) / (*sz).dt +
+				(*(*sz).ism).star_formation_rate + get_outflow_rate(*sz)
+			);
+			sz -> ism -> mass += dMg;
+			break;
+
+		default:
+			return 1;
 
 	}
 
-	free(mass_recycled);
+	update_gas_evolution_sanitycheck(sz);
+	sz -> ism -> star_formation_history[(*sz).timestep + 1l] = (
+		*(*sz).ism).star_formation_rate;
 	return 0;
 
 }
@@ -136,6 +170,8 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz) {
  * Parameters
  * ==========
  * mz: 			The multizone object for the current simulation
+ * unretained: 	The 2D-array to store the outflow rates in, or NULL to
+ * 				allocate a new one
  *
  * Returns
  * =======
@@ -144,14 +180,15 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz) {
  *
  * header: ism.h
  */
-extern double **multizone_unretained(MULTIZONE mz) {
+extern double **multizone_unretained(MULTIZONE mz, double **unretained) {
 
 	unsigned int i, j;
-	double **unretained = (double **) malloc ((*mz.mig).n_zones * sizeof(
-		double *));
+	unsigned short allocate = unretained == NULL;
+	if (allocate) unretained = (double **) malloc ((*mz.mig).n_zones *
+		sizeof(double *));
 	for (i = 0u; i < (*mz.mig).n_zones; i++) {
-		unretained[i] = (double *) malloc ((*mz.zones[0]).n_elements * sizeof(
-			double));
+		if (allocate) unretained[i] = (double *) malloc (
+			(*mz.zones[0]).n_elements * sizeof(double));
 		for (j = 0u; j < (*mz.zones[i]).n_elements; j++) {
 			unretained[i][j] = (
 				*(*mz.zones[i]).elements[j]).unretained / (*mz.zones[i]).dt;
@@ -24,6 +24,33 @@ extern "C" {
  */
 extern unsigned short update_zone_evolution(MULTIZONE *mz);
 
+/*
+ * Moves the infall rate, total gas mass, and star formation rate in one zone
+ * of a multizone simulation forward one timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 					A pointer to the multizone object for this simulation
+ * zone: 				The index of the zone to move forward
+ * mass_recycled: 		The mass of gas in Msun returned to the zone by
+ * 						recycling at this timestep
+ * migration_delta: 	The net mass of gas in Msun the zone loses to migration
+ * 						at this timestep
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an unrecognized mode
+ *
+ * Notes
+ * =====
+ * This function only modifies the zone it is moving forward, so it may be
+ * called for different zones concurrently.
+ *
+ * source: ism.c
+ */
+extern unsigned short update_zone_ism(MULTIZONE *mz, unsigned int zone,
+	double mass_recycled, double migration_delta);
+
 /*
  * Determine the mass outflow rate of each element in each zone of a multizone
  * simulation due solely to entrainment.
@@ -31,6 +58,8 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz);
  * Parameters
  * ==========
  * mz: 			The multizone object for the current simulation
+ * unretained: 	The 2D-array to store the outflow rates in, or NULL to
+ * 				allocate a new one
  *
  * Returns
  * =======
@@ -39,7 +68,7 @@ extern unsigned short update_zone_evolution(MULTIZONE *mz);
  *
  * source: ism.c
  */
-extern double **multizone_unretained(MULTIZONE mz);
+extern double **multizone_unretained(MULTIZONE mz, double **unretained);
 
 #ifdef __cplusplus
 }
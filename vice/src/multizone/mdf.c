@@ -13,7 +13,7 @@
 #include "mdf.h"
 
 /* ---------- Static function comment headers not duplicated here ---------- */
-static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t);
+static void update_MDF_from_tracer(MULTIZONE *mz, unsigned long index);
 static void reset_MDF(SINGLEZONE *sz);
 
 
@@ -43,7 +43,7 @@ extern void tracers_MDF(MULTIZONE *mz) {
 	if ((*mz).verbose) printf("Computing distribution functions....\n");
 	for (i = 0l; i < (*(*mz).mig).tracer_count; i++) {
 		/* ... then update with each tracer particle ... */
-		update_MDF_from_tracer(mz, *(*(*mz).mig).tracers[i]);
+		update_MDF_from_tracer(mz, i);
 		if ((*mz).verbose) progressbar_update(pb, i + 1ul);
 	}
 	if ((*mz).verbose) progressbar_finish(pb);
@@ -63,12 +63,13 @@ extern void tracers_MDF(MULTIZONE *mz) {
  * Parameters
  * ==========
  * mz: 		A pointer to the multizone object with the MDF to update
- * t: 		The tracer particle to update the MDF from
+ * index: 	The index of the tracer particle to update the MDF from
  */
-static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t) {
+static void update_MDF_from_tracer(MULTIZONE *mz, unsigned long index) {
 
-	SINGLEZONE *origin = (*mz).zones[t.zone_origin];
-	SINGLEZONE *final = (*mz).zones[t.zone_current];
+	TRACER t = *(*(*mz).mig).tracers;
+	SINGLEZONE *origin = (*mz).zones[t.zone_origin[index]];
+	SINGLEZONE *final = (*mz).zones[t.zone_current[index]];
 
 	unsigned int i;
 	/* --------------------- for each tracked element --------------------- */
@@ -82,7 +83,7 @@ static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t) {
 		 */
 		double onH_ = log10(
 			/* trailing underscore to not override function in element.h */
-			(*(*origin).elements[i]).Z[t.timestep_origin] /
+			(*(*origin).elements[i]).Z[t.timestep_origin[index]] /
 			(*(*origin).elements[i]).solar
 		);
 
@@ -92,7 +93,7 @@ static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t) {
 			onH_
 		);
 		if (bin != -1l) {
-			final -> mdf -> abundance_distributions[i][bin] += t.mass;
+			final -> mdf -> abundance_distributions[i][bin] += t.mass[index];
 		} else {}
 
 	}
@@ -103,11 +104,11 @@ static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t) {
 		unsigned int j;
 		for (j = 0; j < i; j++) {
 			double onH1 = log10(
-				(*(*origin).elements[i]).Z[t.timestep_origin] /
+				(*(*origin).elements[i]).Z[t.timestep_origin[index]] /
 				(*(*origin).elements[i]).solar
 			);
 			double onH2 = log10(
-				(*(*origin).elements[j]).Z[t.timestep_origin] /
+				(*(*origin).elements[j]).Z[t.timestep_origin[index]] /
 				(*(*origin).elements[j]).solar
 			);
 			long bin = get_bin_number(
@@ -116,7 +117,7 @@ static void update_MDF_from_tracer(MULTIZONE *mz, TRACER t) {
 				onH1 - onH2
 			);
 			if (bin != -1l) {
-				final -> mdf -> ratio_distributions[n][bin] += t.mass;
+				final -> mdf -> ratio_distributions[n][bin] += t.mass[index];
 			} else {}
 			n++;
 		}
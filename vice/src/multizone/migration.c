@@ -6,17 +6,18 @@
 #include <stdlib.h>
 #include "../migration.h"
 #include "../singlezone/singlezone.h"
+#include "../tracer.h"
 #include "../utils.h"
+#include "cohorts.h"
 #include "migration.h"
 
 /* ---------- Static function comment headers not duplicated here ---------- */
-static unsigned short normalize_migration_element(MULTIZONE mz,
-	double ***migration_matrix, unsigned int row, unsigned int column);
-static void migrate_tracer(MULTIZONE mz, TRACER *t);
+static unsigned short normalize_migration_element(MULTIZONE mz, double *arr,
+	unsigned long length);
+static void migrate_tracer(MULTIZONE mz, unsigned long index);
 static void migrate_gas_element(MULTIZONE *mz, int index);
 static void migration_sanity_check(MULTIZONE *mz);
-static double **setup_changes(unsigned int n_zones);
-static double **get_changes(MULTIZONE mz, int index);
+static double *get_changes(MULTIZONE mz, int index);
 
 
 /*
@@ -25,9 +26,9 @@ static double **get_changes(MULTIZONE mz, int index);
  *
  * Parameters
  * ==========
- * migration_matrix: 		The migration matrix to sanity check
- * n_times: 				The number of times the simulation will evaluate
- * n_zones: 				The number of zones in the simulation
+ * mig: 		The migration settings whose gas migration matrix is to be
+ * 				sanity checked
+ * n_times: 	The number of times the simulation will evaluate
  *
  * Returns
  * =======
@@ -35,34 +36,47 @@ static double **get_changes(MULTIZONE mz, int index);
  *
  * header: migration.h
  */
-extern unsigned short migration_matrix_sanitycheck(double ***migration_matrix,
-	unsigned long n_times, unsigned int n_zones) {
+extern unsigned short migration_matrix_sanitycheck(MIGRATION mig,
+	unsigned long n_times) {
 
-	unsigned long i;
-	for (i = 0l; i < n_times; i++) {
-		unsigned int j;
-		/*
-		 * First set the diagonal equal to zero; migration within zones is
-		 * simply ignored.
-		 */
-		for (j = 0; j < n_zones; j++) {
-			migration_matrix[i][j][j] = 0.0;
+	/*
+	 * Migration within zones is never stored, so only the sum of the
+	 * off-diagonal elements in each row needs checked. If no element varies
+	 * with time, the first timestep is representative of all of them.
+	 */
+	unsigned long i, j;
+	unsigned short varies = 0u;
+	for (j = 0ul; j < mig.n_gas_flows; j++) varies |= mig.gas_varies[j];
+	if (!varies && n_times) n_times = 1ul;
+
+	double *outflow = (double *) malloc (mig.n_zones * sizeof(double));
+	for (i = 0ul; i < n_times; i++) {
+		unsigned int k;
+		for (k = 0u; k < mig.n_zones; k++) outflow[k] = 0;
+		for (j = 0ul; j < mig.n_gas_flows; j++) {
+			outflow[mig.gas_origin[j]] += gas_migration_fraction(mig, j, i);
 		}
-		for (j = 0; j < n_zones; j++) {
+		for (k = 0u; k < mig.n_zones; k++) {
 			/*
 			 * At all times for all zones, total probability of migration out
 			 * of the zone must be <= 1.
 			 */
-			if (sum(migration_matrix[i][j], n_zones) > 1) return 1;
+			if (outflow[k] > 1) {
+				free(outflow);
+				return 1;
+			} else {}
 		}
 	}
+	free(outflow);
 	return 0;
 
 }
 
 
 /*
- * Allocates memory for the gas migration matrix.
+ * Allocates memory for the gas migration matrix. Only the non-zero
+ * off-diagonal elements are stored, which are added by
+ * setup_migration_element.
  *
  * Parameters
  * ==========
@@ -72,74 +86,112 @@ extern unsigned short migration_matrix_sanitycheck(double ***migration_matrix,
  */
 extern void malloc_gas_migration(MULTIZONE *mz) {
 
-	/* Allocate memory for each timestep */
-	unsigned long i, length = n_timesteps((*(*mz).zones[0]));
-	mz -> mig -> gas_migration = (double ***) malloc (length *
-		sizeof(double **));
-
-	/*
-	 * At each timestep, allocate memory for an n_zones x n_zones array of
-	 * doubles.
-	 */
-	for (i = 0l; i < length; i++) {
-		mz -> mig -> gas_migration[i] = (double **) malloc (
-			(*(*mz).mig).n_zones * sizeof(double *));
-		unsigned int j;
-		for (j = 0; j < (*(*mz).mig).n_zones; j++) {
-			mz -> mig -> gas_migration[i][j] = (double *) malloc (
-				(*(*mz).mig).n_zones * sizeof(double));
-
-			/* Initially set everything to zero */
-			unsigned int k;
-			for (k = 0; k < (*(*mz).mig).n_zones; k++) {
-				mz -> mig -> gas_migration[i][j][k] = 0.0;
-			}
-		}
-	}
+	/* At most one element for each pair of distinct zones */
+	MIGRATION *mig = mz -> mig;
+	unsigned long capacity = (unsigned long) (*mig).n_zones * (
+		(*mig).n_zones - 1u);
+	gas_migration_free(mig);
+	mig -> gas_origin = (unsigned int *) malloc (capacity *
+		sizeof(unsigned int));
+	mig -> gas_destination = (unsigned int *) malloc (capacity *
+		sizeof(unsigned int));
+	mig -> gas_varies = (unsigned short *) malloc (capacity *
+		sizeof(unsigned short));
+	mig -> gas_migration = (double **) malloc (capacity * sizeof(double *));
 
 }
 
 
 /*
- * Sets up an element of the migration matrix at each timestep that it has
- * memory allocated for.
+ * Sets up an element of the migration matrix. Elements on the diagonal and
+ * those which are zero at all timesteps are not stored, and elements which
+ * do not vary with time are stored as a single value.
  *
  * Parameters
  * ==========
- * mz: 					The multizone object for the current simulation
- * migration_matrix: 	Pointer to the migration matrix itself
- * row: 				The row number of this element
- * column: 				The column number of this element
- * arr: 				The value of the migration matrix at each timestep
+ * mz: 			A pointer to the multizone object for the current simulation
+ * row: 		The row number of this element
+ * column: 		The column number of this element
+ * arr: 		The value of the migration matrix at each timestep, or a
+ * 				single value if it does not vary with time
+ * varies: 		Whether or not arr has a value at each timestep
  *
  * Returns
  * =======
  * 1 if the normalization results in a probabiliy above 1 or below 0. 0 if
  * successful.
  *
+ * Notes
+ * =====
+ * Elements must be set up in order of row, then column, for gas migration to
+ * proceed in the same order as the matrix is traversed.
+ *
  * header: migration.h
  */
-extern unsigned short setup_migration_element(MULTIZONE mz,
-	double ***migration_matrix, unsigned int row, unsigned int column,
-	double *arr) {
+extern unsigned short setup_migration_element(MULTIZONE *mz,
+	unsigned int row, unsigned int column, double *arr,
+	unsigned short varies) {
+
+	/* Migration within zones is simply ignored */
+	if (row == column) return 0;
+
+	unsigned long i, length = varies ? n_timesteps(*(*mz).zones[0]) : 1ul;
+	double *values = (double *) malloc (length * sizeof(double));
+	for (i = 0ul; i < length; i++) values[i] = arr[i];
+	if (normalize_migration_element(*mz, values, length)) {
+		free(values);
+		return 1;
+	} else {}
 
 	/*
-	 * At each timestep, simply copy the value over. Memory will have already
-	 * been allocated.
+	 * Determine whether or not this element is zero at all timesteps, and
+	 * whether or not it has the same value at all timesteps.
 	 */
-	unsigned long i, length = n_timesteps(*mz.zones[0]);
-
-	if (row == column) {
-		for (i = 0l; i < length; i++) {
-			migration_matrix[i][row][column] = 0.0;
-		}
-		return 0;
-	} else {
-		for (i = 0; i < length; i++) {
-			migration_matrix[i][row][column] = arr[i];
-		}
-		return normalize_migration_element(mz, migration_matrix, row, column);
+	unsigned short nonzero = 0u, constant = 1u;
+	for (i = 0ul; i < length; i++) {
+		nonzero |= values[i] != 0;
+		constant &= values[i] == values[0];
 	}
+	if (!nonzero) {
+		free(values);
+		return 0;
+	} else if (varies && constant) {
+		values = (double *) realloc (values, sizeof(double));
+		varies = 0u;
+	} else {}
+
+	MIGRATION *mig = mz -> mig;
+	mig -> gas_origin[(*mig).n_gas_flows] = row;
+	mig -> gas_destination[(*mig).n_gas_flows] = column;
+	mig -> gas_varies[(*mig).n_gas_flows] = varies;
+	mig -> gas_migration[(*mig).n_gas_flows] = values;
+	mig -> n_gas_flows++;
+	return 0;
+
+}
+
+
+/*
+ * Look up the fraction of the ISM in one zone that migrates to another at a
+ * given timestep.
+ *
+ * Parameters
+ * ==========
+ * mig: 		The migration settings for the current simulation
+ * flow: 		The index of the non-zero element of the migration matrix
+ * timestep: 	The timestep number
+ *
+ * Returns
+ * =======
+ * The normalized value of that element of the migration matrix at that
+ * timestep.
+ *
+ * header: migration.h
+ */
+extern double gas_migration_fraction(MIGRATION mig, unsigned long flow,
+	unsigned long timestep) {
+
+	return mig.gas_migration[flow][mig.gas_varies[flow] ? timestep : 0ul];
 
 }
 
@@ -151,18 +203,17 @@ extern unsigned short setup_migration_element(MULTIZONE mz,
  *
  * Parameters
  * ==========
- * mz: 					A copy of the multizone object
- * migration_matrix: 	A pointer to the migration matrix
- * row: 				The row number i
- * column: 				The column number j
+ * mz: 		A copy of the multizone object
+ * arr: 	The values of the element of the migration matrix
+ * length: 	The number of values in arr
  *
  * Returns
  * =======
  * 1 if the normalization results in a probabiliy above 1 or below 0. 0 if
  * successful.
  */
-static unsigned short normalize_migration_element(MULTIZONE mz,
-	double ***migration_matrix, unsigned int row, unsigned int column) {
+static unsigned short normalize_migration_element(MULTIZONE mz, double *arr,
+	unsigned long length) {
 
 	/*
 	 * The row,column'th element of the migration matrix will get multiplied
@@ -173,12 +224,11 @@ static unsigned short normalize_migration_element(MULTIZONE mz,
 	 * This modifies the interpretation of the migration matrix.
 	 * M_ij(1 - \delta_ij) now denotes the likelihood that
 	 */
-	unsigned long i, length = n_timesteps((*mz.zones[0]));
+	unsigned long i;
 	for (i = 0l; i < length; i++) {
-		migration_matrix[i][row][column] *= (*mz.zones[0]).dt;
-		migration_matrix[i][row][column] /= NORMALIZATION_TIME_INTERVAL;
-		if (migration_matrix[i][row][column] < 0 ||
-			migration_matrix[i][row][column] > 1) return 1;
+		arr[i] *= (*mz.zones[0]).dt;
+		arr[i] /= NORMALIZATION_TIME_INTERVAL;
+		if (arr[i] < 0 || arr[i] > 1) return 1;
 	}
 	return 0;
 
@@ -206,7 +256,7 @@ extern void migrate(MULTIZONE *mz) {
 	/* Migrate all tracer particles between zones */
 	unsigned long j;
 	for (j = 0l; j < (*(*mz).mig).tracer_count; j++) {
-		migrate_tracer(*mz, mz -> mig -> tracers[j]);
+		migrate_tracer(*mz, j);
 	}
 	migration_sanity_check(mz); 	/* sanity check the migration */
 
@@ -224,28 +274,31 @@ extern void migrate(MULTIZONE *mz) {
  * Returns
  * =======
  * deltas: a pointer to the array of doubles describing, component-wise, the
- * net change in each zone's mass.
+ * net change in each zone's mass. This array is part of the simulation's
+ * workspace and must not be freed by the caller.
  *
  * header: migration.h
  */
 extern double *migration_gas_changes_by_zone(MULTIZONE mz) {
 
-	double **changes = get_changes(mz, -1);
-	double *deltas = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
-	unsigned int i;
-	for (i = 0u; i < (*mz.mig).n_zones; i++) {
-		/*
-		 * The changes array is indexed such that the ij'th component holds the
-		 * amount of mass that migrates from zone i into zone j. In other words,
-		 * the i'th column (i.e. the first axis of indexing) describes the
-		 * amount that zone i loses, while the i'th row (the second axis of
-		 * indexing) describes the amount that zone i gains.
-		 */
-		deltas[i] = 0;
-		unsigned int j;
-		/* changes[i][i] = 0 for all i's (see get_changes below). */
-		for (j = 0u; j < (*mz.mig).n_zones; j++) deltas[i] += changes[i][j];
-		for (j = 0u; j < (*mz.mig).n_zones; j++) deltas[i] -= changes[j][i];
+	double *changes = get_changes(mz, -1);
+	double *deltas = (*mz.ws).migration_deltas;
+	unsigned long i;
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) deltas[i] = 0;
+
+	/*
+	 * The changes array holds the amount of mass that migrates out of
+	 * gas_origin[i] and into gas_destination[i] for each non-zero element of
+	 * the migration matrix. As in the matrix itself, the origin zone is the
+	 * row (i.e. the first axis of indexing), and the destination zone is the
+	 * column (the second axis of indexing). Each zone's total across its row
+	 * is taken first, followed by its total down its column.
+	 */
+	for (i = 0ul; i < (*mz.mig).n_gas_flows; i++) {
+		deltas[(*mz.mig).gas_origin[i]] += changes[i];
+	}
+	for (i = 0ul; i < (*mz.mig).n_gas_flows; i++) {
+		deltas[(*mz.mig).gas_destination[i]] -= changes[i];
 	}
 
 	return deltas;
@@ -260,13 +313,19 @@ extern double *migration_gas_changes_by_zone(MULTIZONE mz) {
  * Parameters
  * ==========
  * mz: 			The multizone object for the current simulation
- * t: 			A pointer to the tracer particle to potentially move between
+ * index: 		The index of the tracer particle to potentially move between
  * 				zones
  */
-static void migrate_tracer(MULTIZONE mz, TRACER *t) {
+static void migrate_tracer(MULTIZONE mz, unsigned long index) {
 
 	unsigned long timestep = (*mz.zones[0]).timestep;
-	t -> zone_current = (unsigned) (*t).zone_history[timestep + 1l];
+	TRACER *t = (*mz.mig).tracers;
+	unsigned int zone = (unsigned) get_tracer_zone(*t, index, timestep + 1l);
+	if (mz.aggregate && zone != (*t).zone_current[index]) {
+		cohort_move_tracer(t, index / (*mz.mig).n_tracers,
+			(*t).zone_current[index], zone);
+	} else {}
+	t -> zone_current[index] = zone;
 
 }
 
@@ -282,34 +341,24 @@ static void migrate_tracer(MULTIZONE mz, TRACER *t) {
  */
 static void migrate_gas_element(MULTIZONE *mz, int index) {
 
-	unsigned int i, j;
-	double **changes = get_changes(*mz, index);
-	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
-		for (j = 0; j < (*(*mz).mig).n_zones; j++) {
-			if (i == j) {
-				/* migration within zone */
-				continue;
-			} else {
-				switch (index) {
-					case -1:
-						/* gas leaves zone i and goes into zone j */
-						mz -> zones[i] -> ism -> mass -= changes[i][j];
-						mz -> zones[j] -> ism -> mass += changes[i][j];
-						break;
-					default:
-						/* element leaves zone i and goes into zone j */
-						mz -> zones[i] -> elements[index] -> mass -= (
-							changes[i][j]
-						);
-						mz -> zones[j] -> elements[index] -> mass += (
-							changes[i][j]
-						);
-						break;
-				}
-			}
+	unsigned long i;
+	double *changes = get_changes(*mz, index);
+	for (i = 0ul; i < (*(*mz).mig).n_gas_flows; i++) {
+		unsigned int from = (*(*mz).mig).gas_origin[i];
+		unsigned int to = (*(*mz).mig).gas_destination[i];
+		switch (index) {
+			case -1:
+				/* gas leaves zone from and goes into zone to */
+				mz -> zones[from] -> ism -> mass -= changes[i];
+				mz -> zones[to] -> ism -> mass += changes[i];
+				break;
+			default:
+				/* element leaves zone from and goes into zone to */
+				mz -> zones[from] -> elements[index] -> mass -= changes[i];
+				mz -> zones[to] -> elements[index] -> mass += changes[i];
+				break;
 		}
 	}
-	free(changes);
 
 }
 
@@ -355,66 +404,33 @@ static void migration_sanity_check(MULTIZONE *mz) {
  *
  * Returns
  * =======
- * An n_zones x n_zones 2D array of double where the [i][j]'th element is the
- * amount of mass that moves from the i'th to the j'th zone at the current
- * timestep.
+ * An array of doubles with one element for each non-zero element of the
+ * migration matrix, holding the amount of mass that moves from gas_origin[i]
+ * to gas_destination[i] at the current timestep. This array is part of the
+ * simulation's workspace and is overwritten by the next call.
  */
-static double **get_changes(MULTIZONE mz, int index) {
-
-	unsigned int i, j;
-	unsigned long timestep = (*mz.zones[0]).timestep;
-	double **changes = setup_changes((*mz.mig).n_zones);
-
-	for (i = 0; i < (*mz.mig).n_zones; i++) {
-		for (j = 0; j < (*mz.mig).n_zones; j++) {
-			if (i == j) {
-				/* migration within zone */
-				changes[i][j] = 0.0;
-			} else {
-				switch (index) {
-					case -1:
-						/* gas reservoir */
-						changes[i][j] = (
-							(*mz.mig).gas_migration[timestep][i][j] *
-							(*(*mz.zones[i]).ism).mass
-						);
-						break;
-					default:
-						/* element in the i'th zone */
-						changes[i][j] = (
-							(*mz.mig).gas_migration[timestep][i][j] *
-							(*(*mz.zones[i]).elements[index]).mass
-						);
-						break;
-				}
-			}
-		}
-	}
-	return changes;
-
-}
-
-
-/*
- * Sets up a n_zones x n_zones 2D-array of zeroes, within which the change in
- * masses for ISM phase elements and gas can be temporarily stored.
- *
- * Parameters
- * ==========
- * n_zones: 	The number of zones in the simulation
- *
- * Returns
- * =======
- * An n_zones x n_zones 2D double array where each element is set to zero.
- */
-static double **setup_changes(unsigned int n_zones) {
-
-	unsigned int i, j;
-	double **changes = (double **) malloc (n_zones * sizeof(double *));
-	for (i = 0; i < n_zones; i++) {
-		changes[i] = (double *) malloc (n_zones * sizeof(double));
-		for (j = 0; j < n_zones; j++) {
-			changes[i][j] = 0.0;
+static double *get_changes(MULTIZONE mz, int index) {
+
+	unsigned long i, timestep = (*mz.zones[0]).timestep;
+	double *changes = (*mz.ws).changes;
+
+	for (i = 0ul; i < (*mz.mig).n_gas_flows; i++) {
+		SINGLEZONE *origin = mz.zones[(*mz.mig).gas_origin[i]];
+		switch (index) {
+			case -1:
+				/* gas reservoir */
+				changes[i] = (
+					gas_migration_fraction(*mz.mig, i, timestep) *
+					(*(*origin).ism).mass
+				);
+				break;
+			default:
+				/* element in the origin zone */
+				changes[i] = (
+					gas_migration_fraction(*mz.mig, i, timestep) *
+					(*(*origin).elements[index]).mass
+				);
+				break;
 		}
 	}
 	return changes;
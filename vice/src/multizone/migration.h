@@ -32,7 +32,8 @@ extern void migrate(MULTIZONE *mz);
  * Returns
  * =======
  * deltas: a pointer to the array of doubles describing, component-wise, the
- * net change in each zone's mass.
+ * net change in each zone's mass. This array is part of the simulation's
+ * workspace and must not be freed by the caller.
  *
  * source: migration.c
  */
@@ -44,9 +45,9 @@ extern double *migration_gas_changes_by_zone(MULTIZONE mz);
  *
  * Parameters
  * ==========
- * migration_matrix: 		The migration matrix to sanity check
- * n_times: 				The number of times the simulation will evaluate
- * n_zones: 				The number of zones in the simulation
+ * mig: 		The migration settings whose gas migration matrix is to be
+ * 				sanity checked
+ * n_times: 	The number of times the simulation will evaluate
  *
  * Returns
  * =======
@@ -54,11 +55,13 @@ extern double *migration_gas_changes_by_zone(MULTIZONE mz);
  *
  * source: migration.c
  */
-extern unsigned short migration_matrix_sanitycheck(double ***migration_matrix,
-	unsigned long n_times, unsigned int n_zones);
+extern unsigned short migration_matrix_sanitycheck(MIGRATION mig,
+	unsigned long n_times);
 
 /*
- * Allocates memory for the gas migration matrix.
+ * Allocates memory for the gas migration matrix. Only the non-zero
+ * off-diagonal elements are stored, which are added by
+ * setup_migration_element.
  *
  * Parameters
  * ==========
@@ -69,27 +72,54 @@ extern unsigned short migration_matrix_sanitycheck(double ***migration_matrix,
 extern void malloc_gas_migration(MULTIZONE *mz);
 
 /*
- * Sets up an element of the migration matrix at each timestep that it has
- * memory allocated for.
+ * Sets up an element of the migration matrix. Elements on the diagonal and
+ * those which are zero at all timesteps are not stored, and elements which
+ * do not vary with time are stored as a single value.
  *
  * Parameters
  * ==========
- * mz: 					The multizone object for the current simulation
- * migration_matrix: 	Pointer to the migration matrix itself
- * row: 				The row number of this element
- * column: 				The column number of this element
- * arr: 				The value of the migration matrix at each timestep
+ * mz: 			A pointer to the multizone object for the current simulation
+ * row: 		The row number of this element
+ * column: 		The column number of this element
+ * arr: 		The value of the migration matrix at each timestep, or a
+ * 				single value if it does not vary with time
+ * varies: 		Whether or not arr has a value at each timestep
  *
  * Returns
  * =======
  * 1 if the normalization results in a probabiliy above 1 or below 0. 0 if
  * successful.
  *
+ * Notes
+ * =====
+ * Elements must be set up in order of row, then column, for gas migration to
+ * proceed in the same order as the matrix is traversed.
+ *
+ * source: migration.c
+ */
+extern unsigned short setup_migration_element(MULTIZONE *mz,
+	unsigned int row, unsigned int column, double *arr,
+	unsigned short varies);
+
+/*
+ * Look up the fraction of the ISM in one zone that migrates to another at a
+ * given timestep.
+ *
+ * Parameters
+ * ==========
+ * mig: 		The migration settings for the current simulation
+ * flow: 		The index of the non-zero element of the migration matrix
+ * timestep: 	The timestep number
+ *
+ * Returns
+ * =======
+ * The normalized value of that element of the migration matrix at that
+ * timestep.
+ *
  * source: migration.c
  */
-extern unsigned short setup_migration_element(MULTIZONE mz,
-	double ***migration_matrix, unsigned int row, unsigned int column,
-	double *arr);
+extern double gas_migration_fraction(MIGRATION mig, unsigned long flow,
+	unsigned long timestep);
 
 #ifdef __cplusplus
 }
@@ -5,16 +5,47 @@
 #include <stdlib.h>
 #include <string.h>
 #include "../multizone.h"
+#include "../migration.h"
 #include "../singlezone.h"
 #include "../tracer.h"
+#include "../ssp.h"
 #include "../utils.h"
 #include "../io.h"
 #include "multizone.h"
 #include "tracer.h"
 
+typedef struct timestep_inputs {
+
+	/*
+	 * The quantities required to move each zone of a multizone simulation
+	 * forward one timestep which depend on more than one zone. These are
+	 * computed for all zones before any of them are moved forward.
+	 *
+	 * migration_deltas: The net mass of gas in Msun each zone loses to
+	 * 		migration at this timestep
+	 * gas_recycled: The mass of gas in Msun returned to each zone by
+	 * 		continuous recycling as computed from the cohort aggregates, or
+	 * 		NULL if the aggregates are not in use
+	 * recycled: The mass of each element in Msun returned to each zone by
+	 * 		continuous recycling as computed from the cohort aggregates,
+	 * 		indexable via [element][zone], or NULL if the aggregates are not
+	 * 		in use
+	 */
+
+	double *migration_deltas;
+	double *gas_recycled;
+	double **recycled;
+
+} TIMESTEP_INPUTS;
+
 /* ---------- Static function comment headers not duplicated here ---------- */
-static unsigned short multizone_timestepper(MULTIZONE *mz);
+static unsigned short multizone_timestepper(MULTIZONE *mz, ZONE_POOL *pool,
+	double *busy);
 static void verbosity(MULTIZONE mz);
+static void evolve_zone(MULTIZONE *mz, unsigned int zone, void *args);
+static void zone_timestep(MULTIZONE *mz, unsigned int zone, void *args);
+static unsigned int ssp_owner(MULTIZONE mz, unsigned int zone);
+static unsigned short same_ssp(SINGLEZONE sz1, SINGLEZONE sz2);
 
 
 /*
@@ -103,6 +134,11 @@ extern unsigned short multizone_evolve(MULTIZONE *mz) {
  * ==========
  * mz: 		A pointer to the multizone object to run
  *
+ * Notes
+ * =====
+ * The zones are independent of one another in this mode, and are distributed
+ * across mz -> n_threads threads.
+ *
  * header: multizone.h
  */
 extern void multizone_evolve_simple(MULTIZONE *mz) {
@@ -114,12 +150,25 @@ extern void multizone_evolve_simple(MULTIZONE *mz) {
 	PROGRESSBAR *pb = progressbar_initialize((*(*mz).mig).n_zones);
 	if ((*mz).verbose) printf("Evolving zones....\n");
 
-	unsigned int i;
-	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
-		singlezone_evolve_no_setup_no_clean(mz -> zones[i]);
-		if ((*mz).verbose) progressbar_update(pb, i + 1u);
+	/*
+	 * Zones printing their own progressbars share it with one another (see
+	 * singlezone_verbosity), so they can only be evolved one at a time.
+	 */
+	unsigned int i, n_threads = (*mz).n_threads;
+	for (i = 0u; i < (*(*mz).mig).n_zones; i++) {
+		if ((*(*mz).zones[i]).verbose) n_threads = 1u;
 	}
-	if ((*mz).verbose) progressbar_finish(pb);
+	if (n_threads > (*(*mz).mig).n_zones) n_threads = (*(*mz).mig).n_zones;
+
+	double start = wall_clock();
+	double busy = zone_tasks(mz, n_threads, &evolve_zone, NULL, pb);
+	if ((*mz).verbose) {
+		progressbar_finish(pb);
+		if (n_threads > 1u) {
+			printf("Zones evolved on %u threads (speedup: %.2fx)\n",
+				n_threads, busy / (wall_clock() - start));
+		} else {}
+	} else {}
 	progressbar_free(pb);
 
 	/*
@@ -146,6 +195,12 @@ extern void multizone_evolve_simple(MULTIZONE *mz) {
  * ==========
  * mz: 		A pointer to the multizone object to run
  *
+ * Notes
+ * =====
+ * Each timestep, the zones are moved forward across mz -> n_threads threads
+ * once the quantities which depend on more than one zone have been computed.
+ * The threads are started once and reused at every timestep.
+ *
  * header: multizone.h
  */
 extern void multizone_evolve_full(MULTIZONE *mz) {
@@ -158,6 +213,8 @@ extern void multizone_evolve_full(MULTIZONE *mz) {
 	 */
 	long n = 0l;
 	SINGLEZONE *sz = mz -> zones[0];
+	double start = wall_clock(), busy = 0;
+	ZONE_POOL *pool = zone_pool_initialize(mz, (*mz).n_threads);
 	inject_tracers(mz);
 	while ((*sz).current_time <= (*sz).output_times[(*sz).n_outputs - 1l]) {
 		/*
@@ -171,13 +228,21 @@ extern void multizone_evolve_full(MULTIZONE *mz) {
 			write_multizone_history(*mz);
 			n++;
 		} else {}
-		if (multizone_timestepper(mz)) break;
+		if (multizone_timestepper(mz, pool, &busy)) break;
 		verbosity(*mz);
 	}
+	zone_pool_free(pool);
 	verbosity(*mz);
 	inject_tracers(mz);
 	write_multizone_history(*mz);
 
+	unsigned int n_threads = (*mz).n_threads;
+	if (n_threads > (*(*mz).mig).n_zones) n_threads = (*(*mz).mig).n_zones;
+	if ((*mz).verbose && n_threads > 1u) {
+		printf("Zones evolved on %u threads (speedup: %.2fx)\n", n_threads,
+			busy / (wall_clock() - start));
+	} else {}
+
 }
 
 
@@ -187,12 +252,16 @@ extern void multizone_evolve_full(MULTIZONE *mz) {
  * Parameters
  * ==========
  * mz: 		A pointer to the multizone object to move forward
+ * pool: 	The pool of threads to move the zones forward on
+ * busy: 	A pointer to the processor time in seconds spent moving zones
+ * 			forward so far, which will be incremented by that of this timestep
  *
  * Returns
  * =======
  * 0 while the simulation is running, 1 if the simulation is over
  */
-static unsigned short multizone_timestepper(MULTIZONE *mz) {
+static unsigned short multizone_timestepper(MULTIZONE *mz, ZONE_POOL *pool,
+	double *busy) {
 
 	/*
 	 * Change Note: version 1.3.1
@@ -207,30 +276,31 @@ static unsigned short multizone_timestepper(MULTIZONE *mz) {
 	 * Runtime Error raised in Python in vice/core/multizone/_multizone.pyx.
 	 */
 
-	if (strcmp((*(*(*mz).zones[0]).ism).mode, "ifr")) {
-		update_zone_evolution(mz);
-		update_elements(mz);
-	} else {
-		update_elements(mz);
-		update_zone_evolution(mz);
-	}
-
 	/*
-	 * Now each element and the ISM in each zone are at the next timestep.
-	 * bookkeep the new metallicity and update the MDF in each zone.
+	 * Migration and recycling from the cohort aggregates are computed for all
+	 * zones at once, in the memory set aside for them in mz -> ws. The
+	 * remaining enrichment channels which require tracer particles are
+	 * computed one zone at a time from the tracer particles currently in it,
+	 * so that each zone can be moved forward independently.
 	 */
-	unsigned int i, j;
-
-	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
-		SINGLEZONE *sz = mz -> zones[i];
-		for (j = 0; j < (*sz).n_elements; j++) {
-			sz -> elements[j] -> Z[(*sz).timestep + 1l] = (
-				(*(*sz).elements[j]).mass / (*(*sz).ism).mass
-			);
+	unsigned int i;
+	TIMESTEP_INPUTS inputs;
+	index_tracers_by_zone(mz);
+	inputs.migration_deltas = migration_gas_changes_by_zone(*mz);
+	if ((*mz).aggregate) {
+		inputs.gas_recycled = cohort_gas_recycled(*mz,
+			(*(*mz).ws).gas_recycled);
+		inputs.recycled = (*(*mz).ws).recycled;
+		for (i = 0u; i < (*(*mz).zones[0]).n_elements; i++) {
+			cohort_recycled_mass(*mz, i, inputs.recycled[i]);
 		}
-		update_MDF(sz);
+	} else {
+		inputs.gas_recycled = NULL;
+		inputs.recycled = NULL;
 	}
 
+	*busy += zone_pool_run(pool, &zone_timestep, &inputs, NULL);
+
 	/*
 	 * Migrating gas and stars before injecting tracers ensures that stars
 	 * will never migrate the timestep they're born.
@@ -263,16 +333,69 @@ static unsigned short multizone_timestepper(MULTIZONE *mz) {
  */
 extern unsigned short multizone_setup(MULTIZONE *mz) {
 
-	unsigned int i;
+	/*
+	 * Zones with the same IMF, mass range of star formation, post main
+	 * sequence lifetime ratio and timestep size have the same cumulative
+	 * return fraction and main sequence mass fraction. These are computed
+	 * here for the first such zone and handed to the others, and
+	 * singlezone_setup leaves them as they are.
+	 */
+	unsigned int i, n_computed = 0u;
+	double computing = 0;
+
+	/*
+	 * Discard any tables left over from a previous run which did not clean
+	 * up after itself, as they may be sized for a different number of
+	 * timesteps.
+	 */
+	multizone_unshare_ssp(mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
-		if (singlezone_setup(mz -> zones[i])) return 1;
+		if ((*(*(*mz).zones[i]).ssp).crf != NULL) {
+			free(mz -> zones[i] -> ssp -> crf);
+			mz -> zones[i] -> ssp -> crf = NULL;
+		} else {}
+		if ((*(*(*mz).zones[i]).ssp).msmf != NULL) {
+			free(mz -> zones[i] -> ssp -> msmf);
+			mz -> zones[i] -> ssp -> msmf = NULL;
+		} else {}
+	}
+
+	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
+		unsigned int owner = ssp_owner(*mz, i);
+		if (owner < i) {
+			mz -> zones[i] -> ssp -> crf = (*(*(*mz).zones[owner]).ssp).crf;
+			mz -> zones[i] -> ssp -> msmf = (
+				*(*(*mz).zones[owner]).ssp).msmf;
+		} else {
+			double start = wall_clock();
+			if (setup_CRF(mz -> zones[i]) || setup_MSMF(mz -> zones[i])) {
+				multizone_unshare_ssp(mz);
+				return 1;
+			} else {}
+			computing += wall_clock() - start;
+			n_computed++;
+		}
+		if (singlezone_setup(mz -> zones[i])) {
+			multizone_unshare_ssp(mz);
+			return 1;
+		} else {}
 	}
 
-	if (migration_matrix_sanitycheck((*(*mz).mig).gas_migration,
-		n_timesteps((*(*mz).zones[0])), (*(*mz).mig).n_zones)) {
+	if ((*mz).verbose && n_computed < (*(*mz).mig).n_zones) {
+		printf("Return fractions computed for %u of %u zones \
+(setup time saved: %.2f s)\n", n_computed, (*(*mz).mig).n_zones,
+			computing / n_computed * ((*(*mz).mig).n_zones - n_computed));
+	} else {}
+
+	if (migration_matrix_sanitycheck(*(*mz).mig,
+		n_timesteps((*(*mz).zones[0])))) {
+		multizone_unshare_ssp(mz);
 		return 2;
 	} else {
 		mz -> mig -> tracer_count = 0l;
+		workspace_free(mz -> ws);
+		mz -> ws = workspace_initialize((*(*mz).mig).n_zones,
+			(*(*mz).zones[0]).n_elements, (*(*mz).mig).n_gas_flows);
 		return 0;
 	}
 
@@ -292,24 +415,56 @@ extern unsigned short multizone_setup(MULTIZONE *mz) {
  */
 extern void multizone_clean(MULTIZONE *mz) {
 
-	/* clean each singlezone object */
+	/* clean each singlezone object, freeing shared tables only once */
 	unsigned int i;
+	multizone_unshare_ssp(mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
 		singlezone_close_files(mz -> zones[i]);
 		singlezone_clean(mz -> zones[i]);
 	}
 
-	/* free up each tracer and set the pointer to NULL again */
-	unsigned long j;
-	for (j = 0l; j < (*(*mz).mig).tracer_count; j++) {
-		tracer_free(mz -> mig -> tracers[j]);
-	}
-	free(mz -> mig -> tracers);
+	/* free up the tracer particles and set the pointer to NULL again */
+	tracer_free(mz -> mig -> tracers);
 	mz -> mig -> tracers = NULL;
 
-	/* free up the migration matrix */
-	free(mz -> mig -> gas_migration);
-	mz -> mig -> gas_migration = NULL;
+	/* free up the migration matrix and the scratch memory */
+	gas_migration_free(mz -> mig);
+	workspace_free(mz -> ws);
+	mz -> ws = NULL;
+
+}
+
+
+/*
+ * Set the cumulative return fraction and main sequence mass fraction of each
+ * zone which shares them with a lower-numbered zone to NULL, such that each
+ * table is freed only once.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ *
+ * header: multizone.h
+ */
+extern void multizone_unshare_ssp(MULTIZONE *mz) {
+
+	/*
+	 * Go from the last zone to the first so that the lower-numbered zone
+	 * owning a shared table is never set to NULL before those sharing it.
+	 */
+	unsigned int i, j;
+	for (i = (*(*mz).mig).n_zones - 1u; i > 0u; i--) {
+		for (j = 0u; j < i; j++) {
+			if ((*(*(*mz).zones[i]).ssp).crf ==
+				(*(*(*mz).zones[j]).ssp).crf) {
+				mz -> zones[i] -> ssp -> crf = NULL;
+			} else {}
+			if ((*(*(*mz).zones[i]).ssp).msmf ==
+				(*(*(*mz).zones[j]).ssp).msmf) {
+				mz -> zones[i] -> ssp -> msmf = NULL;
+			} else {}
+		}
+	}
 
 }
 
@@ -327,12 +482,19 @@ extern void multizone_clean(MULTIZONE *mz) {
  */
 extern void multizone_cancel(MULTIZONE *mz) {
 
+	/*
+	 * This is also called after the migration matrix fails its sanity check,
+	 * by which point each zone has its CRF and MSMF. Unshare them so that
+	 * singlezone_cancel frees each table once.
+	 */
 	unsigned int i;
+	multizone_unshare_ssp(mz);
 	for (i = 0; i < (*(*mz).mig).n_zones; i++) {
 		singlezone_cancel(mz -> zones[i]);
 	}
-	free(mz -> mig -> gas_migration);
-	mz -> mig -> gas_migration = NULL;
+	gas_migration_free(mz -> mig);
+	workspace_free(mz -> ws);
+	mz -> ws = NULL;
 
 }
 
@@ -343,6 +505,8 @@ extern void multizone_cancel(MULTIZONE *mz) {
  * Parameters
  * ==========
  * mz: 		The multizone object for this simulation
+ * mstar: 	The array to store the stellar mass in each zone in, or NULL to
+ * 			allocate a new one
  *
  * Returns
  * =======
@@ -350,20 +514,22 @@ extern void multizone_cancel(MULTIZONE *mz) {
  *
  * header: multizone.h
  */
-extern double *multizone_stellar_mass(MULTIZONE mz) {
+extern double *multizone_stellar_mass(MULTIZONE mz, double *mstar) {
+
+	if (mz.aggregate) return cohort_stellar_mass(mz, mstar);
 
 	unsigned long i;
-	double *mstar = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
+	if (mstar == NULL) mstar = (double *) malloc ((*mz.mig).n_zones *
+		sizeof(double));
 	for (i = 0ul; i < (*mz.mig).n_zones; i++) {
 		mstar[i] = 0;
 	}
+	TRACER t = *(*mz.mig).tracers;
+	unsigned long timestep = (*mz.zones[0]).timestep;
 	for (i = 0l; i < (*mz.mig).tracer_count; i++) {
-		TRACER t = *(*mz.mig).tracers[i];
-		unsigned long timestep = (*mz.zones[0]).timestep;
-		
-		mstar[t.zone_current] += t.mass * (1 -
-			(*(*mz.zones[t.zone_origin]).ssp).crf[
-				timestep - t.timestep_origin + 1l
+		mstar[t.zone_current[i]] += t.mass[i] * (1 -
+			(*(*mz.zones[t.zone_origin[i]]).ssp).crf[
+				timestep - t.timestep_origin[i] + 1l
 			]);
 	}
 	return mstar;
@@ -388,3 +554,155 @@ static void verbosity(MULTIZONE mz) {
 
 }
 
+
+/*
+ * Evolve a single zone of a multizone simulation in simple mode.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object for this simulation
+ * zone: 	The index of the zone to evolve
+ */
+static void evolve_zone(MULTIZONE *mz, unsigned int zone, void *args) {
+
+	singlezone_evolve_no_setup_no_clean(mz -> zones[zone]);
+
+}
+
+
+/*
+ * Move a single zone of a multizone simulation in full mode forward one
+ * timestep.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object for this simulation
+ * zone: 	The index of the zone to move forward
+ * args: 	A pointer to the TIMESTEP_INPUTS for this timestep
+ *
+ * Notes
+ * =====
+ * The contributions of the tracer particles in each zone are summed in the
+ * order they were injected regardless of how the zones are distributed
+ * across threads, so the results do not depend on the number of threads.
+ */
+static void zone_timestep(MULTIZONE *mz, unsigned int zone, void *args) {
+
+	TIMESTEP_INPUTS *inputs = (TIMESTEP_INPUTS *) args;
+	SINGLEZONE *sz = mz -> zones[zone];
+	unsigned short ifr = !strcmp((*(*sz).ism).mode, "ifr");
+	double gas_recycled;
+	if ((*mz).aggregate) {
+		gas_recycled = (*inputs).gas_recycled[zone];
+	} else {
+		gas_recycled = tracers_gas_recycled_in_zone(*mz, zone);
+	}
+	gas_recycled += instantaneous_gas_recycled(*mz, zone);
+
+	if (!ifr) {
+		update_zone_ism(mz, zone, gas_recycled,
+			(*inputs).migration_deltas[zone]);
+	} else {}
+
+	unsigned int i;
+	for (i = 0u; i < (*sz).n_elements; i++) {
+		double recycled;
+		if ((*mz).aggregate) {
+			recycled = (*inputs).recycled[i][zone];
+		} else {
+			recycled = tracers_recycled_mass_in_zone(*mz, i, zone);
+		}
+		recycled += instantaneous_recycled_mass(*mz, i, zone);
+		update_element_in_zone(mz, zone, i, m_sneia_in_zone(*mz, i, zone),
+			m_AGB_in_zone(*mz, i, zone), recycled);
+	}
+
+	if (ifr) {
+		update_zone_ism(mz, zone, gas_recycled,
+			(*inputs).migration_deltas[zone]);
+	} else {}
+
+	/*
+	 * Now each element and the ISM in the zone are at the next timestep.
+	 * bookkeep the new metallicity and update the MDF.
+	 */
+	for (i = 0u; i < (*sz).n_elements; i++) {
+		sz -> elements[i] -> Z[(*sz).timestep + 1l] = (
+			(*(*sz).elements[i]).mass / (*(*sz).ism).mass
+		);
+	}
+	update_MDF(sz);
+
+}
+
+
+/*
+ * Determine which zone computes the cumulative return fraction and main
+ * sequence mass fraction used by a given zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * zone: 	The index of the zone in question
+ *
+ * Returns
+ * =======
+ * The index of the lowest-numbered zone with the same single stellar
+ * population parameters as the zone in question, which is the index of the
+ * zone itself if no such zone precedes it.
+ */
+static unsigned int ssp_owner(MULTIZONE mz, unsigned int zone) {
+
+	unsigned int i;
+	for (i = 0u; i < zone; i++) {
+		if (same_ssp(*mz.zones[i], *mz.zones[zone])) return i;
+	}
+	return zone;
+
+}
+
+
+/*
+ * Determine whether or not two zones have the same cumulative return fraction
+ * and main sequence mass fraction.
+ *
+ * Parameters
+ * ==========
+ * sz1: 	The first zone
+ * sz2: 	The second zone
+ *
+ * Returns
+ * =======
+ * 1 if the two zones have the same IMF, mass range of star formation, post
+ * main sequence lifetime ratio, timestep size and number of timesteps, 0
+ * otherwise. Custom IMFs are the same only if they call the same function
+ * and their cumulative integrals share a tolerance.
+ *
+ * Notes
+ * =====
+ * Both quantities otherwise depend only on the mass-lifetime relation, which
+ * is the same in every zone.
+ */
+static unsigned short same_ssp(SINGLEZONE sz1, SINGLEZONE sz2) {
+
+	IMF_ *imf1 = (*sz1.ssp).imf;
+	IMF_ *imf2 = (*sz2.ssp).imf;
+	if (sz1.dt != sz2.dt || n_timesteps(sz1) != n_timesteps(sz2) ||
+		(*sz1.ssp).postMS != (*sz2.ssp).postMS ||
+		(*imf1).m_lower != (*imf2).m_lower ||
+		(*imf1).m_upper != (*imf2).m_upper ||
+		strcmp((*imf1).spec, (*imf2).spec)) {
+		return 0u;
+	} else if (!strcmp((*imf1).spec, "custom")) {
+		return ((*(*imf1).custom_imf).callback ==
+			(*(*imf2).custom_imf).callback &&
+			(*(*imf1).custom_imf).user_func ==
+			(*(*imf2).custom_imf).user_func &&
+			(*sz1.ssp).cumulative_tolerance ==
+			(*sz2.ssp).cumulative_tolerance);
+	} else {
+		return 1u;
+	}
+
+}
+
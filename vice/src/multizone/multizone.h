@@ -91,6 +91,26 @@ extern unsigned short multizone_setup(MULTIZONE *mz);
  */
 extern void multizone_clean(MULTIZONE *mz);
 
+/*
+ * Set the cumulative return fraction and main sequence mass fraction of each
+ * zone which shares them with a lower-numbered zone to NULL, such that each
+ * table is freed only once.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object
+ *
+ * Notes
+ * =====
+ * multizone_setup computes these tables only once for all zones with the
+ * same IMF, mass range of star formation, post main sequence lifetime ratio
+ * and timestep size. This must be called before the memory stored by the
+ * zones is freed.
+ *
+ * source: multizone.c
+ */
+extern void multizone_unshare_ssp(MULTIZONE *mz);
+
 /*
  * Undo the pieces of preparation to run a multizone simulation that are
  * called from python. This function is invoked when the user cancels their
@@ -110,6 +130,8 @@ extern void multizone_cancel(MULTIZONE *mz);
  * Parameters
  * ==========
  * mz: 		The multizone object for this simulation
+ * mstar: 	The array to store the stellar mass in each zone in, or NULL to
+ * 			allocate a new one
  *
  * Returns
  * =======
@@ -117,7 +139,7 @@ extern void multizone_cancel(MULTIZONE *mz);
  *
  * source: multizone.c
  */
-extern double *multizone_stellar_mass(MULTIZONE mz);
+extern double *multizone_stellar_mass(MULTIZONE mz, double *mstar);
 
 #ifdef __cplusplus
 }
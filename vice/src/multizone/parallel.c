@@ -0,0 +1,362 @@
+/*
+ * This file implements the distribution of per-zone work in VICE's multizone
+ * simulations across multiple threads.
+ *
+ * Notes
+ * =====
+ * Python functions which must be called as the simulation runs (e.g. yields
+ * and star formation efficiency timescales which depend on the gas mass) are
+ * evaluated via callback objects (see callback_1arg and callback_2arg in
+ * vice/core/_cutils.pyx), which acquire the global interpreter lock before
+ * calling python. Zones which do not call python therefore run concurrently,
+ * while the evaluation of python functions is serialized.
+ */
+
+#include <stdlib.h>
+#include <pthread.h>
+#include <sys/time.h>
+#include <time.h>
+#include "../multizone.h"
+#include "../io.h"
+#include "parallel.h"
+
+typedef struct zone_queue {
+
+	/*
+	 * The state shared between the threads performing some task on each
+	 * zone.
+	 *
+	 * mz: The multizone object for this simulation
+	 * task: The task to perform on each zone
+	 * args: Any additional data the task requires
+	 * pb: The progressbar to update as zones are finished, or NULL
+	 * next: The index of the next zone to hand out to a thread
+	 * finished: The number of zones the task has been completed for
+	 * busy: The processor time spent on the task in seconds
+	 * lock: A mutex controlling access to all of the above
+	 */
+
+	MULTIZONE *mz;
+	void (*task)(MULTIZONE *, unsigned int, void *);
+	void *args;
+	PROGRESSBAR *pb;
+	unsigned int next;
+	unsigned int finished;
+	double busy;
+	pthread_mutex_t lock;
+
+} ZONE_QUEUE;
+
+struct zone_pool {
+
+	/*
+	 * A set of threads which persist between tasks, waiting for the next one
+	 * to be handed out. This avoids creating and joining threads for every
+	 * task when one is performed on each zone at every timestep.
+	 *
+	 * queue: The queue of zones for the current task
+	 * threads: The threads working through the queue alongside the calling
+	 * 		thread
+	 * n_started: The number of threads which were successfully created
+	 * generation: The number of tasks handed out so far
+	 * working: The number of threads still working on the current task
+	 * shutdown: Nonzero once the threads should exit
+	 * lock: A mutex controlling access to generation, working and shutdown
+	 * start: Signaled when a new task is handed out or the pool is freed
+	 * done: Signaled when the last thread finishes the current task
+	 */
+
+	ZONE_QUEUE queue;
+	pthread_t *threads;
+	unsigned int n_started;
+	unsigned long generation;
+	unsigned int working;
+	unsigned short shutdown;
+	pthread_mutex_t lock;
+	pthread_cond_t start;
+	pthread_cond_t done;
+
+};
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static void *pool_worker(void *arg);
+static void *zone_worker(void *arg);
+static double thread_time(void);
+
+
+/*
+ * Perform some task on each zone of a multizone simulation, distributing the
+ * zones across a number of threads.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object for this simulation
+ * n_threads: 	The number of threads to use. If 1, the zones are handled one
+ * 				at a time by the calling thread.
+ * task: 		The task to perform, taking the multizone object, the index
+ * 				of a zone, and args as parameters
+ * args: 		Any additional data the task requires, or NULL
+ * pb: 			A progressbar to update as zones are finished, or NULL to not
+ * 				report progress. It is only updated if mz -> verbose is
+ * 				nonzero.
+ *
+ * Returns
+ * =======
+ * The processor time spent on the task in seconds, summed over all zones.
+ * Dividing by the elapsed time as given by wall_clock gives the speedup from
+ * running on multiple threads.
+ *
+ * header: parallel.h
+ */
+extern double zone_tasks(MULTIZONE *mz, unsigned int n_threads,
+	void (*task)(MULTIZONE *, unsigned int, void *), void *args,
+	PROGRESSBAR *pb) {
+
+	ZONE_POOL *pool = zone_pool_initialize(mz, n_threads);
+	double busy = zone_pool_run(pool, task, args, pb);
+	zone_pool_free(pool);
+	return busy;
+
+}
+
+
+/*
+ * Start the threads which will perform tasks on the zones of a multizone
+ * simulation, to be reused from one task to the next.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object for this simulation
+ * n_threads: 	The number of threads to use, including the calling thread. If
+ * 				1, no threads are created, and zones are handled one at a time
+ * 				by the calling thread.
+ *
+ * Returns
+ * =======
+ * A pointer to the pool of threads, which sit idle until zone_pool_run hands
+ * them a task.
+ *
+ * header: parallel.h
+ */
+extern ZONE_POOL *zone_pool_initialize(MULTIZONE *mz, unsigned int n_threads) {
+
+	ZONE_POOL *pool = (ZONE_POOL *) malloc (sizeof(ZONE_POOL));
+	pool -> queue.mz = mz;
+	pool -> generation = 0ul;
+	pool -> working = 0u;
+	pool -> shutdown = 0u;
+	pthread_mutex_init(&(pool -> queue.lock), NULL);
+	pthread_mutex_init(&(pool -> lock), NULL);
+	pthread_cond_init(&(pool -> start), NULL);
+	pthread_cond_init(&(pool -> done), NULL);
+
+	/*
+	 * The calling thread works through the queue alongside the others, so
+	 * only n_threads - 1 are created. Should a thread fail to start, the
+	 * remaining threads simply pick up its share of the zones.
+	 */
+	unsigned int i;
+	if (n_threads > (*(*mz).mig).n_zones) n_threads = (*(*mz).mig).n_zones;
+	if (!n_threads) n_threads = 1u;
+	pool -> threads = (pthread_t *) malloc (n_threads * sizeof(pthread_t));
+	pool -> n_started = 0u;
+	for (i = 1u; i < n_threads; i++) {
+		if (!pthread_create(&(pool -> threads[(*pool).n_started]), NULL,
+			&pool_worker, pool)) {
+			pool -> n_started++;
+		} else break;
+	}
+	return pool;
+
+}
+
+
+/*
+ * Perform some task on each zone of a multizone simulation, distributing the
+ * zones across the threads of a pool.
+ *
+ * Parameters
+ * ==========
+ * pool: 		The pool of threads, as returned by zone_pool_initialize
+ * task: 		The task to perform, taking the multizone object, the index
+ * 				of a zone, and args as parameters
+ * args: 		Any additional data the task requires, or NULL
+ * pb: 			A progressbar to update as zones are finished, or NULL to not
+ * 				report progress. It is only updated if mz -> verbose is
+ * 				nonzero.
+ *
+ * Returns
+ * =======
+ * The processor time spent on the task in seconds, summed over all zones.
+ *
+ * header: parallel.h
+ */
+extern double zone_pool_run(ZONE_POOL *pool,
+	void (*task)(MULTIZONE *, unsigned int, void *), void *args,
+	PROGRESSBAR *pb) {
+
+	/* No thread is working at this point, so the queue can be reset freely */
+	pool -> queue.task = task;
+	pool -> queue.args = args;
+	pool -> queue.pb = pb;
+	pool -> queue.next = 0u;
+	pool -> queue.finished = 0u;
+	pool -> queue.busy = 0;
+
+	pthread_mutex_lock(&(pool -> lock));
+	pool -> generation++;
+	pool -> working = (*pool).n_started;
+	pthread_cond_broadcast(&(pool -> start));
+	pthread_mutex_unlock(&(pool -> lock));
+
+	zone_worker(&(pool -> queue));
+
+	/* Wait for the other threads to finish the zones they took */
+	pthread_mutex_lock(&(pool -> lock));
+	while ((*pool).working) pthread_cond_wait(&(pool -> done), &(pool -> lock));
+	pthread_mutex_unlock(&(pool -> lock));
+	return (*pool).queue.busy;
+
+}
+
+
+/*
+ * Stop the threads of a pool and free up the memory stored by it.
+ *
+ * Parameters
+ * ==========
+ * pool: 	The pool of threads, as returned by zone_pool_initialize
+ *
+ * header: parallel.h
+ */
+extern void zone_pool_free(ZONE_POOL *pool) {
+
+	if (pool != NULL) {
+		unsigned int i;
+		pthread_mutex_lock(&(pool -> lock));
+		pool -> shutdown = 1u;
+		pthread_cond_broadcast(&(pool -> start));
+		pthread_mutex_unlock(&(pool -> lock));
+		for (i = 0u; i < (*pool).n_started; i++) {
+			pthread_join(pool -> threads[i], NULL);
+		}
+
+		free(pool -> threads);
+		pthread_mutex_destroy(&(pool -> queue.lock));
+		pthread_mutex_destroy(&(pool -> lock));
+		pthread_cond_destroy(&(pool -> start));
+		pthread_cond_destroy(&(pool -> done));
+		free(pool);
+	} else {}
+
+}
+
+
+/*
+ * Wait for tasks to be handed out to a pool of threads, working through the
+ * queue of zones for each one, until the pool is freed.
+ *
+ * Parameters
+ * ==========
+ * arg: 	A pointer to the ZONE_POOL the thread belongs to
+ *
+ * Returns
+ * =======
+ * NULL, as required by pthread_create.
+ */
+static void *pool_worker(void *arg) {
+
+	ZONE_POOL *pool = (ZONE_POOL *) arg;
+	unsigned long seen = 0ul;
+	pthread_mutex_lock(&(pool -> lock));
+	while (1) {
+		while ((*pool).generation == seen && !(*pool).shutdown) {
+			pthread_cond_wait(&(pool -> start), &(pool -> lock));
+		}
+		if ((*pool).shutdown) break;
+		seen = (*pool).generation;
+		pthread_mutex_unlock(&(pool -> lock));
+
+		zone_worker(&(pool -> queue));
+
+		pthread_mutex_lock(&(pool -> lock));
+		if (!--(pool -> working)) pthread_cond_signal(&(pool -> done));
+	}
+	pthread_mutex_unlock(&(pool -> lock));
+	return NULL;
+
+}
+
+
+/*
+ * Perform the task on zones from the queue until there are none left.
+ *
+ * Parameters
+ * ==========
+ * arg: 	A pointer to the ZONE_QUEUE shared between the threads
+ *
+ * Returns
+ * =======
+ * NULL, as required by pthread_create.
+ */
+static void *zone_worker(void *arg) {
+
+	ZONE_QUEUE *queue = (ZONE_QUEUE *) arg;
+	while (1) {
+		pthread_mutex_lock(&(queue -> lock));
+		unsigned int zone = queue -> next++;
+		pthread_mutex_unlock(&(queue -> lock));
+		if (zone >= (*(*(*queue).mz).mig).n_zones) break;
+
+		double start = thread_time();
+		(*queue).task((*queue).mz, zone, (*queue).args);
+		double elapsed = thread_time() - start;
+
+		pthread_mutex_lock(&(queue -> lock));
+		queue -> busy += elapsed;
+		queue -> finished++;
+		if ((*queue).pb != NULL && (*(*queue).mz).verbose) {
+			progressbar_update(queue -> pb, (*queue).finished);
+		} else {}
+		pthread_mutex_unlock(&(queue -> lock));
+	}
+	return NULL;
+
+}
+
+
+/*
+ * Determine the current system time.
+ *
+ * Returns
+ * =======
+ * The time since the epoch in seconds with microsecond precision.
+ *
+ * header: parallel.h
+ */
+extern double wall_clock(void) {
+
+	struct timeval tv;
+	gettimeofday(&tv, NULL);
+	return tv.tv_sec + 1.e-6 * tv.tv_usec;
+
+}
+
+
+/*
+ * Determine the processor time used by the calling thread.
+ *
+ * Returns
+ * =======
+ * The processor time in seconds. Unlike the elapsed time, this does not
+ * include time spent waiting on other threads (e.g. for the global interpreter
+ * lock) or for a processor to become available.
+ */
+static double thread_time(void) {
+
+	struct timespec ts;
+	clock_gettime(CLOCK_THREAD_CPUTIME_ID, &ts);
+	return ts.tv_sec + 1.e-9 * ts.tv_nsec;
+
+}
+
@@ -0,0 +1,132 @@
+#ifndef MULTIZONE_PARALLEL_H
+#define MULTIZONE_PARALLEL_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../objects.h"
+#include "../io.h"
+
+/*
+ * A set of threads which persist between tasks performed on each zone of a
+ * multizone simulation. Its contents are private to parallel.c.
+ */
+typedef struct zone_pool ZONE_POOL;
+
+/*
+ * Perform some task on each zone of a multizone simulation, distributing the
+ * zones across a number of threads.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object for this simulation
+ * n_threads: 	The number of threads to use. If 1, the zones are handled one
+ * 				at a time by the calling thread.
+ * task: 		The task to perform, taking the multizone object, the index
+ * 				of a zone, and args as parameters
+ * args: 		Any additional data the task requires, or NULL
+ * pb: 			A progressbar to update as zones are finished, or NULL to not
+ * 				report progress. It is only updated if mz -> verbose is
+ * 				nonzero.
+ *
+ * Returns
+ * =======
+ * The processor time spent on the task in seconds, summed over all zones.
+ * Dividing by the elapsed time as given by wall_clock gives the speedup from
+ * running on multiple threads.
+ *
+ * Notes
+ * =====
+ * Zones are handed out one at a time as threads become available, so the
+ * load remains balanced even when some zones are much more expensive than
+ * others. The task must therefore not depend on the order in which zones are
+ * handled, nor modify anything shared between zones.
+ *
+ * The threads are created and joined with each call. Tasks performed
+ * repeatedly (e.g. at every timestep) should instead reuse one pool of
+ * threads via zone_pool_initialize and zone_pool_run.
+ *
+ * source: parallel.c
+ */
+extern double zone_tasks(MULTIZONE *mz, unsigned int n_threads,
+	void (*task)(MULTIZONE *, unsigned int, void *), void *args,
+	PROGRESSBAR *pb);
+
+/*
+ * Start the threads which will perform tasks on the zones of a multizone
+ * simulation, to be reused from one task to the next.
+ *
+ * Parameters
+ * ==========
+ * mz: 			A pointer to the multizone object for this simulation
+ * n_threads: 	The number of threads to use, including the calling thread. If
+ * 				1, no threads are created, and zones are handled one at a time
+ * 				by the calling thread.
+ *
+ * Returns
+ * =======
+ * A pointer to the pool of threads, which sit idle until zone_pool_run hands
+ * them a task.
+ *
+ * source: parallel.c
+ */
+extern ZONE_POOL *zone_pool_initialize(MULTIZONE *mz, unsigned int n_threads);
+
+/*
+ * Perform some task on each zone of a multizone simulation, distributing the
+ * zones across the threads of a pool.
+ *
+ * Parameters
+ * ==========
+ * pool: 		The pool of threads, as returned by zone_pool_initialize
+ * task: 		The task to perform, taking the multizone object, the index
+ * 				of a zone, and args as parameters
+ * args: 		Any additional data the task requires, or NULL
+ * pb: 			A progressbar to update as zones are finished, or NULL to not
+ * 				report progress. It is only updated if mz -> verbose is
+ * 				nonzero.
+ *
+ * Returns
+ * =======
+ * The processor time spent on the task in seconds, summed over all zones.
+ *
+ * Notes
+ * =====
+ * The same restrictions on the task apply as in zone_tasks. Only one task may
+ * be running on a pool at a time.
+ *
+ * source: parallel.c
+ */
+extern double zone_pool_run(ZONE_POOL *pool,
+	void (*task)(MULTIZONE *, unsigned int, void *), void *args,
+	PROGRESSBAR *pb);
+
+/*
+ * Stop the threads of a pool and free up the memory stored by it.
+ *
+ * Parameters
+ * ==========
+ * pool: 	The pool of threads, as returned by zone_pool_initialize
+ *
+ * source: parallel.c
+ */
+extern void zone_pool_free(ZONE_POOL *pool);
+
+/*
+ * Determine the current system time.
+ *
+ * Returns
+ * =======
+ * The time since the epoch in seconds with microsecond precision.
+ *
+ * source: parallel.c
+ */
+extern double wall_clock(void);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* MULTIZONE_PARALLEL_H */
+
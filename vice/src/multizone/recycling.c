@@ -12,6 +12,13 @@
 #include "../multizone.h"
 #include "recycling.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static double *tracers_recycled_mass(MULTIZONE mz, unsigned int index);
+static double *tracers_gas_recycled(MULTIZONE mz, double *mass);
+static double tracer_recycled_mass(MULTIZONE mz, unsigned int index,
+	unsigned long i);
+static double tracer_gas_recycled(MULTIZONE mz, unsigned long i);
+
 
 /*
  * Compute the mass of the index'th element added back to the ISM by recycled
@@ -35,55 +42,23 @@
 extern double *recycled_mass(MULTIZONE mz, unsigned int index) {
 
 	/*
-	 * Look at each tracer particle and allow each that was born in a zone
-	 * with continuous recycling to enrich its current zone via continuous
-	 * recycling, regardless of the current zone's recycling prescription.
-	 * Zones that have instantaneous recycling will retain their recycling
-	 * as such as well as that from particles with continuous recycling that
-	 * migrate into that zone.
+	 * Tracer particles that were born in a zone with continuous recycling
+	 * enrich their current zone via continuous recycling, regardless of the
+	 * current zone's recycling prescription. Zones that have instantaneous
+	 * recycling will retain their recycling as such as well as that from
+	 * particles with continuous recycling that migrate into that zone.
 	 */
 
 	unsigned long i;
-	double *recycled = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
-	for (i = 0ul; i < (*mz.mig).n_zones; i++) recycled[i] = 0;
-	for (i = 0ul; i < (*mz.mig).tracer_count; i++) {
-		TRACER *t = mz.mig -> tracers[i];
-		SSP *ssp = mz.zones[(*t).zone_origin] -> ssp;
-
-		if ((*ssp).continuous) {
-			/* ------------------- Continuous recycling -------------------
-			 *
-			 * The metallicity by mass of this element in the tracer particle
-			 * and its age in units of the timestep size.
-			 */
-			double Z = (
-				(*(*mz.zones[(*t).zone_origin]).elements[index]).Z[(
-					*t).timestep_origin]
-			);
-			unsigned long n = (*mz.zones[0]).timestep - (*t).timestep_origin;
-			recycled[(*t).zone_current] += Z * (*t).mass * (
-				((*ssp).crf[n + 1ul] - (*ssp).crf[n])
-			);
-			// mz -> zones[(*t).zone_current] -> elements[index] -> mass += (
-			// 	Z * (*t).mass * ((*ssp).crf[n + 1l] - (*ssp).crf[n])
-			// );
-		} else {}
-
+	double *recycled;
+	if (mz.aggregate) {
+		recycled = cohort_recycled_mass(mz, index, NULL);
+	} else {
+		recycled = tracers_recycled_mass(mz, index);
 	}
 
 	for (i = 0ul; i < (*mz.mig).n_zones; i++) {
-		SSP *ssp = mz.zones[i] -> ssp;
-
-		if (!(*ssp).continuous) {
-			/* ------------------ Instantaneous recycling ------------------ */
-			recycled[i] += (
-				(*(*mz.zones[i]).ism).star_formation_rate *
-				(*mz.zones[i]).dt *
-				(*(*mz.zones[i]).ssp).R0 *
-				(*(*mz.zones[i]).elements[index]).mass /
-				(*(*mz.zones[i]).ism).mass
-			);
-		}
+		recycled[i] += instantaneous_recycled_mass(mz, index, i);
 	}
 
 	return recycled;
@@ -101,6 +76,8 @@ extern double *recycled_mass(MULTIZONE mz, unsigned int index) {
  * Parameters
  * ==========
  * mz: 		The multizone object for this simulation
+ * mass: 	The array to store the mass returned to each zone in, or NULL to
+ * 			allocate a new one
  *
  * Returns
  * =======
@@ -109,46 +86,295 @@ extern double *recycled_mass(MULTIZONE mz, unsigned int index) {
  *
  * header: recycling.h
  */
-extern double *gas_recycled_in_zones(MULTIZONE mz) {
+extern double *gas_recycled_in_zones(MULTIZONE mz, double *mass) {
 
-	/* Store the mass recycled in each zone in this array */
+	/* Continuous recycling from tracer particles */
 	unsigned int j;
-	double *mass = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
+	if (mz.aggregate) {
+		mass = cohort_gas_recycled(mz, mass);
+	} else {
+		mass = tracers_gas_recycled(mz, mass);
+	}
+
+	/* Look at each zone for instantaneous recycling */
 	for (j = 0; j < (*mz.mig).n_zones; j++) {
-		mass[j] = 0;
+		mass[j] += instantaneous_gas_recycled(mz, j);
 	}
 
-	/* Look at each tracer particle for continuous recycling */
+	return mass;
+
+}
+
+
+/*
+ * Compute the mass of the index'th element returned to the ISM of one zone
+ * by continuous recycling from the tracer particles currently in that zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * index: 	The element's index in each of mz's singlezone objects
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of the index'th element recycled into the zone at the
+ * current timestep by tracer particles born in zones with continuous
+ * recycling. recycled_mass is this plus instantaneous_recycled_mass, unless
+ * the multizone object computes recycling from aggregates.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * header: recycling.h
+ */
+extern double tracers_recycled_mass_in_zone(MULTIZONE mz, unsigned int index,
+	unsigned int zone) {
+
 	unsigned long i;
-	for (i = 0l; i < (*mz.mig).tracer_count; i++) {
-		TRACER *t = (*mz.mig).tracers[i];
-		SSP *ssp = mz.zones[(*t).zone_origin] -> ssp;
+	TRACER *t = mz.mig -> tracers;
+	double recycled = 0;
+	for (i = (*t).zone_offsets[zone]; i < (*t).zone_offsets[zone + 1u]; i++) {
+		recycled += tracer_recycled_mass(mz, index, (*t).zone_members[i]);
+	}
+	return recycled;
+
+}
 
-		if ((*ssp).continuous) {
-			/* ------------------- Continuous recycling ------------------- */
-			unsigned long n = (*mz.zones[0]).timestep - (*t).timestep_origin;
-			mass[(*t).zone_current] += (*t).mass * ((*ssp).crf[n + 1l] -
-				(*ssp).crf[n]);
-		} else {}
 
+/*
+ * Compute the mass of ISM gas returned to one zone by continuous recycling
+ * from the tracer particles currently in that zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of ISM gas recycled into the zone at the current timestep
+ * by tracer particles born in zones with continuous recycling.
+ * gas_recycled_in_zones is this plus instantaneous_gas_recycled, unless the
+ * multizone object computes recycling from aggregates.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * header: recycling.h
+ */
+extern double tracers_gas_recycled_in_zone(MULTIZONE mz, unsigned int zone) {
+
+	unsigned long i;
+	TRACER *t = mz.mig -> tracers;
+	double mass = 0;
+	for (i = (*t).zone_offsets[zone]; i < (*t).zone_offsets[zone + 1u]; i++) {
+		mass += tracer_gas_recycled(mz, (*t).zone_members[i]);
 	}
+	return mass;
+
+}
 
-	/* Look at each zone for instantaneous recycling */
-	for (j = 0; j < (*mz.mig).n_zones; j++) {
-		SSP *ssp = mz.zones[j] -> ssp;
 
-		if (!(*ssp).continuous) {
-			/* ------------------ Instantaneous recycling ------------------ */
-			mass[j] += (
-				(*(*mz.zones[j]).ism).star_formation_rate *
-				(*mz.zones[j]).dt *
-				(*(*mz.zones[j]).ssp).R0
-			);
-		} else {}
+/*
+ * Compute the mass of the index'th element returned to the ISM of one zone by
+ * instantaneous recycling.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * index: 	The element's index in each of mz's singlezone objects
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of the index'th element recycled at the current timestep
+ * by the stars that formed in the zone, or zero if the zone has continuous
+ * recycling.
+ *
+ * header: recycling.h
+ */
+extern double instantaneous_recycled_mass(MULTIZONE mz, unsigned int index,
+	unsigned int zone) {
 
+	if (!(*(*mz.zones[zone]).ssp).continuous) {
+		return (
+			(*(*mz.zones[zone]).ism).star_formation_rate *
+			(*mz.zones[zone]).dt *
+			(*(*mz.zones[zone]).ssp).R0 *
+			(*(*mz.zones[zone]).elements[index]).mass /
+			(*(*mz.zones[zone]).ism).mass
+		);
+	} else {
+		return 0;
+	}
+
+}
+
+
+/*
+ * Compute the mass of ISM gas returned to one zone by instantaneous
+ * recycling.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of ISM gas recycled at the current timestep by the stars
+ * that formed in the zone, or zero if the zone has continuous recycling.
+ *
+ * header: recycling.h
+ */
+extern double instantaneous_gas_recycled(MULTIZONE mz, unsigned int zone) {
+
+	if (!(*(*mz.zones[zone]).ssp).continuous) {
+		return (
+			(*(*mz.zones[zone]).ism).star_formation_rate *
+			(*mz.zones[zone]).dt *
+			(*(*mz.zones[zone]).ssp).R0
+		);
+	} else {
+		return 0;
+	}
+
+}
+
+
+/*
+ * Compute the mass of the index'th element returned to the ISM of each zone
+ * by continuous recycling by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * index: 	The element's index in each of mz's singlezone objects
+ *
+ * Returns
+ * =======
+ * An array of doubles, each element is the mass in Msun of the index'th
+ * element recycled into each zone at the current timestep by tracer
+ * particles born in zones with continuous recycling.
+ */
+static double *tracers_recycled_mass(MULTIZONE mz, unsigned int index) {
+
+	unsigned long i;
+	TRACER *t = mz.mig -> tracers;
+	double *recycled = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) recycled[i] = 0;
+	for (i = 0ul; i < (*mz.mig).tracer_count; i++) {
+		recycled[(*t).zone_current[i]] += tracer_recycled_mass(mz, index, i);
+	}
+
+	return recycled;
+
+}
+
+
+/*
+ * Compute the mass of ISM gas returned to each zone by continuous recycling
+ * by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * mass: 	The array to store the mass recycled into each zone in, or NULL
+ * 			to allocate a new one
+ *
+ * Returns
+ * =======
+ * An array of doubles, each element is the mass in Msun of ISM gas recycled
+ * into each zone at the current timestep by tracer particles born in zones
+ * with continuous recycling.
+ */
+static double *tracers_gas_recycled(MULTIZONE mz, double *mass) {
+
+	unsigned long i;
+	TRACER *t = (*mz.mig).tracers;
+	if (mass == NULL) mass = (double *) malloc ((*mz.mig).n_zones *
+		sizeof(double));
+	for (i = 0ul; i < (*mz.mig).n_zones; i++) mass[i] = 0;
+	for (i = 0ul; i < (*mz.mig).tracer_count; i++) {
+		mass[(*t).zone_current[i]] += tracer_gas_recycled(mz, i);
 	}
 
 	return mass;
 
 }
 
+
+/*
+ * Compute the mass of the index'th element returned to the ISM by continuous
+ * recycling from one tracer particle.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * index: 	The element's index in each of mz's singlezone objects
+ * i: 		The index of the tracer particle
+ *
+ * Returns
+ * =======
+ * The mass in Msun of the index'th element recycled at the current timestep
+ * by the stellar population the tracer particle represents, or zero if it was
+ * born in a zone with instantaneous recycling.
+ */
+static double tracer_recycled_mass(MULTIZONE mz, unsigned int index,
+	unsigned long i) {
+
+	TRACER *t = mz.mig -> tracers;
+	SSP *ssp = mz.zones[(*t).zone_origin[i]] -> ssp;
+
+	if ((*ssp).continuous) {
+		/*
+		 * The metallicity by mass of this element in the tracer particle
+		 * and its age in units of the timestep size.
+		 */
+		double Z = (
+			(*(*mz.zones[(*t).zone_origin[i]]).elements[index]).Z[(
+				*t).timestep_origin[i]]
+		);
+		unsigned long n = (*mz.zones[0]).timestep - (*t).timestep_origin[i];
+		return Z * (*t).mass[i] * ((*ssp).crf[n + 1ul] - (*ssp).crf[n]);
+	} else {
+		return 0;
+	}
+
+}
+
+
+/*
+ * Compute the mass of ISM gas returned by continuous recycling from one tracer
+ * particle.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * i: 		The index of the tracer particle
+ *
+ * Returns
+ * =======
+ * The mass in Msun of ISM gas recycled at the current timestep by the stellar
+ * population the tracer particle represents, or zero if it was born in a zone
+ * with instantaneous recycling.
+ */
+static double tracer_gas_recycled(MULTIZONE mz, unsigned long i) {
+
+	TRACER *t = mz.mig -> tracers;
+	SSP *ssp = mz.zones[(*t).zone_origin[i]] -> ssp;
+
+	if ((*ssp).continuous) {
+		unsigned long n = (*mz.zones[0]).timestep - (*t).timestep_origin[i];
+		return (*t).mass[i] * ((*ssp).crf[n + 1l] - (*ssp).crf[n]);
+	} else {
+		return 0;
+	}
+
+}
+
@@ -39,6 +39,8 @@ extern double *recycled_mass(MULTIZONE mz, unsigned int index);
  * Parameters
  * ==========
  * mz: 		The multizone object for this simulation
+ * mass: 	The array to store the mass returned to each zone in, or NULL to
+ * 			allocate a new one
  *
  * Returns
  * =======
@@ -47,7 +49,98 @@ extern double *recycled_mass(MULTIZONE mz, unsigned int index);
  *
  * source: recycling.c
  */
-extern double *gas_recycled_in_zones(MULTIZONE mz);
+extern double *gas_recycled_in_zones(MULTIZONE mz, double *mass);
+
+/*
+ * Compute the mass of the index'th element returned to the ISM of one zone
+ * by continuous recycling from the tracer particles currently in that zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * index: 	The element's index in each of mz's singlezone objects
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of the index'th element recycled into the zone at the
+ * current timestep by tracer particles born in zones with continuous
+ * recycling. recycled_mass is this plus instantaneous_recycled_mass, unless
+ * the multizone object computes recycling from aggregates.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * source: recycling.c
+ */
+extern double tracers_recycled_mass_in_zone(MULTIZONE mz, unsigned int index,
+	unsigned int zone);
+
+/*
+ * Compute the mass of ISM gas returned to one zone by continuous recycling
+ * from the tracer particles currently in that zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of ISM gas recycled into the zone at the current timestep
+ * by tracer particles born in zones with continuous recycling.
+ * gas_recycled_in_zones is this plus instantaneous_gas_recycled, unless the
+ * multizone object computes recycling from aggregates.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * source: recycling.c
+ */
+extern double tracers_gas_recycled_in_zone(MULTIZONE mz, unsigned int zone);
+
+/*
+ * Compute the mass of the index'th element returned to the ISM of one zone by
+ * instantaneous recycling.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * index: 	The element's index in each of mz's singlezone objects
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of the index'th element recycled at the current timestep
+ * by the stars that formed in the zone, or zero if the zone has continuous
+ * recycling.
+ *
+ * source: recycling.c
+ */
+extern double instantaneous_recycled_mass(MULTIZONE mz, unsigned int index,
+	unsigned int zone);
+
+/*
+ * Compute the mass of ISM gas returned to one zone by instantaneous
+ * recycling.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass in Msun of ISM gas recycled at the current timestep by the stars
+ * that formed in the zone, or zero if the zone has continuous recycling.
+ *
+ * source: recycling.c
+ */
+extern double instantaneous_gas_recycled(MULTIZONE mz, unsigned int zone);
 
 #ifdef __cplusplus
 }
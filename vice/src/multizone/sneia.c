@@ -9,6 +9,11 @@
 #include "sneia.h"
 #include "tracer.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static double tracer_sneia_mass(MULTIZONE mz, unsigned short index,
+	unsigned long i);
+
+
 /*
  * Determine the total mass production of a given element produced by SNe Ia
  * in each zone.
@@ -26,25 +31,84 @@
  */
 extern double *m_sneia_from_tracers(MULTIZONE mz, unsigned short index) {
 
-	unsigned long i, timestep = (*mz.zones[0]).timestep;
+	unsigned long i;
+	TRACER *t = mz.mig -> tracers;
 	double *mass = (double *) malloc ((*mz.mig).n_zones * sizeof(double));
 	for (i = 0l; i < (*mz.mig).n_zones; i++) {
 		mass[i] = 0;
 	}
 	for (i = 0l; i < (*mz.mig).tracer_count; i++) {
-		TRACER *t = mz.mig -> tracers[i];
-		SNEIA_YIELD_SPECS sneia = *(
-			mz.zones[(*t).zone_origin] -> elements[index] -> sneia_yields
-		);
-		/* pull yield information from the zone this particle originated */
-		mass[(*t).zone_current] += (
-			get_ia_yield(*(*mz.zones[(*t).zone_origin]).elements[index],
-				tracer_metallicity(mz, *t)) *
-			(*t).mass *
-			sneia.RIa[timestep - (*t).timestep_origin]
-		);
+		mass[(*t).zone_current[i]] += tracer_sneia_mass(mz, index, i);
 	}
 	return mass;
 
 }
 
+
+/*
+ * Determine the mass production of a given element by SNe Ia in one zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation
+ * index: 	The index of the element to calculate the yield information for
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass production of the given element in that zone. This is identical
+ * to the corresponding element of the array returned by m_sneia_from_tracers.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * header: sneia.h
+ */
+extern double m_sneia_in_zone(MULTIZONE mz, unsigned short index,
+	unsigned int zone) {
+
+	unsigned long i;
+	TRACER *t = mz.mig -> tracers;
+	double mass = 0;
+	for (i = (*t).zone_offsets[zone]; i < (*t).zone_offsets[zone + 1u]; i++) {
+		mass += tracer_sneia_mass(mz, index, (*t).zone_members[i]);
+	}
+	return mass;
+
+}
+
+
+/*
+ * Determine the mass of a given element produced by SNe Ia from one tracer
+ * particle.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation
+ * index: 	The index of the element to calculate the yield information for
+ * i: 		The index of the tracer particle
+ *
+ * Returns
+ * =======
+ * The mass of the given element produced in the next timestep by SNe Ia from
+ * the stellar population the tracer particle represents.
+ */
+static double tracer_sneia_mass(MULTIZONE mz, unsigned short index,
+	unsigned long i) {
+
+	TRACER *t = mz.mig -> tracers;
+	SNEIA_YIELD_SPECS sneia = *(
+		mz.zones[(*t).zone_origin[i]] -> elements[index] -> sneia_yields
+	);
+	/* pull yield information from the zone this particle originated */
+	return (
+		get_ia_yield(*(*mz.zones[(*t).zone_origin[i]]).elements[index],
+			tracer_metallicity(mz, i)) *
+		(*t).mass[i] *
+		sneia.RIa[(*mz.zones[0]).timestep - (*t).timestep_origin[i]]
+	);
+
+}
+
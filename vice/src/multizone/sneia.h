@@ -25,6 +25,30 @@ extern "C" {
  */
 extern double *m_sneia_from_tracers(MULTIZONE mz, unsigned short index);
 
+/*
+ * Determine the mass production of a given element by SNe Ia in one zone.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for the current simulation
+ * index: 	The index of the element to calculate the yield information for
+ * zone: 	The index of the zone
+ *
+ * Returns
+ * =======
+ * The mass production of the given element in that zone. This is identical
+ * to the corresponding element of the array returned by m_sneia_from_tracers.
+ *
+ * Notes
+ * =====
+ * This function requires the tracer particles to be indexed by zone at the
+ * current timestep (see index_tracers_by_zone in src/multizone/tracer.c).
+ *
+ * source: sneia.c
+ */
+extern double m_sneia_in_zone(MULTIZONE mz, unsigned short index,
+	unsigned int zone);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
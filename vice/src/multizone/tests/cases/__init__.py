@@ -10,9 +10,17 @@ if not __VICE_SETUP__:
 	__all__ = ["test"]
 	from .....testing import moduletest
 	from ._generic import generic_test
+	from ._aggregate import aggregate_test
+	from .aggregate import aggregate_comparison_test
 	from ._no_migration import no_migration_test
 	from ._separation import separation_test
 	from .bifurcation import bifurcation_test
+	from .threads import threads_comparison_test
+	from .batched import batched_comparison_test
+	from .sf_law import sf_law_comparison_test
+	from .tabulated import tabulated_agb_test
+	from .canceled import canceled_test
+	from .hydrodisk import hydrodisk_comparison_test
 
 	@moduletest
 	def test():
@@ -32,6 +40,14 @@ if not __VICE_SETUP__:
 				generic_test(run = False),
 				no_migration_test(run = False),
 				separation_test(run = False),
+				aggregate_test(run = False),
+				aggregate_comparison_test(run = False),
+				threads_comparison_test(run = False),
+				batched_comparison_test(run = False),
+				sf_law_comparison_test(run = False),
+				tabulated_agb_test(run = False),
+				canceled_test(run = False),
+				hydrodisk_comparison_test(run = False)
 			]
 		]
 
@@ -0,0 +1,18 @@
+# cython: language_level = 3, boundscheck = False
+
+from __future__ import absolute_import
+from .....core.objects._multizone cimport MULTIZONE
+from ._generic cimport generic
+
+
+cdef class aggregate(generic):
+	pass
+
+
+### Aggregate edge case unit tests ###
+cdef extern from "../cohorts.h":
+	unsigned short aggregate_test_cohort_move_tracer(MULTIZONE *mz)
+	unsigned short aggregate_test_cohort_recycled_mass(MULTIZONE *mz)
+	unsigned short aggregate_test_cohort_gas_recycled(MULTIZONE *mz)
+	unsigned short aggregate_test_cohort_stellar_mass(MULTIZONE *mz)
+
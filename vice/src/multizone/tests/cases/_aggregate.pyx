@@ -0,0 +1,90 @@
+# cython: language_level = 3, boundscheck = False
+
+from __future__ import absolute_import
+from ....._globals import _VERSION_ERROR_
+from .....testing import moduletest
+from .....testing import unittest
+from .aggregate import stellar_migration
+from .aggregate import _N_ZONES_
+import sys
+import os
+if sys.version_info[:2] == (2, 7):
+	strcomp = basestring
+elif sys.version_info[:2] >= (3, 5):
+	strcomp = str
+else:
+	_VERSION_ERROR_()
+from . cimport _aggregate
+
+
+@moduletest
+def aggregate_test():
+	r"""
+	Runs an aggregate test on the multizone object. This runs a case with
+	multiple star particles per zone per timestep which migrate between zones
+	at different times, computing recycling and stellar masses from the
+	aggregates of star particles born in the same zone at the same timestep.
+	"""
+	msg = "vice.core.multizone edge case : aggregate"
+	try:
+		_TEST_ = aggregate(n_zones = _N_ZONES_, n_stars = 3)
+		_TEST_.aggregate = True
+		_TEST_.migration.stars = stellar_migration
+		_TEST_.run()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.test_cohort_move_tracer(),
+			_TEST_.test_cohort_recycled_mass(),
+			_TEST_.test_cohort_gas_recycled(),
+			_TEST_.test_cohort_stellar_mass()
+		]
+	]
+
+
+cdef class aggregate:
+
+	r"""
+	A class intended to run the aggregate edge-case test on the multizone
+	class. This is a case in which star particles from the same zone and
+	timestep occupy different zones, and zones are vacated and re-occupied by
+	them over time.
+	"""
+
+	@unittest
+	def test_cohort_move_tracer(self):
+		r"""
+		vice.src.multizone.cohorts.cohort_move_tracer aggregate test
+		"""
+		def test():
+			return _aggregate.aggregate_test_cohort_move_tracer(self._mz)
+		return ["vice.src.multizone.cohorts.cohort_move_tracer", test]
+
+	@unittest
+	def test_cohort_recycled_mass(self):
+		r"""
+		vice.src.multizone.cohorts.cohort_recycled_mass aggregate test
+		"""
+		def test():
+			return _aggregate.aggregate_test_cohort_recycled_mass(self._mz)
+		return ["vice.src.multizone.cohorts.cohort_recycled_mass", test]
+
+	@unittest
+	def test_cohort_gas_recycled(self):
+		r"""
+		vice.src.multizone.cohorts.cohort_gas_recycled aggregate test
+		"""
+		def test():
+			return _aggregate.aggregate_test_cohort_gas_recycled(self._mz)
+		return ["vice.src.multizone.cohorts.cohort_gas_recycled", test]
+
+	@unittest
+	def test_cohort_stellar_mass(self):
+		r"""
+		vice.src.multizone.cohorts.cohort_stellar_mass aggregate test
+		"""
+		def test():
+			return _aggregate.aggregate_test_cohort_stellar_mass(self._mz)
+		return ["vice.src.multizone.cohorts.cohort_stellar_mass", test]
+
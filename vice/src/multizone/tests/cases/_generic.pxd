@@ -13,6 +13,7 @@ cdef extern from "../../multizone.h":
 	void multizone_evolve_full(MULTIZONE *mz)
 	unsigned short multizone_setup(MULTIZONE *mz)
 	void multizone_clean(MULTIZONE *mz)
+	void multizone_unshare_ssp(MULTIZONE *mz)
 
 cdef extern from "../../mdf.h":
 	unsigned short tracers_MDF(MULTIZONE *mz)
@@ -29,3 +30,6 @@ cdef extern from "../../../io/multizone.h":
 cdef extern from "../tracer.h":
 	unsigned short generic_test_inject_tracers(MULTIZONE *mz)
 
+cdef extern from "../multizone.h":
+	unsigned short generic_test_multizone_setup(MULTIZONE *mz)
+
@@ -32,7 +32,8 @@ def generic_test():
 		return [msg, None]
 	return [msg,
 		[
-			_TEST_.test_inject_tracers()
+			_TEST_.test_inject_tracers(),
+			_TEST_.test_multizone_setup()
 		]
 	]
 
@@ -48,6 +49,10 @@ cdef class generic:
 		if "name" in kwargs.keys(): del kwargs["name"]
 		super().__init__(name = "test", **kwargs)
 
+	def __dealloc__(self):
+		# run() leaves the zones set up, with tables shared between them
+		_generic.multizone_unshare_ssp(self._mz)
+
 	def run(self):
 		r"""
 		Runs the simulation
@@ -78,3 +83,13 @@ cdef class generic:
 		def test():
 			return _generic.generic_test_inject_tracers(self._mz)
 		return ["vice.src.multizone.tracer.inject_tracers", test]
+
+	@unittest
+	def test_multizone_setup(self):
+		r"""
+		vice.src.multizone.multizone.multizone_setup generic test
+		"""
+		def test():
+			return _generic.generic_test_multizone_setup(self._mz)
+		return ["vice.src.multizone.multizone.multizone_setup", test]
+
@@ -32,6 +32,9 @@ cdef extern from "../recycling.h":
 	unsigned short separation_test_recycle_metals_from_tracers(MULTIZONE *mz)
 	unsigned short separation_test_gas_recycled_in_zones(MULTIZONE *mz)
 
+cdef extern from "../tracer.h":
+	unsigned short separation_test_get_tracer_zone(MULTIZONE *mz)
+
 cdef extern from "../sneia.h":
 	unsigned short separation_test_m_sneia_from_tracers(MULTIZONE *mz)
 
@@ -42,7 +42,8 @@ def separation_test():
 			_TEST_.test_multizone_stellar_mass(),
 			_TEST_.test_recycle_metals_from_tracers(),
 			_TEST_.test_gas_recycled_in_zones(),
-			_TEST_.test_m_sneia()
+			_TEST_.test_m_sneia(),
+			_TEST_.test_get_tracer_zone()
 		]
 	]
 
@@ -139,3 +140,12 @@ cdef class separation:
 			return _separation.separation_test_m_sneia_from_tracers(self._mz)
 		return ["vice.src.multizone.sneia.m_sneia", test]
 
+	@unittest
+	def test_get_tracer_zone(self):
+		r"""
+		vice.src.multizone.tracer.get_tracer_zone separation test
+		"""
+		def test():
+			return _separation.separation_test_get_tracer_zone(self._mz)
+		return ["vice.src.multizone.tracer.get_tracer_zone", test]
+
@@ -0,0 +1,98 @@
+r"""
+Implements the stellar migration scheme for the aggregate test, and compares
+the output of a model computing recycling and stellar masses from cohort
+aggregates to that of an otherwise identical model which does not.
+"""
+
+from .....core.multizone import multizone
+from .....testing import moduletest
+from .....testing import unittest
+
+_N_ZONES_ = 3
+_TIMES_ = [0.05 * i for i in range(201)]
+
+
+def stellar_migration(zone, tform, time, n = 0):
+	r"""
+	The stellar migration prescription -> star particles move one zone outward
+	every n + 1 Gyr following their formation, wrapping around to the zero'th
+	zone. Star particles from the same zone and timestep therefore occupy
+	different zones, and zones are vacated and re-occupied by them over time.
+	"""
+	return (zone + int((time - tform) / (n + 1))) % _N_ZONES_
+
+
+@moduletest
+def aggregate_comparison_test():
+	r"""
+	Runs two models with the same parameters, one with the attribute
+	``aggregate`` set to True and the other with it set to False, and compares
+	their outputs.
+	"""
+	msg = "vice.core.multizone edge case : aggregate comparison"
+	try:
+		_TEST_ = aggregate_comparison()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.history(),
+			_TEST_.tracers()
+		]
+	]
+
+
+class aggregate_comparison:
+
+	r"""
+	Implements the aggregate comparison test.
+	"""
+
+	def __init__(self):
+		self.outputs = []
+		for aggregate in [False, True]:
+			mz = multizone(name = "test", n_zones = _N_ZONES_, n_stars = 3,
+				aggregate = aggregate)
+			mz.migration.stars = stellar_migration
+			self.outputs.append(mz.run(_TIMES_, overwrite = True,
+				capture = True))
+
+	@unittest
+	def history(self):
+		r"""
+		Ensures that the time evolution of each zone is the same up to
+		floating point round-off.
+		"""
+		def test():
+			for i in range(_N_ZONES_):
+				expected = self.outputs[0].zones["zone%d" % (i)].history
+				actual = self.outputs[1].zones["zone%d" % (i)].history
+				for key in ["mgas", "mstar", "z(fe)", "z(o)"]:
+					for j in range(len(expected[key])):
+						if expected[key][j]:
+							if abs(actual[key][j] / expected[key][j] - 1) > 1e-10:
+								return False
+						elif actual[key][j]:
+							return False
+			return True
+		return ["vice.src.multizone.cohorts", test]
+
+	@unittest
+	def tracers(self):
+		r"""
+		Ensures that the star particles are in the same zones with the same
+		masses and metallicities.
+		"""
+		def test():
+			for key in ["zone_origin", "zone_final", "mass", "z(fe)", "z(o)"]:
+				expected = self.outputs[0].stars[key]
+				actual = self.outputs[1].stars[key]
+				for j in range(len(expected)):
+					if expected[j]:
+						if abs(actual[j] / expected[j] - 1) > 1e-10:
+							return False
+					elif actual[j]:
+						return False
+			return True
+		return ["vice.src.multizone.cohorts", test]
+
@@ -0,0 +1,116 @@
+r"""
+Compares the output of models whose stellar migration prescription is called
+once per star particle per timestep to that of otherwise identical models
+whose prescription is batched, called once for all star particles born in a
+zone at a given timestep.
+"""
+
+from .....core.multizone import multizone
+from .....core.callback import batched
+from .....testing import moduletest
+from .....testing import unittest
+import warnings
+import math
+
+_N_ZONES_ = 6
+_TIMES_ = [0.05 * i for i in range(201)]
+
+# The keyword arguments to the multizone object in each configuration tested.
+_CONFIGURATIONS_ = [
+	{"simple": True, "n_stars": 2},
+	{"simple": False, "n_stars": 2}
+]
+
+
+def stellar_migration(zone, tform, time, n = 0):
+	r"""
+	The stellar migration prescription -> star particles move one zone outward
+	every Gyr following their formation, wrapping around to the zero'th zone,
+	with odd-numbered star particles moving twice as often.
+	"""
+	return (zone + (1 + n % 2) * int(time - tform)) % _N_ZONES_
+
+
+@batched
+def batched_stellar_migration(zone, tform, time, n = [0]):
+	r"""
+	The same prescription as ``stellar_migration``, evaluated on an array of
+	times for an array of star particles.
+	"""
+	return [[stellar_migration(zone, tform, t, n = k) for t in time] for k in n]
+
+
+@moduletest
+def batched_comparison_test():
+	r"""
+	Runs pairs of models with the same parameters in simple mode and in full
+	mode, one with a stellar migration prescription called at each time and
+	the other with an equivalent batched prescription, and compares their
+	outputs.
+	"""
+	msg = "vice.core.multizone edge case : batched stellar migration"
+	try:
+		_TEST_ = batched_comparison()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.history(),
+			_TEST_.tracers()
+		]
+	]
+
+
+class batched_comparison:
+
+	r"""
+	Implements the batched stellar migration comparison test.
+	"""
+
+	def __init__(self):
+		self.outputs = []
+		for kwargs in _CONFIGURATIONS_:
+			pair = []
+			for stars in [stellar_migration, batched_stellar_migration]:
+				with warnings.catch_warnings():
+					warnings.simplefilter("ignore")
+					mz = multizone(name = "test", n_zones = _N_ZONES_,
+						**kwargs)
+				for i in range(_N_ZONES_):
+					mz.zones[i].mode = "ifr"
+					mz.zones[i].func = lambda t: 9.1 * math.exp(-t / 3)
+					mz.zones[i].tau_star = 1 + i
+					mz.migration.gas[i][(i + 1) % _N_ZONES_] = 0.01
+				mz.migration.stars = stars
+				pair.append(mz.run(_TIMES_, overwrite = True, capture = True))
+			self.outputs.append(pair)
+
+	@unittest
+	def history(self):
+		r"""
+		Ensures that the time evolution of each zone is identical.
+		"""
+		def test():
+			for pair in self.outputs:
+				for i in range(_N_ZONES_):
+					expected = pair[0].zones["zone%d" % (i)].history
+					actual = pair[1].zones["zone%d" % (i)].history
+					for key in ["mgas", "mstar", "sfr", "z(fe)", "z(o)"]:
+						if expected[key] != actual[key]: return False
+			return True
+		return ["vice.core.multizone.setup_tracers_batched", test]
+
+	@unittest
+	def tracers(self):
+		r"""
+		Ensures that the star particles are in the same zones with the same
+		masses and metallicities.
+		"""
+		def test():
+			for pair in self.outputs:
+				for key in ["zone_origin", "zone_final", "mass", "z(fe)",
+					"z(o)"]:
+					if pair[0].stars[key] != pair[1].stars[key]: return False
+			return True
+		return ["vice.core.multizone.setup_tracers_batched", test]
+
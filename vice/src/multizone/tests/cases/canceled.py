@@ -0,0 +1,71 @@
+r"""
+Ensures that a zone of a multizone model whose migration matrix failed its
+sanity check, by which point the return fractions of each zone have been
+computed, can be ran on its own with a different timestep size and produce
+the same output as a new singlezone model.
+"""
+
+from .....core.multizone import multizone
+from .....core.singlezone import singlezone
+from .....testing import moduletest
+from .....testing import unittest
+import warnings
+
+_N_ZONES_ = 3
+_TIMES_ = [0.05 * i for i in range(101)]
+
+
+@moduletest
+def canceled_test():
+	r"""
+	Runs a multizone model with an invalid migration matrix, then one of its
+	zones as a singlezone model with a finer timestep, comparing it to a new
+	singlezone model.
+	"""
+	msg = "vice.core.multizone edge case : canceled run"
+	try:
+		_TEST_ = canceled()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.zone_rerun()
+		]
+	]
+
+
+class canceled:
+
+	r"""
+	Implements the canceled multizone run test.
+	"""
+
+	def __init__(self):
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore")
+			mz = multizone(name = "test", n_zones = _N_ZONES_)
+			# the sum of migration likelihoods out of zone 0 exceeds 1
+			mz.migration.gas[0][1] = lambda t: 0.6
+			mz.migration.gas[0][2] = lambda t: 0.6
+			try:
+				mz.run(_TIMES_[:21], overwrite = True)
+			except RuntimeError:
+				pass
+			zone = mz.zones[0]
+			zone.name = "test"
+			zone.dt = 0.005
+			self.zone = zone.run(_TIMES_, overwrite = True, capture = True)
+			sz = singlezone(name = "test", dt = 0.005)
+			self.singlezone = sz.run(_TIMES_, overwrite = True,
+				capture = True)
+
+	@unittest
+	def zone_rerun(self):
+		r"""
+		Ensures that the zone computes its own return fractions for the new
+		timestep size rather than reusing those of the canceled run.
+		"""
+		def test():
+			return all([self.zone.history[key] == self.singlezone.history[key]
+				for key in ["mstar", "z(fe)", "z(o)"]])
+		return ["vice.src.multizone.multizone_cancel", test]
@@ -0,0 +1,116 @@
+r"""
+Compares the output of models whose stellar migration prescription is a
+hydrodiskstars object, the zone histories of whose star particles are set up
+entirely in C, to that of otherwise identical models with a subclass
+overriding the ``__call__`` function, which calls the object from python to
+assign each analog.
+"""
+
+from .....core.multizone import multizone
+from .....toolkit.hydrodisk import hydrodiskstars
+from .....toolkit.hydrodisk.data.download import _h277_exists
+from .....testing import moduletest
+from .....testing import unittest
+import warnings
+import ctypes
+import math
+
+_RAD_BINS_ = [2. * i for i in range(11)]
+_TIMES_ = [0.05 * i for i in range(101)]
+_MODES_ = ["linear", "sudden", "diffusion"]
+_SEED_ = 42 # both models in a pair draw the same random numbers
+
+
+class hydrodiskstars_hook(hydrodiskstars):
+
+	r"""
+	A subclass of the hydrodiskstars object overriding the ``__call__``
+	function, which forces multizone objects to call it from python.
+	"""
+
+	def __init__(self, base):
+		# share the star particle data, whose subsamples are drawn at random
+		self._hydrodiskstars__c_version = base._hydrodiskstars__c_version
+
+	def __call__(self, zone, tform, time):
+		return super().__call__(zone, tform, time)
+
+
+@moduletest
+def hydrodisk_comparison_test():
+	r"""
+	Runs pairs of models with the same parameters in each migration mode of
+	the hydrodiskstars object, one set up in C and the other with a subclass
+	called from python, and compares their outputs.
+	"""
+	msg = "vice.core.multizone edge case : hydrodiskstars setup"
+	if not _h277_exists(): return [msg, None]
+	try:
+		_TEST_ = hydrodisk_comparison()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.history(),
+			_TEST_.tracers()
+		]
+	]
+
+
+class hydrodisk_comparison:
+
+	r"""
+	Implements the hydrodiskstars setup comparison test.
+	"""
+
+	def __init__(self):
+		srand = ctypes.CDLL(None).srand
+		self.outputs = []
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore")
+			base = hydrodiskstars(_RAD_BINS_)
+			hook = hydrodiskstars_hook(base)
+			for mode in _MODES_:
+				base.mode = mode
+				pair = []
+				for stars in [base, hook]:
+					mz = multizone(name = "test",
+						n_zones = len(_RAD_BINS_) - 1, simple = False)
+					for i in range(mz.n_zones):
+						mz.zones[i].mode = "ifr"
+						mz.zones[i].func = lambda t: 9.1 * math.exp(-t / 3)
+						mz.zones[i].tau_star = 1 + i
+					mz.migration.stars = stars
+					srand(_SEED_)
+					pair.append(mz.run(_TIMES_, overwrite = True,
+						capture = True))
+				self.outputs.append(pair)
+
+	@unittest
+	def history(self):
+		r"""
+		Ensures that the time evolution of each zone is identical.
+		"""
+		def test():
+			for pair in self.outputs:
+				for i in range(len(_RAD_BINS_) - 1):
+					expected = pair[0].zones["zone%d" % (i)].history
+					actual = pair[1].zones["zone%d" % (i)].history
+					for key in ["mgas", "mstar", "sfr", "z(fe)", "z(o)"]:
+						if expected[key] != actual[key]: return False
+			return True
+		return ["vice.core.multizone.setup_hydrodisk_tracers", test]
+
+	@unittest
+	def tracers(self):
+		r"""
+		Ensures that the star particles are in the same zones with the same
+		masses and metallicities.
+		"""
+		def test():
+			for pair in self.outputs:
+				for key in ["zone_origin", "zone_final", "mass", "z(fe)",
+					"z(o)"]:
+					if pair[0].stars[key] != pair[1].stars[key]: return False
+			return True
+		return ["vice.core.multizone.setup_hydrodisk_tracers", test]
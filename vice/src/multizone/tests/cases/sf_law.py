@@ -0,0 +1,96 @@
+r"""
+Compares the output of models whose zones adopt the ``J21_sf_law`` star
+formation law, which is evaluated in C, to that of otherwise identical models
+adopting a subclass which overrides ``__call__`` and is therefore called from
+C at every timestep.
+"""
+
+from .....core.multizone import multizone
+from .....toolkit.J21_sf_law import J21_sf_law
+from .....testing import moduletest
+from .....testing import unittest
+import warnings
+import math
+
+_N_ZONES_ = 4
+_TIMES_ = [0.05 * i for i in range(201)]
+
+# The surface area of each zone, chosen such that the gas surface densities
+# span all three regimes of the star formation law.
+_AREAS_ = [50, 200, 1000, 5000]
+
+# The function of time specifying the evolution of each zone in each mode.
+_FUNCS_ = {
+	"ifr": lambda t: 9.1 * math.exp(-t / 3),
+	"gas": lambda t: 5.e9 * math.exp(-t / 6),
+	"sfr": lambda t: 2 * math.exp(-t / 5)
+}
+
+
+class J21_callback(J21_sf_law):
+
+	r"""
+	The ``J21_sf_law`` star formation law, evaluated in python.
+	"""
+
+	def __call__(self, time, arg2):
+		return super().__call__(time, arg2)
+
+
+@moduletest
+def sf_law_comparison_test():
+	r"""
+	Runs pairs of models in each mode, one with a ``J21_sf_law`` object as the
+	attribute ``tau_star`` of each zone and the other with an instance of a
+	subclass overriding ``__call__``, and compares their outputs.
+	"""
+	msg = "vice.core.multizone edge case : J21_sf_law comparison"
+	try:
+		_TEST_ = sf_law_comparison()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.history()
+		]
+	]
+
+
+class sf_law_comparison:
+
+	r"""
+	Implements the J21_sf_law comparison test.
+	"""
+
+	def __init__(self):
+		self.outputs = []
+		for mode in _FUNCS_.keys():
+			pair = []
+			for law in [J21_sf_law, J21_callback]:
+				with warnings.catch_warnings():
+					warnings.simplefilter("ignore")
+					mz = multizone(name = "test", n_zones = _N_ZONES_,
+						simple = True)
+				for i in range(_N_ZONES_):
+					mz.zones[i].mode = mode
+					mz.zones[i].func = _FUNCS_[mode]
+					mz.zones[i].tau_star = law(_AREAS_[i], mode = mode)
+					mz.migration.gas[i][(i + 1) % _N_ZONES_] = 0.01
+				pair.append(mz.run(_TIMES_, overwrite = True, capture = True))
+			self.outputs.append(pair)
+
+	@unittest
+	def history(self):
+		r"""
+		Ensures that the time evolution of each zone is identical.
+		"""
+		def test():
+			for pair in self.outputs:
+				for i in range(_N_ZONES_):
+					expected = pair[0].zones["zone%d" % (i)].history
+					actual = pair[1].zones["zone%d" % (i)].history
+					for key in ["mgas", "mstar", "sfr", "z(fe)", "z(o)"]:
+						if expected[key] != actual[key]: return False
+			return True
+		return ["vice.src.toolkit.J21_sf_law", test]
+
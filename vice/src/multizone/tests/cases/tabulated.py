@@ -0,0 +1,79 @@
+r"""
+Ensures that multizone models running in full mode evaluate a tabulated AGB
+star yield only when the simulation begins, as singlezone models do, rather
+than once per tracer particle at every timestep.
+"""
+
+from .....core.multizone import multizone
+from .....core.singlezone import singlezone
+from .....yields.agb import tabulated
+from ..... import yields
+from .....testing import moduletest
+from .....testing import unittest
+import warnings
+
+_N_ZONES_ = 2
+_TIMES_ = [0.05 * i for i in range(41)]
+_METALLICITIES_ = [0.0001, 0.001, 0.01, 0.02]
+
+
+@moduletest
+def tabulated_agb_test():
+	r"""
+	Runs a singlezone model and a multizone model in full mode with a
+	tabulated AGB star yield for carbon and counts the number of times the
+	yield function is called in each.
+	"""
+	msg = "vice.core.multizone edge case : tabulated AGB yields"
+	try:
+		_TEST_ = tabulated_agb()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.calls()
+		]
+	]
+
+
+class tabulated_agb:
+
+	r"""
+	Implements the tabulated AGB star yield test.
+	"""
+
+	def __init__(self):
+		self.n_calls = 0
+		current = yields.agb.settings['c']
+		yields.agb.settings['c'] = tabulated(self.yield_, _METALLICITIES_)
+		try:
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore")
+				sz = singlezone(name = "test", elements = ["c"])
+				sz.run(_TIMES_, overwrite = True, capture = True)
+				self.singlezone_calls = self.n_calls
+				self.n_calls = 0
+				mz = multizone(name = "test", n_zones = _N_ZONES_,
+					simple = False)
+				for i in range(_N_ZONES_):
+					mz.zones[i].elements = ["c"]
+				mz.run(_TIMES_, overwrite = True, capture = True)
+				self.multizone_calls = self.n_calls
+		finally:
+			yields.agb.settings['c'] = current
+
+	def yield_(self, mass, metallicity):
+		self.n_calls += 1
+		return 1.e-3 * mass * (metallicity / 0.014)
+
+	@unittest
+	def calls(self):
+		r"""
+		Ensures that each zone calls the yield function no more times than
+		the singlezone model.
+		"""
+		def test():
+			return (self.singlezone_calls > 0 and
+				self.multizone_calls <= _N_ZONES_ * self.singlezone_calls)
+		return ["vice.src.multizone.agb", test]
+
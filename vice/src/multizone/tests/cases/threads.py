@@ -0,0 +1,116 @@
+r"""
+Compares the output of models with their zones distributed across multiple
+threads to that of otherwise identical models with their zones evolved one at
+a time.
+"""
+
+from .....core.multizone import multizone
+from .....testing import moduletest
+from .....testing import unittest
+import warnings
+import math
+
+_N_ZONES_ = 6
+_TIMES_ = [0.05 * i for i in range(201)]
+
+# The keyword arguments to the multizone object in each configuration tested.
+_CONFIGURATIONS_ = [
+	{"simple": True},
+	{"simple": False, "n_stars": 2},
+	{"simple": False, "n_stars": 2, "aggregate": True}
+]
+
+
+def tau_star(time, mgas):
+	r"""
+	The star formation efficiency timescale of the odd-numbered zones -> a
+	python function of gas mass which must be called from C at every timestep
+	while other zones are evolving.
+	"""
+	return 2 * (1 + mgas / 6.0e9)**(-0.5)
+
+
+def stellar_migration(zone, tform, time):
+	r"""
+	The stellar migration prescription -> star particles move one zone outward
+	every Gyr following their formation, wrapping around to the zero'th zone.
+	"""
+	return (zone + int(time - tform)) % _N_ZONES_
+
+
+@moduletest
+def threads_comparison_test():
+	r"""
+	Runs pairs of models with the same parameters in simple mode and in full
+	mode, one with the attribute ``n_threads`` set to 1 and the other with it
+	set to 4, and compares their outputs.
+	"""
+	msg = "vice.core.multizone edge case : threads comparison"
+	try:
+		_TEST_ = threads_comparison()
+	except:
+		return [msg, None]
+	return [msg,
+		[
+			_TEST_.history(),
+			_TEST_.tracers()
+		]
+	]
+
+
+class threads_comparison:
+
+	r"""
+	Implements the threads comparison test.
+	"""
+
+	def __init__(self):
+		self.outputs = []
+		for kwargs in _CONFIGURATIONS_:
+			pair = []
+			for n_threads in [1, 4]:
+				with warnings.catch_warnings():
+					warnings.simplefilter("ignore")
+					mz = multizone(name = "test", n_zones = _N_ZONES_,
+						n_threads = n_threads, **kwargs)
+				for i in range(_N_ZONES_):
+					mz.zones[i].mode = "ifr"
+					mz.zones[i].func = lambda t: 9.1 * math.exp(-t / 3)
+					if i % 2:
+						mz.zones[i].tau_star = tau_star
+					else:
+						mz.zones[i].tau_star = 1 + i
+					mz.migration.gas[i][(i + 1) % _N_ZONES_] = 0.01
+				mz.migration.stars = stellar_migration
+				pair.append(mz.run(_TIMES_, overwrite = True, capture = True))
+			self.outputs.append(pair)
+
+	@unittest
+	def history(self):
+		r"""
+		Ensures that the time evolution of each zone is identical.
+		"""
+		def test():
+			for pair in self.outputs:
+				for i in range(_N_ZONES_):
+					expected = pair[0].zones["zone%d" % (i)].history
+					actual = pair[1].zones["zone%d" % (i)].history
+					for key in ["mgas", "mstar", "sfr", "z(fe)", "z(o)"]:
+						if expected[key] != actual[key]: return False
+			return True
+		return ["vice.src.multizone.parallel", test]
+
+	@unittest
+	def tracers(self):
+		r"""
+		Ensures that the star particles are in the same zones with the same
+		masses and metallicities.
+		"""
+		def test():
+			for pair in self.outputs:
+				for key in ["zone_origin", "zone_final", "mass", "z(fe)",
+					"z(o)"]:
+					if pair[0].stars[key] != pair[1].stars[key]: return False
+			return True
+		return ["vice.src.multizone.parallel", test]
+
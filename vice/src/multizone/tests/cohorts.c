@@ -0,0 +1,194 @@
+/*
+ * This file implements testing of the cohort aggregates in the parent
+ * directory.
+ */
+
+#include <stdlib.h>
+#include "../../multizone.h"
+#include "../../utils.h"
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned short compare_by_zone(double *aggregate, double *tracers,
+	unsigned int n_zones);
+
+
+/*
+ * Performs the aggregate edge-case test on the cohort_move_tracer function in
+ * the parent directory. The number of tracer particles from each cohort in
+ * each zone should match that found by counting the tracer particles
+ * individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: cohorts.h
+ */
+extern unsigned short aggregate_test_cohort_move_tracer(MULTIZONE *mz) {
+
+	unsigned long i;
+	unsigned short status = 1u;
+	TRACER *t = mz -> mig -> tracers;
+	for (i = 0ul; i < (*(*mz).mig).tracer_count / (*(*mz).mig).n_tracers;
+		i++) {
+		unsigned long first = i * (*t).cohort_width;
+		unsigned int j, total = 0u;
+		for (j = 0u; j < (*t).cohort_length[i]; j++) {
+			unsigned int k, count = 0u;
+			for (k = 0u; k < (*(*mz).mig).n_tracers; k++) {
+				count += (*t).zone_current[first + k] == (
+					*t).cohort_zone[first + j];
+			}
+			status &= count == (*t).cohort_count[first + j];
+			total += (*t).cohort_count[first + j];
+		}
+		status &= total == (*(*mz).mig).n_tracers;
+		if (!status) break;
+	}
+	return status;
+
+}
+
+
+/*
+ * Performs the aggregate edge-case test on the cohort_recycled_mass function
+ * in the parent directory. The mass of each element recycled in each zone
+ * should match that found by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: cohorts.h
+ */
+extern unsigned short aggregate_test_cohort_recycled_mass(MULTIZONE *mz) {
+
+	unsigned int i;
+	unsigned short status = 1u;
+	for (i = 0u; i < (*(*mz).zones[0]).n_elements; i++) {
+		mz -> aggregate = 1u;
+		double *aggregate = recycled_mass(*mz, i);
+		mz -> aggregate = 0u;
+		double *tracers = recycled_mass(*mz, i);
+		status &= compare_by_zone(aggregate, tracers, (*(*mz).mig).n_zones);
+		free(aggregate);
+		free(tracers);
+		if (!status) break;
+	}
+	mz -> aggregate = 1u;
+	return status;
+
+}
+
+
+/*
+ * Performs the aggregate edge-case test on the cohort_gas_recycled function
+ * in the parent directory. The mass of ISM gas recycled in each zone should
+ * match that found by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: cohorts.h
+ */
+extern unsigned short aggregate_test_cohort_gas_recycled(MULTIZONE *mz) {
+
+	mz -> aggregate = 1u;
+	double *aggregate = gas_recycled_in_zones(*mz, NULL);
+	mz -> aggregate = 0u;
+	double *tracers = gas_recycled_in_zones(*mz, NULL);
+	mz -> aggregate = 1u;
+	unsigned short status = compare_by_zone(aggregate, tracers,
+		(*(*mz).mig).n_zones);
+	free(aggregate);
+	free(tracers);
+	return status;
+
+}
+
+
+/*
+ * Performs the aggregate edge-case test on the cohort_stellar_mass function
+ * in the parent directory. The stellar mass in each zone should match that
+ * found by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: cohorts.h
+ */
+extern unsigned short aggregate_test_cohort_stellar_mass(MULTIZONE *mz) {
+
+	mz -> aggregate = 1u;
+	double *aggregate = multizone_stellar_mass(*mz, NULL);
+	mz -> aggregate = 0u;
+	double *tracers = multizone_stellar_mass(*mz, NULL);
+	mz -> aggregate = 1u;
+	unsigned short status = compare_by_zone(aggregate, tracers,
+		(*(*mz).mig).n_zones);
+	free(aggregate);
+	free(tracers);
+	return status;
+
+}
+
+
+/*
+ * Compare the per-zone quantities computed from the cohort aggregates to
+ * those computed from each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * aggregate: 	The quantity in each zone computed from the aggregates
+ * tracers: 	The quantity in each zone computed from the tracer particles
+ * n_zones: 	The number of zones in the simulation
+ *
+ * Returns
+ * =======
+ * 1 if the two agree to within floating point round-off in every zone and at
+ * least one of them is non-zero, 0 otherwise.
+ */
+static unsigned short compare_by_zone(double *aggregate, double *tracers,
+	unsigned int n_zones) {
+
+	/*
+	 * The aggregates multiply the contribution of a single tracer particle
+	 * by the number of particles in each zone rather than summing them one
+	 * at a time, so the two can differ by round-off. They are otherwise
+	 * identical, so this tolerance is much tighter than those used in
+	 * comparing multizone and singlezone models.
+	 */
+	unsigned int i;
+	unsigned short nonzero = 0u;
+	for (i = 0u; i < n_zones; i++) {
+		if (tracers[i]) {
+			nonzero = 1u;
+			if (absval((aggregate[i] - tracers[i]) / tracers[i]) > 1e-12) {
+				return 0u;
+			} else {}
+		} else if (aggregate[i]) {
+			return 0u;
+		} else {}
+	}
+	return nonzero;
+
+}
+
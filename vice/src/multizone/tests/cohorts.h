@@ -0,0 +1,82 @@
+#ifndef MULTIZONE_TESTS_COHORTS_H
+#define MULTIZONE_TESTS_COHORTS_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+/*
+ * Performs the aggregate edge-case test on the cohort_move_tracer function in
+ * the parent directory. The number of tracer particles from each cohort in
+ * each zone should match that found by counting the tracer particles
+ * individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: cohorts.c
+ */
+extern unsigned short aggregate_test_cohort_move_tracer(MULTIZONE *mz);
+
+/*
+ * Performs the aggregate edge-case test on the cohort_recycled_mass function
+ * in the parent directory. The mass of each element recycled in each zone
+ * should match that found by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: cohorts.c
+ */
+extern unsigned short aggregate_test_cohort_recycled_mass(MULTIZONE *mz);
+
+/*
+ * Performs the aggregate edge-case test on the cohort_gas_recycled function
+ * in the parent directory. The mass of ISM gas recycled in each zone should
+ * match that found by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: cohorts.c
+ */
+extern unsigned short aggregate_test_cohort_gas_recycled(MULTIZONE *mz);
+
+/*
+ * Performs the aggregate edge-case test on the cohort_stellar_mass function
+ * in the parent directory. The stellar mass in each zone should match that
+ * found by looking at each tracer particle individually.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: cohorts.c
+ */
+extern unsigned short aggregate_test_cohort_stellar_mass(MULTIZONE *mz);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* MULTIZONE_TESTS_COHORTS_H */
+
@@ -51,7 +51,7 @@ extern unsigned short no_migration_test_multizone_unretained(MULTIZONE *mz) {
 	 */
 	unsigned int i, j;
 	unsigned short status = 1u;
-	double **unretained = multizone_unretained(*mz);
+	double **unretained = multizone_unretained(*mz, NULL);
 	if (unretained != NULL) {
 		for (i = 0u; i < (*(*mz).mig).n_zones; i++) {
 			for (j = 0u; j < (*(*mz).zones[i]).n_elements; j++) {
@@ -89,7 +89,7 @@ extern unsigned short separation_test_migrate(MULTIZONE *mz) {
 	 */
 	unsigned long i, n = 0ul;
 	for (i = 0ul; i < (*(*mz).mig).tracer_count; i++) {
-		if ((*(*(*mz).mig).tracers[i]).zone_current == 0u) n++;
+		if ((*(*(*mz).mig).tracers).zone_current[i] == 0u) n++;
 	}
 	return n == 2 * (*(*mz).mig).n_tracers;
 
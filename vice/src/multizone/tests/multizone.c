@@ -8,6 +8,7 @@
 #include "../multizone.h"
 #include "../../utils.h"
 #include "../../singlezone/singlezone.h"
+#include "../../ssp.h"
 
 
 /*
@@ -27,7 +28,7 @@
 extern unsigned short no_migration_test_multizone_stellar_mass(MULTIZONE *mz) {
 
 	unsigned int i;
-	double *actual = multizone_stellar_mass(*mz);
+	double *actual = multizone_stellar_mass(*mz, NULL);
 	if (actual != NULL) {
 
 		/*
@@ -87,7 +88,7 @@ extern unsigned short no_migration_test_multizone_stellar_mass(MULTIZONE *mz) {
  */
 extern unsigned short separation_test_multizone_stellar_mass(MULTIZONE *mz) {
 
-	double *actual = multizone_stellar_mass(*mz);
+	double *actual = multizone_stellar_mass(*mz, NULL);
 	if (actual != NULL) {
 		/*
 		 * There will be two rather than one timestep's worth of tracer
@@ -118,3 +119,38 @@ extern unsigned short separation_test_multizone_stellar_mass(MULTIZONE *mz) {
 
 }
 
+
+/*
+ * Performs the generic test on the multizone_setup function in the parent
+ * directory. Zones with the same single stellar population parameters should
+ * share one cumulative return fraction and main sequence mass fraction, which
+ * should match those computed for that population directly.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: multizone.h
+ */
+extern unsigned short generic_test_multizone_setup(MULTIZONE *mz) {
+
+	unsigned long i;
+	SSP *ssp = (*(*mz).zones[0]).ssp;
+	unsigned short status = (*ssp).crf != NULL && (*ssp).msmf != NULL;
+	for (i = 1ul; i < (*(*mz).mig).n_zones; i++) {
+		status &= (*(*(*mz).zones[i]).ssp).crf == (*ssp).crf;
+		status &= (*(*(*mz).zones[i]).ssp).msmf == (*ssp).msmf;
+	}
+	for (i = 0ul; status && i < n_timesteps(*(*mz).zones[0]); i += 10ul) {
+		double t = i * (*(*mz).zones[0]).dt;
+		status &= absval((*ssp).crf[i] - CRF(*ssp, t)) < 1e-12;
+		status &= absval((*ssp).msmf[i] - MSMF(*ssp, t)) < 1e-12;
+	}
+	return status;
+
+}
+
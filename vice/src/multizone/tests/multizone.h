@@ -38,6 +38,24 @@ extern unsigned short no_migration_test_multizone_stellar_mass(MULTIZONE *mz);
  */
 extern unsigned short separation_test_multizone_stellar_mass(MULTIZONE *mz);
 
+/*
+ * Performs the generic test on the multizone_setup function in the parent
+ * directory. Zones with the same single stellar population parameters should
+ * share one cumulative return fraction and main sequence mass fraction, which
+ * should match those computed for that population directly.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: multizone.c
+ */
+extern unsigned short generic_test_multizone_setup(MULTIZONE *mz);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
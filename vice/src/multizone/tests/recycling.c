@@ -182,7 +182,7 @@ extern unsigned short no_migration_test_gas_recycled_in_zones(MULTIZONE *mz) {
 	for (i = 0u; i < (*(*mz).mig).n_zones; i++) {
 		mz -> zones[i] -> timestep--;
 	}
-	double *actual = gas_recycled_in_zones(*mz);
+	double *actual = gas_recycled_in_zones(*mz, NULL);
 	if (actual != NULL) {
 		for (i = 0u; i < (*(*mz).mig).n_zones; i++) {
 			double expected = mass_recycled(*(*mz).zones[i], NULL);
@@ -225,7 +225,7 @@ extern unsigned short separation_test_gas_recycled_in_zones(MULTIZONE *mz) {
 	 * gas recycled should be comparable - a few massive stars roughly
 	 * balances with many more lower mass stars for recycling.
 	 */
-	double *recycled = gas_recycled_in_zones(*mz);
+	double *recycled = gas_recycled_in_zones(*mz, NULL);
 	if (recycled != NULL) {
 		unsigned short status = (
 			absval(log10(recycled[1]) - log10(recycled[0])) < 1
@@ -2,6 +2,7 @@
  * This file implements testing of the tracer routines in the parent directory.
  */
 
+#include "../../singlezone.h"
 #include "../tracer.h"
 
 
@@ -40,3 +41,41 @@ extern unsigned short generic_test_inject_tracers(MULTIZONE *mz) {
 
 }
 
+
+
+/*
+ * Performs the separation test on the get_tracer_zone function in the parent
+ * directory. Every star particle should be in the zone of its birth at the
+ * timestep of birth and in the quiescent zone afterwards, which requires at
+ * most two changes in zone in its run-length encoded zone history, unless it
+ * is stored in full because it is short.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to perform the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: tracer.h
+ */
+extern unsigned short separation_test_get_tracer_zone(MULTIZONE *mz) {
+
+	unsigned long i, n = (*(*(*mz).mig).tracers).n_timesteps;
+	TRACER t = *(*(*mz).mig).tracers;
+	for (i = 0ul; i < (*(*mz).mig).tracer_count; i++) {
+		unsigned long birth = t.timestep_origin[i];
+		if (t.history_lengths[i] > 2u &&
+			t.history_lengths[i] != n - birth) return 0u;
+		if (get_tracer_zone(t, i, birth) != (signed) t.zone_origin[i]) {
+			return 0u;
+		} else {}
+		if (birth && get_tracer_zone(t, i, birth - 1ul) != -1) return 0u;
+		if (birth + 1ul <= n - BUFFER && (
+			get_tracer_zone(t, i, birth + 1ul) != 1 ||
+			get_tracer_zone(t, i, n - 1ul) != 1)) return 0u;
+	}
+	return 1u;
+
+}
@@ -23,6 +23,24 @@ extern "C" {
  */
 extern unsigned short generic_test_inject_tracers(MULTIZONE *mz);
 
+/*
+ * Performs the separation test on the get_tracer_zone function in the parent
+ * directory. Every star particle should be in the zone of its birth at the
+ * timestep of birth and in the quiescent zone afterwards, which requires at
+ * most two changes in zone in its run-length encoded zone history.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object to perform the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: tracer.c
+ */
+extern unsigned short separation_test_get_tracer_zone(MULTIZONE *mz);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
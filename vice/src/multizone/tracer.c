@@ -4,12 +4,22 @@
  */
 
 #include <stdlib.h>
+#include <string.h>
+#include <limits.h>
 #include "../multizone.h"
 #include "../singlezone.h"
 #include "../tracer.h"
 #include "../utils.h"
 #include "tracer.h"
 
+/* ---------- Static function comment headers not duplicated here ---------- */
+static unsigned short zone_history_width(unsigned int n_zones);
+static unsigned int read_history_entry(const unsigned char *entry,
+	unsigned short width);
+static void write_history_entry(unsigned char *entry, unsigned short width,
+	unsigned int value);
+
+
 /*
  * Injects tracer particles into a multizone object for the current timestep
  *
@@ -32,15 +42,18 @@ extern void inject_tracers(MULTIZONE *mz) {
 
 		unsigned long i, timestep = (*(*mz).zones[0]).timestep;
 		MIGRATION *mig = mz -> mig;
+		TRACER *t = mig -> tracers;
 		for (i = (*mig).tracer_count;
 			i < (*mig).tracer_count + (*mig).n_tracers * (*mig).n_zones;
 			i++) {
 
-			SINGLEZONE sz = *(*mz).zones[(*(*mig).tracers[i]).zone_origin];
-			TRACER *t = mz -> mig -> tracers[i];
-			t -> mass = (*sz.ism).star_formation_rate * sz.dt / (*mig).n_tracers;
-			t -> zone_current = (unsigned) (
-				(*(*mig).tracers[i]).zone_history[timestep + 1l]);
+			SINGLEZONE sz = *(*mz).zones[(*t).zone_origin[i]];
+			t -> mass[i] = (*sz.ism).star_formation_rate * sz.dt / (
+				*mig).n_tracers;
+			t -> zone_current[i] = (unsigned) get_tracer_zone(*t, i,
+				timestep + 1l);
+			if ((*mz).aggregate) cohort_add_tracer(t, i / (*mig).n_tracers,
+				(*t).zone_current[i]);
 		}
 
 		mig -> tracer_count += (*mig).n_tracers * (*mig).n_zones;
@@ -62,12 +75,12 @@ extern void inject_tracers(MULTIZONE *mz) {
 extern void compute_tracer_masses(MULTIZONE *mz) {
 
 	unsigned long i;
+	TRACER *t = mz -> mig -> tracers;
 	for (i = 0l; i < (*(*mz).mig).tracer_count; i++) {
-		TRACER *t = (*(*mz).mig).tracers[i];
-		SINGLEZONE origin = *(*mz).zones[(*t).zone_origin];
+		SINGLEZONE origin = *(*mz).zones[(*t).zone_origin[i]];
 
-		t -> mass = (
-			(*origin.ism).star_formation_history[(*t).timestep_origin] *
+		t -> mass[i] = (
+			(*origin.ism).star_formation_history[(*t).timestep_origin[i]] *
 			origin.dt / (*(*mz).mig).n_tracers
 		);
 	}
@@ -80,7 +93,7 @@ extern void compute_tracer_masses(MULTIZONE *mz) {
  * Parameters
  * ==========
  * mz: 		The multizone object for the current simulation
- * t: 		The tracer particle to determine the metallicity of
+ * index: 	The index of the tracer particle to determine the metallicity of
  *
  * Returns
  * =======
@@ -88,12 +101,302 @@ extern void compute_tracer_masses(MULTIZONE *mz) {
  *
  * header: tracer.h
  */
-extern double tracer_metallicity(MULTIZONE mz, TRACER t) {
+extern double tracer_metallicity(MULTIZONE mz, unsigned long index) {
 
 	return scale_metallicity(
-		(*mz.zones[t.zone_origin]),
-		t.timestep_origin
+		(*mz.zones[(*(*mz.mig).tracers).zone_origin[index]]),
+		(*(*mz.mig).tracers).timestep_origin[index]
+	);
+
+}
+
+/*
+ * Determine the zone number of a tracer particle at a given timestep from
+ * its zone history.
+ *
+ * Parameters
+ * ==========
+ * t: 			The tracer particles
+ * index: 		The index of the tracer particle
+ * timestep: 	The timestep number
+ *
+ * Returns
+ * =======
+ * The zone number of the tracer particle at that timestep; -1 if it has not
+ * yet formed.
+ *
+ * Notes
+ * =====
+ * Each particle's zone history is stored in one of two forms, whichever
+ * takes up less memory (see set_tracer_history). If it has one zone number
+ * per timestep from its birth onward, it is stored in full. Otherwise, it is
+ * a run-length encoding: the timesteps at which the particle enters a zone,
+ * in increasing order beginning with the timestep of birth, followed by the
+ * zone number it enters at each. Zone numbers take up history_width bytes
+ * each, and timesteps sizeof(unsigned int) bytes. Entries are not aligned
+ * and are copied out with memcpy.
+ *
+ * header: tracer.h
+ */
+extern int get_tracer_zone(TRACER t, unsigned long index,
+	unsigned long timestep) {
+
+	unsigned long birth = t.timestep_origin[index];
+	if (timestep < birth) return -1;
+	if (timestep >= t.n_timesteps) timestep = t.n_timesteps - 1ul;
+	unsigned char *history = (
+		(unsigned char *) t.zone_history + t.history_offsets[index]);
+	unsigned long length = t.history_lengths[index];
+	if (length == t.n_timesteps - birth) {
+		return (signed) read_history_entry(
+			history + (timestep - birth) * t.history_width, t.history_width);
+	} else {
+		/* The last change in zone at or before this timestep */
+		unsigned long lo = 0ul, hi = length;
+		while (hi - lo > 1ul) {
+			unsigned long mid = (lo + hi) / 2ul;
+			if (read_history_entry(history + mid * sizeof(unsigned int),
+				sizeof(unsigned int)) <= timestep) {
+				lo = mid;
+			} else {
+				hi = mid;
+			}
+		}
+		return (signed) read_history_entry(
+			history + length * sizeof(unsigned int) + lo * t.history_width,
+			t.history_width);
+	}
+
+}
+
+/*
+ * Assign the zone history of a tracer particle.
+ *
+ * Parameters
+ * ==========
+ * t: 				A pointer to the tracer particles
+ * index: 			The index of the tracer particle
+ * birth_timestep: 	The timestep at which the tracer particle is born
+ * zones: 			The zone number of the tracer particle at each timestep.
+ * 					Entries before the timestep of birth are ignored.
+ *
+ * Notes
+ * =====
+ * This also assigns the timestep and zone of birth. The zone history is
+ * run-length encoded if that requires fewer bytes than storing it in full
+ * (see get_tracer_zone), and the block holding the zone histories of all
+ * particles is grown as needed.
+ *
+ * header: tracer.h
+ */
+extern void set_tracer_history(TRACER *t, unsigned long index,
+	unsigned long birth_timestep, int *zones) {
+
+	unsigned long i, j, n_changes = 1ul;
+	unsigned long n = (*t).n_timesteps - birth_timestep;
+	for (i = birth_timestep + 1ul; i < (*t).n_timesteps; i++) {
+		if (zones[i] != zones[i - 1ul]) n_changes++;
+	}
+	unsigned short width = (*t).history_width;
+	unsigned long length, size;
+	if (n_changes * (sizeof(unsigned int) + width) < n * width) {
+		length = n_changes;
+		size = n_changes * (sizeof(unsigned int) + width);
+	} else {
+		length = n;
+		size = n * width;
+	}
+
+	if ((*t).history_size + size > (*t).history_capacity) {
+		t -> history_capacity *= 2ul;
+		if ((*t).history_capacity < (*t).history_size + size) {
+			t -> history_capacity = (*t).history_size + size;
+		} else {}
+		t -> zone_history = realloc (t -> zone_history,
+			(*t).history_capacity);
+	} else {}
+
+	unsigned char *history = (
+		(unsigned char *) t -> zone_history + (*t).history_size);
+	if (length == n) {
+		for (i = 0ul; i < n; i++) {
+			write_history_entry(history + i * width, width,
+				(unsigned) zones[birth_timestep + i]);
+		}
+	} else {
+		unsigned char *entered = history + length * sizeof(unsigned int);
+		for (i = birth_timestep, j = 0ul; i < (*t).n_timesteps; i++) {
+			if (i == birth_timestep || zones[i] != zones[i - 1ul]) {
+				write_history_entry(history + j * sizeof(unsigned int),
+					sizeof(unsigned int), (unsigned) i);
+				write_history_entry(entered + j * width, width,
+					(unsigned) zones[i]);
+				j++;
+			} else {}
+		}
+	}
+	t -> history_offsets[index] = (*t).history_size;
+	t -> history_lengths[index] = (unsigned) length;
+	t -> history_size += size;
+	t -> timestep_origin[index] = birth_timestep;
+	t -> zone_origin[index] = (unsigned) zones[birth_timestep];
+
+}
+
+/*
+ * Assign the zone histories of all tracer particles born in a given zone at a
+ * given timestep from a block of zone numbers.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for this simulation
+ * zone: 		The zone of birth
+ * timestep: 	The timestep of birth
+ * block: 		The zone numbers of each tracer particle, stored in one
+ * 				contiguous block of n_times entries per tracer particle.
+ * n_times: 	The number of entries per tracer particle
+ *
+ * Returns
+ * =======
+ * 0 on success. 1 if any zone number is out of range, and 2 if the zone
+ * number of any tracer particle at its time of birth is not the zone of
+ * birth. In these cases, none of the zone histories are modified.
+ *
+ * header: tracer.h
+ */
+extern unsigned short setup_tracer_block(MULTIZONE mz, unsigned int zone,
+	unsigned long timestep, int *block, unsigned long n_times) {
+
+	unsigned long i, j, n = (*(*mz.mig).tracers).n_timesteps;
+	unsigned int k, n_tracers = (*mz.mig).n_tracers;
+	for (i = 0ul; i < n_tracers * n_times; i++) {
+		if (block[i] < 0 || block[i] >= (signed) (*mz.mig).n_zones) return 1u;
+	}
+	if (!mz.simple && n_times) {
+		for (k = 0u; k < n_tracers; k++) {
+			if (block[k * n_times] != (signed) zone) return 2u;
+		}
+	} else {}
+
+	TRACER *t = mz.mig -> tracers;
+	int *zones = (int *) malloc (n * sizeof(int));
+	for (k = 0u; k < n_tracers; k++) {
+		unsigned long index = (
+			timestep * (*mz.mig).n_zones * n_tracers + zone * n_tracers + k
+		);
+		int *row = block + k * n_times;
+		if (mz.simple) {
+			/*
+			 * Only the final zone matters in simple mode, taken from the last
+			 * entry and assigned just inside the buffer.
+			 */
+			for (i = timestep; i < n; i++) zones[i] = (signed) zone;
+			if (n_times) zones[n - BUFFER + 1l] = row[n_times - 1ul];
+			t -> zone_current[index] = (unsigned) zones[n - BUFFER + 1l];
+		} else {
+			/*
+			 * Entries correspond to consecutive timesteps starting at birth,
+			 * and any remaining timesteps (i.e. the buffer) take the value
+			 * of the last.
+			 */
+			for (i = timestep, j = 0ul; i < n; i++) {
+				if (j < n_times) {
+					zones[i] = row[j++];
+				} else {
+					zones[i] = j ? row[j - 1ul] : (signed) zone;
+				}
+			}
+			t -> zone_current[index] = zone;
+		}
+		set_tracer_history(t, index, timestep, zones);
+	}
+	free(zones);
+	return 0u;
+
+}
+
+/*
+ * Group the indices of the tracer particles by the zone they currently reside
+ * in. Within each zone, the particles remain in increasing order of their
+ * index.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object for this simulation
+ *
+ * Notes
+ * =====
+ * Sums over the particles in one zone visit them in the same order as a loop
+ * over every particle, and are therefore identical to the last bit. This
+ * allows each zone to be moved forward one timestep independently of the
+ * others (see multizone_timestepper in src/multizone/multizone.c).
+ *
+ * header: tracer.h
+ */
+extern void index_tracers_by_zone(MULTIZONE *mz) {
+
+	/* A counting sort on the zone each particle currently resides in */
+	unsigned long i;
+	TRACER *t = mz -> mig -> tracers;
+	for (i = 0ul; i <= (*(*mz).mig).n_zones; i++) t -> zone_offsets[i] = 0ul;
+	for (i = 0ul; i < (*(*mz).mig).tracer_count; i++) {
+		t -> zone_offsets[(*t).zone_current[i] + 1u]++;
+	}
+	for (i = 0ul; i < (*(*mz).mig).n_zones; i++) {
+		t -> zone_offsets[i + 1ul] += (*t).zone_offsets[i];
+	}
+
+	/*
+	 * Use the offsets as a running position within each zone, after which
+	 * each holds the offset of the following zone -> shift them back.
+	 */
+	for (i = 0ul; i < (*(*mz).mig).tracer_count; i++) {
+		t -> zone_members[t -> zone_offsets[(*t).zone_current[i]]++] = i;
+	}
+	for (i = (*(*mz).mig).n_zones; i > 0ul; i--) {
+		t -> zone_offsets[i] = (*t).zone_offsets[i - 1ul];
+	}
+	t -> zone_offsets[0] = 0ul;
+
+}
+
+/*
+ * Determine the amount of memory required to store the tracer particles of a
+ * multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ *
+ * Returns
+ * =======
+ * The number of bytes that malloc_tracers will allocate.
+ *
+ * Notes
+ * =====
+ * This counts room for zone histories which never change from the zone of
+ * birth. The memory used by the zone histories grows beyond this as they are
+ * assigned by set_tracer_history, but only for particles which change zones.
+ *
+ * header: tracer.h
+ */
+extern double tracers_memory_estimate(MULTIZONE mz) {
+
+	double n_steps = (double) n_timesteps(*mz.zones[0]);
+	double n = (double) (*mz.mig).n_zones * (*mz.mig).n_tracers * n_steps;
+	double per_particle = (
+		sizeof(double) + 2 * sizeof(unsigned int) + sizeof(unsigned long) +
+		sizeof(unsigned long) + sizeof(unsigned int) + /* history offsets */
+		/* initial zone history */
+		sizeof(unsigned int) + zone_history_width((*mz.mig).n_zones)
 	);
+	if (!mz.simple) per_particle += sizeof(unsigned long); /* zone_members */
+	if (mz.aggregate && !mz.simple) {
+		/* cohort_zone and cohort_count, plus cohort_length per cohort */
+		per_particle += 2 * sizeof(unsigned int) + (
+			sizeof(unsigned int) / (double) (*mz.mig).n_tracers);
+	} else {}
+	return n * per_particle;
 
 }
 
@@ -108,14 +411,137 @@ extern double tracer_metallicity(MULTIZONE mz, TRACER t) {
  */
 extern void malloc_tracers(MULTIZONE *mz) {
 
-	unsigned long i, n = (
-		(*(*mz).mig).n_zones * (*(*mz).mig).n_tracers *
-		n_timesteps(*(*mz).zones[0])
+	TRACER *t = tracer_initialize();
+	t -> n_timesteps = n_timesteps(*(*mz).zones[0]);
+	t -> n_particles = (
+		(*(*mz).mig).n_zones * (*(*mz).mig).n_tracers * (*t).n_timesteps
 	);
-	mz -> mig -> tracers = (TRACER **) malloc (n * sizeof(TRACER *));
-	for (i = 0l; i < n; i++) {
-		mz -> mig -> tracers[i] = tracer_initialize();
+	t -> history_width = zone_history_width((*(*mz).mig).n_zones);
+	t -> mass = (double *) malloc ((*t).n_particles * sizeof(double));
+	t -> zone_origin = (unsigned int *) malloc (
+		(*t).n_particles * sizeof(unsigned int));
+	t -> zone_current = (unsigned int *) malloc (
+		(*t).n_particles * sizeof(unsigned int));
+	t -> timestep_origin = (unsigned long *) malloc (
+		(*t).n_particles * sizeof(unsigned long));
+	t -> history_offsets = (unsigned long *) malloc (
+		(*t).n_particles * sizeof(unsigned long));
+	t -> history_lengths = (unsigned int *) malloc (
+		(*t).n_particles * sizeof(unsigned int));
+
+	/*
+	 * Start with room for a zone history that never changes from the zone of
+	 * birth, which set_tracer_history will extend as necessary.
+	 */
+	t -> history_capacity = (*t).n_particles * (
+		sizeof(unsigned int) + (*t).history_width);
+	t -> zone_history = malloc ((*t).history_capacity);
+
+	unsigned long i;
+	for (i = 0ul; i < (*t).n_particles; i++) {
+		t -> mass[i] = 0;
+		t -> history_offsets[i] = 0ul;
+		t -> history_lengths[i] = 0u;
 	}
+	if (!(*mz).simple) {
+		t -> zone_members = (unsigned long *) malloc ((*t).n_particles *
+			sizeof(unsigned long));
+		t -> zone_offsets = (unsigned long *) malloc (
+			((*(*mz).mig).n_zones + 1u) * sizeof(unsigned long));
+	} else {}
+	mz -> mig -> tracers = t;
+	if ((*mz).aggregate && !(*mz).simple) malloc_cohorts(mz);
 
 }
 
+/*
+ * Determine the narrowest unsigned integer type that can store every zone
+ * number in a multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * n_zones: 	The number of zones in the simulation
+ *
+ * Returns
+ * =======
+ * The size of that type in bytes.
+ */
+static unsigned short zone_history_width(unsigned int n_zones) {
+
+	if (n_zones - 1u <= UCHAR_MAX) {
+		return sizeof(unsigned char);
+	} else if (n_zones - 1u <= USHRT_MAX) {
+		return sizeof(unsigned short);
+	} else {
+		return sizeof(unsigned int);
+	}
+
+}
+
+/*
+ * Read one entry of a zone history.
+ *
+ * Parameters
+ * ==========
+ * entry: 	A pointer to the first byte of the entry
+ * width: 	The size of the entry in bytes
+ *
+ * Returns
+ * =======
+ * The zone number or timestep stored in the entry.
+ */
+static unsigned int read_history_entry(const unsigned char *entry,
+	unsigned short width) {
+
+	switch (width) {
+
+		case sizeof(unsigned char):
+			return *entry;
+
+		case sizeof(unsigned short): {
+			unsigned short value;
+			memcpy(&value, entry, sizeof(unsigned short));
+			return value;
+		}
+
+		default: {
+			unsigned int value;
+			memcpy(&value, entry, sizeof(unsigned int));
+			return value;
+		}
+
+	}
+
+}
+
+/*
+ * Write one entry of a zone history.
+ *
+ * Parameters
+ * ==========
+ * entry: 	A pointer to the first byte of the entry
+ * width: 	The size of the entry in bytes
+ * value: 	The zone number or timestep to store
+ */
+static void write_history_entry(unsigned char *entry, unsigned short width,
+	unsigned int value) {
+
+	switch (width) {
+
+		case sizeof(unsigned char):
+			*entry = (unsigned char) value;
+			break;
+
+		case sizeof(unsigned short): {
+			unsigned short narrow = (unsigned short) value;
+			memcpy(entry, &narrow, sizeof(unsigned short));
+			break;
+		}
+
+		default:
+			memcpy(entry, &value, sizeof(unsigned int));
+			break;
+
+	}
+
+}
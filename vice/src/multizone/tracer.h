@@ -43,7 +43,7 @@ extern void compute_tracer_masses(MULTIZONE *mz);
  * Parameters
  * ==========
  * mz: 		The multizone object for the current simulation
- * t: 		The tracer particle to determine the metallicity of
+ * index: 	The index of the tracer particle to determine the metallicity of
  *
  * Returns
  * =======
@@ -51,7 +51,135 @@ extern void compute_tracer_masses(MULTIZONE *mz);
  *
  * source: tracer.c
  */
-extern double tracer_metallicity(MULTIZONE mz, TRACER t);
+extern double tracer_metallicity(MULTIZONE mz, unsigned long index);
+
+/*
+ * Determine the zone number of a tracer particle at a given timestep from
+ * its zone history.
+ *
+ * Parameters
+ * ==========
+ * t: 			The tracer particles
+ * index: 		The index of the tracer particle
+ * timestep: 	The timestep number
+ *
+ * Returns
+ * =======
+ * The zone number of the tracer particle at that timestep; -1 if it has not
+ * yet formed.
+ *
+ * Notes
+ * =====
+ * Each particle's zone history is stored in one of two forms, whichever
+ * takes up less memory (see set_tracer_history). If it has one entry per
+ * timestep from its birth onward, it is stored in full. Otherwise, it is a
+ * run-length encoding: pairs of the timestep at which the particle enters a
+ * zone and the zone number, in increasing order of timestep, beginning with
+ * the timestep of birth.
+ *
+ * source: tracer.c
+ */
+extern int get_tracer_zone(TRACER t, unsigned long index,
+	unsigned long timestep);
+
+/*
+ * Assign the zone history of a tracer particle.
+ *
+ * Parameters
+ * ==========
+ * t: 				A pointer to the tracer particles
+ * index: 			The index of the tracer particle
+ * birth_timestep: 	The timestep at which the tracer particle is born
+ * zones: 			The zone number of the tracer particle at each timestep.
+ * 					Entries before the timestep of birth are ignored.
+ *
+ * Notes
+ * =====
+ * This also assigns the timestep and zone of birth. The zone history is
+ * run-length encoded if that requires fewer entries than storing it in full
+ * (see get_tracer_zone), and the block holding the zone histories of all
+ * particles is grown as needed.
+ *
+ * source: tracer.c
+ */
+extern void set_tracer_history(TRACER *t, unsigned long index,
+	unsigned long birth_timestep, int *zones);
+
+/*
+ * Assign the zone histories of all tracer particles born in a given zone at a
+ * given timestep from a block of zone numbers.
+ *
+ * Parameters
+ * ==========
+ * mz: 			The multizone object for this simulation
+ * zone: 		The zone of birth
+ * timestep: 	The timestep of birth
+ * block: 		The zone numbers of each tracer particle, stored in one
+ * 				contiguous block of n_times entries per tracer particle.
+ * n_times: 	The number of entries per tracer particle
+ *
+ * Returns
+ * =======
+ * 0 on success. 1 if any zone number is out of range, and 2 if the zone
+ * number of any tracer particle at its time of birth is not the zone of
+ * birth. In these cases, none of the zone histories are modified.
+ *
+ * Notes
+ * =====
+ * When the multizone object is not in simple mode, the entries correspond to
+ * consecutive timesteps starting at the timestep of birth, and the zone
+ * number at any later timesteps is that of the last entry. In simple mode,
+ * only the last entry is used, and it is taken as the final zone of each
+ * tracer particle. This replicates the zone histories assigned from a
+ * migration prescription evaluated at one time per call (see
+ * setup_single_tracer in vice/core/multizone/_multizone.pyx).
+ *
+ * source: tracer.c
+ */
+extern unsigned short setup_tracer_block(MULTIZONE mz, unsigned int zone,
+	unsigned long timestep, int *block, unsigned long n_times);
+
+/*
+ * Group the indices of the tracer particles by the zone they currently reside
+ * in. Within each zone, the particles remain in increasing order of their
+ * index.
+ *
+ * Parameters
+ * ==========
+ * mz: 		A pointer to the multizone object for this simulation
+ *
+ * Notes
+ * =====
+ * Sums over the particles in one zone visit them in the same order as a loop
+ * over every particle, and are therefore identical to the last bit. This
+ * allows each zone to be moved forward one timestep independently of the
+ * others (see multizone_timestepper in src/multizone/multizone.c).
+ *
+ * source: tracer.c
+ */
+extern void index_tracers_by_zone(MULTIZONE *mz);
+
+/*
+ * Determine the amount of memory required to store the tracer particles of a
+ * multizone simulation.
+ *
+ * Parameters
+ * ==========
+ * mz: 		The multizone object for this simulation
+ *
+ * Returns
+ * =======
+ * The number of bytes that malloc_tracers will allocate.
+ *
+ * Notes
+ * =====
+ * This counts room for zone histories which never change from the zone of
+ * birth. The memory used by the zone histories grows beyond this as they are
+ * assigned by set_tracer_history, but only for particles which change zones.
+ *
+ * source: tracer.c
+ */
+extern double tracers_memory_estimate(MULTIZONE mz);
 
 /*
  * Allocate memory for the stellar tracer particles
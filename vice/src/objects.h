@@ -27,6 +27,7 @@ extern "C" {
 #include "objects/sneia.h"
 #include "objects/ssp.h"
 #include "objects/tracer.h"
+#include "objects/workspace.h"
 
 #ifdef __cplusplus
 }
@@ -13,7 +13,8 @@
 
 /*
  * Allocate memory for and return a pointer to an AGB_YIELD_GRID struct and
- * initialize all fields to NULL.
+ * initialize all fields to NULL. The cohort cache is allocated by setup_AGB
+ * when a simulation begins.
  *
  * header: agb.h
  */
@@ -25,6 +26,13 @@ extern AGB_YIELD_GRID *agb_yield_grid_initialize(void) {
 	agb_grid -> custom_yield = callback_2arg_initialize();
 	agb_grid -> interpolator = interp_scheme_2d_initialize();
 	agb_grid -> entrainment = 1;
+	agb_grid -> tabulate = 0u;
+	agb_grid -> cohort_Z = NULL;
+	agb_grid -> cohort_bins = NULL;
+	agb_grid -> n_cohorts = 0ul;
+	agb_grid -> turnoff_mass = NULL;
+	agb_grid -> mass_bins = NULL;
+	agb_grid -> yield_table = NULL;
 
 	return agb_grid;
 
@@ -45,6 +53,8 @@ extern void agb_yield_grid_free(AGB_YIELD_GRID *agb_grid) {
 			agb_grid -> custom_yield = NULL;
 		} else {}
 
+		agb_cohort_cache_free(agb_grid);
+
 		if ((*agb_grid).interpolator != NULL) {
 			interp_scheme_2d_free(agb_grid -> interpolator);
 			agb_grid -> interpolator = NULL;
@@ -58,3 +68,41 @@ extern void agb_yield_grid_free(AGB_YIELD_GRID *agb_grid) {
 }
 
 
+/*
+ * Free up the memory stored in the cohort cache of an AGB_YIELD_GRID struct,
+ * leaving the yield settings themselves intact.
+ *
+ * header: agb.h
+ */
+extern void agb_cohort_cache_free(AGB_YIELD_GRID *agb_grid) {
+
+	if ((*agb_grid).cohort_Z != NULL) {
+		free(agb_grid -> cohort_Z);
+		agb_grid -> cohort_Z = NULL;
+	} else {}
+
+	if ((*agb_grid).cohort_bins != NULL) {
+		free(agb_grid -> cohort_bins);
+		agb_grid -> cohort_bins = NULL;
+	} else {}
+
+	if ((*agb_grid).turnoff_mass != NULL) {
+		free(agb_grid -> turnoff_mass);
+		agb_grid -> turnoff_mass = NULL;
+	} else {}
+
+	if ((*agb_grid).mass_bins != NULL) {
+		free(agb_grid -> mass_bins);
+		agb_grid -> mass_bins = NULL;
+	} else {}
+
+	if ((*agb_grid).yield_table != NULL) {
+		free(agb_grid -> yield_table[0]);
+		free(agb_grid -> yield_table);
+		agb_grid -> yield_table = NULL;
+	} else {}
+
+	agb_grid -> n_cohorts = 0ul;
+
+}
+
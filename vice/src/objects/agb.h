@@ -10,7 +10,8 @@ extern "C" {
 
 /*
  * Allocate memory for and return a pointer to an AGB_YIELD_GRID struct and
- * initialize all fields to NULL.
+ * initialize all fields to NULL. The cohort cache is allocated by setup_AGB
+ * when a simulation begins.
  *
  * source: agb.c
  */
@@ -23,6 +24,14 @@ extern AGB_YIELD_GRID *agb_yield_grid_initialize(void);
  */
 extern void agb_yield_grid_free(AGB_YIELD_GRID *agb_grid);
 
+/*
+ * Free up the memory stored in the cohort cache of an AGB_YIELD_GRID struct,
+ * leaving the yield settings themselves intact.
+ *
+ * source: agb.c
+ */
+extern void agb_cohort_cache_free(AGB_YIELD_GRID *agb_grid);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus*/
@@ -3,6 +3,7 @@
  */
 
 #include <stdlib.h>
+#include <sys/mman.h>
 #include "../dataframe.h"
 #include "../io.h"
 #include "objects.h"
@@ -23,6 +24,11 @@ extern FROMFILE *fromfile_initialize(void) {
 	ff -> n_cols = 0u;
 	ff -> labels = NULL;
 	ff -> data = NULL;
+	ff -> offsets = NULL;
+	ff -> types = NULL;
+	ff -> swap = 0u;
+	ff -> map = NULL;
+	ff -> map_size = 0ul;
 	return ff;
 
 }
@@ -58,10 +64,36 @@ extern void fromfile_free(FROMFILE *ff) {
 		} else {}
 
 		if ((*ff).data != NULL) {
+			/* Columns pointing into the mapped file aren't freed directly */
+			unsigned int i;
+			for (i = 0u; i < (*ff).n_cols; i++) {
+				if ((*ff).data[i] != NULL && !(
+					(*ff).map != NULL &&
+					(char *) (*ff).data[i] >= (char *) (*ff).map &&
+					(char *) (*ff).data[i] < (char *) (*ff).map +
+						(*ff).map_size)) {
+					free(ff -> data[i]);
+				} else {}
+			}
 			free(ff -> data);
 			ff -> data = NULL;
 		} else {}
 
+		if ((*ff).map != NULL) {
+			munmap(ff -> map, (*ff).map_size);
+			ff -> map = NULL;
+		} else {}
+
+		if ((*ff).offsets != NULL) {
+			free(ff -> offsets);
+			ff -> offsets = NULL;
+		} else {}
+
+		if ((*ff).types != NULL) {
+			free(ff -> types);
+			ff -> types = NULL;
+		} else {}
+
 		free(ff);
 		ff = NULL;
 
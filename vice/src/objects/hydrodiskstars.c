@@ -4,6 +4,7 @@
  */
 
 #include <stdlib.h>
+#include <sys/mman.h>
 #include "hydrodiskstars.h"
 
 
@@ -16,6 +17,7 @@ extern HYDRODISKSTARS *hydrodiskstars_initialize(void) {
 
 	HYDRODISKSTARS *hds = (HYDRODISKSTARS *) malloc (sizeof(HYDRODISKSTARS));
 	hds -> n_stars = 0ul;
+	hds -> rows = NULL;
 	hds -> ids = NULL;
 	hds -> birth_times = NULL;
 	hds -> birth_radii = NULL;
@@ -29,6 +31,14 @@ extern HYDRODISKSTARS *hydrodiskstars_initialize(void) {
 	hds -> decomp = NULL;
 	hds -> n_rad_bins = 0u;
 	hds -> mode = NULL;
+	hds -> cells = NULL;
+	hds -> cell_offsets = NULL;
+	hds -> n_time_cells = 0ul;
+	hds -> n_radius_cells = 0ul;
+	hds -> min_birth_time = 0;
+	hds -> min_birth_radius = 0;
+	hds -> map = NULL;
+	hds -> map_size = 0ul;
 	return hds;
 
 }
@@ -46,6 +56,28 @@ extern void hydrodiskstars_free(HYDRODISKSTARS *hds) {
 		hds -> n_stars = 0ul;
 		hds -> n_rad_bins = 0u;
 
+		if ((*hds).map != NULL) {
+			/* The columns point into the mapping rather than the heap */
+			munmap(hds -> map, (*hds).map_size);
+			hds -> map = NULL;
+			hds -> map_size = 0ul;
+			hds -> ids = NULL;
+			hds -> birth_times = NULL;
+			hds -> birth_radii = NULL;
+			hds -> final_radii = NULL;
+			hds -> zform = NULL;
+			hds -> zfinal = NULL;
+			hds -> v_rad = NULL;
+			hds -> v_phi = NULL;
+			hds -> v_z = NULL;
+			hds -> decomp = NULL;
+		} else {}
+
+		if ((*hds).rows != NULL) {
+			free(hds -> rows);
+			hds -> rows = NULL;
+		} else {}
+
 		if ((*hds).ids != NULL) {
 			free(hds -> ids);
 			hds -> ids = NULL;
@@ -91,6 +123,11 @@ extern void hydrodiskstars_free(HYDRODISKSTARS *hds) {
 			hds -> v_z = NULL;
 		} else {}
 
+		if ((*hds).decomp != NULL) {
+			free(hds -> decomp);
+			hds -> decomp = NULL;
+		} else {}
+
 		if ((*hds).rad_bins != NULL) {
 			free(hds -> rad_bins);
 			hds -> rad_bins = NULL;
@@ -101,6 +138,16 @@ extern void hydrodiskstars_free(HYDRODISKSTARS *hds) {
 			hds -> mode = NULL;
 		} else {}
 
+		if ((*hds).cells != NULL) {
+			free(hds -> cells);
+			hds -> cells = NULL;
+		} else {}
+
+		if ((*hds).cell_offsets != NULL) {
+			free(hds -> cell_offsets);
+			hds -> cell_offsets = NULL;
+		} else {}
+
 		free(hds);
 		hds = NULL;
 
@@ -15,7 +15,12 @@
  */
 extern INTEGRAL *integral_initialize(void) {
 
-	return (INTEGRAL *) malloc (sizeof(INTEGRAL));
+	INTEGRAL *intgrl = (INTEGRAL *) malloc (sizeof(INTEGRAL));
+	intgrl -> params = NULL;
+	intgrl -> breakpoints = NULL;
+	intgrl -> n_breakpoints = 0ul;
+	intgrl -> evals = 0ul;
+	return intgrl;
 
 }
 
@@ -25,6 +25,7 @@ extern ISM *ism_initialize(void) {
 	ism -> enh = NULL;
 	ism -> tau_star = NULL;
 	ism -> functional_tau_star = callback_2arg_initialize();
+	ism -> J21 = 0;
 	return ism;
 
 }
@@ -23,6 +23,10 @@ extern MIGRATION *migration_initialize(unsigned int n) {
 	mig -> n_zones = n;
 	mig -> n_tracers = 0u;
 	mig -> tracer_count = 0ul;
+	mig -> n_gas_flows = 0ul;
+	mig -> gas_origin = NULL;
+	mig -> gas_destination = NULL;
+	mig -> gas_varies = NULL;
 	mig -> gas_migration = NULL;
 	mig -> tracers = NULL;
 	mig -> tracers_output = NULL;
@@ -40,17 +44,10 @@ extern void migration_free(MIGRATION *mig) {
 
 	if (mig != NULL) {
 
-		if ((*mig).gas_migration != NULL) {
-			free(mig -> gas_migration);
-			mig -> gas_migration = NULL;
-		} else {}
+		gas_migration_free(mig);
 
 		if ((*mig).tracers != NULL) {
-			unsigned long i;
-			for (i = 0l; i < (*mig).tracer_count; i++) {
-				if ((*mig).tracers[i] != NULL) tracer_free(mig -> tracers[i]);
-			}
-			free(mig -> tracers);
+			tracer_free(mig -> tracers);
 			mig -> tracers = NULL;
 		} else {}
 
@@ -66,3 +63,40 @@ extern void migration_free(MIGRATION *mig) {
 
 }
 
+
+/*
+ * Free up the memory stored by the gas migration matrix of a migration
+ * object.
+ *
+ * header: migration.h
+ */
+extern void gas_migration_free(MIGRATION *mig) {
+
+	if ((*mig).gas_migration != NULL) {
+		unsigned long i;
+		for (i = 0ul; i < (*mig).n_gas_flows; i++) {
+			free(mig -> gas_migration[i]);
+		}
+		free(mig -> gas_migration);
+		mig -> gas_migration = NULL;
+	} else {}
+
+	if ((*mig).gas_origin != NULL) {
+		free(mig -> gas_origin);
+		mig -> gas_origin = NULL;
+	} else {}
+
+	if ((*mig).gas_destination != NULL) {
+		free(mig -> gas_destination);
+		mig -> gas_destination = NULL;
+	} else {}
+
+	if ((*mig).gas_varies != NULL) {
+		free(mig -> gas_varies);
+		mig -> gas_varies = NULL;
+	} else {}
+
+	mig -> n_gas_flows = 0ul;
+
+}
+
@@ -26,6 +26,14 @@ extern MIGRATION *migration_initialize(unsigned int n);
  */
 extern void migration_free(MIGRATION *mig);
 
+/*
+ * Free up the memory stored by the gas migration matrix of a migration
+ * object.
+ *
+ * source: migration.c
+ */
+extern void gas_migration_free(MIGRATION *mig);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus*/
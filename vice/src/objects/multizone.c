@@ -8,6 +8,7 @@
 #include "objects.h"
 #include "multizone.h"
 #include "migration.h"
+#include "workspace.h"
 
 
 /*
@@ -32,6 +33,11 @@ extern MULTIZONE *multizone_initialize(unsigned int n) {
 	mz -> name = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
 	mz -> mig = migration_initialize(n);
 	mz -> verbose = 0;
+	mz -> simple = 0;
+	mz -> aggregate = 0;
+	mz -> n_threads = 1u;
+	mz -> binary = 0u;
+	mz -> ws = NULL;
 	return mz;
 
 }
@@ -62,6 +68,11 @@ extern void multizone_free(MULTIZONE *mz) {
 			mz -> mig = NULL;
 		}
 
+		if ((*mz).ws != NULL) {
+			workspace_free(mz -> ws);
+			mz -> ws = NULL;
+		} else {}
+
 		free(mz);
 		mz = NULL;
 
@@ -128,11 +128,34 @@ typedef struct asymptotic_giant_branch_star_yield_grid {
 	 * interpolator: The mass-metallicity interpolation grid
 	 * entrainment: The fraction of this element's yields that get mixed
 	 * 		with the ISM.
+	 * tabulate: A boolean int describing whether or not to evaluate a custom
+	 * 		yield once per simulation on the grid of metallicities stored in
+	 * 		the interpolator's y-coordinates and interpolate between them.
+	 * cohort_Z: The metallicity by mass Z of the stars that formed at each
+	 * 		previous timestep. Each entry is computed once, the first time it
+	 * 		is needed, as a stellar population's metallicity does not change.
+	 * cohort_bins: The bin number of each entry of cohort_Z on the grid of
+	 * 		metallicities stored in the interpolator's y-coordinates.
+	 * n_cohorts: The number of timesteps stored in cohort_Z and cohort_bins
+	 * turnoff_mass: The mass of dying stars at each age in timesteps. NULL
+	 * 		when the mass-lifetime relation depends on metallicity.
+	 * mass_bins: The bin number of each entry of turnoff_mass on the grid of
+	 * 		masses stored in the interpolator's x-coordinates.
+	 * yield_table: The custom yield at the turnoff mass for each age in
+	 * 		timesteps (first axis) and at each metallicity on the grid
+	 * 		(second axis) when tabulate is true.
 	 */
 
 	CALLBACK_2ARG *custom_yield;
 	INTERP_SCHEME_2D *interpolator;
 	double entrainment;
+	unsigned short tabulate;
+	double *cohort_Z;
+	long *cohort_bins;
+	unsigned long n_cohorts;
+	double *turnoff_mass;
+	long *mass_bins;
+	double **yield_table;
 
 } AGB_YIELD_GRID;
 
@@ -170,6 +193,14 @@ typedef struct sneia_yield_specs {
 	 * t_d: The minimum delay time on SNe Ia in Gyr.
 	 * entrainment: The fraction of the nucleosynthetic yield that is
 	 * 		captured and retained by the interstellar medium
+	 * cohort_yields: The SN Ia yield at the metallicity of each previous
+	 * 		timestep times the star formation rate at that timestep. Each
+	 * 		entry is computed once, the first time it is needed, as the
+	 * 		metallicity and star formation rate of a stellar population do not
+	 * 		change once it has formed.
+	 * n_cohorts: The number of timesteps stored in cohort_yields
+	 * rate: The rate of mass production at the timestep rate_timestep
+	 * rate_timestep: The timestep at which the rate was last computed
 	 */
 
 	CALLBACK_1ARG *yield_;
@@ -178,6 +209,10 @@ typedef struct sneia_yield_specs {
 	double tau_ia;
 	double t_d;
 	double entrainment;
+	double *cohort_yields;
+	unsigned long n_cohorts;
+	double rate;
+	unsigned long rate_timestep;
 
 
 } SNEIA_YIELD_SPECS;
@@ -266,6 +301,19 @@ typedef struct interstellar_medium {
 	 * smoothing_time: The outflow smoothing time
 	 * schmidt: A boolean int describing whether or not to adopt
 	 * 		Kennicutt-Schmidt law driven star formation efficiency.
+	 * J21: A boolean int describing whether or not to adopt the star
+	 * 		formation law of Johnson et al. (2021), mirroring a
+	 * 		vice.toolkit.J21_sf_law object, in place of functional_tau_star.
+	 * J21_area: The surface area of the star forming region in kpc^2.
+	 * J21_present_day_molecular: The depletion time of molecular gas at the
+	 * 		present day in Gyr.
+	 * J21_molecular_index: The power-law index on its time-dependence.
+	 * J21_Sigma_g1: The lower of the two gas surface densities in Msun kpc^-2
+	 * 		at which the Kennicutt-Schmidt relation breaks.
+	 * J21_Sigma_g2: The higher of the two.
+	 * J21_index1: The power-law index of the tau_star - Sigma_gas relation
+	 * 		below J21_Sigma_g1 (i.e. 1 - N).
+	 * J21_index2: The same between J21_Sigma_g1 and J21_Sigma_g2.
 	 */
 
 	char *mode;
@@ -282,6 +330,14 @@ typedef struct interstellar_medium {
 	double mgschmidt;
 	double smoothing_time;
 	int schmidt;
+	int J21;
+	double J21_area;
+	double J21_present_day_molecular;
+	double J21_molecular_index;
+	double J21_Sigma_g1;
+	double J21_Sigma_g2;
+	double J21_index1;
+	double J21_index2;
 
 } ISM;
 
@@ -358,6 +414,9 @@ typedef struct single_stellar_population {
 	 * R0: The instantaneous recycling rate, if applicable.
 	 * continuous: A boolean int describing whether or not to adopt
 	 * 		continuous recycling.
+	 * cumulative_tolerance: The tolerance on the cumulative integrals over
+	 * 		stellar mass from which the CRF and MSMF are computed with a
+	 * 		custom IMF. Zero to integrate the IMF at each timestep instead.
 	 */
 
 	IMF_ *imf;
@@ -366,6 +425,7 @@ typedef struct single_stellar_population {
 	double postMS;
 	double R0;
 	int continuous;
+	double cumulative_tolerance;
 
 } SSP;
 
@@ -390,6 +450,12 @@ typedef struct singlezone {
 	 * n_elements: The number of elements to track
 	 * verbose: boolean int describing whether or not to print the time as the
 	 * 		simulation evolves
+	 * binary: boolean int describing whether or not to write the output in
+	 * 		binary columnar format rather than ascii
+	 * history_buffer: The rows of history output recorded so far when writing
+	 * 		binary output, stored contiguously. These are written to the
+	 * 		history.out file column by column once the simulation finishes.
+	 * history_rows: The number of rows stored in history_buffer
 	 * elements: The yield information for each element
 	 * ism: The time evolution information for the interstellar medium (ISM)
 	 * mdf: The stellar metallicity distribution function (MDF) information
@@ -407,6 +473,9 @@ typedef struct singlezone {
 	double Z_solar;
 	unsigned int n_elements;
 	unsigned short verbose;
+	unsigned short binary;
+	double *history_buffer;
+	unsigned long history_rows;
 	ELEMENT **elements;
 	ISM *ism;
 	MDF *mdf;
@@ -418,25 +487,71 @@ typedef struct singlezone {
 typedef struct tracer {
 
 	/*
-	 * This struct implements the tracer particle for multizone simulations
+	 * This struct implements the tracer particles for multizone simulations.
+	 * The particles are stored as a structure of arrays, each indexed by the
+	 * particle number.
 	 *
-	 * mass: The initial mass of the tracer particle in Msun
-	 * zone_origin: The zone in which the particle was born
-	 * zone_current: The zone in which the particle currently resides
-	 * zone_history: The zone number of the tracer particle at all timesteps
-	 * 		This is -1 at timesteps before the tracer particle is born
-	 * timestep_origin: The timestep at which the tracer particle is born
+	 * mass: The initial mass of each tracer particle in Msun
+	 * zone_origin: The zone in which each particle was born
+	 * zone_current: The zone in which each particle currently resides
+	 * timestep_origin: The timestep at which each particle is born
+	 * zone_history: The zone histories of all particles from their
+	 * 		timestep of birth onward, stored in one contiguous block of bytes
+	 * 		which grows as histories are assigned.
+	 * history_width: The size in bytes of each zone number in zone_history;
+	 * 		the narrowest unsigned integer type that can store every zone
+	 * 		number.
+	 * history_offsets: The offset in bytes of each particle's history in
+	 * 		zone_history
+	 * history_lengths: The number of zone numbers in each particle's history
+	 * history_size: The number of bytes of zone_history in use
+	 * history_capacity: The number of bytes allocated for zone_history
+	 * n_particles: The number of tracer particles allocated
+	 * n_timesteps: The number of timesteps in each particle's zone history
+	 * cohort_zone: The zones occupied by the particles of each cohort (those
+	 * 		born in the same zone at the same timestep), stored in one
+	 * 		contiguous block of cohort_width entries per cohort.
+	 * cohort_count: The number of particles from each cohort in the
+	 * 		corresponding entry of cohort_zone
+	 * cohort_length: The number of entries in use for each cohort
+	 * cohort_width: The maximum number of entries per cohort; the number of
+	 * 		tracer particles per zone per timestep.
+	 * zone_members: The indices of the tracer particles grouped by the zone
+	 * 		they currently reside in, in increasing order within each zone.
+	 * zone_offsets: The index in zone_members of the first tracer particle in
+	 * 		each zone, with one additional entry holding the total number of
+	 * 		particles.
 	 *
 	 * Notes
 	 * =====
-	 * zone_history is an array filled from user-specifications in python
+	 * zone_history is filled from user-specifications in python via
+	 * set_tracer_history and accessed via get_tracer_zone in
+	 * src/multizone/tracer.c, which document its encoding.
+	 * The cohort arrays are allocated only if the multizone object computes
+	 * recycling and stellar masses from aggregates (see
+	 * src/multizone/cohorts.c), and are NULL otherwise. zone_members and
+	 * zone_offsets are rebuilt at each timestep of the full integration by
+	 * index_tracers_by_zone in src/multizone/tracer.c.
 	 */
 
-	double mass;
-	int *zone_history;
-	unsigned int zone_origin;
-	unsigned int zone_current;
-	unsigned long timestep_origin;
+	double *mass;
+	unsigned int *zone_origin;
+	unsigned int *zone_current;
+	unsigned long *timestep_origin;
+	void *zone_history;
+	unsigned short history_width;
+	unsigned long *history_offsets;
+	unsigned int *history_lengths;
+	unsigned long history_size;
+	unsigned long history_capacity;
+	unsigned long n_particles;
+	unsigned long n_timesteps;
+	unsigned int *cohort_zone;
+	unsigned int *cohort_count;
+	unsigned int *cohort_length;
+	unsigned int cohort_width;
+	unsigned long *zone_members;
+	unsigned long *zone_offsets;
 
 } TRACER;
 
@@ -449,20 +564,72 @@ typedef struct migration {
 	 * n_zones: The number of zones in the simulation
 	 * n_tracers: The number of tracer particles per zone per timestep
 	 * tracer_count: The number of active tracer particles
-	 * gas_migration: The migration matrix associated with the ISM gas
-	 * tracers: Pointers to the tracer particles themselves
+	 * n_gas_flows: The number of non-zero off-diagonal elements of the gas
+	 * 		migration matrix
+	 * gas_origin: The zone gas moves out of for each non-zero element (the
+	 * 		row of the migration matrix)
+	 * gas_destination: The zone gas moves into for each non-zero element (the
+	 * 		column of the migration matrix)
+	 * gas_varies: Whether or not each non-zero element varies with time
+	 * gas_migration: The values of each non-zero element of the migration
+	 * 		matrix associated with the ISM gas; one value at each timestep for
+	 * 		those that vary with time and a single value otherwise.
+	 * tracers: The tracer particles themselves
+	 *
+	 * Notes
+	 * =====
+	 * The non-zero elements of the gas migration matrix are stored in order
+	 * of row, then column, and accessed via gas_migration_fraction in
+	 * src/multizone/migration.c.
 	 */
 
 	unsigned int n_zones;
 	unsigned int n_tracers;
 	unsigned long tracer_count;
-	double ***gas_migration;
-	TRACER **tracers;
+	unsigned long n_gas_flows;
+	unsigned int *gas_origin;
+	unsigned int *gas_destination;
+	unsigned short *gas_varies;
+	double **gas_migration;
+	TRACER *tracers;
 	FILE *tracers_output;
 
 } MIGRATION;
 
 
+typedef struct workspace {
+
+	/*
+	 * Preallocated memory for the quantities computed for every zone at each
+	 * timestep of a multizone simulation, such that they need not be
+	 * allocated and freed each timestep. The contents are overwritten each
+	 * time they are computed.
+	 *
+	 * changes: The mass that moves along each non-zero element of the gas
+	 * 		migration matrix
+	 * migration_deltas: The net mass of gas each zone loses to migration
+	 * gas_recycled: The mass of gas returned to each zone by recycling
+	 * recycled: The mass of each element returned to each zone by
+	 * 		recycling, indexable via [element][zone]
+	 * mstar: The stellar mass in each zone
+	 * unretained: The mass outflow rate of each element in each zone due to
+	 * 		entrainment, indexable via [zone][element]
+	 * n_zones: The number of zones the workspace is sized for
+	 * n_elements: The number of elements the workspace is sized for
+	 */
+
+	double *changes;
+	double *migration_deltas;
+	double *gas_recycled;
+	double **recycled;
+	double *mstar;
+	double **unretained;
+	unsigned int n_zones;
+	unsigned int n_elements;
+
+} WORKSPACE;
+
+
 typedef struct multizone {
 
 	/*
@@ -473,6 +640,16 @@ typedef struct multizone {
 	 * mig: The migration settings for this simulation
 	 * verbose: boolean int describing whether or not to print the time as the
 	 * 		simulation evolves
+	 * simple: boolean int describing whether or not to evolve each zone as
+	 * 		a one-zone model
+	 * aggregate: boolean int describing whether or not to compute recycling
+	 * 		and stellar masses from per-zone aggregates of the tracer
+	 * 		particles rather than from each tracer particle individually
+	 * n_threads: The number of threads to distribute the zones across
+	 * binary: boolean int describing whether or not to write the output in
+	 * 		binary columnar format rather than ascii
+	 * ws: The scratch memory for each timestep, allocated by multizone_setup
+	 * 		and freed by multizone_clean. NULL while no simulation is running.
 	 */
 
 	char *name;
@@ -480,6 +657,10 @@ typedef struct multizone {
 	MIGRATION *mig;
 	unsigned short verbose;
 	unsigned short simple;
+	unsigned short aggregate;
+	unsigned int n_threads;
+	unsigned short binary;
+	WORKSPACE *ws;
 
 } MULTIZONE;
 
@@ -489,7 +670,10 @@ typedef struct integral {
 	/*
 	 * This struct encodes information on a definite integral.
 	 *
-	 * func: The function to integrate
+	 * func: The function to integrate, taking params as its second argument
+	 * params: Any additional data the integrand requires, or NULL. This
+	 * 		allows integrals to be evaluated concurrently without sharing
+	 * 		state between them.
 	 * a: The lower bound of integration
 	 * b: The upper bound of integration
 	 * tolerance: The maximum allowed numerical tolerance
@@ -500,9 +684,16 @@ typedef struct integral {
 	 * results: The numerically computed value of the integral, it's
 	 * 		approximate numerical errors and the number of bins in quadrature
 	 * 		at the time of convergence.
+	 * breakpoints: Values between a and b at which the integrand is known not
+	 * 		to be smooth (e.g. the masses of a tabulated yield grid), in any
+	 * 		order. Adaptive methods place subinterval edges exactly here.
+	 * 		NULL if there are none. Not freed by integral_free.
+	 * n_breakpoints: The number of elements in the breakpoints array
+	 * evals: The number of times func was evaluated
 	 */
 
-	double (*func)(double);
+	double (*func)(double, void *);
+	void *params;
 	double a;
 	double b;
 	double tolerance;
@@ -512,6 +703,9 @@ typedef struct integral {
 	unsigned long iters;
 	double result;
 	double error;
+	double *breakpoints;
+	unsigned long n_breakpoints;
+	unsigned long evals;
 
 } INTEGRAL;
 
@@ -520,13 +714,25 @@ typedef struct fromfile {
 
 	/*
 	 * This struct holds data from a square ascii output file, which is the
-	 * format that VICE output is stored.
+	 * format that VICE output is stored, or from an output file in binary
+	 * columnar format.
 	 *
 	 * name: The name of the file
 	 * labels: The column labels to key on from python via the VICE dataframe
 	 * n_rows: The number of lines of data in the file
 	 * n_cols: The dimensionality of the data
-	 * data: The data itself
+	 * data: The data itself, stored column-major. Each column is NULL until
+	 * 		it is first accessed, at which point the whole of an ascii file
+	 * 		or that column alone of a binary file is read in.
+	 * offsets: The position in bytes of each column within a binary file
+	 * types: The type of each column of a binary file ('d' for double and
+	 * 		'u' for unsigned int)
+	 * swap: 1 if the byte order of a binary file differs from the machine's,
+	 * 		0 otherwise
+	 * map: A binary file mapped into memory, or NULL if it could not be.
+	 * 		Columns of doubles in the machine's byte order point into it
+	 * 		directly.
+	 * map_size: The size of the mapping in bytes
 	 */
 
 	char *name;
@@ -534,6 +740,11 @@ typedef struct fromfile {
 	unsigned long n_rows;
 	unsigned int n_cols;
 	double **data;
+	unsigned long *offsets;
+	char *types;
+	unsigned short swap;
+	void *map;
+	unsigned long map_size;
 
 } FROMFILE;
 
@@ -544,7 +755,9 @@ typedef struct hydrodiskstars {
 	 * This struct holds data from star particles in a hydrodynamical
 	 * simulation for construction of migration schemes.
 	 *
-	 * n_stars: the number of star particles in the data
+	 * n_stars: the number of star particles in the sample
+	 * rows: The row in each of the following columns of each star particle
+	 * 		in the sample
 	 * ids: The ID of each star particle
 	 * birth_times: The times in Gyr at which each star particle was born
 	 * birth_radii: The radii in kpc at which each star particle was born
@@ -560,9 +773,21 @@ typedef struct hydrodiskstars {
 	 * 		bulge, or pseudobulge
 	 * n_rad_bins: The number of radial bins
 	 * mode: The mode of stellar migration
+	 * cells: The indices of each star particle, sorted by their cell on a
+	 * 		grid in birth time and birth radius
+	 * cell_offsets: The position in cells of the first star particle in
+	 * 		each cell, with one additional entry holding n_stars
+	 * n_time_cells: The number of cells along the birth time axis
+	 * n_radius_cells: The number of cells along the birth radius axis
+	 * min_birth_time: The birth time in Gyr at the edge of the first cell
+	 * min_birth_radius: The birth radius in kpc at the edge of the first cell
+	 * map: The binary cache of the data mapped into memory, into which the
+	 * 		columns point, or NULL if they were read from the ascii files
+	 * map_size: The size of the mapping in bytes
 	 */
 
 	unsigned long n_stars;
+	unsigned long *rows;
 	unsigned long *ids;
 	double *birth_times;
 	double *birth_radii;
@@ -576,6 +801,14 @@ typedef struct hydrodiskstars {
 	unsigned short *decomp;
 	unsigned short n_rad_bins;
 	char *mode;
+	unsigned long *cells;
+	unsigned long *cell_offsets;
+	unsigned long n_time_cells;
+	unsigned long n_radius_cells;
+	double min_birth_time;
+	double min_birth_radius;
+	void *map;
+	unsigned long map_size;
 
 } HYDRODISKSTARS;
 
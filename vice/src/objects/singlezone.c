@@ -23,6 +23,9 @@ extern SINGLEZONE *singlezone_initialize(void) {
 	sz -> history_writer = NULL;
 	sz -> mdf_writer = NULL;
 	sz -> output_times = NULL;
+	sz -> binary = 0u;
+	sz -> history_buffer = NULL;
+	sz -> history_rows = 0ul;
 	sz -> elements = NULL; 		/* set by python */
 	sz -> ism = ism_initialize();
 	sz -> mdf = mdf_initialize();
@@ -10,8 +10,8 @@
 
 /*
  * Allocate memory for and return a pointer to a SNEIA_YIELD_SPECS struct.
- * Automatically initializes RIa and yield_ to NULL. Allocates memory for a
- * 100-character dtd char * specifier.
+ * Automatically initializes RIa and cohort_yields to NULL. Allocates memory
+ * for a 100-character dtd char * specifier.
  *
  * header: sneia.h
  */
@@ -23,6 +23,10 @@ extern SNEIA_YIELD_SPECS *sneia_yield_initialize(void) {
 	/* some defaults to prevent errors */
 	sneia_yields -> yield_ = callback_1arg_initialize();
 	sneia_yields -> RIa = NULL;
+	sneia_yields -> cohort_yields = NULL;
+	sneia_yields -> n_cohorts = 0ul;
+	sneia_yields -> rate = 0;
+	sneia_yields -> rate_timestep = 0ul;
 	sneia_yields -> dtd = (char *) malloc (100 * sizeof(char));
 	sneia_yields -> tau_ia = 1.5;
 	sneia_yields -> t_d = 0.15;
@@ -52,6 +56,11 @@ extern void sneia_yield_free(SNEIA_YIELD_SPECS *sneia_yields) {
 			sneia_yields -> RIa = NULL;
 		} else {}
 
+		if ((*sneia_yields).cohort_yields != NULL) {
+			free(sneia_yields -> cohort_yields);
+			sneia_yields -> cohort_yields = NULL;
+		} else {}
+
 		if ((*sneia_yields).dtd != NULL) {
 			free(sneia_yields -> dtd);
 			sneia_yields -> dtd = NULL;
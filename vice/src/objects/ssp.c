@@ -30,6 +30,7 @@ extern SSP *ssp_initialize(void) {
 	);
 	ssp -> crf = NULL;
 	ssp -> msmf = NULL;
+	ssp -> cumulative_tolerance = SSP_CUMULATIVE_TOLERANCE;
 	return ssp;
 
 }
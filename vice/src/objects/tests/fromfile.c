@@ -24,7 +24,10 @@ extern unsigned short test_fromfile_initialize(void) {
 		(*test).n_rows == 0ul &&
 		(*test).n_cols == 0u &&
 		(*test).labels == NULL &&
-		(*test).data == NULL
+		(*test).data == NULL &&
+		(*test).offsets == NULL &&
+		(*test).types == NULL &&
+		(*test).map == NULL
 	);
 	fromfile_free(test);
 	return result;
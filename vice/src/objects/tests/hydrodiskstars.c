@@ -20,6 +20,7 @@ extern unsigned short test_hydrodiskstars_initialize(void) {
 	HYDRODISKSTARS *test = hydrodiskstars_initialize();
 	unsigned short status = test != NULL;
 	status &= (*test).n_stars == 0ul;
+	status &= (*test).rows == NULL;
 	status &= (*test).ids == NULL;
 	status &= (*test).birth_times == NULL;
 	status &= (*test).birth_radii == NULL;
@@ -31,6 +32,11 @@ extern unsigned short test_hydrodiskstars_initialize(void) {
 	status &= (*test).rad_bins == NULL;
 	status &= (*test).decomp == NULL;
 	status &= (*test).n_rad_bins == 0u;
+	status &= (*test).cells == NULL;
+	status &= (*test).cell_offsets == NULL;
+	status &= (*test).n_time_cells == 0ul;
+	status &= (*test).n_radius_cells == 0ul;
+	status &= (*test).map == NULL;
 	hydrodiskstars_free(test);
 	return status;
 
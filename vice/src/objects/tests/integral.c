@@ -19,7 +19,12 @@
 extern unsigned short test_integral_initialize(void) {
 
 	INTEGRAL *test = integral_initialize();
-	unsigned short result = test != NULL;
+	unsigned short result = (test != NULL &&
+		(*test).params == NULL &&
+		(*test).breakpoints == NULL &&
+		(*test).n_breakpoints == 0ul &&
+		(*test).evals == 0ul
+	);
 	integral_free(test);
 	return result;
 
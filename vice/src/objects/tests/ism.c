@@ -28,7 +28,8 @@ extern unsigned short test_ism_initialize(void) {
 		(*test).star_formation_history == NULL &&
 		(*test).eta == NULL &&
 		(*test).enh == NULL &&
-		(*test).tau_star == NULL
+		(*test).tau_star == NULL &&
+		(*test).J21 == 0
 	);
 	ism_free(test);
 	return result;
@@ -24,6 +24,10 @@ extern unsigned short test_migration_initialize(void) {
 		(*test).n_zones == TESTS_N_ZONES &&
 		(*test).n_tracers == 0u &&
 		(*test).tracer_count == 0ul &&
+		(*test).n_gas_flows == 0ul &&
+		(*test).gas_origin == NULL &&
+		(*test).gas_destination == NULL &&
+		(*test).gas_varies == NULL &&
 		(*test).gas_migration == NULL &&
 		(*test).tracers == NULL &&
 		(*test).tracers_output == NULL
@@ -24,7 +24,8 @@ extern unsigned short test_multizone_initialize(void) {
 		(*test).name != NULL &&
 		(*test).mig != NULL &&
 		(*(*test).mig).n_zones == TESTS_N_ZONES &&
-		(*test).verbose == 0
+		(*test).verbose == 0 &&
+		(*test).ws == NULL
 	);
 	multizone_free(test);
 	return result;
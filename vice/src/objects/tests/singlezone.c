@@ -29,6 +29,7 @@ extern unsigned short test_singlezone_initialize(void) {
 		(*test).history_writer == NULL &&
 		(*test).mdf_writer == NULL &&
 		(*test).output_times == NULL &&
+		(*test).history_buffer == NULL &&
 		(*test).elements == NULL &&
 		(*test).ism != NULL &&
 		(*test).mdf != NULL &&
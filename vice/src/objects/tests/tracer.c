@@ -20,8 +20,20 @@ extern unsigned short test_tracer_initialize(void) {
 
 	TRACER *test = tracer_initialize();
 	unsigned short result = (test != NULL &&
-		(*test).mass == 0 &&
-		(*test).zone_history == NULL
+		(*test).mass == NULL &&
+		(*test).zone_origin == NULL &&
+		(*test).zone_current == NULL &&
+		(*test).timestep_origin == NULL &&
+		(*test).zone_history == NULL &&
+		(*test).history_offsets == NULL &&
+		(*test).history_lengths == NULL &&
+		(*test).history_size == 0ul &&
+		(*test).n_particles == 0ul &&
+		(*test).cohort_zone == NULL &&
+		(*test).cohort_count == NULL &&
+		(*test).cohort_length == NULL &&
+		(*test).zone_members == NULL &&
+		(*test).zone_offsets == NULL
 	);
 	tracer_free(test);
 	return result;
@@ -0,0 +1,59 @@
+/*
+ * This file implements testing of the workspace object's memory management
+ */
+
+#include <stdlib.h>
+#include "../../objects.h"
+#include "workspace.h"
+
+
+/*
+ * Test the function which constructs a workspace object
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: workspace.h
+ */
+extern unsigned short test_workspace_initialize(void) {
+
+	WORKSPACE *test = workspace_initialize(10u, 3u, 20ul);
+	unsigned short result = (test != NULL &&
+		(*test).changes != NULL &&
+		(*test).migration_deltas != NULL &&
+		(*test).gas_recycled != NULL &&
+		(*test).recycled != NULL &&
+		(*test).mstar != NULL &&
+		(*test).unretained != NULL &&
+		(*test).n_zones == 10u &&
+		(*test).n_elements == 3u &&
+		(*test).recycled[2] == (*test).recycled[0] + 20 &&
+		(*test).unretained[9] == (*test).unretained[0] + 27
+	);
+	workspace_free(test);
+	return result;
+
+}
+
+
+/*
+ * Test the function which frees the memory stored in a workspace object
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: workspace.h
+ */
+extern unsigned short test_workspace_free(void) {
+
+	/* The destructor function should not modify the address */
+	WORKSPACE *test = workspace_initialize(10u, 3u, 20ul);
+	void *initial_address = (void *) test;
+	workspace_free(test);
+	void *final_address = (void *) test;
+	return initial_address == final_address;
+
+}
+
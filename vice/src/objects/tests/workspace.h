@@ -0,0 +1,37 @@
+
+#ifndef TESTS_OBJECTS_WORKSPACE_H
+#define TESTS_OBJECTS_WORKSPACE_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../../objects.h"
+
+/*
+ * Test the function which constructs a workspace object
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: workspace.c
+ */
+extern unsigned short test_workspace_initialize(void);
+
+/*
+ * Test the function which frees the memory stored in a workspace object
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: workspace.c
+ */
+extern unsigned short test_workspace_free(void);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* TESTS_OBJECTS_WORKSPACE_H */
@@ -9,22 +9,40 @@
 
 
 /*
- * Allocates memory for and returns a pointer to a TRACER particle.
+ * Allocates memory for and returns a pointer to a TRACER object. The arrays
+ * storing the tracer particles themselves are allocated by malloc_tracers in
+ * src/multizone/tracer.c.
  *
  * header: tracer.h
  */
 extern TRACER *tracer_initialize(void) {
 
 	TRACER *t = (TRACER *) malloc (sizeof(TRACER));
-	t -> mass = 0;
+	t -> mass = NULL;
+	t -> zone_origin = NULL;
+	t -> zone_current = NULL;
+	t -> timestep_origin = NULL;
 	t -> zone_history = NULL;
+	t -> history_width = sizeof(unsigned int);
+	t -> history_offsets = NULL;
+	t -> history_lengths = NULL;
+	t -> history_size = 0ul;
+	t -> history_capacity = 0ul;
+	t -> n_particles = 0ul;
+	t -> n_timesteps = 0ul;
+	t -> cohort_zone = NULL;
+	t -> cohort_count = NULL;
+	t -> cohort_length = NULL;
+	t -> cohort_width = 0u;
+	t -> zone_members = NULL;
+	t -> zone_offsets = NULL;
 	return t;
 
 }
 
 
 /*
- * Frees up the memory stored by the tracer particle.
+ * Frees up the memory stored by the tracer particles.
  *
  * header: tracer.h
  */
@@ -32,14 +50,69 @@ extern void tracer_free(TRACER *t) {
 
 	if (t != NULL) {
 
+		if ((*t).mass != NULL) {
+			free(t -> mass);
+			t -> mass = NULL;
+		} else {}
+
+		if ((*t).zone_origin != NULL) {
+			free(t -> zone_origin);
+			t -> zone_origin = NULL;
+		} else {}
+
+		if ((*t).zone_current != NULL) {
+			free(t -> zone_current);
+			t -> zone_current = NULL;
+		} else {}
+
+		if ((*t).timestep_origin != NULL) {
+			free(t -> timestep_origin);
+			t -> timestep_origin = NULL;
+		} else {}
+
 		if ((*t).zone_history != NULL) {
 			free(t -> zone_history);
 			t -> zone_history = NULL;
-		}
+		} else {}
+
+		if ((*t).history_offsets != NULL) {
+			free(t -> history_offsets);
+			t -> history_offsets = NULL;
+		} else {}
+
+		if ((*t).history_lengths != NULL) {
+			free(t -> history_lengths);
+			t -> history_lengths = NULL;
+		} else {}
+
+		if ((*t).cohort_zone != NULL) {
+			free(t -> cohort_zone);
+			t -> cohort_zone = NULL;
+		} else {}
+
+		if ((*t).cohort_count != NULL) {
+			free(t -> cohort_count);
+			t -> cohort_count = NULL;
+		} else {}
+
+		if ((*t).cohort_length != NULL) {
+			free(t -> cohort_length);
+			t -> cohort_length = NULL;
+		} else {}
+
+		if ((*t).zone_members != NULL) {
+			free(t -> zone_members);
+			t -> zone_members = NULL;
+		} else {}
+
+		if ((*t).zone_offsets != NULL) {
+			free(t -> zone_offsets);
+			t -> zone_offsets = NULL;
+		} else {}
 
 		free(t);
 		t = NULL;
-		
+
 	} else {}
 
 }
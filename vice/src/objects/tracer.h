@@ -9,14 +9,16 @@ extern "C" {
 #include "objects.h"
 
 /*
- * Allocates memory for and returns a pointer to a TRACER particle.
+ * Allocates memory for and returns a pointer to a TRACER object. The arrays
+ * storing the tracer particles themselves are allocated by malloc_tracers in
+ * src/multizone/tracer.c.
  *
  * source: tracer.c
  */
 extern TRACER *tracer_initialize(void);
 
 /*
- * Frees up the memory stored by the tracer particle.
+ * Frees up the memory stored by the tracer particles.
  *
  * source: tracer.c
  */
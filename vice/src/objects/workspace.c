@@ -0,0 +1,104 @@
+/*
+ * This file implements memory management for the workspace object.
+ */
+
+#include <stdlib.h>
+#include "objects.h"
+#include "workspace.h"
+
+
+/*
+ * Allocates memory for and returns a pointer to a WORKSPACE object.
+ *
+ * Parameters
+ * ==========
+ * n_zones: 		The number of zones in the multizone simulation
+ * n_elements: 		The number of elements tracked by each zone
+ * n_gas_flows: 	The number of non-zero elements of the gas migration
+ * 					matrix
+ *
+ * header: workspace.h
+ */
+extern WORKSPACE *workspace_initialize(unsigned int n_zones,
+	unsigned int n_elements, unsigned long n_gas_flows) {
+
+	/*
+	 * The rows of each two-dimensional array point into a single block of
+	 * memory, which is freed through the first row.
+	 */
+	unsigned int i;
+	WORKSPACE *ws = (WORKSPACE *) malloc (sizeof(WORKSPACE));
+	ws -> n_zones = n_zones;
+	ws -> n_elements = n_elements;
+	ws -> changes = (double *) malloc (n_gas_flows * sizeof(double));
+	ws -> migration_deltas = (double *) malloc (n_zones * sizeof(double));
+	ws -> gas_recycled = (double *) malloc (n_zones * sizeof(double));
+	ws -> mstar = (double *) malloc (n_zones * sizeof(double));
+
+	ws -> recycled = (double **) malloc (n_elements * sizeof(double *));
+	ws -> recycled[0] = (double *) malloc (n_elements * n_zones *
+		sizeof(double));
+	for (i = 1u; i < n_elements; i++) {
+		ws -> recycled[i] = (*ws).recycled[0] + i * n_zones;
+	}
+
+	ws -> unretained = (double **) malloc (n_zones * sizeof(double *));
+	ws -> unretained[0] = (double *) malloc (n_zones * n_elements *
+		sizeof(double));
+	for (i = 1u; i < n_zones; i++) {
+		ws -> unretained[i] = (*ws).unretained[0] + i * n_elements;
+	}
+
+	return ws;
+
+}
+
+
+/*
+ * Frees up the memory stored in a WORKSPACE object.
+ *
+ * header: workspace.h
+ */
+extern void workspace_free(WORKSPACE *ws) {
+
+	if (ws != NULL) {
+
+		if ((*ws).changes != NULL) {
+			free(ws -> changes);
+			ws -> changes = NULL;
+		} else {}
+
+		if ((*ws).migration_deltas != NULL) {
+			free(ws -> migration_deltas);
+			ws -> migration_deltas = NULL;
+		} else {}
+
+		if ((*ws).gas_recycled != NULL) {
+			free(ws -> gas_recycled);
+			ws -> gas_recycled = NULL;
+		} else {}
+
+		if ((*ws).mstar != NULL) {
+			free(ws -> mstar);
+			ws -> mstar = NULL;
+		} else {}
+
+		if ((*ws).recycled != NULL) {
+			free(ws -> recycled[0]);
+			free(ws -> recycled);
+			ws -> recycled = NULL;
+		} else {}
+
+		if ((*ws).unretained != NULL) {
+			free(ws -> unretained[0]);
+			free(ws -> unretained);
+			ws -> unretained = NULL;
+		} else {}
+
+		free(ws);
+		ws = NULL;
+
+	} else {}
+
+}
+
@@ -0,0 +1,38 @@
+
+#ifndef OBJECTS_WORKSPACE_H
+#define OBJECTS_WORKSPACE_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "objects.h"
+
+/*
+ * Allocates memory for and returns a pointer to a WORKSPACE object.
+ *
+ * Parameters
+ * ==========
+ * n_zones: 		The number of zones in the multizone simulation
+ * n_elements: 		The number of elements tracked by each zone
+ * n_gas_flows: 	The number of non-zero elements of the gas migration
+ * 					matrix
+ *
+ * source: workspace.c
+ */
+extern WORKSPACE *workspace_initialize(unsigned int n_zones,
+	unsigned int n_elements, unsigned long n_gas_flows);
+
+/*
+ * Frees up the memory stored in a WORKSPACE object.
+ *
+ * source: workspace.c
+ */
+extern void workspace_free(WORKSPACE *ws);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus*/
+
+#endif /* OBJECTS_WORKSPACE_H */
+
@@ -12,6 +12,17 @@
 #include "../utils.h"
 #include "agb.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static void update_agb_cohorts(SINGLEZONE sz, ELEMENT e);
+static double cohort_AGB_yield(SINGLEZONE sz, ELEMENT e, unsigned long age,
+	unsigned long cohort);
+static double aged_AGB_yield(SINGLEZONE sz, ELEMENT e, unsigned long age,
+	double Z, long Z_bin);
+static double grid_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass,
+	long mass_bin, long Z_bin);
+static unsigned short mlr_depends_on_metallicity(void);
+
+
 /*
  * Determine the mass of a given element produced by AGB stars at the current
  * timestep of a singlezone simulation.
@@ -26,13 +37,23 @@
  * The mass of the given element in solar masses produced by AGB stars in one
  * timestep from all previous generations of stars.
  *
+ * Notes
+ * =====
+ * The metallicity of each stellar population and its bin on the yield grid
+ * are computed only once and stored in the cohort cache allocated by
+ * setup_AGB, as are the turnoff mass and its bin on the yield grid at each
+ * age when the mass-lifetime relation does not depend on metallicity. Stellar
+ * populations of zero age have no dying stars, so the sum begins one
+ * timestep ago.
+ *
  * header: agb.h
  */
 extern double m_AGB(SINGLEZONE sz, ELEMENT e) {
 
 	if (sz.timestep == 0l) {
 		return 0; /* No star's yet */
-	} else {
+	} else if ((*e.agb_grid).cohort_Z == NULL) {
+		/* setup_AGB has not been called -> fall back on the direct sum */
 		unsigned long i;
 		double mass = 0;
 		for (i = 0l; i <= sz.timestep; i++) {
@@ -46,16 +67,245 @@ extern double m_AGB(SINGLEZONE sz, ELEMENT e) {
 				(*sz.ism).star_formation_history[sz.timestep - i] * sz.dt *
 				((*sz.ssp).msmf[i] - (*sz.ssp).msmf[i + 1l])
 			);
-			
+
 		}
 
 		return mass;
-		
+
+	} else {
+		unsigned long i;
+		double mass = 0;
+		double *sfh = (*sz.ism).star_formation_history;
+		double *msmf = (*sz.ssp).msmf;
+		update_agb_cohorts(sz, e);
+		for (i = 1l; i <= sz.timestep; i++) {
+			/* From section 4.4 of VICE's science documentation */
+			mass += (
+				cohort_AGB_yield(sz, e, i, sz.timestep - i) *
+				sfh[sz.timestep - i] * sz.dt * (msmf[i] - msmf[i + 1l])
+			);
+		}
+
+		return mass;
+
+	}
+
+}
+
+
+/*
+ * Allocate memory for and fill the cohort cache of each element's AGB star
+ * yields at the beginning of a singlezone simulation.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the SINGLEZONE object for the current simulation
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * header: agb.h
+ */
+extern unsigned short setup_AGB(SINGLEZONE *sz) {
+
+	unsigned int j;
+	unsigned long i, k, n = n_timesteps(*sz);
+	for (j = 0u; j < (*sz).n_elements; j++) {
+
+		AGB_YIELD_GRID *agb_grid = sz -> elements[j] -> agb_grid;
+		agb_cohort_cache_free(agb_grid);
+		agb_grid -> cohort_Z = (double *) malloc (n * sizeof(double));
+		agb_grid -> cohort_bins = (long *) malloc (n * sizeof(long));
+		if ((*agb_grid).cohort_Z == NULL || (*agb_grid).cohort_bins == NULL) {
+			return 1u; 		/* memory error */
+		} else {}
+
+		if ((*agb_grid).tabulate) {
+			/*
+			 * Evaluate the custom yield once at each age and at each
+			 * metallicity on the grid. The table is stored as a single
+			 * contiguous block.
+			 */
+			unsigned long n_Z = (*(*agb_grid).interpolator).n_y_values;
+			double *block = (double *) malloc (n * n_Z * sizeof(double));
+			agb_grid -> yield_table = (double **) malloc (n * sizeof(double *));
+			if (block == NULL || (*agb_grid).yield_table == NULL) {
+				free(block);
+				return 1u; 		/* memory error */
+			} else {}
+			for (i = 0ul; i < n; i++) {
+				agb_grid -> yield_table[i] = block + i * n_Z;
+				for (k = 0ul; k < n_Z; k++) {
+					double Z = (*(*agb_grid).interpolator).ycoords[k];
+					agb_grid -> yield_table[i][k] = get_AGB_yield(
+						*(*sz).elements[j], Z,
+						dying_star_mass(i * (*sz).dt, (*(*sz).ssp).postMS, Z));
+				}
+			}
+		} else if (!mlr_depends_on_metallicity()) {
+			agb_grid -> turnoff_mass = (double *) malloc (n * sizeof(double));
+			if ((*agb_grid).turnoff_mass == NULL) return 1u;
+			for (i = 0ul; i < n; i++) {
+				agb_grid -> turnoff_mass[i] = dying_star_mass(i * (*sz).dt,
+					(*(*sz).ssp).postMS, 0);
+			}
+			if ((*(*agb_grid).custom_yield).user_func == NULL) {
+				agb_grid -> mass_bins = (long *) malloc (n * sizeof(long));
+				if ((*agb_grid).mass_bins == NULL) return 1u;
+				for (i = 0ul; i < n; i++) {
+					agb_grid -> mass_bins[i] = interp_scheme_2d_x_bin(
+						*(*agb_grid).interpolator,
+						(*agb_grid).turnoff_mass[i]);
+				}
+			} else {}
+		} else {}
+
 	}
 
+	return 0u;
+
+}
+
+
+/*
+ * Store the metallicity and its bin on the yield grid of the stars that
+ * formed at each timestep prior to the current one that is not yet stored.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ * e: 		The element to store the metallicities for
+ */
+static void update_agb_cohorts(SINGLEZONE sz, ELEMENT e) {
+
+	unsigned long i;
+	for (i = (*e.agb_grid).n_cohorts; i < sz.timestep; i++) {
+		e.agb_grid -> cohort_Z[i] = scale_metallicity(sz, i);
+		if ((*(*e.agb_grid).interpolator).ycoords != NULL) {
+			e.agb_grid -> cohort_bins[i] = interp_scheme_2d_y_bin(
+				*(*e.agb_grid).interpolator, (*e.agb_grid).cohort_Z[i]);
+		} else {
+			e.agb_grid -> cohort_bins[i] = -1l;
+		}
+	}
+	if (sz.timestep > (*e.agb_grid).n_cohorts) {
+		e.agb_grid -> n_cohorts = sz.timestep;
+	} else {}
+
+}
+
+
+/*
+ * Determine the fractional yield of a given element from the AGB stars of a
+ * stellar population using the cohort cache.
+ *
+ * Parameters
+ * ==========
+ * sz: 			The SINGLEZONE object for the current simulation
+ * e: 			The element struct containing AGB yield information
+ * age: 		The age of the stellar population in timesteps
+ * cohort: 		The timestep at which the stellar population formed
+ *
+ * Returns
+ * =======
+ * The fraction of each dying AGB star's mass that is converted into the
+ * element e under the current yield settings.
+ */
+static double cohort_AGB_yield(SINGLEZONE sz, ELEMENT e, unsigned long age,
+	unsigned long cohort) {
+
+	return aged_AGB_yield(sz, e, age, (*e.agb_grid).cohort_Z[cohort],
+		(*e.agb_grid).cohort_bins[cohort]);
+
+}
+
+
+/*
+ * Determine the fractional yield of a given element from the AGB stars of a
+ * stellar population of known age and metallicity using the per-age values
+ * stored by setup_AGB.
+ *
+ * Parameters
+ * ==========
+ * sz: 			The SINGLEZONE object in which the stellar population formed
+ * e: 			The element struct containing AGB yield information
+ * age: 		The age of the stellar population in timesteps
+ * Z: 			The metallicity by mass of the stellar population
+ *
+ * Returns
+ * =======
+ * The fraction of each dying AGB star's mass that is converted into the
+ * element e under the current yield settings.
+ *
+ * Notes
+ * =====
+ * This function does not modify the cohort cache, and may therefore be
+ * called for different zones from multiple threads at once.
+ *
+ * header: agb.h
+ */
+extern double population_AGB_yield(SINGLEZONE sz, ELEMENT e,
+	unsigned long age, double Z) {
+
+	long Z_bin = -1l;
+	if ((*(*e.agb_grid).interpolator).ycoords != NULL && (
+		(*e.agb_grid).yield_table != NULL ||
+		(*e.agb_grid).mass_bins != NULL)) {
+		Z_bin = interp_scheme_2d_y_bin(*(*e.agb_grid).interpolator, Z);
+	} else {}
+	return aged_AGB_yield(sz, e, age, Z, Z_bin);
+
 }
 
 
+/*
+ * Determine the fractional yield of a given element from the AGB stars of a
+ * stellar population of known age, metallicity, and bin on the yield grid in
+ * metallicity.
+ *
+ * Parameters
+ * ==========
+ * sz: 			The SINGLEZONE object in which the stellar population formed
+ * e: 			The element struct containing AGB yield information
+ * age: 		The age of the stellar population in timesteps
+ * Z: 			The metallicity by mass of the stellar population
+ * Z_bin: 		The bin number of Z on the yield grid in metallicity
+ *
+ * Returns
+ * =======
+ * The fraction of each dying AGB star's mass that is converted into the
+ * element e under the current yield settings.
+ */
+static double aged_AGB_yield(SINGLEZONE sz, ELEMENT e, unsigned long age,
+	double Z, long Z_bin) {
+
+	AGB_YIELD_GRID agb_grid = *e.agb_grid;
+
+	if (agb_grid.yield_table != NULL) {
+		/* Linear interpolation in metallicity at fixed age */
+		double *Zgrid = (*agb_grid.interpolator).ycoords;
+		return interpolate(Zgrid[Z_bin], Zgrid[Z_bin + 1l],
+			agb_grid.yield_table[age][Z_bin],
+			agb_grid.yield_table[age][Z_bin + 1l], Z);
+	} else {}
+
+	double turnoff_mass;
+	if (agb_grid.turnoff_mass != NULL) {
+		turnoff_mass = agb_grid.turnoff_mass[age];
+	} else {
+		turnoff_mass = dying_star_mass(age * sz.dt, (*sz.ssp).postMS, Z);
+	}
+
+	if (agb_grid.mass_bins != NULL) {
+		return grid_AGB_yield(e, Z, turnoff_mass, agb_grid.mass_bins[age],
+			Z_bin);
+	} else {
+		return get_AGB_yield(e, Z, turnoff_mass);
+	}
+
+}
+
 
 /*
  * Determine the fractional yield of a given element from AGB stars at a
@@ -96,6 +346,40 @@ extern double get_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass) {
 
 	} else {
 
+		return grid_AGB_yield(e, Z_stars, turnoff_mass,
+			interp_scheme_2d_x_bin(*(*e.agb_grid).interpolator, turnoff_mass),
+			interp_scheme_2d_y_bin(*(*e.agb_grid).interpolator, Z_stars));
+
+	}
+
+}
+
+
+/*
+ * Determine the fractional yield of a given element from AGB stars at a
+ * given mass and metallicity off of the built-in yield grid when the bin
+ * numbers of the mass and metallicity are already known.
+ *
+ * Parameters
+ * ==========
+ * e: 				The element struct containing AGB yield information
+ * Z_stars: 		The metallicity by mass Z of the AGB stars
+ * turnoff_mass:	The mass of the AGB stars
+ * mass_bin: 		The bin number of turnoff_mass on the yield grid
+ * Z_bin: 			The bin number of Z_stars on the yield grid
+ *
+ * Returns
+ * =======
+ * The fraction of each AGB star's mass that is converted into the element e
+ * under the current yield settings.
+ */
+static double grid_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass,
+	long mass_bin, long Z_bin) {
+
+	if (turnoff_mass < MIN_AGB_MASS || turnoff_mass > MAX_AGB_MASS) {
+		/* see comment in get_AGB_yield */
+		return 0;
+	} else {
 		/*
 		 * Let the 2-D interpolation scheme handle the meat of this
 		 * calculation to not repeat code. For many AGB elements though, this
@@ -103,14 +387,39 @@ extern double get_AGB_yield(ELEMENT e, double Z_stars, double turnoff_mass) {
 		 * probably more physical for the yields to flatten off. To mitigate
 		 * this issue, we don't allow negative AGB star yields below 1.5 Msun.
 		 */
-		double yield = interp_scheme_2d_evaluate(*(*e.agb_grid).interpolator,
-			turnoff_mass, Z_stars);
+		double yield = interp_scheme_2d_evaluate_bins(
+			*(*e.agb_grid).interpolator, turnoff_mass, Z_stars, mass_bin,
+			Z_bin);
 		if (turnoff_mass < 1.5 && yield < 0) {
 			return 0;
 		} else {
 			return yield;
 		}
-		
+	}
+
+}
+
+
+/*
+ * Determine whether or not the current mass-lifetime relation setting depends
+ * on metallicity.
+ *
+ * Returns
+ * =======
+ * 1 if the turnoff mass depends on metallicity, 0 otherwise
+ */
+static unsigned short mlr_depends_on_metallicity(void) {
+
+	switch (get_mlr_hashcode()) {
+
+		case VINCENZO2016:
+		case HPT2000:
+		case KA1997:
+			return 1u;
+
+		default:
+			return 0u;
+
 	}
 
 }
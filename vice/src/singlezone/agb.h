@@ -26,6 +26,49 @@ extern "C" {
  */
 extern double m_AGB(SINGLEZONE sz, ELEMENT e);
 
+/*
+ * Allocate memory for and fill the cohort cache of each element's AGB star
+ * yields at the beginning of a singlezone simulation.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the SINGLEZONE object for the current simulation
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on failure
+ *
+ * source: agb.c
+ */
+extern unsigned short setup_AGB(SINGLEZONE *sz);
+
+/*
+ * Determine the fractional yield of a given element from the AGB stars of a
+ * stellar population of known age and metallicity using the per-age values
+ * stored by setup_AGB.
+ *
+ * Parameters
+ * ==========
+ * sz: 			The SINGLEZONE object in which the stellar population formed
+ * e: 			The element struct containing AGB yield information
+ * age: 		The age of the stellar population in timesteps
+ * Z: 			The metallicity by mass of the stellar population
+ *
+ * Returns
+ * =======
+ * The fraction of each dying AGB star's mass that is converted into the
+ * element e under the current yield settings.
+ *
+ * Notes
+ * =====
+ * This function does not modify the cohort cache, and may therefore be
+ * called for different zones from multiple threads at once.
+ *
+ * source: agb.c
+ */
+extern double population_AGB_yield(SINGLEZONE sz, ELEMENT e,
+	unsigned long age, double Z);
+
 /*
  * Determine the fractional yield of a given element from AGB stars at a
  * given mass and metallicity.
@@ -9,6 +9,7 @@
 #include "../callback.h"
 #include "../ssp.h"
 #include "../ism.h"
+#include "../toolkit.h"
 #include "../utils.h"
 #include "ism.h"
 
@@ -209,7 +210,10 @@ extern double get_SFE_timescale(SINGLEZONE sz, unsigned short setup) {
 	 * SFE timescale at the next timestep
 	 */
 	setup = 1 - setup;
-	if ((*(*sz.ism).functional_tau_star).user_func != NULL) {
+	if ((*sz.ism).J21) {
+		/* Native implementation of vice.toolkit.J21_sf_law */
+		return J21_sf_law_gas(*sz.ism, sz.current_time, (*sz.ism).mass);
+	} else if ((*(*sz.ism).functional_tau_star).user_func != NULL) {
 		/* User-specified function of time and gas mass, in that order. */
 		return callback_2arg_evaluate(*(*sz.ism).functional_tau_star,
 			sz.current_time, (*sz.ism).mass);
@@ -256,7 +260,14 @@ extern double get_ism_mass_SFRmode(SINGLEZONE sz, unsigned short setup) {
 
 	setup = 1 - setup;
 	double tau_star;
-	if ((*(*sz.ism).functional_tau_star).user_func != NULL) {
+	if ((*sz.ism).J21) {
+		/*
+		 * Native implementation of vice.toolkit.J21_sf_law, which takes the
+		 * star formation rate in Msun/yr as does a user-specified function.
+		 */
+		tau_star = J21_sf_law_sfr(*sz.ism, sz.current_time,
+			1e-9 * (*sz.ism).star_formation_rate);
+	} else if ((*(*sz.ism).functional_tau_star).user_func != NULL) {
 		/*
 		 * User-specified function of time and star formation rate, in that
 		 * order. Users specify star formation rate in Msun/yr, however, while
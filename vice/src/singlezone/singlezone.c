@@ -50,6 +50,20 @@ extern long singlezone_address(SINGLEZONE *sz) {
  */
 extern unsigned short singlezone_evolve(SINGLEZONE *sz) {
 
+	/*
+	 * singlezone_setup keeps a CRF and MSMF that are already in place, which
+	 * only multizone_setup intends. Any left over from a previous run that
+	 * failed are sized for that run's timesteps, so discard them.
+	 */
+	if ((*(*sz).ssp).crf != NULL) {
+		free(sz -> ssp -> crf);
+		sz -> ssp -> crf = NULL;
+	} else {}
+	if ((*(*sz).ssp).msmf != NULL) {
+		free(sz -> ssp -> msmf);
+		sz -> ssp -> msmf = NULL;
+	} else {}
+
 	if (singlezone_setup(sz)) return 1u; 	/* setup failed */
 	singlezone_evolve_no_setup_no_clean(sz);
 
@@ -86,14 +100,14 @@ extern void singlezone_evolve_no_setup_no_clean(SINGLEZONE *sz) {
 		 */
 		if ((*sz).current_time >= (*sz).output_times[n] ||
 			2 * (*sz).output_times[n] < 2 * (*sz).current_time + (*sz).dt) {
-			write_singlezone_history(*sz);
+			write_singlezone_history(sz);
 			n++;
 		} else {}
 		if (singlezone_timestepper(sz)) break;
 		singlezone_verbosity(*sz);
 	}
 	singlezone_verbosity(*sz);
-	write_singlezone_history(*sz);
+	write_singlezone_history(sz);
 
 }
 
@@ -184,13 +198,17 @@ extern unsigned short singlezone_setup(SINGLEZONE *sz) {
 
 	/*
 	 * Setup the cumulative return fraction, main sequence mass fraction,
-	 * metallicity distribution function, SNe Ia rates, and gas evolution.
+	 * metallicity distribution function, SNe Ia rates, AGB star cohort
+	 * cache, and gas evolution. The CRF and MSMF will already be in place if
+	 * multizone_setup has computed them for another zone with the same
+	 * single stellar population parameters.
 	 */
 
-	if (setup_CRF(sz)) return 1u;
-	if (setup_MSMF(sz)) return 1u;
+	if ((*(*sz).ssp).crf == NULL && setup_CRF(sz)) return 1u;
+	if ((*(*sz).ssp).msmf == NULL && setup_MSMF(sz)) return 1u;
 	if (setup_MDF(sz)) return 1u;
 	if (setup_RIa(sz)) return 1u;
+	if (setup_AGB(sz)) return 1u;
 	if (setup_gas_evolution(sz)) return 1u;
 	unsigned int i;
 	for (i = 0u; i < (*sz).n_elements; i++) {
@@ -236,13 +254,20 @@ extern void singlezone_clean(SINGLEZONE *sz) {
 			sz -> elements[i] -> agb_grid -> interpolator -> xcoords = NULL;
 			sz -> elements[i] -> agb_grid -> interpolator -> ycoords = NULL;
 			sz -> elements[i] -> agb_grid -> interpolator -> zcoords = NULL;
+		} else if ((*(*(*sz).elements[i]).agb_grid).tabulate) {
+			free(sz -> elements[i] -> agb_grid -> interpolator -> ycoords);
+			sz -> elements[i] -> agb_grid -> interpolator -> ycoords = NULL;
 		} else {}
+		agb_cohort_cache_free(sz -> elements[i] -> agb_grid);
 		free(sz -> elements[i] -> Z);
 		free(sz -> elements[i] -> Zin);
 		free(sz -> elements[i] -> sneia_yields -> RIa);
+		free(sz -> elements[i] -> sneia_yields -> cohort_yields);
 		sz -> elements[i] -> Z = NULL;
 		sz -> elements[i] -> Zin = NULL;
 		sz -> elements[i] -> sneia_yields -> RIa = NULL;
+		sz -> elements[i] -> sneia_yields -> cohort_yields = NULL;
+		sz -> elements[i] -> sneia_yields -> n_cohorts = 0l;
 	}
 	free(sz -> ism -> specified);
 	free(sz -> ism -> star_formation_history);
@@ -299,6 +324,11 @@ extern void singlezone_cancel(SINGLEZONE *sz) {
 			free(sz -> elements[i] -> sneia_yields -> RIa);
 			sz -> elements[i] -> sneia_yields -> RIa = NULL;
 		} else {}
+		if ((*(*(*sz).elements[i]).sneia_yields).cohort_yields != NULL) {
+			free(sz -> elements[i] -> sneia_yields -> cohort_yields);
+			sz -> elements[i] -> sneia_yields -> cohort_yields = NULL;
+		} else {}
+		agb_cohort_cache_free(sz -> elements[i] -> agb_grid);
 		if ((*(*(*(*sz).elements[i]).agb_grid).interpolator).xcoords != NULL) {
 			free(sz -> elements[i] -> agb_grid -> interpolator -> xcoords);
 			sz -> elements[i] -> agb_grid -> interpolator -> xcoords = NULL;
@@ -330,6 +360,20 @@ extern void singlezone_cancel(SINGLEZONE *sz) {
 		sz -> ism -> tau_star = NULL;
 	} else {}
 
+	/*
+	 * singlezone_setup would otherwise reuse these on the next run even if
+	 * the timestep size, ending time or IMF have changed. Zones of a
+	 * multizone object must not share them here; see multizone_cancel.
+	 */
+	if ((*(*sz).ssp).crf != NULL) {
+		free(sz -> ssp -> crf);
+		sz -> ssp -> crf = NULL;
+	} else {}
+	if ((*(*sz).ssp).msmf != NULL) {
+		free(sz -> ssp -> msmf);
+		sz -> ssp -> msmf = NULL;
+	} else {}
+
 }
 
 
@@ -14,6 +14,10 @@
 
 /* ---------- static function comment headers not duplicated here ---------- */
 static double RIa_builtin(ELEMENT e, double time);
+static void update_cohort_yields(SINGLEZONE sz, ELEMENT e);
+static double mdot_sneia_convolution(SINGLEZONE sz, ELEMENT e);
+static double mdot_sneia_exponential(SINGLEZONE sz, ELEMENT e);
+static unsigned long RIa_length(SINGLEZONE sz);
 
 
 /*
@@ -30,20 +34,145 @@ static double RIa_builtin(ELEMENT e, double time);
  * =======
  * The time-derivative of the type Ia supernovae mass enrichment term
  *
+ * Notes
+ * =====
+ * The product of the yield and the star formation rate is computed only once
+ * for each timestep and stored in the cohort_yields array, so the SN Ia yield
+ * (which may be a python function) is evaluated once per timestep rather than
+ * once per previous timestep at each timestep. With the built-in exponential
+ * DTD, the rate is updated recursively from the previous timestep at a fixed
+ * cost, and otherwise it is a contiguous sum over cohort_yields and RIa.
+ *
  * header: sneia.h
  */
 extern double mdot_sneia(SINGLEZONE sz, ELEMENT e) {
 
+	if ((*e.sneia_yields).cohort_yields == NULL) {
+		/* setup_RIa has not been called -> fall back on the direct sum */
+		unsigned long i;
+		double mdotia = 0;
+		for (i = 0l; i < sz.timestep; i++) {
+			mdotia += (
+				get_ia_yield(e, scale_metallicity(sz, i)) *
+				(*sz.ism).star_formation_history[i] *
+				(*e.sneia_yields).RIa[sz.timestep - i]
+			);
+		}
+		return mdotia;
+	} else if ((*e.sneia_yields).rate_timestep == sz.timestep) {
+		/* already computed at this timestep */
+		return (*e.sneia_yields).rate;
+	} else {}
+
+	update_cohort_yields(sz, e);
+	if (checksum((*e.sneia_yields).dtd) == EXP &&
+		(*e.sneia_yields).rate_timestep + 1l == sz.timestep) {
+		e.sneia_yields -> rate = mdot_sneia_exponential(sz, e);
+	} else {
+		e.sneia_yields -> rate = mdot_sneia_convolution(sz, e);
+	}
+	e.sneia_yields -> rate_timestep = sz.timestep;
+
+	/* Entrainment is handled in vice/src/singlezone/element.c */
+	return (*e.sneia_yields).rate;
+
+}
+
+
+/*
+ * Store the product of the SN Ia yield and the star formation rate for each
+ * timestep prior to the current one that is not yet stored.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ * e: 		The element to store the yield-weighted star formation history for
+ */
+static void update_cohort_yields(SINGLEZONE sz, ELEMENT e) {
+
 	unsigned long i;
-	double mdotia = 0;
-	for (i = 0l; i < sz.timestep; i++) {
-		mdotia += (
+	for (i = (*e.sneia_yields).n_cohorts; i < sz.timestep; i++) {
+		e.sneia_yields -> cohort_yields[i] = (
 			get_ia_yield(e, scale_metallicity(sz, i)) *
-			(*sz.ism).star_formation_history[i] *
-			(*e.sneia_yields).RIa[sz.timestep - i]
+			(*sz.ism).star_formation_history[i]
 		);
 	}
-	/* Entrainment is handled in vice/src/singlezone/element.c */
+	if (sz.timestep > (*e.sneia_yields).n_cohorts) {
+		e.sneia_yields -> n_cohorts = sz.timestep;
+	} else {}
+
+}
+
+
+/*
+ * Compute the SN Ia mass production rate at the current timestep by
+ * convolving the yield-weighted star formation history with the delay-time
+ * distribution directly. This is valid for any DTD.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ * e: 		The element to find the rate of mass enrichment for
+ *
+ * Returns
+ * =======
+ * The time-derivative of the type Ia supernovae mass enrichment term
+ */
+static double mdot_sneia_convolution(SINGLEZONE sz, ELEMENT e) {
+
+	unsigned long i, length = RIa_length(sz);
+	double mdotia = 0;
+	double *cohorts = (*e.sneia_yields).cohort_yields;
+	double *ria = (*e.sneia_yields).RIa;
+
+	/* populations older than the DTD is evaluated for don't contribute */
+	i = sz.timestep >= length ? sz.timestep - length + 1l : 0l;
+	for (; i < sz.timestep; i++) {
+		mdotia += cohorts[i] * ria[sz.timestep - i];
+	}
+	return mdotia;
+
+}
+
+
+/*
+ * Compute the SN Ia mass production rate at the current timestep from that
+ * at the previous timestep under the built-in exponential DTD. Every
+ * contributing population's rate declines by the same factor
+ * exp(-dt / tau_ia) over one timestep, so only the population that has just
+ * reached the minimum delay time needs to be added, and the one that has
+ * just aged past the maximum time the DTD is evaluated for removed.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ * e: 		The element to find the rate of mass enrichment for
+ *
+ * Returns
+ * =======
+ * The time-derivative of the type Ia supernovae mass enrichment term
+ */
+static double mdot_sneia_exponential(SINGLEZONE sz, ELEMENT e) {
+
+	unsigned long delay, length = RIa_length(sz);
+	double *ria = (*e.sneia_yields).RIa;
+	double decay = exp(-sz.dt / (*e.sneia_yields).tau_ia);
+	double mdotia = decay * (*e.sneia_yields).rate;
+
+	/* the index of the first non-zero element of the DTD */
+	for (delay = 1l; delay < length; delay++) {
+		if (ria[delay]) break;
+	}
+
+	if (delay < length && sz.timestep >= delay) {
+		mdotia += (*e.sneia_yields).cohort_yields[sz.timestep - delay] * (
+			ria[delay]);
+	} else {}
+	if (sz.timestep >= length) {
+		mdotia -= (*e.sneia_yields).cohort_yields[sz.timestep - length] * (
+			decay * ria[length - 1l]);
+	} else {}
+
 	return mdotia;
 
 }
@@ -88,9 +217,20 @@ extern double get_ia_yield(ELEMENT e, double Z) {
 extern unsigned short setup_RIa(SINGLEZONE *sz) {
 
 	unsigned int j;
-	unsigned long i, length = (unsigned long) (RIA_MAX_EVAL_TIME / (*sz).dt);
+	unsigned long i, length = RIa_length(*sz);
 	for (j = 0; j < (*sz).n_elements; j++) {
 
+		/* the yield-weighted star formation history, filled as it runs */
+		sz -> elements[j] -> sneia_yields -> cohort_yields = (double *) malloc (
+			n_timesteps(*sz) * sizeof(double));
+		if ((*(*(*sz).elements[j]).sneia_yields).cohort_yields == NULL) {
+			return 1; 		/* memory error */
+		} else {
+			sz -> elements[j] -> sneia_yields -> n_cohorts = 0l;
+			sz -> elements[j] -> sneia_yields -> rate = 0;
+			sz -> elements[j] -> sneia_yields -> rate_timestep = 0l;
+		}
+
 		switch (checksum((*(*(*sz).elements[j]).sneia_yields).dtd)) {
 
 			case PLAW:
@@ -174,6 +314,25 @@ static double RIa_builtin(ELEMENT e, double time) {
 }
 
 
+/*
+ * Determine the number of timesteps that the SNe Ia delay-time distribution
+ * is evaluated at.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ *
+ * Returns
+ * =======
+ * The length of the RIa array stored in each element's SNe Ia yield settings
+ */
+static unsigned long RIa_length(SINGLEZONE sz) {
+
+	return (unsigned long) (RIA_MAX_EVAL_TIME / sz.dt);
+
+}
+
+
 /*
  * Normalize the SNe Ia delay-time distribution once it is set according to
  * an arbitrary normalization.
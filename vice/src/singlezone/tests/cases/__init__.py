@@ -12,6 +12,7 @@ if not __VICE_SETUP__:
 	from ._quiescence import tau_star_inf
 	from ._max_age_ssp import single_max_age_ssp
 	from ._zero_age_ssp import single_zero_age_ssp
+	from ._exponential_dtd import recursive_exponential_dtd
 
 
 	@moduletest
@@ -23,7 +24,8 @@ if not __VICE_SETUP__:
 			[
 				tau_star_inf(run = False),
 				single_max_age_ssp(run = False),
-				single_zero_age_ssp(run = False)
+				single_zero_age_ssp(run = False),
+				recursive_exponential_dtd(run = False)
 			]
 		]
 
@@ -0,0 +1,14 @@
+# cython: language_level = 3, boundscheck = False
+
+from __future__ import absolute_import
+from .....core.objects._singlezone cimport SINGLEZONE
+from ._generic cimport generic
+
+cdef class exponential_dtd(generic):
+	pass
+
+
+### Exponential DTD unit tests ###
+cdef extern from "../sneia.h":
+	unsigned short exponential_dtd_test_mdot_sneia(SINGLEZONE *sz)
+
@@ -0,0 +1,80 @@
+# cython: language_level = 3, boundscheck = False, binding = True
+
+from __future__ import absolute_import
+from .....testing import moduletest
+from .....testing import unittest
+from . cimport _exponential_dtd
+import warnings
+
+_DT_ = 0.1
+_TIMES_ = [_DT_ * i for i in range(401)]
+
+
+@moduletest
+def recursive_exponential_dtd():
+	r"""
+	Runs an exponential DTD edge-case test on a simulation in which star
+	formation stops for longer than the DTD is evaluated for before resuming.
+	"""
+	return [
+		"""vice.core.singlezone edge case : exponential SN Ia DTD \
+[tau_star = infinity if 5 <= t < 25 Gyr else 2 Gyr]""",
+		exponential_dtd_test(tau_star = tau_star, RIa = "exp", dt = _DT_)
+	]
+
+
+def tau_star(t):
+	r"""
+	The attribute tau_star as a function of time for the exponential DTD
+	edge-case test.
+	"""
+	if 5 <= t < 25:
+		return float("inf")
+	else:
+		return 2
+
+
+def exponential_dtd_test(**kwargs):
+	r"""
+	Run an exponential DTD edge-case test.
+
+	Parameters
+	----------
+	kwargs : varying types
+		The keyword arguments to set as attributes of the singlezone class.
+		Assumed to adopt the exponential SN Ia DTD.
+
+	Returns
+	-------
+	tests : list
+		The unit tests to return as a part of the moduletest object.
+		None if the exponential_dtd class cannot be instantiated.
+	"""
+	try:
+		with warnings.catch_warnings():
+			# the simulation intentionally runs past 15 Gyr
+			warnings.simplefilter("ignore")
+			_TEST_ = exponential_dtd(output_times = _TIMES_, **kwargs)
+	except:
+		return None
+	return [
+		_TEST_.test_m_sneia()
+	]
+
+
+cdef class exponential_dtd:
+
+	r"""
+	A class intended to run unit tests for the exponential SN Ia DTD, under
+	which the SN Ia rate is updated recursively from one timestep to the next.
+	"""
+
+	@unittest
+	def test_m_sneia(self):
+		r"""
+		vice.src.singlezone.sneia.m_sneia exponential DTD test
+		"""
+		def test():
+			return _exponential_dtd.exponential_dtd_test_mdot_sneia(self._sz)
+		return ["vice.src.singlezone.sneia.m_sneia", test]
+
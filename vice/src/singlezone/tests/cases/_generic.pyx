@@ -25,16 +25,16 @@ cdef class generic:
 	production.
 	"""
 
-	def __init__(self, **kwargs):
+	def __init__(self, output_times = _TIMES_, **kwargs):
 		if "name" in kwargs.keys(): del kwargs["name"]
 		super().__init__(name = "test", **kwargs)
-		self.prep(_TIMES_)
+		self.prep(output_times)
 		self.open_output_dir(True)
-		self._sz[0].n_outputs = len(_TIMES_)
+		self._sz[0].n_outputs = len(output_times)
 		self._sz[0].output_times = <double *> malloc (self._sz[0].n_outputs *
 			sizeof(double))
 		for i in range(self._sz[0].n_outputs):
-			self._sz[0].output_times[i] = _TIMES_[i]
+			self._sz[0].output_times[i] = output_times[i]
 		_generic.singlezone_setup(self._sz)
 		_generic.singlezone_evolve_no_setup_no_clean(self._sz)
 		_generic.normalize_MDF(self._sz)
@@ -3,8 +3,15 @@
  * parent directory.
  */
 
+#include <stdlib.h>
+#include <math.h>
+#include "../../sneia.h"
+#include "../../utils.h"
 #include "../sneia.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static double direct_mdot_sneia(SINGLEZONE sz, ELEMENT e);
+
 /*
  * Performs the quiescence edge-case test on the mdot_sneia function in the
  * parent directory.
@@ -86,3 +93,85 @@ extern unsigned short zero_age_ssp_test_mdot_sneia(SINGLEZONE *sz) {
 
 }
 
+
+
+/*
+ * Performs the exponential DTD edge-case test on the mdot_sneia function in
+ * the parent directory. With the exponential DTD, mdot_sneia updates the SN Ia
+ * mass production rate from its value at the previous timestep. This test
+ * replays a completed simulation from the first timestep, ensuring that the
+ * recursively updated rate agrees with the direct sum over the yield-weighted
+ * star formation history at each timestep.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * Notes
+ * =====
+ * Differences are measured relative to the maximum rate over the simulation,
+ * such that timesteps at which every contributing population has aged out of
+ * the DTD, where the direct sum is exactly zero, are included.
+ *
+ * header: sneia.h
+ */
+extern unsigned short exponential_dtd_test_mdot_sneia(SINGLEZONE *sz) {
+
+	unsigned short status = 1u;
+	unsigned int i;
+	unsigned long final = (*sz).timestep;
+	for (i = 0u; i < (*sz).n_elements; i++) {
+		ELEMENT *e = sz -> elements[i];
+		if (checksum((*(*e).sneia_yields).dtd) != EXP) return 0u;
+		e -> sneia_yields -> rate = 0;
+		e -> sneia_yields -> rate_timestep = 0l;
+		double max_rate = 0, max_diff = 0;
+		unsigned long j;
+		for (j = 1l; j <= final; j++) {
+			sz -> timestep = j;
+			double recursive = mdot_sneia(*sz, *e);
+			double direct = direct_mdot_sneia(*sz, *e);
+			if (fabs(direct) > max_rate) max_rate = fabs(direct);
+			if (fabs(recursive - direct) > max_diff) {
+				max_diff = fabs(recursive - direct);
+			} else {}
+		}
+		status &= max_diff <= 1e-10 * max_rate;
+		if (!status) break;
+	}
+	sz -> timestep = final;
+	return status;
+
+}
+
+
+/*
+ * Compute the SN Ia mass production rate at the current timestep by summing
+ * over the yield-weighted star formation history of every population within
+ * the time the DTD is evaluated for.
+ *
+ * Parameters
+ * ==========
+ * sz: 		The SINGLEZONE object for the current simulation
+ * e: 		The element to find the rate of mass enrichment for
+ *
+ * Returns
+ * =======
+ * The time-derivative of the type Ia supernovae mass enrichment term
+ */
+static double direct_mdot_sneia(SINGLEZONE sz, ELEMENT e) {
+
+	unsigned long i, length = (unsigned long) (RIA_MAX_EVAL_TIME / sz.dt);
+	double mdotia = 0;
+	i = sz.timestep >= length ? sz.timestep - length + 1l : 0l;
+	for (; i < sz.timestep; i++) {
+		mdotia += (*e.sneia_yields).cohort_yields[i] * (
+			(*e.sneia_yields).RIa[sz.timestep - i]);
+	}
+	return mdotia;
+
+}
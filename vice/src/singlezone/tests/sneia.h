@@ -54,6 +54,32 @@ extern unsigned short max_age_ssp_test_mdot_sneia(SINGLEZONE *sz);
  */
 extern unsigned short zero_age_ssp_test_mdot_sneia(SINGLEZONE *sz);
 
+/*
+ * Performs the exponential DTD edge-case test on the mdot_sneia function in
+ * the parent directory. With the exponential DTD, mdot_sneia updates the SN Ia
+ * mass production rate from its value at the previous timestep. This test
+ * replays a completed simulation from the first timestep, ensuring that the
+ * recursively updated rate agrees with the direct sum over the yield-weighted
+ * star formation history at each timestep.
+ *
+ * Parameters
+ * ==========
+ * sz: 		A pointer to the singlezone object to run the test on
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * Notes
+ * =====
+ * Differences are measured relative to the maximum rate over the simulation,
+ * such that timesteps at which every contributing population has aged out of
+ * the DTD, where the direct sum is exactly zero, are included.
+ *
+ * source: sneia.c
+ */
+extern unsigned short exponential_dtd_test_mdot_sneia(SINGLEZONE *sz);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
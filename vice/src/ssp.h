@@ -45,9 +45,38 @@ extern "C" {
 #define SSP_NMAX 2e8
 #endif /* SSP_NMAX */
 
+/*
+ * Default tolerance on the cumulative integrals over stellar mass from which
+ * the CRF and MSMF are computed at every timestep with a custom IMF
+ */
+#ifndef SSP_CUMULATIVE_TOLERANCE
+#define SSP_CUMULATIVE_TOLERANCE 1e-6
+#endif /* SSP_CUMULATIVE_TOLERANCE */
+
+/*
+ * Maximum number of bisections of any interval in the cumulative integrals
+ * over stellar mass, beyond which the CRF and MSMF are computed by
+ * quadrature at each timestep instead
+ * User modification strongly discouraged
+ */
+#ifndef SSP_CUMULATIVE_MAXDEPTH
+#define SSP_CUMULATIVE_MAXDEPTH 40u
+#endif /* SSP_CUMULATIVE_MAXDEPTH */
+
+/*
+ * Maximum number of stellar masses sampled in the cumulative integrals over
+ * stellar mass, beyond which the CRF and MSMF are computed by quadrature at
+ * each timestep instead
+ * User modification strongly discouraged
+ */
+#ifndef SSP_CUMULATIVE_NMAX
+#define SSP_CUMULATIVE_NMAX 1000000ul
+#endif /* SSP_CUMULATIVE_NMAX */
+
 #include "objects.h"
 #include "objects/ssp.h"
 #include "ssp/crf.h"
+#include "ssp/cumulative.h"
 #include "ssp/mlr.h"
 #include "ssp/msmf.h"
 #include "ssp/remnants.h"
@@ -14,8 +14,8 @@
 #include "mlr.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static double CRFdenominator_integrand(double m);
-static double CRFnumerator_integrand(double m);
+static double CRFdenominator_integrand(double m, void *imf);
+static double CRFnumerator_integrand(double m, void *imf);
 static double CRFnumerator_Kalirai08(SSP ssp, double time);
 static double CRFnumerator_Kalirai08_IMFrange(double m_upper,
 	double turnoff_mass, double m_lower, double a);
@@ -23,7 +23,6 @@ static double CRFnumerator_Kalirai08_above_8Msun(double m_upper,
 	double turnoff_mass, double a);
 static double CRFnumerator_Kalirai08_below_8Msun(double m_upper,
 	double turnoff_mass, double a);
-static IMF_ *ADOPTED_IMF = NULL;
 
 /*
  * Determine the cumulative return fraction from a single stellar population
@@ -88,6 +87,21 @@ extern unsigned short setup_CRF(SINGLEZONE *sz) {
 		unsigned long i, n = n_timesteps(*sz);
 
 		sz -> ssp -> crf = (double *) malloc (n * sizeof(double));
+		if (checksum((*(*(*sz).ssp).imf).spec) == CUSTOM &&
+			(*(*sz).ssp).cumulative_tolerance > 0) {
+			/*
+			 * Each timestep would otherwise integrate the custom IMF
+			 * numerically from scratch. Fall back to doing so only if the
+			 * cumulative integral over stellar mass does not converge, or if
+			 * the user has asked for it by setting the tolerance to zero.
+			 */
+			double *times = (double *) malloc (n * sizeof(double));
+			for (i = 0l; i < n; i++) times[i] = i * (*sz).dt;
+			unsigned short failed = cumulative_CRF(*(*sz).ssp, times, n,
+				(*(*sz).ssp).cumulative_tolerance, sz -> ssp -> crf);
+			free(times);
+			if (!failed) return 0u;
+		} else {}
 		for (i = 0l; i < n; i++) {
 			sz -> ssp -> crf[i] = CRFnumerator_Kalirai08(
 				(*(*sz).ssp), i * (*sz).dt) / denominator;
@@ -105,6 +119,7 @@ extern unsigned short setup_CRF(SINGLEZONE *sz) {
  * Parameters
  * ==========
  * m: 		The initial stellar mass in Msun
+ * imf: 		The IMF object to weight by
  *
  * Returns
  * =======
@@ -115,9 +130,10 @@ extern unsigned short setup_CRF(SINGLEZONE *sz) {
  * ========
  * Section 2.2 of Science Documentation: The Cumulative Return Fraction
  */
-static double CRFnumerator_integrand(double m) {
+static double CRFnumerator_integrand(double m, void *imf) {
 
-	return (m - Kalirai08_remnant_mass(m)) * imf_evaluate(*ADOPTED_IMF, m);
+	return (m - Kalirai08_remnant_mass(m)) * imf_evaluate(*((IMF_ *) imf),
+		m);
 
 }
 
@@ -128,6 +144,7 @@ static double CRFnumerator_integrand(double m) {
  * Parameters
  * ==========
  * m: 		The initial stellar mass in Msun
+ * imf: 		The IMF object to weight by
  *
  * Returns
  * =======
@@ -137,9 +154,9 @@ static double CRFnumerator_integrand(double m) {
  * ========
  * Section 2.2 of Science Documentation: The Cumulative Return Fraction
  */
-static double CRFdenominator_integrand(double m) {
+static double CRFdenominator_integrand(double m, void *imf) {
 
-	return m * imf_evaluate(*ADOPTED_IMF, m);
+	return m * imf_evaluate(*((IMF_ *) imf), m);
 
 }
 
@@ -245,9 +262,9 @@ static double CRFnumerator_Kalirai08(SSP ssp, double t) {
 
 		case CUSTOM:
 			/* custom IMF -> no assumptions made, must integrate numerically */
-			ADOPTED_IMF = ssp.imf;
 			INTEGRAL *numerator = integral_initialize();
 			numerator -> func = &CRFnumerator_integrand;
+			numerator -> params = ssp.imf;
 			numerator -> a = turnoff_mass;
 			numerator -> b = (*ssp.imf).m_upper;
 			/* default values for these parameters */
@@ -258,7 +275,6 @@ static double CRFnumerator_Kalirai08(SSP ssp, double t) {
 			quad(numerator);
 			double x = (*numerator).result;
 			integral_free(numerator);
-			ADOPTED_IMF = NULL;
 			return x;
 
 		default:
@@ -467,9 +483,9 @@ extern double CRFdenominator(SSP ssp) {
 
 		case CUSTOM:
 			/* custom IMF -> no assumptions made, must integrate numerically */
-			ADOPTED_IMF = ssp.imf;
 			INTEGRAL *denominator = integral_initialize();
 			denominator -> func = &CRFdenominator_integrand;
+			denominator -> params = ssp.imf;
 			denominator -> a = (*ssp.imf).m_lower;
 			denominator -> b = (*ssp.imf).m_upper;
 			/* default values for these properties */
@@ -480,7 +496,6 @@ extern double CRFdenominator(SSP ssp) {
 			quad(denominator);
 			double x = (*denominator).result;
 			integral_free(denominator);
-			ADOPTED_IMF = NULL;
 			return x;
 
 		default:
@@ -0,0 +1,531 @@
+/*
+ * This file implements the calculation of the cumulative return fraction and
+ * main sequence mass fraction of a single stellar population at many ages
+ * from a single cumulative integral over stellar mass.
+ *
+ * Notes
+ * =====
+ * The main sequence turnoff mass decreases monotonically with age, so the
+ * integrals over the IMF from the turnoff mass to the upper mass limit (or
+ * from the lower mass limit to the turnoff mass) at every age are all
+ * determined by one running integral from the lower mass limit. This is
+ * computed by adaptive Simpson's rule in the logarithm of the stellar mass,
+ * storing the running integral and the integrand at each sampled mass. At
+ * masses in between, the running integral is interpolated with a cubic
+ * Hermite polynomial, taking the integrand as its derivative. A custom IMF is
+ * therefore evaluated a few hundred times in total rather than at least
+ * SSP_NMIN times for each age.
+ */
+
+#include <stdlib.h>
+#include <math.h>
+#include "../ssp.h"
+#include "../imf.h"
+#include "../utils.h"
+#include "cumulative.h"
+#include "remnants.h"
+#include "mlr.h"
+
+typedef struct mass_integral {
+
+	/*
+	 * The running integral over stellar mass of some quantity weighted by
+	 * the IMF.
+	 *
+	 * imf: The IMF to weight the integrand by
+	 * weight: The quantity to weight by the IMF as a function of stellar mass
+	 * lnm: The natural logarithm of each stellar mass sampled, in
+	 * 		increasing order
+	 * integrand: The integrand with respect to ln(m) at each mass
+	 * running: The integral from the lower mass limit to each mass
+	 * n: The number of masses sampled
+	 * size: The number of masses memory has been allocated for
+	 */
+
+	IMF_ *imf;
+	double (*weight)(double);
+	double *lnm;
+	double *integrand;
+	double *running;
+	unsigned long n;
+	unsigned long size;
+
+} MASS_INTEGRAL;
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static MASS_INTEGRAL *mass_integral(IMF_ *imf, double (*weight)(double),
+	double tolerance);
+static unsigned short adaptive_simpson(MASS_INTEGRAL *mi, double a,
+	double fa, double c, double fc, double b, double fb, double whole,
+	double eps, unsigned short depth);
+static unsigned short sample(MASS_INTEGRAL *mi, double lnm, double integrand,
+	double running);
+static double evaluate_integrand(MASS_INTEGRAL mi, double lnm);
+static double interpolate_running(MASS_INTEGRAL mi, double m);
+static void mass_integral_free(MASS_INTEGRAL *mi);
+static double returned_mass(double m);
+static double initial_mass(double m);
+
+/* The number of intervals in ln(m) each mass range starts out with */
+static const unsigned short INITIAL_INTERVALS = 16u;
+
+/*
+ * The fraction of an interval in ln(m) inside the ends of a mass range at
+ * which the integrand is evaluated in place of the ends themselves
+ */
+static const double EDGE = 1e-9;
+
+
+/*
+ * Evaluate the cumulative return fraction of a single stellar population at
+ * many ages from one cumulative integral over stellar mass.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		The SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * times: 		The ages in Gyr at which to evaluate the CRF
+ * n_times: 	The number of elements in the times array
+ * tolerance: 	The maximum relative numerical error on the integral over
+ * 				stellar mass
+ * crf: 		The array to store the CRF at each age in
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the tolerance could not be reached or the IMF is
+ * unrecognized, in which case the values stored in crf are meaningless.
+ *
+ * header: cumulative.h
+ */
+extern unsigned short cumulative_CRF(SSP ssp, double *times,
+	unsigned long n_times, double tolerance, double *crf) {
+
+	/*
+	 * The denominator is the whole integral of the initial mass, computed to
+	 * the same tolerance.
+	 */
+	MASS_INTEGRAL *mi = mass_integral(ssp.imf, &initial_mass, tolerance);
+	if (mi == NULL) return 1u;
+	double denominator = (*mi).running[(*mi).n - 1ul];
+	mass_integral_free(mi);
+	if (denominator <= 0) return 1u;
+	mi = mass_integral(ssp.imf, &returned_mass, tolerance);
+	if (mi == NULL) return 1u;
+
+	unsigned long i;
+	double total = (*mi).running[(*mi).n - 1ul];
+	for (i = 0ul; i < n_times; i++) {
+		double turnoff_mass = dying_star_mass(times[i], ssp.postMS, 0.014);
+		if (turnoff_mass > (*ssp.imf).m_upper) {
+			crf[i] = 0;
+		} else {
+			crf[i] = (total - interpolate_running(*mi, turnoff_mass)) /
+				denominator;
+		}
+	}
+	mass_integral_free(mi);
+	return 0u;
+
+}
+
+
+/*
+ * Evaluate the main sequence mass fraction of a single stellar population at
+ * many ages from one cumulative integral over stellar mass.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		The SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * times: 		The ages in Gyr at which to evaluate the MSMF
+ * n_times: 	The number of elements in the times array
+ * tolerance: 	The maximum relative numerical error on the integral over
+ * 				stellar mass
+ * msmf: 		The array to store the MSMF at each age in
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the tolerance could not be reached or the IMF is
+ * unrecognized, in which case the values stored in msmf are meaningless.
+ *
+ * header: cumulative.h
+ */
+extern unsigned short cumulative_MSMF(SSP ssp, double *times,
+	unsigned long n_times, double tolerance, double *msmf) {
+
+	MASS_INTEGRAL *mi = mass_integral(ssp.imf, &initial_mass, tolerance);
+	if (mi == NULL) return 1u;
+	double denominator = (*mi).running[(*mi).n - 1ul];
+	if (denominator <= 0) {
+		mass_integral_free(mi);
+		return 1u;
+	} else {}
+
+	unsigned long i;
+	for (i = 0ul; i < n_times; i++) {
+		double turnoff_mass = dying_star_mass(times[i], ssp.postMS, 0.014);
+		if (turnoff_mass > (*ssp.imf).m_upper) {
+			msmf[i] = 1;
+		} else {
+			msmf[i] = interpolate_running(*mi, turnoff_mass) / denominator;
+		}
+	}
+	mass_integral_free(mi);
+	return 0u;
+
+}
+
+
+/*
+ * Compute the running integral over stellar mass of some quantity weighted by
+ * the IMF, from the lower to the upper mass limit of star formation.
+ *
+ * Parameters
+ * ==========
+ * imf: 		The IMF to weight the integrand by
+ * weight: 		The quantity to weight by the IMF as a function of stellar
+ * 				mass in Msun
+ * tolerance: 	The maximum relative numerical error on the integral
+ *
+ * Returns
+ * =======
+ * The running integral, or NULL if the tolerance could not be reached
+ * within SSP_CUMULATIVE_MAXDEPTH bisections of any interval, if more than
+ * SSP_CUMULATIVE_NMAX masses would be required, or if the mass limits are
+ * not positive.
+ *
+ * Notes
+ * =====
+ * The range is split at 8 Msun, where the Kalirai et al. (2008) remnant mass
+ * is discontinuous, so that no interval needs to be bisected repeatedly
+ * around it.
+ *
+ * References
+ * ==========
+ * Kalirai et al. (2008), ApJ, 676, 594
+ */
+static MASS_INTEGRAL *mass_integral(IMF_ *imf, double (*weight)(double),
+	double tolerance) {
+
+	if ((*imf).m_lower <= 0 || (*imf).m_upper <= (*imf).m_lower) return NULL;
+	double bounds[3];
+	unsigned short i, j, n_ranges = 0u;
+	bounds[0] = log((*imf).m_lower);
+	if ((*imf).m_lower < 8 && 8 < (*imf).m_upper) {
+		bounds[++n_ranges] = log(8);
+	} else {}
+	bounds[++n_ranges] = log((*imf).m_upper);
+
+	MASS_INTEGRAL *mi = (MASS_INTEGRAL *) malloc (sizeof(MASS_INTEGRAL));
+	mi -> imf = imf;
+	mi -> weight = weight;
+	mi -> n = 0ul;
+	mi -> size = 0ul;
+	mi -> lnm = NULL;
+	mi -> integrand = NULL;
+	mi -> running = NULL;
+
+	/*
+	 * Simpson's rule with INITIAL_INTERVALS intervals in each mass range
+	 * gives a coarse estimate of the whole integral, which sets the absolute
+	 * tolerance shared between intervals in proportion to their width. The
+	 * integrand is evaluated just inside the ends of each range, where it may
+	 * be discontinuous.
+	 */
+	unsigned short n_points = 2u * INITIAL_INTERVALS + 1u;
+	double *f = (double *) malloc (n_ranges * n_points * sizeof(double));
+	double scale = 0;
+	for (i = 0u; i < n_ranges; i++) {
+		double *fi = f + i * n_points;
+		double width = (bounds[i + 1u] - bounds[i]) / (n_points - 1u);
+		for (j = 0u; j < n_points; j++) {
+			double x = bounds[i] + j * width;
+			if (!j) {
+				x += EDGE * width;
+			} else if (j == n_points - 1u) {
+				x = bounds[i + 1u] - EDGE * width;
+			} else {}
+			fi[j] = evaluate_integrand(*mi, x);
+		}
+		for (j = 0u; j < INITIAL_INTERVALS; j++) {
+			scale += width / 3 * absval(fi[2u * j] + 4 * fi[2u * j + 1u] +
+				fi[2u * j + 2u]);
+		}
+	}
+	double eps = tolerance * scale / (bounds[n_ranges] - bounds[0]);
+
+	/*
+	 * Each range starts with a sample at its lower bound, such that the
+	 * integrand on either side of a discontinuity is known.
+	 */
+	unsigned short status = 0u;
+	for (i = 0u; i < n_ranges && !status; i++) {
+		double *fi = f + i * n_points;
+		double width = (bounds[i + 1u] - bounds[i]) / (n_points - 1u);
+		status = sample(mi, bounds[i], fi[0],
+			i ? (*mi).running[(*mi).n - 1ul] : 0);
+		for (j = 0u; j < INITIAL_INTERVALS && !status; j++) {
+			double a = bounds[i] + 2u * j * width;
+			double b = j == INITIAL_INTERVALS - 1u ? bounds[i + 1u] : (
+				a + 2 * width);
+			status = adaptive_simpson(mi, a, fi[2u * j], a + width,
+				fi[2u * j + 1u], b, fi[2u * j + 2u], width / 3 * (
+				fi[2u * j] + 4 * fi[2u * j + 1u] + fi[2u * j + 2u]),
+				eps * (b - a), 0u);
+		}
+	}
+	free(f);
+	if (status) {
+		mass_integral_free(mi);
+		return NULL;
+	} else {
+		return mi;
+	}
+
+}
+
+
+/*
+ * Integrate over an interval in ln(m) by adaptive Simpson's rule, sampling
+ * the running integral at the end points of each interval in which the
+ * tolerance is reached and at their quarter points.
+ *
+ * Parameters
+ * ==========
+ * mi: 		The running integral, sampled up to the lower bound a
+ * a: 		The lower bound of the interval in ln(m)
+ * fa: 		The integrand at a
+ * c: 		The midpoint of the interval
+ * fc: 		The integrand at c
+ * b: 		The upper bound of the interval
+ * fb: 		The integrand at b
+ * whole: 	Simpson's rule over the interval
+ * eps: 	The maximum absolute error on the integral over the interval
+ * depth: 	The number of times the interval has been bisected
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the interval must be bisected more than
+ * SSP_CUMULATIVE_MAXDEPTH times or if more than SSP_CUMULATIVE_NMAX masses
+ * would be sampled.
+ *
+ * References
+ * ==========
+ * Press, Teukolsky, Vetterling & Flannery (2007), Numerical Recipes,
+ * Cambridge University Press
+ */
+static unsigned short adaptive_simpson(MASS_INTEGRAL *mi, double a,
+	double fa, double c, double fc, double b, double fb, double whole,
+	double eps, unsigned short depth) {
+
+	double d = (a + c) / 2, e = (c + b) / 2;
+	double fd = evaluate_integrand(*mi, d);
+	double fe = evaluate_integrand(*mi, e);
+	double left = (c - a) / 6 * (fa + 4 * fd + fc);
+	double right = (b - c) / 6 * (fc + 4 * fe + fb);
+
+	if (absval(left + right - whole) <= 15 * eps) {
+		/*
+		 * The integral over the first half of each half comes from the
+		 * quadratic through its end points and midpoint.
+		 */
+		double start = (*mi).running[(*mi).n - 1ul];
+		return (
+			sample(mi, d, fd, start + (c - a) / 24 * (5 * fa + 8 * fd - fc)) ||
+			sample(mi, c, fc, start + left) ||
+			sample(mi, e, fe, start + left + (b - c) / 24 * (5 * fc +
+				8 * fe - fb)) ||
+			sample(mi, b, fb, start + left + right)
+		);
+	} else if (depth < SSP_CUMULATIVE_MAXDEPTH) {
+		return (
+			adaptive_simpson(mi, a, fa, d, fd, c, fc, left, eps / 2,
+				depth + 1u) ||
+			adaptive_simpson(mi, c, fc, e, fe, b, fb, right, eps / 2,
+				depth + 1u)
+		);
+	} else {
+		return 1u;
+	}
+
+}
+
+
+/*
+ * Append a sampled mass to a running integral.
+ *
+ * Parameters
+ * ==========
+ * mi: 			The running integral
+ * lnm: 		The natural logarithm of the stellar mass
+ * integrand: 	The integrand with respect to ln(m) at that mass
+ * running: 	The integral from the lower mass limit to that mass
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if more than SSP_CUMULATIVE_NMAX masses would be sampled
+ * or memory could not be allocated.
+ */
+static unsigned short sample(MASS_INTEGRAL *mi, double lnm, double integrand,
+	double running) {
+
+	if ((*mi).n == (*mi).size) {
+		if ((*mi).size >= SSP_CUMULATIVE_NMAX) return 1u;
+		unsigned long size = (*mi).size ? 2ul * (*mi).size : 256ul;
+		double *x = (double *) realloc (mi -> lnm, size * sizeof(double));
+		if (x == NULL) return 1u;
+		mi -> lnm = x;
+		x = (double *) realloc (mi -> integrand, size * sizeof(double));
+		if (x == NULL) return 1u;
+		mi -> integrand = x;
+		x = (double *) realloc (mi -> running, size * sizeof(double));
+		if (x == NULL) return 1u;
+		mi -> running = x;
+		mi -> size = size;
+	} else {}
+	mi -> lnm[(*mi).n] = lnm;
+	mi -> integrand[(*mi).n] = integrand;
+	mi -> running[(*mi).n] = running;
+	mi -> n++;
+	return 0u;
+
+}
+
+
+/*
+ * Evaluate the integrand of a running integral with respect to ln(m).
+ *
+ * Parameters
+ * ==========
+ * mi: 		The running integral
+ * lnm: 	The natural logarithm of the stellar mass in Msun
+ *
+ * Returns
+ * =======
+ * The weight times the IMF times the stellar mass, the latter being the
+ * Jacobian of the change of variables from m to ln(m).
+ */
+static double evaluate_integrand(MASS_INTEGRAL mi, double lnm) {
+
+	double m = exp(lnm);
+	return mi.weight(m) * imf_evaluate(*mi.imf, m) * m;
+
+}
+
+
+/*
+ * Interpolate a running integral to some stellar mass.
+ *
+ * Parameters
+ * ==========
+ * mi: 		The running integral
+ * m: 		The stellar mass in Msun
+ *
+ * Returns
+ * =======
+ * The integral from the lower mass limit to m, which is 0 below the lower
+ * mass limit and the whole integral above the upper mass limit.
+ *
+ * Notes
+ * =====
+ * Between two sampled masses, the running integral is the cubic Hermite
+ * polynomial matching its values and derivatives (i.e. the integrand) at
+ * both, which is accurate to fourth order in the spacing like Simpson's rule
+ * itself.
+ */
+static double interpolate_running(MASS_INTEGRAL mi, double m) {
+
+	if (m <= 0) return 0;
+	double lnm = log(m);
+	if (lnm <= mi.lnm[0]) {
+		return 0;
+	} else if (lnm >= mi.lnm[mi.n - 1ul]) {
+		return mi.running[mi.n - 1ul];
+	} else {
+		/*
+		 * Bisect for the interval containing ln(m). Where a mass is sampled
+		 * twice at a discontinuity, this takes the sample above it.
+		 */
+		unsigned long i = 0ul, j = mi.n - 1ul;
+		while (j - i > 1ul) {
+			unsigned long k = (i + j) / 2ul;
+			if (mi.lnm[k] <= lnm) {
+				i = k;
+			} else {
+				j = k;
+			}
+		}
+		double h = mi.lnm[j] - mi.lnm[i];
+		double s = (lnm - mi.lnm[i]) / h;
+		double s2 = s * s, s3 = s2 * s;
+		return (
+			(2 * s3 - 3 * s2 + 1) * mi.running[i] +
+			(s3 - 2 * s2 + s) * h * mi.integrand[i] +
+			(-2 * s3 + 3 * s2) * mi.running[j] +
+			(s3 - s2) * h * mi.integrand[j]
+		);
+	}
+
+}
+
+
+/*
+ * Free up the memory stored by a running integral.
+ *
+ * Parameters
+ * ==========
+ * mi: 		The running integral to free
+ */
+static void mass_integral_free(MASS_INTEGRAL *mi) {
+
+	if (mi != NULL) {
+		free(mi -> lnm);
+		free(mi -> integrand);
+		free(mi -> running);
+		free(mi);
+	} else {}
+
+}
+
+
+/*
+ * The mass returned to the ISM by a star of a given initial mass over its
+ * lifetime according to the Kalirai et al. (2008) remnant mass.
+ *
+ * Parameters
+ * ==========
+ * m: 		The initial stellar mass in Msun
+ *
+ * Returns
+ * =======
+ * The difference between the initial and remnant masses in Msun
+ *
+ * References
+ * ==========
+ * Kalirai et al. (2008), ApJ, 676, 594
+ */
+static double returned_mass(double m) {
+
+	return m - Kalirai08_remnant_mass(m);
+
+}
+
+
+/*
+ * The initial mass of a star, weighting the IMF to obtain the main sequence
+ * mass.
+ *
+ * Parameters
+ * ==========
+ * m: 		The initial stellar mass in Msun
+ *
+ * Returns
+ * =======
+ * m itself
+ */
+static double initial_mass(double m) {
+
+	return m;
+
+}
+
@@ -0,0 +1,75 @@
+#ifndef SSP_CUMULATIVE_H
+#define SSP_CUMULATIVE_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../objects.h"
+
+/*
+ * Evaluate the cumulative return fraction of a single stellar population at
+ * many ages from one cumulative integral over stellar mass.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		The SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * times: 		The ages in Gyr at which to evaluate the CRF
+ * n_times: 	The number of elements in the times array
+ * tolerance: 	The maximum relative numerical error on the integral over
+ * 				stellar mass
+ * crf: 		The array to store the CRF at each age in
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the tolerance could not be reached or the IMF is
+ * unrecognized, in which case the values stored in crf are meaningless.
+ *
+ * Notes
+ * =====
+ * The IMF is evaluated a number of times set by the tolerance alone,
+ * independent of the number of ages. Callers should fall back to the CRF
+ * function at each age on failure.
+ *
+ * source: cumulative.c
+ */
+extern unsigned short cumulative_CRF(SSP ssp, double *times,
+	unsigned long n_times, double tolerance, double *crf);
+
+/*
+ * Evaluate the main sequence mass fraction of a single stellar population at
+ * many ages from one cumulative integral over stellar mass.
+ *
+ * Parameters
+ * ==========
+ * ssp: 		The SSP struct containing information on the stellar IMF and
+ * 				the mass range of star formation
+ * times: 		The ages in Gyr at which to evaluate the MSMF
+ * n_times: 	The number of elements in the times array
+ * tolerance: 	The maximum relative numerical error on the integral over
+ * 				stellar mass
+ * msmf: 		The array to store the MSMF at each age in
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 if the tolerance could not be reached or the IMF is
+ * unrecognized, in which case the values stored in msmf are meaningless.
+ *
+ * Notes
+ * =====
+ * The IMF is evaluated a number of times set by the tolerance alone,
+ * independent of the number of ages. Callers should fall back to the MSMF
+ * function at each age on failure.
+ *
+ * source: cumulative.c
+ */
+extern unsigned short cumulative_MSMF(SSP ssp, double *times,
+	unsigned long n_times, double tolerance, double *msmf);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* SSP_CUMULATIVE_H */
+
@@ -8,9 +8,43 @@
 #include "../ssp.h"
 #include "mlr.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static double mlr_lifetime(double mass, double postMS, double Z);
+static unsigned short mlr_table_depends_on_metallicity(void);
+static double mlr_table_evaluate(double time, double postMS, double Z);
+static double mlr_table_interpolate(unsigned long i, unsigned long j,
+	double dx, double dy);
+static double mlr_table_root(double logt, double logZ);
+static unsigned short mlr_table_fill(double max_age, unsigned long ppd_t,
+	unsigned long ppd_Z);
+static double mlr_table_max_error(unsigned short which, double tolerance,
+	unsigned short discard);
+
 /* The hash-code for the current MLR setting: default is Larson (1974) */
 static unsigned short MLR_SETTING = LARSON1974;
 
+/*
+ * The turnoff mass lookup table
+ * =============================
+ * MLR_TABLE: 			log10 of the main sequence turnoff mass, stored with
+ * 						MLR_TABLE_N_Z metallicities for each age. NaN where it
+ * 						is not defined. NULL if there is no table.
+ * MLR_TABLE_HASHCODE: 	The setting the table was built for
+ * MLR_TABLE_N_AGES: 	The number of ages on the table
+ * MLR_TABLE_N_Z: 		The number of metallicities on the table
+ * MLR_TABLE_DLOGT: 	The spacing in log10(age) between points
+ * MLR_TABLE_DLOGZ: 	The spacing in log10(Z) between points
+ * MLR_TABLE_ROOT_PRECISION: 	The precision in log10(mass) or log10(age) to
+ * 						which the turnoff mass at each point is found
+ */
+static double *MLR_TABLE = NULL;
+static unsigned short MLR_TABLE_HASHCODE = 0u;
+static unsigned long MLR_TABLE_N_AGES = 0ul;
+static unsigned long MLR_TABLE_N_Z = 0ul;
+static double MLR_TABLE_DLOGT = 0;
+static double MLR_TABLE_DLOGZ = 0;
+static double MLR_TABLE_ROOT_PRECISION = 1e-13;
+
 /*
  * Determine the mass of dying stars from a single stellar population of known
  * age under the current mass-lifetime relationship setting.
@@ -35,10 +69,18 @@ static unsigned short MLR_SETTING = LARSON1974;
  * so that any can be called with a function pointer.
  * See header files in ./vice/src/ssp/mlr/ for details.
  *
+ * If a lookup table has been built with mlr_table_setup for the current
+ * setting, the turnoff mass is interpolated from it wherever it is defined.
+ *
  * header: mlr.h
  */
 extern double dying_star_mass(double time, double postMS, double Z) {
 
+	if (MLR_TABLE != NULL && MLR_TABLE_HASHCODE == MLR_SETTING) {
+		double mass = mlr_table_evaluate(time, postMS, Z);
+		if (mass > 0) return mass;
+	} else {}
+
 	/*
 	 * Simply construct a function pointer to the current MLR setting and call
 	 * it directly.
@@ -124,6 +166,7 @@ extern unsigned short set_mlr_hashcode(unsigned short hashcode) {
 	if (hashcode == POWERLAW || hashcode == VINCENZO2016 ||
 		hashcode == HPT2000 || hashcode == KA1997 || hashcode == PM1993 ||
 		hashcode == MM1989 || hashcode == LARSON1974) {
+		if (hashcode != MLR_TABLE_HASHCODE) mlr_table_free();
 		MLR_SETTING = hashcode;
 		return 0u;
 	} else {
@@ -132,3 +175,532 @@ extern unsigned short set_mlr_hashcode(unsigned short hashcode) {
 
 }
 
+
+/*
+ * Evaluate one of the mass-lifetime relations at each of an array of masses
+ * or ages.
+ *
+ * Parameters
+ * ==========
+ * hashcode: 		The hashcode of the mass-lifetime relation to evaluate.
+ * 					See the #define'd values above.
+ * which: 			0 to compute lifetimes from masses, 1 to compute the
+ * 					masses of dying stars from ages.
+ * qty: 			The stellar masses in Msun or the ages of stellar
+ * 					populations in Gyr, as determined by which.
+ * postMS: 			The ratio of a star's post main sequence lifetime to its
+ * 					main sequence lifetime.
+ * Z: 				The metallicity by mass at each element of qty.
+ * n: 				The number of elements in qty and Z.
+ * result: 			The array to store the lifetime or the mass at each
+ * 					element of qty in, of the same length as qty.
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an unrecognized hashcode.
+ *
+ * header: mlr.h
+ */
+extern unsigned short mlr_evaluate_array(unsigned short hashcode,
+	unsigned short which, const double *qty, double postMS, const double *Z,
+	unsigned long n, double *result) {
+
+	double (*mlr)(double, double, double);
+
+	switch (hashcode) {
+
+		case POWERLAW:
+			mlr = which ? &powerlaw_turnoffmass : &powerlaw_lifetime;
+			break;
+
+		case VINCENZO2016:
+			mlr = which ? &vincenzo2016_turnoffmass : &vincenzo2016_lifetime;
+			break;
+
+		case HPT2000:
+			mlr = which ? &hpt2000_turnoffmass : &hpt2000_lifetime;
+			break;
+
+		case KA1997:
+			mlr = which ? &ka1997_turnoffmass : &ka1997_lifetime;
+			break;
+
+		case PM1993:
+			mlr = which ? &pm1993_turnoffmass : &pm1993_lifetime;
+			break;
+
+		case MM1989:
+			mlr = which ? &mm1989_turnoffmass : &mm1989_lifetime;
+			break;
+
+		case LARSON1974:
+			mlr = which ? &larson1974_turnoffmass : &larson1974_lifetime;
+			break;
+
+		default:
+			return 1u;
+
+	}
+
+	unsigned long i;
+	for (i = 0ul; i < n; i++) {
+		if (qty[i] == 0) {
+			result[i] = INFINITY;
+		} else {
+			result[i] = mlr(qty[i], postMS, Z[i]);
+		}
+	}
+	return 0u;
+
+}
+
+
+
+/*
+ * Build the lookup table of turnoff masses under the current mass-lifetime
+ * relationship setting, replacing any existing table.
+ *
+ * Parameters
+ * ==========
+ * max_age: 		The maximum age in Gyr to include on the table.
+ * tolerance: 		The maximum relative error in the turnoff mass between
+ * 					points on the table.
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on a memory error.
+ *
+ * header: mlr.h
+ */
+extern unsigned short mlr_table_setup(double max_age, double tolerance) {
+
+	unsigned long ppd_t = MLR_TABLE_INITIAL_RESOLUTION;
+	unsigned long ppd_Z = MLR_TABLE_INITIAL_RESOLUTION;
+	mlr_table_free();
+	if (max_age <= pow(10, MLR_TABLE_LOGT_MIN)) return 0u; /* nothing to do */
+	MLR_TABLE_ROOT_PRECISION = tolerance / 100;
+
+	/*
+	 * Where the turnoff mass has a kink between two points, the error in
+	 * linear interpolation halfway between them can be as small as half of
+	 * the largest error, so test against half of the tolerance.
+	 */
+	tolerance /= 2;
+	while (1) {
+		if (mlr_table_fill(max_age, ppd_t, ppd_Z)) return 1u;
+		unsigned short fail_t = mlr_table_max_error(0u, tolerance,
+			0u) > tolerance;
+		unsigned short fail_Z = mlr_table_max_error(1u, tolerance,
+			0u) > tolerance;
+		unsigned short fail_center = mlr_table_max_error(2u, tolerance,
+			0u) > tolerance;
+		if (fail_center && !fail_t && !fail_Z) {
+			/* error is largest at the centers of cells -> refine both */
+			fail_t = 1u;
+			fail_Z = mlr_table_depends_on_metallicity();
+		} else {}
+		unsigned short refine_t = (fail_t &&
+			ppd_t < MLR_TABLE_MAX_RESOLUTION);
+		unsigned short refine_Z = (fail_Z &&
+			ppd_Z < MLR_TABLE_MAX_RESOLUTION);
+
+		if (!fail_t && !fail_Z) {
+			return 0u;
+		} else if ((!refine_t && !refine_Z) ||
+			(1ul + refine_t) * (1ul + refine_Z) * MLR_TABLE_N_AGES *
+			MLR_TABLE_N_Z > MLR_TABLE_MAX_SIZE) {
+			/*
+			 * Further refinement is not allowed. This happens where the
+			 * turnoff mass is not a smooth function of age or metallicity
+			 * (e.g. where the lifetime is not a monotonic function of mass or
+			 * where a tabulated form interpolates between a coarse grid).
+			 * Discard the points bounding those cells, and dying_star_mass
+			 * will evaluate the mass-lifetime relation directly there.
+			 */
+			mlr_table_max_error(0u, tolerance, 1u);
+			mlr_table_max_error(1u, tolerance, 1u);
+			mlr_table_max_error(2u, tolerance, 1u);
+			return 0u;
+		} else {
+			if (refine_t) ppd_t *= 2ul;
+			if (refine_Z) ppd_Z *= 2ul;
+		}
+	}
+
+}
+
+
+/*
+ * Free up the memory stored in the turnoff mass lookup table.
+ *
+ * header: mlr.h
+ */
+extern void mlr_table_free(void) {
+
+	if (MLR_TABLE != NULL) {
+		free(MLR_TABLE);
+		MLR_TABLE = NULL;
+	} else {}
+	MLR_TABLE_HASHCODE = 0u;
+	MLR_TABLE_N_AGES = 0ul;
+	MLR_TABLE_N_Z = 0ul;
+
+}
+
+
+/*
+ * Determine the number of points on the turnoff mass lookup table.
+ *
+ * header: mlr.h
+ */
+extern unsigned long mlr_table_size(void) {
+
+	if (MLR_TABLE != NULL && MLR_TABLE_HASHCODE == MLR_SETTING) {
+		return MLR_TABLE_N_AGES * MLR_TABLE_N_Z;
+	} else {
+		return 0ul;
+	}
+
+}
+
+
+/*
+ * Determine the lifetime of a star under the current mass-lifetime
+ * relationship setting.
+ *
+ * Parameters
+ * ==========
+ * mass: 		The mass of the star in Msun
+ * postMS: 		The ratio of a star's post main sequence lifetime to its main
+ * 				sequence lifetime.
+ * Z: 			The metallicity by mass of the star
+ *
+ * Returns
+ * =======
+ * The lifetime of the star in Gyr. NaN for an unrecognized setting.
+ */
+static double mlr_lifetime(double mass, double postMS, double Z) {
+
+	switch (MLR_SETTING) {
+
+		case POWERLAW:
+			return powerlaw_lifetime(mass, postMS, Z);
+
+		case VINCENZO2016:
+			return vincenzo2016_lifetime(mass, postMS, Z);
+
+		case HPT2000:
+			return hpt2000_lifetime(mass, postMS, Z);
+
+		case KA1997:
+			return ka1997_lifetime(mass, postMS, Z);
+
+		case PM1993:
+			return pm1993_lifetime(mass, postMS, Z);
+
+		case MM1989:
+			return mm1989_lifetime(mass, postMS, Z);
+
+		case LARSON1974:
+			return larson1974_lifetime(mass, postMS, Z);
+
+		default:
+			return NAN;
+
+	}
+
+}
+
+
+/*
+ * Determine whether or not the current mass-lifetime relationship setting
+ * depends on metallicity.
+ *
+ * Returns
+ * =======
+ * 1 if the turnoff mass depends on metallicity, 0 otherwise.
+ */
+static unsigned short mlr_table_depends_on_metallicity(void) {
+
+	return (MLR_SETTING == VINCENZO2016 || MLR_SETTING == HPT2000 ||
+		MLR_SETTING == KA1997);
+
+}
+
+
+/*
+ * Interpolate the turnoff mass from the lookup table.
+ *
+ * Parameters
+ * ==========
+ * time: 		The age of the stellar population in Gyr
+ * postMS: 		The ratio of a star's post main sequence lifetime to its main
+ * 				sequence lifetime.
+ * Z: 			The metallicity by mass of the stellar population
+ *
+ * Returns
+ * =======
+ * The turnoff mass in Msun. -1 if the age or metallicity is not on the table
+ * or the table is not defined there.
+ *
+ * Notes
+ * =====
+ * Except for the forms which quantify the total lifetime (Vincenzo et al.
+ * 2016; Kodama & Arimoto 1997), the total lifetime is the main sequence
+ * lifetime times 1 + postMS. The table is therefore built for main sequence
+ * turnoff masses, and one table serves all values of postMS.
+ */
+static double mlr_table_evaluate(double time, double postMS, double Z) {
+
+	if (MLR_SETTING != VINCENZO2016 && MLR_SETTING != KA1997) {
+		time /= 1 + postMS;
+	} else {}
+	if (!(time > 0)) return -1;
+	double x = (log10(time) - MLR_TABLE_LOGT_MIN) / MLR_TABLE_DLOGT;
+	if (x < 0 || x > MLR_TABLE_N_AGES - 1ul) return -1;
+	unsigned long i = (unsigned long) x;
+	if (i == MLR_TABLE_N_AGES - 1ul) i--;
+
+	double logm;
+	if (MLR_TABLE_N_Z == 1ul) {
+		logm = mlr_table_interpolate(i, 0ul, x - i, 0);
+	} else {
+		if (!(Z > 0)) return -1;
+		double y = log10(Z / MLR_TABLE_Z_MIN) / MLR_TABLE_DLOGZ;
+		if (y < 0 || y > MLR_TABLE_N_Z - 1ul) return -1;
+		unsigned long j = (unsigned long) y;
+		if (j == MLR_TABLE_N_Z - 1ul) j--;
+		logm = mlr_table_interpolate(i, j, x - i, y - j);
+	}
+
+	if (isnan(logm)) {
+		return -1;
+	} else {
+		return pow(10, logm);
+	}
+
+}
+
+
+/*
+ * Linearly interpolate within one cell of the lookup table.
+ *
+ * Parameters
+ * ==========
+ * i: 		The index of the age at the lower edge of the cell
+ * j: 		The index of the metallicity at the lower edge of the cell.
+ * 			Ignored if the table has one metallicity.
+ * dx: 		The position within the cell in age, between 0 and 1
+ * dy: 		The position within the cell in metallicity, between 0 and 1
+ *
+ * Returns
+ * =======
+ * log10 of the turnoff mass. NaN if any of the points bounding the cell are
+ * not defined.
+ */
+static double mlr_table_interpolate(unsigned long i, unsigned long j,
+	double dx, double dy) {
+
+	unsigned long n = MLR_TABLE_N_Z;
+	if (n == 1ul) {
+		return (1 - dx) * MLR_TABLE[i] + dx * MLR_TABLE[i + 1ul];
+	} else {
+		return (
+			(1 - dx) * (1 - dy) * MLR_TABLE[i * n + j] +
+			(1 - dx) * dy * MLR_TABLE[i * n + j + 1ul] +
+			dx * (1 - dy) * MLR_TABLE[(i + 1ul) * n + j] +
+			dx * dy * MLR_TABLE[(i + 1ul) * n + j + 1ul]
+		);
+	}
+
+}
+
+
+/*
+ * Find the main sequence turnoff mass at a given age and metallicity.
+ *
+ * Parameters
+ * ==========
+ * logt: 		log10 of the age in Gyr
+ * logZ: 		log10 of the metallicity by mass
+ *
+ * Returns
+ * =======
+ * log10 of the turnoff mass in Msun. NaN if the root is not between
+ * MLR_TABLE_MASS_MIN and MLR_TABLE_MASS_MAX.
+ *
+ * Notes
+ * =====
+ * This solves for the root of log10(lifetime) - log10(age) in log10(mass)
+ * with the Illinois variant of the method of false position (e.g. Dowell &
+ * Jarratt 1971). Because log10(lifetime) is nearly linear in log10(mass),
+ * this converges in a handful of evaluations of the lifetime, while always
+ * keeping the root bracketed. Unlike the bisection function in ./mlr/root.c,
+ * it converges to within MLR_TABLE_ROOT_PRECISION, 1% of the tolerance on the
+ * table, so that its accuracy is limited only by the spacing between points.
+ *
+ * References
+ * ==========
+ * Dowell & Jarratt (1971), BIT Numerical Mathematics, 11, 168
+ */
+static double mlr_table_root(double logt, double logZ) {
+
+	double Z = pow(10, logZ);
+	double lower = log10(MLR_TABLE_MASS_MIN);
+	double upper = log10(MLR_TABLE_MASS_MAX);
+	double f_lower = log10(mlr_lifetime(MLR_TABLE_MASS_MIN, 0, Z)) - logt;
+	double f_upper = log10(mlr_lifetime(MLR_TABLE_MASS_MAX, 0, Z)) - logt;
+	if (!(f_lower > 0) || !(f_upper < 0)) return NAN;
+
+	/* lifetimes decrease with mass */
+	unsigned short n, retained = 0u;
+	for (n = 0u; n < 100u; n++) {
+		double middle = (lower * f_upper - upper * f_lower) / (
+			f_upper - f_lower);
+		double f_middle = log10(mlr_lifetime(pow(10, middle), 0, Z)) - logt;
+		if (isnan(f_middle)) {
+			return NAN;
+		} else if (fabs(f_middle) < MLR_TABLE_ROOT_PRECISION ||
+			upper - lower < MLR_TABLE_ROOT_PRECISION) {
+			return middle;
+		} else if (f_middle > 0) {
+			lower = middle;
+			f_lower = f_middle;
+			if (retained == 2u) f_upper /= 2; /* kept upper bound twice */
+			retained = 2u;
+		} else {
+			upper = middle;
+			f_upper = f_middle;
+			if (retained == 1u) f_lower /= 2; /* kept lower bound twice */
+			retained = 1u;
+		}
+	}
+	return (lower + upper) / 2;
+
+}
+
+
+/*
+ * Allocate memory for and fill the lookup table at a given resolution.
+ *
+ * Parameters
+ * ==========
+ * max_age: 		The maximum age on the table in Gyr
+ * ppd_t: 			The minimum number of points per dex in age
+ * ppd_Z: 			The minimum number of points per dex in metallicity
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on a memory error.
+ */
+static unsigned short mlr_table_fill(double max_age, unsigned long ppd_t,
+	unsigned long ppd_Z) {
+
+	unsigned long i, j;
+	double range = log10(max_age) - MLR_TABLE_LOGT_MIN;
+	mlr_table_free();
+	MLR_TABLE_N_AGES = 2ul + (unsigned long) (range * ppd_t);
+	MLR_TABLE_DLOGT = range / (MLR_TABLE_N_AGES - 1ul);
+	if (mlr_table_depends_on_metallicity()) {
+		range = log10(MLR_TABLE_Z_MAX / MLR_TABLE_Z_MIN);
+		MLR_TABLE_N_Z = 2ul + (unsigned long) (range * ppd_Z);
+		MLR_TABLE_DLOGZ = range / (MLR_TABLE_N_Z - 1ul);
+	} else {
+		MLR_TABLE_N_Z = 1ul;
+		MLR_TABLE_DLOGZ = 0;
+	}
+
+	MLR_TABLE = (double *) malloc (MLR_TABLE_N_AGES * MLR_TABLE_N_Z *
+		sizeof(double));
+	if (MLR_TABLE == NULL) {
+		mlr_table_free();
+		return 1u;
+	} else {
+		MLR_TABLE_HASHCODE = MLR_SETTING;
+	}
+
+	for (i = 0ul; i < MLR_TABLE_N_AGES; i++) {
+		for (j = 0ul; j < MLR_TABLE_N_Z; j++) {
+			MLR_TABLE[i * MLR_TABLE_N_Z + j] = mlr_table_root(
+				MLR_TABLE_LOGT_MIN + i * MLR_TABLE_DLOGT,
+				log10(MLR_TABLE_Z_MIN) + j * MLR_TABLE_DLOGZ);
+		}
+	}
+
+	return 0u;
+
+}
+
+
+/*
+ * Estimate the maximum relative error in the turnoff mass interpolated from
+ * the lookup table halfway between points.
+ *
+ * Parameters
+ * ==========
+ * which: 		0 to test halfway between ages at each metallicity on the
+ * 				table, 1 halfway between metallicities at each age, and 2 at
+ * 				the center of each cell.
+ * tolerance: 	The maximum relative error
+ * discard: 	Whether or not to discard the points bounding each cell in
+ * 				which the error exceeds the tolerance.
+ *
+ * Returns
+ * =======
+ * The maximum relative error in the turnoff mass. 0 if the table has one
+ * metallicity and which is not 0.
+ *
+ * Notes
+ * =====
+ * Rather than finding the turnoff mass at each test point, this evaluates
+ * the lifetime of stars at the interpolated mass and at a slightly higher
+ * mass. The logarithmic derivative of the lifetime then converts the error in
+ * the lifetime to an error in the turnoff mass, which costs two evaluations
+ * of the lifetime per test point.
+ */
+static double mlr_table_max_error(unsigned short which, double tolerance,
+	unsigned short discard) {
+
+	unsigned long i, j, n = MLR_TABLE_N_Z;
+	unsigned long n_i = MLR_TABLE_N_AGES - (which != 1u);
+	unsigned long n_j = n - (which != 0u);
+	unsigned long di = (which != 1u), dj = (which != 0u);
+	double max_error = 0;
+	if (n == 1ul && which) return 0;
+
+	for (i = 0ul; i < n_i; i++) {
+		for (j = 0ul; j < n_j; j++) {
+			double logm;
+			if (which == 2u) {
+				logm = mlr_table_interpolate(i, j, 0.5, 0.5);
+			} else {
+				logm = (MLR_TABLE[i * n + j] +
+					MLR_TABLE[(i + di) * n + j + dj]) / 2;
+			}
+			if (isnan(logm)) continue;
+			double logt = MLR_TABLE_LOGT_MIN + (i + 0.5 * di) * MLR_TABLE_DLOGT;
+			double Z = MLR_TABLE_Z_MIN * pow(10, (j + 0.5 * dj) *
+				MLR_TABLE_DLOGZ);
+			double logtau = log10(mlr_lifetime(pow(10, logm), 0, Z));
+			double slope = (log10(mlr_lifetime(pow(10, logm + 1e-4), 0, Z)) -
+				logtau) / 1e-4;
+			double error;
+			if (slope < 0) {
+				error = fabs(pow(10, (logt - logtau) / slope) - 1);
+			} else {
+				/* lifetime not decreasing with mass -> can't be tabulated */
+				error = INFINITY;
+			}
+			if (error > tolerance && discard) {
+				MLR_TABLE[i * n + j] = NAN;
+				MLR_TABLE[(i + di) * n + j] = NAN;
+				MLR_TABLE[i * n + j + dj] = NAN;
+				MLR_TABLE[(i + di) * n + j + dj] = NAN;
+			} else {}
+			if (error > max_error) max_error = error;
+		}
+	}
+
+	return max_error;
+
+}
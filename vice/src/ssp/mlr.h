@@ -51,6 +51,48 @@ extern "C" {
 #define LARSON1974 868u
 #endif /* LARSON1974 */
 
+/* The bounds in stellar mass of the turnoff mass lookup table in Msun */
+#ifndef MLR_TABLE_MASS_MIN
+#define MLR_TABLE_MASS_MIN 0.08
+#endif /* MLR_TABLE_MASS_MIN */
+
+#ifndef MLR_TABLE_MASS_MAX
+#define MLR_TABLE_MASS_MAX 100.0
+#endif /* MLR_TABLE_MASS_MAX */
+
+/* The minimum age in Gyr on the turnoff mass lookup table as log10(age) */
+#ifndef MLR_TABLE_LOGT_MIN
+#define MLR_TABLE_LOGT_MIN -3.0
+#endif /* MLR_TABLE_LOGT_MIN */
+
+/*
+ * The bounds in metallicity by mass on the lookup table. The upper bound is
+ * the highest metallicity at which the Vincenzo et al. (2016) and Hurley,
+ * Pols & Tout (2000) forms are calibrated.
+ */
+#ifndef MLR_TABLE_Z_MIN
+#define MLR_TABLE_Z_MIN 1.0e-5
+#endif /* MLR_TABLE_Z_MIN */
+
+#ifndef MLR_TABLE_Z_MAX
+#define MLR_TABLE_Z_MAX 0.03
+#endif /* MLR_TABLE_Z_MAX */
+
+/* The initial number of points per dex in age and metallicity */
+#ifndef MLR_TABLE_INITIAL_RESOLUTION
+#define MLR_TABLE_INITIAL_RESOLUTION 10ul
+#endif /* MLR_TABLE_INITIAL_RESOLUTION */
+
+/* The maximum number of points per dex in age and metallicity */
+#ifndef MLR_TABLE_MAX_RESOLUTION
+#define MLR_TABLE_MAX_RESOLUTION 640ul
+#endif /* MLR_TABLE_MAX_RESOLUTION */
+
+/* The maximum number of points on the lookup table */
+#ifndef MLR_TABLE_MAX_SIZE
+#define MLR_TABLE_MAX_SIZE 1048576ul
+#endif /* MLR_TABLE_MAX_SIZE */
+
 /*
  * Determine the mass of dying stars from a single stellar population of known
  * age under the current mass-lifetime relationship setting.
@@ -75,10 +117,63 @@ extern "C" {
  * so that any can be called with a function pointer.
  * See header files in ./vice/src/ssp/mlr/ for details.
  *
+ * If a lookup table has been built with mlr_table_setup for the current
+ * setting, the turnoff mass is interpolated from it wherever it is defined.
+ *
  * source: mlr.c
  */
 extern double dying_star_mass(double time, double postMS, double Z);
 
+/*
+ * Build the lookup table of turnoff masses under the current mass-lifetime
+ * relationship setting, replacing any existing table.
+ *
+ * Parameters
+ * ==========
+ * max_age: 		The maximum age in Gyr to include on the table.
+ * tolerance: 		The maximum relative error in the turnoff mass between
+ * 					points on the table.
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on a memory error.
+ *
+ * Notes
+ * =====
+ * The table stores log10 of the main sequence turnoff mass on a grid uniform
+ * in log10 of age and (for metallicity-dependent forms only) log10 of
+ * metallicity, between the bounds #define'd above. Each point is found by
+ * bisection on the lifetime of stars to within 1% of the tolerance, and the
+ * grid is refined by factors of two in either dimension until linear
+ * interpolation between points is accurate to within the tolerance. If
+ * MLR_TABLE_MAX_RESOLUTION points per dex or MLR_TABLE_MAX_SIZE points in
+ * total does not suffice, the points bounding the parts of the table which
+ * have not converged are discarded, and dying_star_mass evaluates the
+ * mass-lifetime relation directly there.
+ *
+ * source: mlr.c
+ */
+extern unsigned short mlr_table_setup(double max_age, double tolerance);
+
+/*
+ * Free up the memory stored in the turnoff mass lookup table.
+ *
+ * source: mlr.c
+ */
+extern void mlr_table_free(void);
+
+/*
+ * Determine the number of points on the turnoff mass lookup table.
+ *
+ * Returns
+ * =======
+ * The number of ages times the number of metallicities on the table. 0 if
+ * there is no table for the current setting.
+ *
+ * source: mlr.c
+ */
+extern unsigned long mlr_table_size(void);
+
 /*
  * Get the hashcode of the current mass-lifetime relationship setting. Their
  * values are #define'd in ./vice/src/ssp/mlr.h.
@@ -104,6 +199,41 @@ extern unsigned short get_mlr_hashcode(void);
  */
 extern unsigned short set_mlr_hashcode(unsigned short hashcode);
 
+/*
+ * Evaluate one of the mass-lifetime relations at each of an array of masses
+ * or ages.
+ *
+ * Parameters
+ * ==========
+ * hashcode: 		The hashcode of the mass-lifetime relation to evaluate.
+ * 					See the #define'd values above.
+ * which: 			0 to compute lifetimes from masses, 1 to compute the
+ * 					masses of dying stars from ages.
+ * qty: 			The stellar masses in Msun or the ages of stellar
+ * 					populations in Gyr, as determined by which.
+ * postMS: 			The ratio of a star's post main sequence lifetime to its
+ * 					main sequence lifetime.
+ * Z: 				The metallicity by mass at each element of qty.
+ * n: 				The number of elements in qty and Z.
+ * result: 			The array to store the lifetime or the mass at each
+ * 					element of qty in, of the same length as qty.
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an unrecognized hashcode.
+ *
+ * Notes
+ * =====
+ * The result at each element is the same as calling the form of the
+ * mass-lifetime relation directly, except that it is infinite where qty is
+ * zero. The lookup table built by mlr_table_setup is not used.
+ *
+ * source: mlr.c
+ */
+extern unsigned short mlr_evaluate_array(unsigned short hashcode,
+	unsigned short which, const double *qty, double postMS, const double *Z,
+	unsigned long n, double *result);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -14,8 +14,7 @@
 #include "mlr.h"
 
 /* ---------- static function comment headers not duplicated here ---------- */
-static double MSMFnumerator_integrand(double m);
-static IMF_ *ADOPTED_IMF = NULL;
+static double MSMFnumerator_integrand(double m, void *imf);
 
 
 /*
@@ -81,6 +80,16 @@ extern unsigned short setup_MSMF(SINGLEZONE *sz) {
 		unsigned long i, n = n_timesteps(*sz);
 
 		sz -> ssp -> msmf = (double *) malloc (n * sizeof(double));
+		if (checksum((*(*(*sz).ssp).imf).spec) == CUSTOM &&
+			(*(*sz).ssp).cumulative_tolerance > 0) {
+			/* see comment in setup_CRF in crf.c */
+			double *times = (double *) malloc (n * sizeof(double));
+			for (i = 0l; i < n; i++) times[i] = i * (*sz).dt;
+			unsigned short failed = cumulative_MSMF(*(*sz).ssp, times, n,
+				(*(*sz).ssp).cumulative_tolerance, sz -> ssp -> msmf);
+			free(times);
+			if (!failed) return 0;
+		} else {}
 		for (i = 0l; i < n; i++) {
 			sz -> ssp -> msmf[i] = MSMFnumerator((*(*sz).ssp),
 				i * (*sz).dt) / denominator;
@@ -215,9 +224,9 @@ extern double MSMFnumerator(SSP ssp, double t) {
 
 		case CUSTOM:
 			/* custom IMF -> no assumptions made, must integrate numerically */
-			ADOPTED_IMF = ssp.imf;
 			INTEGRAL *numerator = integral_initialize();
 			numerator -> func = &MSMFnumerator_integrand;
+			numerator -> params = ssp.imf;
 			numerator -> a = (*ssp.imf).m_lower;
 			numerator -> b = turnoff_mass;
 			/* default values for these parameters */
@@ -228,7 +237,6 @@ extern double MSMFnumerator(SSP ssp, double t) {
 			quad(numerator);
 			double x = (*numerator).result;
 			integral_free(numerator);
-			ADOPTED_IMF = NULL;
 			return x;
 
 		default:
@@ -255,9 +263,9 @@ extern double MSMFnumerator(SSP ssp, double t) {
  * ========
  * Section 2.3 of Science Documentation: The Main Sequence Mass Fraction
  */
-static double MSMFnumerator_integrand(double m) {
+static double MSMFnumerator_integrand(double m, void *imf) {
 
-	return m * imf_evaluate(*ADOPTED_IMF, m);
+	return m * imf_evaluate(*((IMF_ *) imf), m);
 
 }
 
@@ -6,6 +6,8 @@
 #include <stdlib.h>
 #include "../ssp.h"
 #include "../singlezone.h"
+#include "../imf.h"
+#include "../utils.h"
 #include "ssp.h"
 
 /*
@@ -42,12 +44,16 @@ extern double *single_population_enrichment(SSP *ssp, ELEMENT *e,
 		free(mass);
 		free(ssp -> msmf);
 		return NULL;
-	} else {
+	} else if (checksum((*(*ssp).imf).spec) != CUSTOM ||
+		(*ssp).cumulative_tolerance <= 0 ||
+		cumulative_MSMF(*ssp, times, n_times, (*ssp).cumulative_tolerance,
+			ssp -> msmf)) {
+		/* see comment in setup_CRF in crf.c */
 		unsigned long i;
 		for (i = 0l; i < n_times; i++) {
 			ssp -> msmf[i] = MSMFnumerator(*ssp, times[i]) / denominator;
 		}
-	}
+	} else {}
 
 	mass[0] = 0;
 	double ia_yield = get_ia_yield(*e, Z);
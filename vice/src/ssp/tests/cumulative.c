@@ -0,0 +1,107 @@
+/*
+ * This file implements testing of the cumulative integrals over stellar mass
+ * at vice/src/ssp/cumulative.h
+ */
+
+#include <stdlib.h>
+#include <string.h>
+#include <math.h>
+#include "../../ssp.h"
+#include "../../imf.h"
+#include "../../utils.h"
+#include "cumulative.h"
+
+/* ---------- static function comment headers not duplicated here ---------- */
+static unsigned short test_cumulative_common(unsigned short (*cumulative)(
+	SSP, double *, unsigned long, double, double *),
+	double (*direct)(SSP, double));
+static double test_imf(double mass, void *dummy);
+
+/* The number of times to evaluate the CRF and MSMF at */
+static const unsigned long TEST_N_TIMES = 1001ul;
+
+
+/*
+ * Test the cumulative_CRF function at vice/src/ssp/cumulative.h
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: cumulative.h
+ */
+extern unsigned short test_cumulative_CRF(void) {
+
+	return test_cumulative_common(&cumulative_CRF, &CRF);
+
+}
+
+
+/*
+ * Test the cumulative_MSMF function at vice/src/ssp/cumulative.h
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: cumulative.h
+ */
+extern unsigned short test_cumulative_MSMF(void) {
+
+	return test_cumulative_common(&cumulative_MSMF, &MSMF);
+
+}
+
+
+/*
+ * Compare a quantity computed from the cumulative integral over stellar mass
+ * with a custom IMF identical to the Kroupa (2001) IMF to that computed
+ * analytically with the built-in Kroupa IMF at each age.
+ *
+ * Parameters
+ * ==========
+ * cumulative: 	The function computing the quantity at many ages
+ * direct: 		The function computing the quantity at one age
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ */
+static unsigned short test_cumulative_common(unsigned short (*cumulative)(
+	SSP, double *, unsigned long, double, double *),
+	double (*direct)(SSP, double)) {
+
+	SSP *test = ssp_initialize();
+	strcpy(test -> imf -> spec, "custom");
+	test -> imf -> custom_imf -> callback = &test_imf;
+	test -> imf -> custom_imf -> user_func = test;
+
+	unsigned long i;
+	double *times = (double *) malloc (TEST_N_TIMES * sizeof(double));
+	double *values = (double *) malloc (TEST_N_TIMES * sizeof(double));
+	for (i = 0ul; i < TEST_N_TIMES; i++) times[i] = 0.01 * i;
+	unsigned short status = !cumulative(*test, times, TEST_N_TIMES,
+		SSP_CUMULATIVE_TOLERANCE, values);
+
+	strcpy(test -> imf -> spec, "kroupa");
+	for (i = 0ul; i < TEST_N_TIMES && status; i++) {
+		status &= absval(values[i] - direct(*test, times[i])) < 1e-5;
+	}
+	free(times);
+	free(values);
+	ssp_free(test);
+	return status;
+
+}
+
+
+/*
+ * A test IMF to point a custom IMF callback object to, identical to the
+ * Kroupa (2001) IMF above 0.08 Msun.
+ */
+static double test_imf(double mass, void *dummy) {
+
+	return kroupa01(mass);
+
+}
+
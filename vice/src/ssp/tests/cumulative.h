@@ -0,0 +1,38 @@
+
+#ifndef TESTS_SSP_CUMULATIVE_H
+#define TESTS_SSP_CUMULATIVE_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../../objects.h"
+
+/*
+ * Test the cumulative_CRF function at vice/src/ssp/cumulative.h
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: cumulative.c
+ */
+extern unsigned short test_cumulative_CRF(void);
+
+/*
+ * Test the cumulative_MSMF function at vice/src/ssp/cumulative.h
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: cumulative.c
+ */
+extern unsigned short test_cumulative_MSMF(void);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* TESTS_SSP_CUMULATIVE_H */
+
@@ -10,6 +10,7 @@ cdef extern from "utils.h":
 	unsigned short test_interpolate2D()
 	unsigned short test_interpolate_sqrt()
 	unsigned short test_get_bin_number()
+	unsigned short test_get_bin_number_uniform()
 	unsigned short test_binspace()
 	unsigned short test_bin_centers()
 	unsigned short test_sum()
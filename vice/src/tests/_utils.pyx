@@ -12,6 +12,7 @@ __all__ = [
 	"test_2D_interpolation",
 	"test_sqrtx_interpolation",
 	"test_bin_number_finder",
+	"test_uniform_bin_number_finder",
 	"test_binspace_generator",
 	"test_bin_center_calculator",
 	"test_summation",
@@ -39,6 +40,7 @@ def test():
 			test_2D_interpolation(),
 			test_sqrtx_interpolation(),
 			test_bin_number_finder(),
+			test_uniform_bin_number_finder(),
 			test_binspace_generator(),
 			test_bin_center_calculator(),
 			test_summation(),
@@ -120,6 +122,15 @@ def test_bin_number_finder():
 	return ["vice.src.utils.get_bin_number", _utils.test_get_bin_number]
 
 
+@unittest
+def test_uniform_bin_number_finder():
+	"""
+	Tests the bin number finder for evenly spaced bins at vice/src/utils.h
+	"""
+	return ["vice.src.utils.get_bin_number_uniform",
+		_utils.test_get_bin_number_uniform]
+
+
 @unittest
 def test_binspace_generator():
 	"""
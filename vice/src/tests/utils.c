@@ -326,6 +326,53 @@ extern unsigned short test_get_bin_number(void) {
 }
 
 
+/*
+ * Tests the bin number lookup function for evenly spaced bins at
+ * vice/src/utils.h
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: utils.h
+ */
+extern unsigned short test_get_bin_number_uniform(void) {
+
+	/*
+	 * Tests the function by making sure that it agrees with get_bin_number at
+	 * the bin edges and at random values within and outside of a test
+	 * binspace, and that uniform_bin_width recognizes whether or not the
+	 * bins are evenly spaced.
+	 */
+	unsigned short i, status = 1u;
+	double *test_bins = binspace(
+		TEST_RANDOM_RANGE_MIN,
+		TEST_RANDOM_RANGE_MAX,
+		TEST_BINSPACE_N_BINS
+	);
+	double width = uniform_bin_width(test_bins, TEST_BINSPACE_N_BINS);
+	status &= width > 0;
+	for (i = 0u; i <= TEST_BINSPACE_N_BINS && status; i++) {
+		status &= get_bin_number_uniform(test_bins, TEST_BINSPACE_N_BINS,
+			width, test_bins[i]) == get_bin_number(test_bins,
+			TEST_BINSPACE_N_BINS, test_bins[i]);
+	}
+	for (i = 0u; i < 1000u && status; i++) {
+		double value = rand_range(2 * TEST_RANDOM_RANGE_MIN -
+			TEST_RANDOM_RANGE_MAX, 2 * TEST_RANDOM_RANGE_MAX -
+			TEST_RANDOM_RANGE_MIN);
+		status &= get_bin_number_uniform(test_bins, TEST_BINSPACE_N_BINS,
+			width, value) == get_bin_number(test_bins, TEST_BINSPACE_N_BINS,
+			value);
+	}
+	test_bins[1] += 0.5 * width;
+	status &= uniform_bin_width(test_bins, TEST_BINSPACE_N_BINS) == 0;
+	free(test_bins);
+	return status;
+
+}
+
+
 /*
  * Test the binspace function at vice/src/utils.h
  *
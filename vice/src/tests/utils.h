@@ -105,6 +105,18 @@ extern unsigned short test_interpolate_sqrt(void);
  */
 extern unsigned short test_get_bin_number(void);
 
+/*
+ * Tests the bin number lookup function for evenly spaced bins at
+ * vice/src/utils.h
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: utils.c
+ */
+extern unsigned short test_get_bin_number_uniform(void);
+
 /*
  * Test the binspace function at vice/src/utils.h
  *
@@ -9,6 +9,7 @@ extern "C" {
 #include "toolkit/hydrodiskstars.h"
 #include "toolkit/interp_scheme_1d.h"
 #include "toolkit/interp_scheme_2d.h"
+#include "toolkit/J21_sf_law.h"
 
 #ifdef __cplusplus
 }
@@ -0,0 +1,125 @@
+/*
+ * This file implements the star formation law of Johnson et al. (2021), which
+ * the vice.toolkit.J21_sf_law object implements in python. The arithmetic
+ * follows that object's __call__ function operation for operation, such that
+ * the two produce identical values.
+ */
+
+#include <math.h>
+#include "J21_sf_law.h"
+
+/* ---------- Static function comment headers not duplicated here ---------- */
+static double J21_molecular(ISM ism, double time);
+
+
+/*
+ * Evaluate the star formation law of Johnson et al. (2021) in infall or gas
+ * mode, as implemented by the vice.toolkit.J21_sf_law object.
+ *
+ * Parameters
+ * ==========
+ * ism: 		The ISM object holding the parameters of the star formation law
+ * time: 		The simulation time in Gyr
+ * mgas: 		The gas supply in Msun
+ *
+ * Returns
+ * =======
+ * The star formation efficiency timescale tau_star in Gyr.
+ *
+ * header: J21_sf_law.h
+ */
+extern double J21_sf_law_gas(ISM ism, double time, double mgas) {
+
+	double molecular = J21_molecular(ism, time);
+	double Sigma_gas = mgas / ism.J21_area;
+	if (Sigma_gas >= ism.J21_Sigma_g2) {
+		return molecular;
+	} else if (ism.J21_Sigma_g1 <= Sigma_gas) {
+		return molecular * pow(Sigma_gas / ism.J21_Sigma_g2, ism.J21_index2);
+	} else if (Sigma_gas) {
+		return molecular * (
+			pow(ism.J21_Sigma_g1 / ism.J21_Sigma_g2, ism.J21_index2) *
+			pow(Sigma_gas / ism.J21_Sigma_g1, ism.J21_index1)
+		);
+	} else {
+		/* force zero star formation when there's no gas */
+		return INFINITY;
+	}
+
+}
+
+
+/*
+ * Evaluate the star formation law of Johnson et al. (2021) in star formation
+ * mode, as implemented by the vice.toolkit.J21_sf_law object.
+ *
+ * Parameters
+ * ==========
+ * ism: 		The ISM object holding the parameters of the star formation law
+ * time: 		The simulation time in Gyr
+ * sfr: 		The star formation rate in Msun/yr
+ *
+ * Returns
+ * =======
+ * The star formation efficiency timescale tau_star in Gyr.
+ *
+ * header: J21_sf_law.h
+ */
+extern double J21_sf_law_sfr(ISM ism, double time, double sfr) {
+
+	double molecular = J21_molecular(ism, time);
+	double index1 = ism.J21_index1, index2 = ism.J21_index2;
+	double Sigma_sfr = sfr / ism.J21_area;
+	Sigma_sfr *= 1e9; /* yr^-1 -> Gyr^-1 */
+
+	/* The star formation densities corresponding to Sigma_g1 and Sigma_g2 */
+	double Sigma_sfr2 = ism.J21_Sigma_g2 / molecular;
+	double Sigma_sfr1 = pow(
+		ism.J21_Sigma_g1 / ism.J21_Sigma_g2,
+		index2 * (1 - index2) / (index2 - index1)
+	) / molecular * pow(
+		ism.J21_Sigma_g2,
+		index2 * (1 - index1) / (index2 - index1)
+	) * pow(
+		ism.J21_Sigma_g1,
+		-index1 * (1 - index2) / (index2 - index1)
+	);
+
+	if (Sigma_sfr >= Sigma_sfr2) {
+		return molecular;
+	} else if (Sigma_sfr1 <= Sigma_sfr) {
+		return pow(molecular, 1 / (1 - index2)) * pow(
+			Sigma_sfr / ism.J21_Sigma_g2, index2 / (1 - index2));
+	} else if (Sigma_sfr) {
+		return pow(
+			ism.J21_Sigma_g1 / ism.J21_Sigma_g2, index2 / (1 - index1)
+		) * pow(molecular, 1 / (1 - index1)) * pow(
+			Sigma_sfr / ism.J21_Sigma_g1, index1 / (1 - index1));
+	} else {
+		/* results in zero gas mass regardless */
+		return 1.e-12;
+	}
+
+}
+
+
+/*
+ * The depletion time of molecular gas due to star formation at a given
+ * simulation time.
+ *
+ * Parameters
+ * ==========
+ * ism: 		The ISM object holding the parameters of the star formation law
+ * time: 		The simulation time in Gyr
+ *
+ * Returns
+ * =======
+ * The value of tau_mol in Gyr, as computed by J21_sf_law.molecular.
+ */
+static double J21_molecular(ISM ism, double time) {
+
+	return ism.J21_present_day_molecular * pow(
+		(1.5 + time) / 13.7, ism.J21_molecular_index);
+
+}
+
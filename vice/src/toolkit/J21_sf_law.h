@@ -0,0 +1,51 @@
+
+#ifndef TOOLKIT_J21_SF_LAW_H
+#define TOOLKIT_J21_SF_LAW_H
+
+#ifdef __cplusplus
+extern "C" {
+#endif /* __cplusplus */
+
+#include "../objects.h"
+
+/*
+ * Evaluate the star formation law of Johnson et al. (2021) in infall or gas
+ * mode, as implemented by the vice.toolkit.J21_sf_law object.
+ *
+ * Parameters
+ * ==========
+ * ism: 		The ISM object holding the parameters of the star formation law
+ * time: 		The simulation time in Gyr
+ * mgas: 		The gas supply in Msun
+ *
+ * Returns
+ * =======
+ * The star formation efficiency timescale tau_star in Gyr.
+ *
+ * source: J21_sf_law.c
+ */
+extern double J21_sf_law_gas(ISM ism, double time, double mgas);
+
+/*
+ * Evaluate the star formation law of Johnson et al. (2021) in star formation
+ * mode, as implemented by the vice.toolkit.J21_sf_law object.
+ *
+ * Parameters
+ * ==========
+ * ism: 		The ISM object holding the parameters of the star formation law
+ * time: 		The simulation time in Gyr
+ * sfr: 		The star formation rate in Msun/yr
+ *
+ * Returns
+ * =======
+ * The star formation efficiency timescale tau_star in Gyr.
+ *
+ * source: J21_sf_law.c
+ */
+extern double J21_sf_law_sfr(ISM ism, double time, double sfr);
+
+#ifdef __cplusplus
+}
+#endif /* __cplusplus */
+
+#endif /* TOOLKIT_J21_SF_LAW_H */
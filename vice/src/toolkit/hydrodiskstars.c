@@ -3,8 +3,12 @@
  */
 
 #include <stdlib.h>
+#include <stdio.h>
 #include <string.h>
 #include <math.h>
+#include <unistd.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 #include "../utils.h"
 #include "../io.h"
 #include "hydrodiskstars.h"
@@ -19,9 +23,16 @@ static unsigned short hydrodiskstars_import_sub(HYDRODISKSTARS *hds,
 	unsigned short zfinal_column, unsigned short v_radcolumn,
 	unsigned short v_phicolumn, unsigned short v_zcolumn,
 	unsigned short decomp_column);
+static unsigned short cache_current(char *filestem, char *cache);
+static unsigned short write_cache(char *filestem, char *cache,
+	unsigned short *columns);
+static unsigned short map_cache(HYDRODISKSTARS *hds, char *cache,
+	unsigned short *columns, unsigned long *first_rows);
+static void cache_labels(char **labels, unsigned short *columns);
+static unsigned short select_subsample(HYDRODISKSTARS *hds,
+	unsigned long *first_rows, unsigned short subsample);
 static unsigned short decomp_contains(unsigned short *decomp_values,
 	unsigned short n_decomp_values, unsigned short test_value);
-static unsigned long sum_(unsigned short *arr, unsigned long length);
 static unsigned long candidate_search(HYDRODISKSTARS hds, double birth_radius,
 	double birth_time, unsigned long **candidates, double max_radius,
 	double max_time);
@@ -32,10 +43,23 @@ static long assign_analog_min_radius(HYDRODISKSTARS hds,
 	double birth_radius, double birth_time);
 static double final_radius(HYDRODISKSTARS hds, double birth_radius,
 	long analog_idx);
+static unsigned long cell_number(double value, double minimum, double width,
+	unsigned long n_cells);
+static double cell_distance(double value, double minimum, double width,
+	unsigned long cell);
+static int compare_indices(const void *a, const void *b);
 
 /* The number of subsample files present in the code base */
 static unsigned short NSUBS = 30u;
 
+/*
+ * The columns of the binary cache: the ID, the eight floating point
+ * quantities, and the decomposition tag of each star particle, followed by
+ * the subsample it belongs to.
+ */
+static unsigned short N_CACHE_COLUMNS = 11u;
+static char CACHE_TYPES[] = "lddddddddhh";
+
 
 /*
  * Read the raw data describing hydrodynamical simulation star particles into
@@ -70,6 +94,27 @@ extern unsigned short hydrodiskstars_import(HYDRODISKSTARS *hds,
 	unsigned short v_phicolumn, unsigned short v_zcolumn,
 	unsigned short decomp_column) {
 
+	/*
+	 * Map the binary cache of all subsamples into memory, writing it first
+	 * if it is missing or older than the ascii files. If it can't be written
+	 * (e.g. the install directory is read-only), the subsamples are read from
+	 * the ascii files as they're needed.
+	 */
+	unsigned short columns[10] = {ids_column, birth_times_column,
+		birth_radii_column, final_radii_column, zform_column, zfinal_column,
+		v_radcolumn, v_phicolumn, v_zcolumn, decomp_column};
+	char *cache = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
+	sprintf(cache, "%s%s", filestem, HYDRODISK_CACHE_FILE);
+	unsigned long *first_rows = (unsigned long *) malloc ((NSUBS + 1u) *
+		sizeof(unsigned long));
+	if (!(cache_current(filestem, cache) &&
+		map_cache(hds, cache, columns, first_rows))) {
+		if (write_cache(filestem, cache, columns)) {
+			map_cache(hds, cache, columns, first_rows);
+		} else {}
+	} else {}
+	free(cache);
+
 	/*
 	 * Bookkeeping
 	 * ===========
@@ -90,23 +135,381 @@ extern unsigned short hydrodiskstars_import(HYDRODISKSTARS *hds,
 		n++;
 		included = (unsigned short *) realloc (included,
 			(n + 1u) * sizeof(unsigned short));
-		
-		/* Construct the name of the file to import */
-		char *filename = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
-		sprintf(filename, "%ssub%u.dat", filestem, subsample);
-		status &= hydrodiskstars_import_sub(hds, filename, ids_column,
-			birth_times_column, birth_radii_column, final_radii_column,
-			zform_column, zfinal_column, v_radcolumn, v_phicolumn, v_zcolumn,
-			decomp_column);
-		free(filename);
+
+		if ((*hds).map != NULL) {
+			status &= select_subsample(hds, first_rows, subsample);
+		} else {
+			/* Construct the name of the file to import */
+			char *filename = (char *) malloc (MAX_FILENAME_SIZE *
+				sizeof(char));
+			sprintf(filename, "%ssub%u.dat", filestem, subsample);
+			status &= hydrodiskstars_import_sub(hds, filename, ids_column,
+				birth_times_column, birth_radii_column, final_radii_column,
+				zform_column, zfinal_column, v_radcolumn, v_phicolumn,
+				v_zcolumn, decomp_column);
+			free(filename);
+		}
 	} while ((*hds).n_stars < Nstars && status);
 	free(included);
+	free(first_rows);
+
+	if (status) status &= hydrodiskstars_index(hds);
+	return status;
+
+}
+
+
+/*
+ * Determine if the binary cache of the star particle data is at least as
+ * recent as each of the ascii files it was made from.
+ *
+ * Parameters
+ * ==========
+ * filestem: 	The path to the ascii files, minus the "subN.dat"
+ * cache: 		The path to the binary cache
+ *
+ * Returns
+ * =======
+ * 1 if the cache exists and was not modified before any of the ascii files,
+ * 0 otherwise. Ascii files which are missing are not compared against.
+ */
+static unsigned short cache_current(char *filestem, char *cache) {
+
+	struct stat cache_stat, sub_stat;
+	if (stat(cache, &cache_stat)) return 0u;
+	unsigned short i, status = 1u;
+	char *filename = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
+	for (i = 0u; i < NSUBS; i++) {
+		sprintf(filename, "%ssub%u.dat", filestem, i);
+		if (!stat(filename, &sub_stat) &&
+			sub_stat.st_mtime > cache_stat.st_mtime) {
+			status = 0u;
+			break;
+		} else {}
+	}
+	free(filename);
+	return status;
+
+}
+
+
+/*
+ * Write every subsample of the star particle data to a single file in VICE's
+ * binary columnar format.
+ *
+ * Parameters
+ * ==========
+ * filestem: 	The path to the ascii files, minus the "subN.dat"
+ * cache: 		The path to the binary cache to write
+ * columns: 	The column of each quantity in the ascii files, in the order
+ * 				of the arguments to hydrodiskstars_import
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * Notes
+ * =====
+ * See write_binary_header in vice/src/io/utils.h for details on the format.
+ * The star particles are stored in order of subsample, and the quantities in
+ * the same types as in the hydrodiskstars object, such that they can be used
+ * directly from the mapping. The subsamples are read one at a time and
+ * written into their position in each column. The cache is written under a
+ * temporary name and then renamed, so that other processes never see a
+ * partially written cache.
+ */
+static unsigned short write_cache(char *filestem, char *cache,
+	unsigned short *columns) {
+
+	/* The number of star particles in each subsample */
+	unsigned short i, j;
+	unsigned long k, n_rows = 0ul;
+	unsigned long *lengths = (unsigned long *) malloc (NSUBS *
+		sizeof(unsigned long));
+	char *filename = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
+	for (i = 0u; i < NSUBS; i++) {
+		sprintf(filename, "%ssub%u.dat", filestem, i);
+		long length = line_count(filename);
+		int h_length = header_length(filename);
+		if (length < 0l || h_length < 0) {
+			free(lengths);
+			free(filename);
+			return 0u;
+		} else {
+			lengths[i] = (unsigned long) (length - h_length);
+			n_rows += lengths[i];
+		}
+	}
+
+	char *tmp = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
+	sprintf(tmp, "%s.%ld", cache, (long) getpid());
+	FILE *out = fopen(tmp, "wb");
+	if (out == NULL) {
+		free(lengths);
+		free(filename);
+		free(tmp);
+		return 0u;
+	} else {}
+	char **labels = (char **) malloc (N_CACHE_COLUMNS * sizeof(char *));
+	for (j = 0u; j < N_CACHE_COLUMNS; j++) {
+		labels[j] = (char *) malloc (MAX_LABEL_SIZE * sizeof(char));
+	}
+	cache_labels(labels, columns);
+	write_binary_header(out, labels, CACHE_TYPES, N_CACHE_COLUMNS, n_rows);
+	long start = ftell(out);
+	for (j = 0u; j < N_CACHE_COLUMNS; j++) free(labels[j]);
+	free(labels);
+
+	unsigned short status = 1u;
+	unsigned long first = 0ul;
+	for (i = 0u; i < NSUBS && status; i++) {
+		sprintf(filename, "%ssub%u.dat", filestem, i);
+		double **raw = lengths[i] ? read_square_ascii_file(filename) : NULL;
+		if (raw == NULL && lengths[i]) {
+			status = 0u;
+			break;
+		} else {}
+		long offset = start;
+		for (j = 0u; j < N_CACHE_COLUMNS; j++) {
+			/* Each value has the size of those in column j */
+			unsigned short size;
+			switch (CACHE_TYPES[j]) {
+				case 'l':
+					size = sizeof(unsigned long);
+					break;
+				case 'h':
+					size = sizeof(unsigned short);
+					break;
+				default:
+					size = sizeof(double);
+					break;
+			}
+			fseek(out, offset + (long) (first * size), SEEK_SET);
+			for (k = 0ul; k < lengths[i]; k++) {
+				if (CACHE_TYPES[j] == 'l') {
+					unsigned long value = raw[k][columns[j]];
+					fwrite(&value, size, 1, out);
+				} else if (j == N_CACHE_COLUMNS - 1u) {
+					/* the subsample itself */
+					fwrite(&i, size, 1, out);
+				} else if (CACHE_TYPES[j] == 'h') {
+					unsigned short value = raw[k][columns[j]];
+					fwrite(&value, size, 1, out);
+				} else {
+					fwrite(&raw[k][columns[j]], size, 1, out);
+				}
+			}
+			offset += (long) (n_rows * size);
+		}
+		for (k = 0ul; k < lengths[i]; k++) free(raw[k]);
+		free(raw);
+		first += lengths[i];
+	}
 
+	status &= !ferror(out);
+	fclose(out);
+	if (status) status = !rename(tmp, cache);
+	if (!status) remove(tmp);
+	free(lengths);
+	free(filename);
+	free(tmp);
 	return status;
 
 }
 
 
+/*
+ * Map the binary cache of the star particle data into memory, pointing the
+ * columns of the hydrodiskstars object into the mapping.
+ *
+ * Parameters
+ * ==========
+ * hds: 		A pointer to the hydrodiskstars object
+ * cache: 		The path to the binary cache
+ * columns: 	The column of each quantity in the ascii files, in the order
+ * 				of the arguments to hydrodiskstars_import
+ * first_rows: 	An array of length NSUBS + 1 to store the row of the first
+ * 				star particle in each subsample, with the last entry holding
+ * 				the total number of star particles
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 if the cache could not be read, was written on a machine
+ * with a different byte order, was made from different columns of the ascii
+ * files, or is shorter than its header says.
+ *
+ * Notes
+ * =====
+ * The mapping is shared and read-only, so any number of hydrodiskstars
+ * objects, including those in different processes, use the same physical
+ * memory for the data.
+ */
+static unsigned short map_cache(HYDRODISKSTARS *hds, char *cache,
+	unsigned short *columns, unsigned long *first_rows) {
+
+	FILE *in = fopen(cache, "rb");
+	if (in == NULL) return 0u;
+
+	/* Read the header, confirming each column is as expected */
+	unsigned short j, status = 0u, n_cols = 0u;
+	unsigned long n_rows = 0ul;
+	unsigned int size;
+	char type;
+	char *line = (char *) malloc (LINESIZE * sizeof(char));
+	char *word = (char *) malloc (LINESIZE * sizeof(char));
+	char **labels = (char **) malloc (N_CACHE_COLUMNS * sizeof(char *));
+	for (j = 0u; j < N_CACHE_COLUMNS; j++) {
+		labels[j] = (char *) malloc (MAX_LABEL_SIZE * sizeof(char));
+	}
+	cache_labels(labels, columns);
+	if (fgets(line, LINESIZE, in) != NULL &&
+		!strcmp(line, BINARY_OUTPUT_TAG "\n")) {
+		while (fgets(line, LINESIZE, in) != NULL) {
+			if (!strncmp(line, "# end", 5)) {
+				status = n_cols == N_CACHE_COLUMNS && n_rows;
+				break;
+			} else if (sscanf(line, "# byteorder: %s", word) == 1) {
+				if (strcmp(word, little_endian() ? "little" : "big")) break;
+			} else if (sscanf(line, "# rows: %lu", &n_rows) == 1) {
+				continue;
+			} else if (sscanf(line, "# column: %s %c%u", word, &type,
+				&size) == 3) {
+				if (n_cols == N_CACHE_COLUMNS ||
+					strcmp(word, labels[n_cols])) break;
+				switch (CACHE_TYPES[n_cols]) {
+					case 'l':
+						if (type != 'u' || size != sizeof(unsigned long)) {
+							n_cols = N_CACHE_COLUMNS + 1u;
+						} else {}
+						break;
+					case 'h':
+						if (type != 'u' || size != sizeof(unsigned short)) {
+							n_cols = N_CACHE_COLUMNS + 1u;
+						} else {}
+						break;
+					default:
+						if (type != 'f' || size != sizeof(double)) {
+							n_cols = N_CACHE_COLUMNS + 1u;
+						} else {}
+						break;
+				}
+				if (n_cols > N_CACHE_COLUMNS) break;
+				n_cols++;
+			} else {
+				break;
+			}
+		}
+	} else {}
+	for (j = 0u; j < N_CACHE_COLUMNS; j++) free(labels[j]);
+	free(labels);
+	free(line);
+	free(word);
+
+	/* The data begin immediately after the header */
+	long start = ftell(in);
+	fseek(in, 0l, SEEK_END);
+	long end = ftell(in);
+	unsigned long expected = (unsigned long) start + n_rows * (
+		sizeof(unsigned long) + 8u * sizeof(double) +
+		2u * sizeof(unsigned short));
+	if (!status || end < 0l || (unsigned long) end < expected) {
+		fclose(in);
+		return 0u;
+	} else {}
+	void *map = mmap(NULL, (size_t) end, PROT_READ, MAP_SHARED, fileno(in),
+		0);
+	fclose(in);
+	if (map == MAP_FAILED) return 0u;
+
+	char *data = (char *) map + start;
+	unsigned short *subsamples;
+	hds -> ids = (unsigned long *) data;
+	data += n_rows * sizeof(unsigned long);
+	hds -> birth_times = (double *) data;
+	hds -> birth_radii = (double *) (data += n_rows * sizeof(double));
+	hds -> final_radii = (double *) (data += n_rows * sizeof(double));
+	hds -> zform = (double *) (data += n_rows * sizeof(double));
+	hds -> zfinal = (double *) (data += n_rows * sizeof(double));
+	hds -> v_rad = (double *) (data += n_rows * sizeof(double));
+	hds -> v_phi = (double *) (data += n_rows * sizeof(double));
+	hds -> v_z = (double *) (data += n_rows * sizeof(double));
+	hds -> decomp = (unsigned short *) (data += n_rows * sizeof(double));
+	subsamples = (unsigned short *) (data += n_rows * sizeof(unsigned short));
+	hds -> map = map;
+	hds -> map_size = (unsigned long) end;
+
+	/* Star particles are stored in order of subsample */
+	unsigned long k = 0ul;
+	for (j = 0u; j <= NSUBS; j++) {
+		while (k < n_rows && subsamples[k] < j) k++;
+		first_rows[j] = k;
+	}
+	return 1u;
+
+}
+
+
+/*
+ * Determine the labels of each column in the binary cache of the star
+ * particle data.
+ *
+ * Parameters
+ * ==========
+ * labels: 		The array of N_CACHE_COLUMNS strings to store the labels in
+ * columns: 	The column of each quantity in the ascii files, in the order
+ * 				of the arguments to hydrodiskstars_import
+ *
+ * Notes
+ * =====
+ * Each label records the column of the ascii files the quantity was taken
+ * from, so that a cache made from different columns is not used.
+ */
+static void cache_labels(char **labels, unsigned short *columns) {
+
+	char *names[] = {"id", "tform", "rform", "rfinal", "zform", "zfinal",
+		"vrad", "vphi", "vz", "decomp"};
+	unsigned short j;
+	for (j = 0u; j < N_CACHE_COLUMNS - 1u; j++) {
+		sprintf(labels[j], "%s:%u", names[j], columns[j]);
+	}
+	strcpy(labels[N_CACHE_COLUMNS - 1u], "subsample");
+
+}
+
+
+/*
+ * Add the star particles in one subsample of the binary cache to the
+ * sample of a hydrodiskstars object.
+ *
+ * Parameters
+ * ==========
+ * hds: 			A pointer to the hydrodiskstars object
+ * first_rows: 		The row of the first star particle in each subsample, as
+ * 					determined by map_cache
+ * subsample: 		The subsample to add
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 if the subsample is empty or does not exist
+ */
+static unsigned short select_subsample(HYDRODISKSTARS *hds,
+	unsigned long *first_rows, unsigned short subsample) {
+
+	/* rand_range may return NSUBS itself, as if its file were missing */
+	if (subsample >= NSUBS) return 0u;
+	unsigned long i, n = first_rows[subsample + 1u] - first_rows[subsample];
+	if (!n) return 0u;
+	hds -> rows = (unsigned long *) realloc (hds -> rows,
+		((*hds).n_stars + n) * sizeof(unsigned long));
+	for (i = 0ul; i < n; i++) {
+		hds -> rows[(*hds).n_stars + i] = first_rows[subsample] + i;
+	}
+	hds -> n_stars += n;
+	return 1u;
+
+}
+
+
 /*
  * Determines if a subsample of the data was already imported.
  *
@@ -214,9 +617,12 @@ static unsigned short hydrodiskstars_import_sub(HYDRODISKSTARS *hds,
 
 			/* Copy it over */
 			unsigned long i;
+			hds -> rows = (unsigned long *) realloc (hds -> rows,
+				(*hds).n_stars * sizeof(unsigned long));
 			for (i = 0u; i < n_lines; i++) {
 				/* The position of this star particle in the data */
 				unsigned long idx = (*hds).n_stars - n_lines + i;
+				hds -> rows[idx] = idx;
 				hds -> ids[idx] = raw[i][ids_column];
 				hds -> birth_times[idx] = raw[i][birth_times_column];
 				hds -> birth_radii[idx] = raw[i][birth_radii_column];
@@ -227,6 +633,7 @@ static unsigned short hydrodiskstars_import_sub(HYDRODISKSTARS *hds,
 				hds -> v_phi[idx] = raw[i][v_phicolumn];
 				hds -> v_z[idx] = raw[i][v_zcolumn];
 				hds -> decomp[idx] = raw[i][decomp_column];
+				free(raw[i]);
 			}
 
 			free(raw);
@@ -264,85 +671,20 @@ extern unsigned short hydrodiskstars_decomp_filter(HYDRODISKSTARS *hds,
 	unsigned short *decomp_values, unsigned short n_decomp_values) {
 
 	/*
-	 * Determine which star particles pass the filter. Store it as a simple
-	 * array of boolean integers.
+	 * Keep the rows of the star particles which pass the filter in the same
+	 * order. The data themselves are left in place.
 	 */
-	unsigned short *which = (unsigned short *) malloc ((*hds).n_stars *
-		sizeof(unsigned short));
-	unsigned long i;
+	unsigned long i, n = 0ul;
 	for (i = 0ul; i < (*hds).n_stars; i++) {
-		which[i] = decomp_contains(decomp_values, n_decomp_values,
-			(*hds).decomp[i]);
-	}
-
-	/*
-	 * Find the number of star particles which pass the filter, and allocate
-	 * memory for a new arrays for each star particle's attributes.
-	 */
-	unsigned long n_pass = sum_(which, (*hds).n_stars);
-	unsigned long *new_ids = (unsigned long *) malloc (n_pass * sizeof(
-		unsigned long));
-	double *new_birth_times = (double *) malloc (n_pass * sizeof(double));
-	double *new_birth_radii = (double *) malloc (n_pass * sizeof(double));
-	double *new_final_radii = (double *) malloc (n_pass * sizeof(double));
-	double *new_zform = (double *) malloc (n_pass * sizeof(double));
-	double *new_zfinal = (double *) malloc (n_pass * sizeof(double));
-	double *new_v_rad = (double *) malloc (n_pass * sizeof(double));
-	double *new_v_phi = (double *) malloc (n_pass * sizeof(double));
-	double *new_v_z = (double *) malloc (n_pass * sizeof(double));
-	unsigned short *new_decomp = (unsigned short *) malloc (n_pass * sizeof(
-		unsigned short));
-
-	/*
-	 * Iterate over the current sample, and for those that passed the filter,
-	 * copy them over to the new arrays.
-	 */
-	unsigned long n = 0ul;
-	for (i = 0ul; i < (*hds).n_stars; i++) {
-		if (which[i]) {
-			new_ids[n] = hds -> ids[i];
-			new_birth_times[n] = hds -> birth_times[i];
-			new_birth_radii[n] = hds -> birth_radii[i];
-			new_final_radii[n] = hds -> final_radii[i];
-			new_zform[n] = hds -> zform[i];
-			new_zfinal[n] = hds -> zfinal[i];
-			new_v_rad[n] = hds -> v_rad[i];
-			new_v_phi[n] = hds -> v_phi[i];
-			new_v_z[n] = hds -> v_z[i];
-			new_decomp[n] = hds -> decomp[i];
-			n++;
+		if (decomp_contains(decomp_values, n_decomp_values,
+			(*hds).decomp[(*hds).rows[i]])) {
+			hds -> rows[n++] = (*hds).rows[i];
 		} else {}
 	}
-	free(which);
-
-	/* Free up the old arrays and point the hds data at the new ones. */
-	free(hds -> ids);
-	free(hds -> birth_times);
-	free(hds -> birth_radii);
-	free(hds -> final_radii);
-	free(hds -> zform);
-	free(hds -> zfinal);
-	free(hds -> v_rad);
-	free(hds -> v_phi);
-	free(hds -> v_z);
-	free(hds -> decomp);
-	hds -> ids = new_ids;
-	hds -> birth_times = new_birth_times;
-	hds -> birth_radii = new_birth_radii;
-	hds -> final_radii = new_final_radii;
-	hds -> zform = new_zform;
-	hds -> zfinal = new_zfinal;
-	hds -> v_rad = new_v_rad;
-	hds -> v_phi = new_v_phi;
-	hds -> v_z = new_v_z;
-	hds -> decomp = new_decomp;
-	hds -> n_stars = n_pass;
+	hds -> n_stars = n;
 
-	/*
-	 * The number of times n++ ran should be equal to n_pass. Return that as
-	 * a success or failure message.
-	 */
-	return n == n_pass;
+	/* The positions of the star particles in the sample have changed */
+	return hydrodiskstars_index(hds);
 
 }
 
@@ -374,30 +716,103 @@ static unsigned short decomp_contains(unsigned short *decomp_values,
 
 
 /*
- * Calculate the sum of an array of unsigned shorts.
+ * Sort the star particles in a hydrodiskstars object onto a grid in birth
+ * time and birth radius, allowing candidate analog searches to assess only
+ * the star particles in the cells which overlap the search window.
  *
  * Parameters
  * ==========
- * arr: 		The array to compute the sum of
- * length: 		The number of entries in the array.
+ * hds: 		A pointer to the hydrodiskstars object to index
  *
  * Returns
  * =======
- * The sum of all entries
+ * 1 on success, 0 on failure
  *
- * Notes
- * =====
- * This performs the same function as "sum" in vice/src/utils.h, but that
- * function accepts a double pointer, which is incompatible with an
- * unsigned short pointer.
+ * header: hydrodiskstars.h
  */
-static unsigned long sum_(unsigned short *arr, unsigned long length) {
+extern unsigned short hydrodiskstars_index(HYDRODISKSTARS *hds) {
 
-	unsigned long i, s = 0ul;
-	for (i = 0ul; i < length; i++) {
-		s += arr[i];
+	if ((*hds).cells != NULL) free(hds -> cells);
+	if ((*hds).cell_offsets != NULL) free(hds -> cell_offsets);
+	hds -> cells = NULL;
+	hds -> cell_offsets = NULL;
+	hds -> n_time_cells = 0ul;
+	hds -> n_radius_cells = 0ul;
+	if (!(*hds).n_stars) return 1u;
+
+	/* The grid spans the range of birth times and radii in the data */
+	unsigned long i;
+	double max_birth_time = (*hds).birth_times[(*hds).rows[0]];
+	double max_birth_radius = (*hds).birth_radii[(*hds).rows[0]];
+	hds -> min_birth_time = max_birth_time;
+	hds -> min_birth_radius = max_birth_radius;
+	for (i = 1ul; i < (*hds).n_stars; i++) {
+		double birth_time = (*hds).birth_times[(*hds).rows[i]];
+		double birth_radius = (*hds).birth_radii[(*hds).rows[i]];
+		if (birth_time < (*hds).min_birth_time) {
+			hds -> min_birth_time = birth_time;
+		} else if (birth_time > max_birth_time) {
+			max_birth_time = birth_time;
+		} else {}
+		if (birth_radius < (*hds).min_birth_radius) {
+			hds -> min_birth_radius = birth_radius;
+		} else if (birth_radius > max_birth_radius) {
+			max_birth_radius = birth_radius;
+		} else {}
 	}
-	return s;
+	hds -> n_time_cells = 1ul + (unsigned long) (
+		(max_birth_time - (*hds).min_birth_time) / HYDRODISK_CELL_TIME_WIDTH);
+	hds -> n_radius_cells = 1ul + (unsigned long) (
+		(max_birth_radius - (*hds).min_birth_radius) /
+		HYDRODISK_CELL_RADIUS_WIDTH);
+
+	/*
+	 * Counting sort: the number of star particles in each cell gives the
+	 * position of the first one in each cell, after which the star particles
+	 * are placed in the order they appear in the data.
+	 */
+	unsigned long n_cells = (*hds).n_time_cells * (*hds).n_radius_cells;
+	unsigned long *cell = (unsigned long *) malloc ((*hds).n_stars *
+		sizeof(unsigned long));
+	hds -> cells = (unsigned long *) malloc ((*hds).n_stars *
+		sizeof(unsigned long));
+	hds -> cell_offsets = (unsigned long *) calloc (n_cells + 1ul,
+		sizeof(unsigned long));
+	if (cell == NULL || (*hds).cells == NULL ||
+		(*hds).cell_offsets == NULL) {
+		free(cell);
+		free(hds -> cells);
+		free(hds -> cell_offsets);
+		hds -> cells = NULL;
+		hds -> cell_offsets = NULL;
+		return 0u;
+	} else {}
+
+	for (i = 0ul; i < (*hds).n_stars; i++) {
+		cell[i] = (
+			cell_number((*hds).birth_times[(*hds).rows[i]],
+				(*hds).min_birth_time, HYDRODISK_CELL_TIME_WIDTH,
+				(*hds).n_time_cells) *
+			(*hds).n_radius_cells +
+			cell_number((*hds).birth_radii[(*hds).rows[i]],
+				(*hds).min_birth_radius, HYDRODISK_CELL_RADIUS_WIDTH,
+				(*hds).n_radius_cells)
+		);
+		hds -> cell_offsets[cell[i] + 1ul]++;
+	}
+	for (i = 0ul; i < n_cells; i++) {
+		hds -> cell_offsets[i + 1ul] += (*hds).cell_offsets[i];
+	}
+	/* cell_offsets[c] temporarily tracks the next open slot in cell c */
+	for (i = 0ul; i < (*hds).n_stars; i++) {
+		hds -> cells[hds -> cell_offsets[cell[i]]++] = i;
+	}
+	for (i = n_cells; i > 0ul; i--) {
+		hds -> cell_offsets[i] = (*hds).cell_offsets[i - 1ul];
+	}
+	hds -> cell_offsets[0] = 0ul;
+	free(cell);
+	return 1u;
 
 }
 
@@ -431,7 +846,7 @@ extern long hydrodiskstars_find_analog(HYDRODISKSTARS hds, double birth_radius,
 
 	/* Conduct the initial candidate search, default analog_idx of -1l */
 	long analog_idx = -1l;
-	unsigned long *candidates;
+	unsigned long *candidates = NULL;
 	unsigned long n_candidates;
 	double search_radius = INITIAL_ANALOG_SEARCH_RADIUS;
 	double search_time = INITIAL_ANALOG_SEARCH_TIME;
@@ -501,22 +916,50 @@ static unsigned long candidate_search(HYDRODISKSTARS hds, double birth_radius,
 	double birth_time, unsigned long **candidates, double max_radius,
 	double max_time) {
 
-	unsigned long i, n_candidates = 0ul;
-
-	for (i = 0ul; i < hds.n_stars; i++) {
-		if (assess_candidate(hds, birth_radius, birth_time, max_radius,
-			max_time, i)) {
-			if (n_candidates) {
-				*candidates = (unsigned long *) realloc (*candidates,
-					(n_candidates + 1ul) * sizeof(unsigned long));
-			} else {
-				*candidates = (unsigned long *) malloc (sizeof(unsigned long));
+	/*
+	 * The cells overlapping the search window. The window is padded by a
+	 * negligible amount so that rounding errors in computing its edges can
+	 * not exclude a cell containing a star particle on its boundary.
+	 */
+	if (!hds.n_stars) return 0ul;
+	unsigned long t, r, k, size = 0ul, n_candidates = 0ul;
+	unsigned long t0 = cell_number(birth_time - max_time - 1.e-9,
+		hds.min_birth_time, HYDRODISK_CELL_TIME_WIDTH, hds.n_time_cells);
+	unsigned long t1 = cell_number(birth_time + max_time + 1.e-9,
+		hds.min_birth_time, HYDRODISK_CELL_TIME_WIDTH, hds.n_time_cells);
+	unsigned long r0 = cell_number(birth_radius - max_radius - 1.e-9,
+		hds.min_birth_radius, HYDRODISK_CELL_RADIUS_WIDTH,
+		hds.n_radius_cells);
+	unsigned long r1 = cell_number(birth_radius + max_radius + 1.e-9,
+		hds.min_birth_radius, HYDRODISK_CELL_RADIUS_WIDTH,
+		hds.n_radius_cells);
+
+	for (t = t0; t <= t1; t++) {
+		for (r = r0; r <= r1; r++) {
+			unsigned long cell = t * hds.n_radius_cells + r;
+			for (k = hds.cell_offsets[cell]; k < hds.cell_offsets[cell + 1ul];
+				k++) {
+				if (assess_candidate(hds, birth_radius, birth_time,
+					max_radius, max_time, hds.cells[k])) {
+					if (n_candidates == size) {
+						/* double the size of the array as it fills */
+						size = size ? 2ul * size : 64ul;
+						*candidates = (unsigned long *) realloc (*candidates,
+							size * sizeof(unsigned long));
+					} else {}
+					(*candidates)[n_candidates] = hds.cells[k];
+					n_candidates++;
+				} else {}
 			}
-			(*candidates)[n_candidates] = i;
-			n_candidates++;
 		}
 	}
 
+	/*
+	 * Put the candidates in the order they appear in the data, so that the
+	 * random selection is the same as if all star particles were assessed.
+	 */
+	if (n_candidates > 1ul) qsort(*candidates, n_candidates,
+		sizeof(unsigned long), compare_indices);
 	return n_candidates;
 
 }
@@ -560,8 +1003,9 @@ static unsigned short assess_candidate(HYDRODISKSTARS hds,
 	 * The most stringent tests first - whether or not the star particle is
 	 * within the allowed range of birth radius and time.
 	 */
-	assessment &= absval(hds.birth_times[index] - birth_time) < max_time;
-	assessment &= absval(hds.birth_radii[index] - birth_radius) < max_radius;
+	unsigned long row = hds.rows[index];
+	assessment &= absval(hds.birth_times[row] - birth_time) < max_time;
+	assessment &= absval(hds.birth_radii[row] - birth_radius) < max_radius;
 
 	/*
 	 * If a star particle passes the tests so far, check the final radius
@@ -606,37 +1050,64 @@ static long assign_analog_min_radius(HYDRODISKSTARS hds,
 	 * This function is called only when the initial search within
 	 * MAXIMUM_ANALOG_SEARCH_TIME and MAXIMUM_ANALOG_SEARCH_RADIUS fail to
 	 * find a candidate analog star particle. Therefore start with an analog
-	 * index of -1.
+	 * index of -1 and a minimum difference in birth radius of infinity.
 	 */
-	unsigned long i;
 	long analog_idx = -1l;
-	for (i = 0ul; i < hds.n_stars; i++) {
-		/*
-		 * For each star particle in the data, check if it's birth radius is
-		 * closer than the one with the current minimum. If there is no analog
-		 * yet, take the current minimum to be infinity.
-		 */
-		double current_candidate_dr;
-		if (analog_idx == -1l) {
-			/* Linux distributions don't have INFINITY defined */
-			#ifdef INFINITY
-				current_candidate_dr = INFINITY;
-			#else
-				current_candidate_dr = 1e6;
-			#endif
-		} else {
-			current_candidate_dr = absval(
-				hds.birth_radii[analog_idx] - birth_radius
-			);
+	double unbounded;
+	/* Linux distributions don't have INFINITY defined */
+	#ifdef INFINITY
+		unbounded = INFINITY;
+	#else
+		unbounded = 1e6;
+	#endif
+	double min_dr = unbounded;
+	if (!hds.n_stars) return analog_idx;
+
+	/*
+	 * Work outward from the column of cells containing the birth radius,
+	 * stopping once every remaining column is further away in birth radius
+	 * than the current analog. Ties go to the star particle which appears
+	 * first in the data.
+	 */
+	unsigned long t, k, d;
+	unsigned long t0 = cell_number(
+		birth_time - MAXIMUM_ANALOG_SEARCH_TIME - 1.e-9, hds.min_birth_time,
+		HYDRODISK_CELL_TIME_WIDTH, hds.n_time_cells);
+	unsigned long t1 = cell_number(
+		birth_time + MAXIMUM_ANALOG_SEARCH_TIME + 1.e-9, hds.min_birth_time,
+		HYDRODISK_CELL_TIME_WIDTH, hds.n_time_cells);
+	unsigned long center = cell_number(birth_radius, hds.min_birth_radius,
+		HYDRODISK_CELL_RADIUS_WIDTH, hds.n_radius_cells);
+	for (d = 0ul; d <= center || center + d < hds.n_radius_cells; d++) {
+		unsigned short side;
+		for (side = 0u; side < 2u; side++) {
+			/* the column below the center, then the one above it */
+			if (side && !d) break;
+			if (!side && d > center) continue;
+			unsigned long r = side ? center + d : center - d;
+			if (r >= hds.n_radius_cells) continue;
+			if (cell_distance(birth_radius, hds.min_birth_radius,
+				HYDRODISK_CELL_RADIUS_WIDTH, r) > min_dr + 1.e-9) continue;
+			for (t = t0; t <= t1; t++) {
+				unsigned long cell = t * hds.n_radius_cells + r;
+				for (k = hds.cell_offsets[cell];
+					k < hds.cell_offsets[cell + 1ul]; k++) {
+					unsigned long i = hds.cells[k];
+					double dr = absval(hds.birth_radii[hds.rows[i]] -
+						birth_radius);
+					if ((dr < min_dr || (dr == min_dr && (signed) i <
+						analog_idx)) && assess_candidate(hds, birth_radius,
+						birth_time, unbounded, MAXIMUM_ANALOG_SEARCH_TIME,
+						i)) {
+						analog_idx = (signed) i;
+						min_dr = dr;
+					} else {}
+				}
+			}
 		}
-		if (assess_candidate(hds, birth_radius, birth_time,
-			current_candidate_dr, MAXIMUM_ANALOG_SEARCH_TIME, i)) {
-			/*
-			 * If this star particle passes this call to assess_candidate,
-			 * take it as the new candidate analog.
-			 */
-			analog_idx = (signed) i;
-		} else {}
+		/* every column at least d cells away is now too far */
+		if (analog_idx != -1l && (double) d * HYDRODISK_CELL_RADIUS_WIDTH >
+			min_dr + 1.e-9) break;
 	}
 
 	return analog_idx;
@@ -783,7 +1254,8 @@ static double final_radius(HYDRODISKSTARS hds, double birth_radius,
 		 * in radius. This is more reflective of the dynamical history of the
 		 * star particle.
 		 */
-		dr = hds.final_radii[analog_idx] - hds.birth_radii[analog_idx];
+		unsigned long row = hds.rows[analog_idx];
+		dr = hds.final_radii[row] - hds.birth_radii[row];
 	} else {
 		/* Although this shouldn't happen, let dr = 0 as a failsafe. */
 		dr = 0;
@@ -793,3 +1265,88 @@ static double final_radius(HYDRODISKSTARS hds, double birth_radius,
 
 }
 
+
+/*
+ * Determine which cell along one axis of the grid constructed by
+ * hydrodiskstars_index a given value falls in.
+ *
+ * Parameters
+ * ==========
+ * value: 		The birth time or birth radius
+ * minimum: 	The value at the edge of the first cell
+ * width: 		The width of each cell
+ * n_cells: 	The number of cells along this axis
+ *
+ * Returns
+ * =======
+ * The cell number, limited to the range of the grid such that values off
+ * the grid are assigned to the first or last cell.
+ */
+static unsigned long cell_number(double value, double minimum, double width,
+	unsigned long n_cells) {
+
+	double x = (value - minimum) / width;
+	if (x < 0) {
+		return 0ul;
+	} else if (x >= n_cells) {
+		return n_cells - 1ul;
+	} else {
+		return (unsigned long) x;
+	}
+
+}
+
+
+/*
+ * Determine the distance along one axis of the grid constructed by
+ * hydrodiskstars_index between a given value and the nearest edge of a
+ * given cell.
+ *
+ * Parameters
+ * ==========
+ * value: 		The birth time or birth radius
+ * minimum: 	The value at the edge of the first cell
+ * width: 		The width of each cell
+ * cell: 		The cell number
+ *
+ * Returns
+ * =======
+ * The distance to the nearest edge of the cell, or zero if the value falls
+ * within it.
+ */
+static double cell_distance(double value, double minimum, double width,
+	unsigned long cell) {
+
+	double lower = minimum + cell * width;
+	if (value < lower) {
+		return lower - value;
+	} else if (value > lower + width) {
+		return value - lower - width;
+	} else {
+		return 0;
+	}
+
+}
+
+
+/*
+ * Compare two star particle indices for sorting with qsort.
+ *
+ * Parameters
+ * ==========
+ * a: 		A pointer to the first index
+ * b: 		A pointer to the second index
+ *
+ * Returns
+ * =======
+ * -1, 0, or 1 if the first index is less than, equal to, or greater than the
+ * second, respectively.
+ */
+static int compare_indices(const void *a, const void *b) {
+
+	unsigned long x = *((const unsigned long *) a);
+	unsigned long y = *((const unsigned long *) b);
+	return (x > y) - (x < y);
+
+}
+
@@ -70,6 +70,30 @@ extern "C" {
 #define HYDRODISK_END_TIME 13.2
 #endif /* HYDRODISK_END_TIME */
 
+/*
+ * The width in Gyr of each cell along the birth time axis of the grid which
+ * star particles are sorted onto for candidate analog searches.
+ */
+#ifndef HYDRODISK_CELL_TIME_WIDTH
+#define HYDRODISK_CELL_TIME_WIDTH 0.100
+#endif /* HYDRODISK_CELL_TIME_WIDTH */
+
+/*
+ * The width in kpc of each cell along the birth radius axis of the grid which
+ * star particles are sorted onto for candidate analog searches.
+ */
+#ifndef HYDRODISK_CELL_RADIUS_WIDTH
+#define HYDRODISK_CELL_RADIUS_WIDTH 0.100
+#endif /* HYDRODISK_CELL_RADIUS_WIDTH */
+
+/*
+ * The name of the binary cache of the star particle data, written to the
+ * same directory as the ascii files the first time they are imported.
+ */
+#ifndef HYDRODISK_CACHE_FILE
+#define HYDRODISK_CACHE_FILE "subsamples.bin"
+#endif /* HYDRODISK_CACHE_FILE */
+
 #include "../objects.h"
 
 /*
@@ -95,6 +119,16 @@ extern "C" {
  * =======
  * 1 on success, 0 on failure
  *
+ * Notes
+ * =====
+ * The first import writes every subsample to a binary cache in the same
+ * directory (see HYDRODISK_CACHE_FILE), which is rewritten if any of the
+ * ascii files are modified afterwards. Subsequent imports map the cache into
+ * memory, such that hydrodiskstars objects, including those in different
+ * processes, share the data rather than each parsing and storing a copy.
+ * The subsamples are selected in the same manner either way, with the rows
+ * attribute recording the star particles in the sample.
+ *
  * source: hydrodiskstars.c
  */
 extern unsigned short hydrodiskstars_import(HYDRODISKSTARS *hds,
@@ -120,11 +154,40 @@ extern unsigned short hydrodiskstars_import(HYDRODISKSTARS *hds,
  * =======
  * 1 on success, 0 on failure
  *
+ * Notes
+ * =====
+ * Only the rows of the star particles in the sample are modified; the data
+ * themselves are left in place.
+ *
  * source: hydrodiskstars.c
  */
 extern unsigned short hydrodiskstars_decomp_filter(HYDRODISKSTARS *hds,
 	unsigned short *decomp_values, unsigned short n_decomp_values);
 
+/*
+ * Sort the star particles in a hydrodiskstars object onto a grid in birth
+ * time and birth radius, allowing candidate analog searches to assess only
+ * the star particles in the cells which overlap the search window.
+ *
+ * Parameters
+ * ==========
+ * hds: 		A pointer to the hydrodiskstars object to index
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * Notes
+ * =====
+ * hydrodiskstars_import and hydrodiskstars_decomp_filter call this function
+ * once they have modified the star particle data, replacing any previous
+ * index. Within each cell, star particles are stored in the order in which
+ * they appear in the data.
+ *
+ * source: hydrodiskstars.c
+ */
+extern unsigned short hydrodiskstars_index(HYDRODISKSTARS *hds);
+
 /*
  * Find an analog star particle from the hydrodynamical simulation given a
  * birth radius and time of a stellar population in a multizone simulation.
@@ -147,6 +210,12 @@ extern unsigned short hydrodiskstars_decomp_filter(HYDRODISKSTARS *hds,
  * the one with the smallest change in birth radius that still satisfies the
  * T +/- 500 Myr criterion.
  *
+ * Each search assesses only the star particles in the cells of the grid
+ * constructed by hydrodiskstars_index which overlap the search window, and
+ * the candidates are taken in the order in which they appear in the data.
+ * The analog assigned is therefore the same as if every star particle were
+ * assessed.
+ *
  * source: hydrodiskstars.c
  */
 extern long hydrodiskstars_find_analog(HYDRODISKSTARS hds, double birth_radius,
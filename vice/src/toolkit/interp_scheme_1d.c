@@ -6,6 +6,9 @@
 #include "interp_scheme_1d.h"
 #include "../utils.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static double evaluate_bin(INTERP_SCHEME_1D is1d, double x, long bin);
+
 
 /*
  * Evaluate an interp_scheme_1d object at some value of the x-coordinate.
@@ -24,7 +27,57 @@
  */
 extern double interp_scheme_1d_evaluate(INTERP_SCHEME_1D is1d, double x) {
 
-	long bin = get_bin_number(is1d.xcoords, is1d.n_points - 1ul, x);
+	return evaluate_bin(is1d, x,
+		get_bin_number(is1d.xcoords, is1d.n_points - 1ul, x));
+
+}
+
+
+/*
+ * Evaluate an interp_scheme_1d object at each of an array of x-coordinates.
+ *
+ * Parameters
+ * ==========
+ * is1d: 		The interp_scheme_1d object to evaluate as a function.
+ * x: 			The values of the x-coordinate to evaluate at.
+ * n: 			The number of elements in x.
+ * result: 		The array to store is1d(x) at each x-coordinate in, of the
+ * 				same length as x.
+ *
+ * header: interp_scheme_1d.h
+ */
+extern void interp_scheme_1d_evaluate_array(INTERP_SCHEME_1D is1d,
+	const double *x, unsigned long n, double *result) {
+
+	unsigned long i, num_bins = is1d.n_points - 1ul;
+	double width = uniform_bin_width(is1d.xcoords, num_bins);
+	if (width) {
+		for (i = 0ul; i < n; i++) result[i] = evaluate_bin(is1d, x[i],
+			get_bin_number_uniform(is1d.xcoords, num_bins, width, x[i]));
+	} else {
+		for (i = 0ul; i < n; i++) result[i] = evaluate_bin(is1d, x[i],
+			get_bin_number(is1d.xcoords, num_bins, x[i]));
+	}
+
+}
+
+
+/*
+ * Evaluate an interp_scheme_1d object at some value of the x-coordinate
+ * whose bin number on the grid is already known.
+ *
+ * Parameters
+ * ==========
+ * is1d: 		The interp_scheme_1d object to evaluate as a function.
+ * x: 			The value of the x-coordinate to evaluate at.
+ * bin: 		The bin number of x, as determined by get_bin_number.
+ *
+ * Returns
+ * =======
+ * is1d(x), extrapolating off of the first or last two points if bin is -1.
+ */
+static double evaluate_bin(INTERP_SCHEME_1D is1d, double x, long bin) {
+
 	if (bin == -1l) {
 		/*
 		 * The x-coordinate is either larger than the largest x-coordinate or
@@ -48,4 +101,3 @@ extern double interp_scheme_1d_evaluate(INTERP_SCHEME_1D is1d, double x) {
 		is1d.ycoords[bin], is1d.ycoords[bin + 1l], x);
 
 }
-
@@ -25,6 +25,28 @@ extern "C" {
  */
 extern double interp_scheme_1d_evaluate(INTERP_SCHEME_1D is1d, double x);
 
+/*
+ * Evaluate an interp_scheme_1d object at each of an array of x-coordinates.
+ *
+ * Parameters
+ * ==========
+ * is1d: 		The interp_scheme_1d object to evaluate as a function.
+ * x: 			The values of the x-coordinate to evaluate at.
+ * n: 			The number of elements in x.
+ * result: 		The array to store is1d(x) at each x-coordinate in, of the
+ * 				same length as x.
+ *
+ * Notes
+ * =====
+ * The result is the same as calling interp_scheme_1d_evaluate at each
+ * x-coordinate. If the x-coordinates of the scheme are evenly spaced, the
+ * bin number of each x-coordinate is computed rather than searched for.
+ *
+ * source: interp_scheme_1d.c
+ */
+extern void interp_scheme_1d_evaluate_array(INTERP_SCHEME_1D is1d,
+	const double *x, unsigned long n, double *result);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
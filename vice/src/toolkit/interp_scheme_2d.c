@@ -6,6 +6,10 @@
 #include "interp_scheme_2d.h"
 #include "../utils.h"
 
+/* ---------- static function comment headers not duplicated here ---------- */
+static long extrapolating_bin(double *coords, unsigned long n_values,
+	double width, double value);
+
 
 /*
  * Evaluate an interp_scheme_2d object at some value of the x- and
@@ -27,43 +31,77 @@
 extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 	double y) {
 
-	long x_bin = get_bin_number(is2d.xcoords, is2d.n_x_values - 1ul, x);
-	long y_bin = get_bin_number(is2d.ycoords, is2d.n_y_values - 1ul, y);
+	return interp_scheme_2d_evaluate_bins(is2d, x, y,
+		interp_scheme_2d_x_bin(is2d, x), interp_scheme_2d_y_bin(is2d, y));
 
-	if (x_bin == -1l) {
-		/*
-		 * The x-coordinate is either larger than the largest x-coordinate or
-		 * smaller than the smallest one.
-		 */
-		if (x < is2d.xcoords[0]) {
-			x_bin = 0ul;
-		} else if (x > is2d.xcoords[is2d.n_x_values - 1ul]) {
-			x_bin = (signed) is2d.n_x_values - 2l;
-		} else {
-			/* error handling for manylinux1 distribution */
-			#ifdef NAN
-				return NAN;
-			#else
-				return 0;
-			#endif
-		}
-	}
+}
+
+
+/*
+ * Evaluate an interp_scheme_2d object at each of an array of x- and
+ * y-coordinates.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The values of the x-coordinate to evaluate at.
+ * y: 			The values of the y-coordinate to evaluate at, of the same
+ * 				length as x.
+ * n: 			The number of elements in x and y.
+ * result: 		The array to store is2d(x, y) at each pair of coordinates in,
+ * 				of the same length as x and y.
+ *
+ * header: interp_scheme_2d.h
+ */
+extern void interp_scheme_2d_evaluate_array(INTERP_SCHEME_2D is2d,
+	const double *x, const double *y, unsigned long n, double *result) {
+
+	/* The bin widths are zero on axes that are not evenly spaced */
+	double x_width = uniform_bin_width(is2d.xcoords, is2d.n_x_values - 1ul);
+	double y_width = uniform_bin_width(is2d.ycoords, is2d.n_y_values - 1ul);
 
-	/* Same check for the y-coordinate */
-	if (y_bin == -1l) {
-		if (y < is2d.ycoords[0]) {
-			y_bin = 0ul;
-		} else if (y > is2d.ycoords[is2d.n_y_values - 1ul]) {
-			y_bin = (signed) is2d.n_y_values - 2l;
-		} else {
-			#ifdef NAN
-				return NAN;
-			#else
-				return 0;
-			#endif
-		}
+	unsigned long i;
+	for (i = 0ul; i < n; i++) {
+		result[i] = interp_scheme_2d_evaluate_bins(is2d, x[i], y[i],
+			extrapolating_bin(is2d.xcoords, is2d.n_x_values, x_width, x[i]),
+			extrapolating_bin(is2d.ycoords, is2d.n_y_values, y_width, y[i]));
 	}
 
+}
+
+
+/*
+ * Evaluate an interp_scheme_2d object at some value of the x- and
+ * y-coordinates whose bin numbers on the grid are already known.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The value of the x-coordinate to evaluate at.
+ * y: 			The value of the y-coordinate to evaluate at.
+ * x_bin: 		The bin number of x, as determined by interp_scheme_2d_x_bin
+ * y_bin: 		The bin number of y, as determined by interp_scheme_2d_y_bin
+ *
+ * Returns
+ * =======
+ * is2d(x), the value of the function f(x, y) approximated via 2-D linear
+ * interpolation off the known (x, y, z) values of the interpolation scheme.
+ * NaN if either bin number is -1.
+ *
+ * header: interp_scheme_2d.h
+ */
+extern double interp_scheme_2d_evaluate_bins(INTERP_SCHEME_2D is2d, double x,
+	double y, long x_bin, long y_bin) {
+
+	if (x_bin == -1l || y_bin == -1l) {
+		/* error handling for manylinux1 distribution */
+		#ifdef NAN
+			return NAN;
+		#else
+			return 0;
+		#endif
+	} else {}
+
 	/* The x-, y-, and z-vals to conduct 2-D linear interpolation between */
 	double xvals[2] = {is2d.xcoords[x_bin], is2d.xcoords[x_bin + 1l]};
 	double yvals[2] = {is2d.ycoords[y_bin], is2d.ycoords[y_bin + 1l]};
@@ -76,3 +114,93 @@ extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 
 }
 
+
+/*
+ * Determine the bin number of an x-coordinate on the grid of an
+ * interp_scheme_2d object.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object
+ * x: 			The value of the x-coordinate
+ *
+ * Returns
+ * =======
+ * The bin number of x. Values below (above) the grid are assigned to the
+ * first (last) bin such that the scheme extrapolates off of them. -1 if x is
+ * not a number.
+ *
+ * header: interp_scheme_2d.h
+ */
+extern long interp_scheme_2d_x_bin(INTERP_SCHEME_2D is2d, double x) {
+
+	return extrapolating_bin(is2d.xcoords, is2d.n_x_values, 0, x);
+
+}
+
+
+/*
+ * Determine the bin number of a y-coordinate on the grid of an
+ * interp_scheme_2d object.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object
+ * y: 			The value of the y-coordinate
+ *
+ * Returns
+ * =======
+ * The bin number of y. Values below (above) the grid are assigned to the
+ * first (last) bin such that the scheme extrapolates off of them. -1 if y is
+ * not a number.
+ *
+ * header: interp_scheme_2d.h
+ */
+extern long interp_scheme_2d_y_bin(INTERP_SCHEME_2D is2d, double y) {
+
+	return extrapolating_bin(is2d.ycoords, is2d.n_y_values, 0, y);
+
+}
+
+
+/*
+ * Determine the bin number of a value on one axis of an interp_scheme_2d
+ * object, allowing for extrapolation off of the grid.
+ *
+ * Parameters
+ * ==========
+ * coords: 		The coordinates on the axis
+ * n_values: 	The number of coordinates on the axis
+ * width: 		The spacing between coordinates as determined by
+ * 				uniform_bin_width, or zero to search for the bin number.
+ * value: 		The value to find the bin number of
+ *
+ * Returns
+ * =======
+ * The bin number of value, or -1 if value is not a number
+ */
+static long extrapolating_bin(double *coords, unsigned long n_values,
+	double width, double value) {
+
+	long bin;
+	if (width) {
+		bin = get_bin_number_uniform(coords, n_values - 1ul, width, value);
+	} else {
+		bin = get_bin_number(coords, n_values - 1ul, value);
+	}
+
+	if (bin == -1l) {
+		/*
+		 * The value is either larger than the largest coordinate or smaller
+		 * than the smallest one.
+		 */
+		if (value < coords[0]) {
+			bin = 0l;
+		} else if (value > coords[n_values - 1ul]) {
+			bin = (signed) n_values - 2l;
+		} else {}
+	} else {}
+
+	return bin;
+
+}
@@ -28,6 +28,92 @@ extern "C" {
 extern double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x,
 	double y);
 
+/*
+ * Evaluate an interp_scheme_2d object at each of an array of x- and
+ * y-coordinates.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The values of the x-coordinate to evaluate at.
+ * y: 			The values of the y-coordinate to evaluate at, of the same
+ * 				length as x.
+ * n: 			The number of elements in x and y.
+ * result: 		The array to store is2d(x, y) at each pair of coordinates in,
+ * 				of the same length as x and y.
+ *
+ * Notes
+ * =====
+ * The result is the same as calling interp_scheme_2d_evaluate at each pair
+ * of coordinates. If the x- or y-coordinates of the scheme are evenly
+ * spaced, the bin numbers on that axis are computed rather than searched for.
+ *
+ * source: interp_scheme_2d.c
+ */
+extern void interp_scheme_2d_evaluate_array(INTERP_SCHEME_2D is2d,
+	const double *x, const double *y, unsigned long n, double *result);
+
+/*
+ * Evaluate an interp_scheme_2d object at some value of the x- and
+ * y-coordinates whose bin numbers on the grid are already known.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object to evaluate as a function.
+ * x: 			The value of the x-coordinate to evaluate at.
+ * y: 			The value of the y-coordinate to evaluate at.
+ * x_bin: 		The bin number of x, as determined by interp_scheme_2d_x_bin
+ * y_bin: 		The bin number of y, as determined by interp_scheme_2d_y_bin
+ *
+ * Returns
+ * =======
+ * is2d(x), the value of the function f(x, y) approximated via 2-D linear
+ * interpolation off the known (x, y, z) values of the interpolation scheme.
+ * NaN if either bin number is -1.
+ *
+ * source: interp_scheme_2d.c
+ */
+extern double interp_scheme_2d_evaluate_bins(INTERP_SCHEME_2D is2d, double x,
+	double y, long x_bin, long y_bin);
+
+/*
+ * Determine the bin number of an x-coordinate on the grid of an
+ * interp_scheme_2d object.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object
+ * x: 			The value of the x-coordinate
+ *
+ * Returns
+ * =======
+ * The bin number of x. Values below (above) the grid are assigned to the
+ * first (last) bin such that the scheme extrapolates off of them. -1 if x is
+ * not a number.
+ *
+ * source: interp_scheme_2d.c
+ */
+extern long interp_scheme_2d_x_bin(INTERP_SCHEME_2D is2d, double x);
+
+/*
+ * Determine the bin number of a y-coordinate on the grid of an
+ * interp_scheme_2d object.
+ *
+ * Parameters
+ * ==========
+ * is2d: 		The interp_scheme_2d object
+ * y: 			The value of the y-coordinate
+ *
+ * Returns
+ * =======
+ * The bin number of y. Values below (above) the grid are assigned to the
+ * first (last) bin such that the scheme extrapolates off of them. -1 if y is
+ * not a number.
+ *
+ * source: interp_scheme_2d.c
+ */
+extern long interp_scheme_2d_y_bin(INTERP_SCHEME_2D is2d, double y);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
@@ -343,6 +343,79 @@ extern long get_bin_number(double *binspace, unsigned long num_bins,
 }
 
 
+/*
+ * Determine whether or not an array of bin edges is evenly spaced.
+ *
+ * Parameters
+ * ==========
+ * binspace: 		A pointer to the bin edges
+ * num_bins: 		The number of bins in the binspace. This should always be
+ * 					1 less than the number of elements in this array.
+ *
+ * Returns
+ * =======
+ * The width of each bin if every edge lies within UNIFORM_BINSPACE_TOLERANCE
+ * bin widths of where it would on an evenly spaced grid between the first
+ * and last edges. 0 otherwise.
+ *
+ * header: utils.h
+ */
+extern double uniform_bin_width(double *binspace, unsigned long num_bins) {
+
+	if (!num_bins) return 0;
+	double width = (binspace[num_bins] - binspace[0]) / num_bins;
+	if (!(width > 0)) return 0;
+
+	unsigned long i;
+	for (i = 1ul; i < num_bins; i++) {
+		if (absval(binspace[i] - binspace[0] - i * width) >
+			UNIFORM_BINSPACE_TOLERANCE * width) return 0;
+	}
+	return width;
+
+}
+
+
+/*
+ * Gets the bin number for a given value in an evenly spaced array of bin
+ * edges without searching through them.
+ *
+ * Parameters
+ * ==========
+ * binspace: 		A pointer to the bin edges
+ * num_bins: 		The number of bins in the binspace. This should always be
+ * 					1 less than the number of elements in this array.
+ * width: 			The width of each bin, as determined by uniform_bin_width
+ * value: 			The value to find the bin number for
+ *
+ * Returns
+ * =======
+ * The same as get_bin_number. -1l if the value does not lie in the given
+ * binspace or is not a number.
+ *
+ * header: utils.h
+ */
+extern long get_bin_number_uniform(double *binspace, unsigned long num_bins,
+	double width, double value) {
+
+	if (!(value >= binspace[0] && value <= binspace[num_bins])) return -1l;
+
+	long idx = (long) ((value - binspace[0]) / width);
+	if (idx > (signed) num_bins - 1l) idx = (signed) num_bins - 1l;
+
+	/*
+	 * Because the edges are within UNIFORM_BINSPACE_TOLERANCE bin widths of
+	 * an even grid, these loops take at most one step. They ensure that the
+	 * first edge larger than or equal to the value is at idx + 1 as in
+	 * get_bin_number.
+	 */
+	while (idx > 0l && binspace[idx] >= value) idx--;
+	while (binspace[idx + 1l] < value) idx++;
+	return idx;
+
+}
+
+
 /*
  * Determine the metallicity by mass of the ISM. This is not simply the sum
  * of the total metallicities by mass of each individual element. VICE employs
@@ -11,6 +11,15 @@ extern "C" {
 
 #include "objects.h"
 
+/*
+ * The maximum departure of a bin edge from an evenly spaced grid, in units
+ * of the bin width, for which uniform_bin_width considers the edges evenly
+ * spaced.
+ */
+#ifndef UNIFORM_BINSPACE_TOLERANCE
+#define UNIFORM_BINSPACE_TOLERANCE 1e-3
+#endif /* UNIFORM_BINSPACE_TOLERANCE */
+
 extern unsigned long (*checksum)(char *);
 
 /*
@@ -208,6 +217,54 @@ extern double interpolate_sqrt(double x1, double x2, double y1, double y2,
 extern long get_bin_number(double *binspace, unsigned long num_bins,
 	double value);
 
+/*
+ * Determine whether or not an array of bin edges is evenly spaced.
+ *
+ * Parameters
+ * ==========
+ * binspace: 		A pointer to the bin edges
+ * num_bins: 		The number of bins in the binspace. This should always be
+ * 					1 less than the number of elements in this array.
+ *
+ * Returns
+ * =======
+ * The width of each bin if every edge lies within UNIFORM_BINSPACE_TOLERANCE
+ * bin widths of where it would on an evenly spaced grid between the first
+ * and last edges. 0 otherwise.
+ *
+ * source: utils.c
+ */
+extern double uniform_bin_width(double *binspace, unsigned long num_bins);
+
+/*
+ * Gets the bin number for a given value in an evenly spaced array of bin
+ * edges without searching through them.
+ *
+ * Parameters
+ * ==========
+ * binspace: 		A pointer to the bin edges
+ * num_bins: 		The number of bins in the binspace. This should always be
+ * 					1 less than the number of elements in this array.
+ * width: 			The width of each bin, as determined by uniform_bin_width
+ * value: 			The value to find the bin number for
+ *
+ * Returns
+ * =======
+ * The same as get_bin_number, to which this is equivalent for any binspace
+ * with a nonzero return value from uniform_bin_width. -1l if the value does
+ * not lie in the given binspace or is not a number.
+ *
+ * Notes
+ * =====
+ * The bin number is computed from the distance to the first edge, then
+ * compared against the neighboring edges to correct for any round-off error
+ * or small departures from even spacing, so the result is always exact.
+ *
+ * source: utils.c
+ */
+extern long get_bin_number_uniform(double *binspace, unsigned long num_bins,
+	double width, double value);
+
 /*
  * Determine the metallicity by mass of the ISM. This is not simply the sum
  * of the total metallicities by mass of each individual element. VICE employs
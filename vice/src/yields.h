@@ -27,6 +27,11 @@ extern "C" {
 #define SIMPSON 777
 #endif /* SIMPSON */
 
+/* hash-code for adaptive 21-point Gauss-Kronrod quadrature */
+#ifndef GK21
+#define GK21 309
+#endif /* GK21 */
+
 #include "objects.h"
 #include "objects/integral.h"
 #include "objects/ccsne.h"
@@ -1,10 +1,22 @@
 /*
  * This file implements the calculations of IMF-averaged yields from core
  * collapse supernovae (CCSNe).
+ *
+ * Notes
+ * =====
+ * Each calculation carries its yield table, IMF, explodability and progenitor
+ * abundance in a context passed to the integrands as the params of their
+ * integral objects, so any number of calculations may run concurrently.
+ * Custom IMFs and explodability models defined in python are evaluated via
+ * callback objects (see callback_1arg in vice/core/_cutils.pyx), which
+ * acquire the global interpreter lock before calling python. Calculations
+ * which call python therefore run concurrently with the others, but not with
+ * one another.
  */
 
 #include <stdlib.h>
 #include <string.h>
+#include <pthread.h>
 #include "../callback.h"
 #include "../yields.h"
 #include "../io.h"
@@ -16,211 +28,355 @@
 #include "../debug.h"
 #include "ccsne.h"
 
-/* ---------- static function comment headers not duplicated here ---------- */
-static void setup_calculation(IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element);
-static void zero_wind_yield_grid(void);
-static double interpolate_yield(double m);
-static double y_cc_numerator(double m);
-static double y_cc_denominator(double m);
+typedef struct yield_table {
 
+	/*
+	 * The mass yields of one element from one study at one metallicity and
+	 * rotational velocity.
+	 *
+	 * explosive: The stellar mass - element yield from the explosion
+	 * wind: The stellar mass - element yield from the wind
+	 * size: The number of stellar masses on which the yields are sampled
+	 */
 
-/*
- * These variables are declared globally in this file because it is easier for
- * quadrature functions to be able to access them while still only taking one
- * parameter.
- *
- * GRID: 			The stellar mass - element yield from the explosion
- * WIND: 			The stellar mass - element yield from the wind
- * GRIDSIZE:		The number of stellar masses on which the yield grid is
- * 					sampled
- * IMF: 			The assumed stellar IMF's corresponding object
- * EXPLODABILITY: 	The fractions of stars that explode in those mass ranges
- * Z_PROGENITOR: 	Z_x of the progenitor stars for the element x.
- * WEIGHT_INITIAL: 	A boolean int describing whether or not to weight the
- * 					initial composition by explodability
- * TESTING: 		A global testing status: 1 if testing, 0 if not.
- */
-static double **GRID;
-static double **WIND;
-static unsigned int GRIDSIZE = 0;
-static IMF_ *IMF = NULL;
-static CALLBACK_1ARG *EXPLODABILITY = NULL;
-static double Z_PROGENITOR;
-static unsigned short WEIGHT_INITIAL;
+	double **explosive;
+	double **wind;
+	unsigned int size;
+
+} YIELD_TABLE;
+
+typedef struct yield_context {
+
+	/*
+	 * The state of one IMF-averaged yield calculation, passed to the
+	 * integrands as the params of the integral objects.
+	 *
+	 * table: The yield table to interpolate
+	 * specs: The specifications of the calculation
+	 */
+
+	YIELD_TABLE *table;
+	CCSNE_YIELD_INTEGRAL *specs;
+
+} YIELD_CONTEXT;
+
+typedef struct yield_queue {
+
+	/*
+	 * The state shared between the threads computing a batch of yields.
+	 *
+	 * yields: The yields to compute
+	 * tables: The yield table for each element of yields
+	 * n: The number of yields to compute
+	 * next: The index of the next yield to hand out to a thread
+	 * lock: A mutex controlling access to next
+	 */
+
+	CCSNE_YIELD_INTEGRAL *yields;
+	YIELD_TABLE **tables;
+	unsigned long n;
+	unsigned long next;
+	pthread_mutex_t lock;
+
+} YIELD_QUEUE;
+
+/* ---------- static function comment headers not duplicated here ---------- */
+static void *yield_worker(void *arg);
+static void compute_yield(CCSNE_YIELD_INTEGRAL *specs, YIELD_TABLE *table);
+static YIELD_TABLE *read_yield_table(CCSNE_YIELD_INTEGRAL specs);
+static double **zero_wind_yield_grid(double **explosive, unsigned int size);
+static void yield_table_free(YIELD_TABLE *table);
+static double explodability(YIELD_CONTEXT context, double m);
+static double interpolate_yield(YIELD_CONTEXT context, double m);
+static double y_cc_numerator(double m, void *context);
+static double y_cc_denominator(double m, void *context);
 
 
 /*
- * Weight the initial composition of each star by explodability. This ensures
- * that net yields are not reported as negative when the study did not
- * separate wind and explosive yields.
+ * Compute a batch of IMF-averaged fractional yields from CCSNe, distributing
+ * them across a number of threads.
  *
  * Parameters
  * ==========
- * 1 to weight the initial composition by explodability, 0 to not.
+ * yields: 		The specifications of each yield to compute. The results are
+ * 				stored in their numerator and denominator integral objects,
+ * 				and the values returned by quad in their status fields.
+ * n: 			The number of yields to compute
+ * n_threads: 	The number of threads to use. If 1, the yields are computed
+ * 				one at a time by the calling thread.
+ *
+ * Notes
+ * =====
+ * Each yield table is read from disk once per batch, no matter how many
+ * yields share it. The results are independent of the number of threads.
  *
  * header: ccsne.h
  */
-extern void weight_initial_by_explodability(unsigned short weight) {
+extern void IMFintegrated_fractional_yields(CCSNE_YIELD_INTEGRAL *yields,
+	unsigned long n, unsigned int n_threads) {
 
 	trace_print();
-	debug_print("weight = %u\n", weight);
-	WEIGHT_INITIAL = weight;
+	unsigned long i, j;
+	YIELD_TABLE **tables = (YIELD_TABLE **) malloc (n *
+		sizeof(YIELD_TABLE *));
+	for (i = 0ul; i < n; i++) {
+		tables[i] = NULL;
+		for (j = 0ul; j < i; j++) {
+			if (!strcmp(yields[i].path, yields[j].path) &&
+				!strcmp(yields[i].element, yields[j].element) &&
+				yields[i].wind == yields[j].wind) {
+				tables[i] = tables[j];
+				break;
+			} else {}
+		}
+		if (tables[i] == NULL) tables[i] = read_yield_table(yields[i]);
+	}
+
+	YIELD_QUEUE queue;
+	queue.yields = yields;
+	queue.tables = tables;
+	queue.n = n;
+	queue.next = 0ul;
+	pthread_mutex_init(&queue.lock, NULL);
+
+	/*
+	 * As in zone_tasks (see vice/src/multizone/parallel.c), the calling
+	 * thread works through the queue alongside n_threads - 1 others.
+	 */
+	unsigned int k, n_started = 0u;
+	if (n_threads > n) n_threads = (unsigned) n;
+	if (!n_threads) n_threads = 1u;
+	pthread_t *threads = (pthread_t *) malloc (n_threads * sizeof(pthread_t));
+	for (k = 1u; k < n_threads; k++) {
+		if (!pthread_create(&threads[n_started], NULL, &yield_worker,
+			&queue)) {
+			n_started++;
+		} else break;
+	}
+	yield_worker(&queue);
+	for (k = 0u; k < n_started; k++) pthread_join(threads[k], NULL);
+	free(threads);
+	pthread_mutex_destroy(&queue.lock);
+
+	/* each table is freed by the first yield that uses it */
+	for (i = 0ul; i < n; i++) {
+		if (tables[i] == NULL) continue;
+		for (j = i + 1ul; j < n; j++) {
+			if (tables[j] == tables[i]) tables[j] = NULL;
+		}
+		yield_table_free(tables[i]);
+	}
+	free(tables);
 
 }
 
 
 /*
- * Set the value of the progenitor stars abundance by mass Z_x for the element
- * x whose net yield is being calculated.
+ * Compute yields from the queue until there are none left.
  *
  * Parameters
  * ==========
- * Z: 		The initial abundance Z_x itself
+ * arg: 		A pointer to the yield queue
  *
- * header: ccsne.h
+ * Returns
+ * =======
+ * NULL
  */
-extern void set_Z_progenitor(double Z) {
-
-	trace_print();
-	debug_print("Z = %.5e\n", Z);
-	Z_PROGENITOR = Z;
+static void *yield_worker(void *arg) {
+
+	YIELD_QUEUE *queue = (YIELD_QUEUE *) arg;
+	while (1) {
+		pthread_mutex_lock(&(queue -> lock));
+		unsigned long i = (*queue).next++;
+		pthread_mutex_unlock(&(queue -> lock));
+		if (i >= (*queue).n) break;
+		compute_yield(&((*queue).yields[i]), (*queue).tables[i]);
+	}
+	return NULL;
 
 }
 
 
 /*
- * Determine the value of the integrated IMF weighted by the mass yield of a
- * given element, up to the normalization of the IMF.
+ * Compute the numerator and denominator of one IMF-averaged fractional yield.
  *
  * Parameters
  * ==========
- * intgrl: 			The integral object for the numerator of the yield
- * imf:				The associated IMF object
- * explodability: 	Stellar explodability as a function of mass
- * path:			The nme of the data file containing the grid
- * wind: 			Boolean int describing whether or not to include winds
- * element: 		The symbol of the element
- *
- * Returns
- * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h).
- *
- * header: ccsne.h
+ * specs: 		The specifications of the yield, in which the results are
+ * 				stored
+ * table: 		The yield table of the element, or NULL if it could not be
+ * 				read, in which case the status of both integrals is set to 3
  */
-extern unsigned short IMFintegrated_fractional_yield_numerator(
-	INTEGRAL *intgrl, IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element) {
+static void compute_yield(CCSNE_YIELD_INTEGRAL *specs, YIELD_TABLE *table) {
 
 	trace_print();
-	setup_calculation(imf, explodability, path, wind, element);
-	intgrl -> func = &y_cc_numerator;
-	int x = quad(intgrl);
-	free(GRID);
-	free(WIND);
-	intgrl -> func = NULL;
-	GRIDSIZE = 0;
-	IMF = NULL;
-	return x;
+	if (table == NULL) {
+		specs -> numerator_status = 3u;
+		specs -> denominator_status = 3u;
+		return;
+	} else {}
+
+	YIELD_CONTEXT context;
+	context.table = table;
+	context.specs = specs;
+
+	/*
+	 * The yields are interpolated linearly between the masses on the grid,
+	 * and they're zero below the minimum mass for core collapse. Adaptive
+	 * methods split the range of integration at these masses such that the
+	 * kinks in the integrand never fall inside of a subinterval.
+	 */
+	unsigned int i;
+	INTEGRAL *num = (*specs).numerator;
+	num -> func = &y_cc_numerator;
+	num -> params = &context;
+	num -> n_breakpoints = (*table).size + 1ul;
+	num -> breakpoints = (double *) malloc ((*num).n_breakpoints *
+		sizeof(double));
+	num -> breakpoints[0] = CC_MIN_STELLAR_MASS;
+	for (i = 0u; i < (*table).size; i++) {
+		num -> breakpoints[i + 1u] = (*table).explosive[i][0];
+	}
+	specs -> numerator_status = quad(num);
+	free(num -> breakpoints);
+	num -> breakpoints = NULL;
+	num -> n_breakpoints = 0ul;
+	num -> func = NULL;
+	num -> params = NULL;
+
+	INTEGRAL *den = (*specs).denominator;
+	den -> func = &y_cc_denominator;
+	den -> params = &context;
+	specs -> denominator_status = quad(den);
+	den -> func = NULL;
+	den -> params = NULL;
 
 }
 
 
 /*
- * Setup the yield calculation by initializing all of the necessary global
- * variables.
+ * Read the yield table for the element of a given yield calculation.
  *
  * Parameters
  * ==========
- * imf:				The associated IMF object
- * explodability: 	Stellar explodability as a function of mass
- * path:			The nme of the data file containing the grid
- * wind: 			Boolean int describing whether or not to include winds
- * element: 		The symbol of the element
+ * specs: 		The specifications of the yield calculation
+ *
+ * Returns
+ * =======
+ * The yield table, or NULL if the explosive yields could not be read. If
+ * specs.wind is 0, the wind yields are taken to be zero.
  */
-static void setup_calculation(IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element) {
+static YIELD_TABLE *read_yield_table(CCSNE_YIELD_INTEGRAL specs) {
 
 	trace_print();
-
-	/*
-	 * Initialize these variables globally. This is such that the function
-	 * which executes numerical quadrature can accept only one parameter - the
-	 * ZAMS mass of the progenitor.
-	 */
 	char *file = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
-	strcpy(file, path);
+	strcpy(file, specs.path);
 	strcat(file, "explosive/");
-	strcat(file, element);
+	strcat(file, specs.element);
 	strcat(file, ".dat");
 	debug_print("Explosive yield file: %s\n", file);
 
-	GRIDSIZE = line_count(file) - header_length(file);
-	GRID = cc_yield_grid(file);
+	YIELD_TABLE *table = (YIELD_TABLE *) malloc (sizeof(YIELD_TABLE));
+	int size = line_count(file) - header_length(file);
+	table -> explosive = size > 1 ? cc_yield_grid(file) : NULL;
+	free(file);
+	if ((*table).explosive == NULL) {
+		free(table);
+		return NULL;
+	} else {
+		table -> size = (unsigned) size;
+	}
 
-	if (wind) {
+	if (specs.wind) {
 		char *wind = (char *) malloc (MAX_FILENAME_SIZE * sizeof(char));
-		strcpy(wind, path);
+		strcpy(wind, specs.path);
 		strcat(wind, "wind/");
-		strcat(wind, element);
+		strcat(wind, specs.element);
 		strcat(wind, ".dat");
 		debug_print("Wind yield file: %s\n", wind);
-		WIND = cc_yield_grid(wind);
+		table -> wind = cc_yield_grid(wind);
 		free(wind);
 	} else {
-		zero_wind_yield_grid();
+		table -> wind = NULL;
 	}
+	if ((*table).wind == NULL) table -> wind = zero_wind_yield_grid(
+		(*table).explosive, (*table).size);
 
-	IMF = imf;
-	EXPLODABILITY = explodability;
+	return table;
 
 }
 
 
 /*
- * Determine the value of the integrated IMF weighted by stellar mass, up to
- * the normalization of the IMF.
+ * Obtain a grid of zero wind yields in the event that the user is neglecting
+ * the wind yields in this calculation.
  *
  * Parameters
  * ==========
- * intgrl: 		The integral object for the denominator of the yield
- * imf:			The associated IMF object
+ * explosive: 	The explosive yields, whose masses the wind yields take on
+ * size: 		The number of masses on the grid
  *
  * Returns
  * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h)
- *
- * header: ccsne.c
+ * The stellar mass - wind yield grid, with every yield set to zero
  */
-extern unsigned short IMFintegrated_fractional_yield_denominator(
-	INTEGRAL *intgrl, IMF_ *imf) {
+static double **zero_wind_yield_grid(double **explosive, unsigned int size) {
 
 	trace_print();
-	IMF = imf;
-	intgrl -> func = &y_cc_denominator;
-	int x = quad(intgrl);
-	intgrl -> func = NULL;
-	IMF = NULL;
-	return x;
+	unsigned int i;
+	double **wind = (double **) malloc (size * sizeof(double *));
+	for (i = 0u; i < size; i++) {
+		wind[i] = (double *) malloc (2 * sizeof(double));
+		wind[i][0] = explosive[i][0];
+		wind[i][1] = 0.0;
+	}
+	return wind;
 
 }
 
 
 /*
- * Initialize the wind yield to a grid of zeroes in the event that the user
- * is neglecting the wind yields in this calculation.
+ * Free up the memory stored by a yield table.
+ *
+ * Parameters
+ * ==========
+ * table: 		The yield table to free
  */
-static void zero_wind_yield_grid(void) {
+static void yield_table_free(YIELD_TABLE *table) {
 
-	trace_print();
-	unsigned int i;
-	WIND = (double **) malloc (GRIDSIZE * sizeof(double *));
-	for (i = 0u; i < GRIDSIZE; i++) {
-		WIND[i] = (double *) malloc (2 * sizeof(double));
-		WIND[i][0] = GRID[i][0];
-		WIND[i][1] = 0.0;
+	if (table != NULL) {
+		unsigned int i;
+		for (i = 0u; i < (*table).size; i++) {
+			free(table -> explosive[i]);
+			free(table -> wind[i]);
+		}
+		free(table -> explosive);
+		free(table -> wind);
+		free(table);
+	} else {}
+
+}
+
+
+/*
+ * Determine the fraction of stars of a given mass which explode as CCSNe.
+ *
+ * Parameters
+ * ==========
+ * context: 	The yield calculation
+ * m: 			The mass of a star in Msun
+ *
+ * Returns
+ * =======
+ * The value of the explodability callback object at m, or 1 if there is
+ * none, in which case all stars above CC_MIN_STELLAR_MASS explode.
+ */
+static double explodability(YIELD_CONTEXT context, double m) {
+
+	if ((*context.specs).explodability != NULL) {
+		return callback_1arg_evaluate(*(*context.specs).explodability, m);
+	} else {
+		return 1;
 	}
 
 }
@@ -233,19 +389,24 @@ static void zero_wind_yield_grid(void) {
  *
  * Parameters
  * ==========
- * m: 		The mass of a star whose yield is to be interpolated
+ * context: 	The yield calculation
+ * m: 			The mass of a star whose yield is to be interpolated
  *
  * Returns
  * =======
  * The interpolated yield in Msun
  */
-static double interpolate_yield(double m) {
+static double interpolate_yield(YIELD_CONTEXT context, double m) {
 
 	trace_print();
 	if (m < CC_MIN_STELLAR_MASS) {
 		return 0;
 	} else {
 
+		double **grid = (*context.table).explosive;
+		double **wind = (*context.table).wind;
+		unsigned int size = (*context.table).size;
+
 		/*
 		 * The corrective term to subtract that accounts for initial abundances
 		 * in calculating net yields.
@@ -262,17 +423,18 @@ static double interpolate_yield(double m) {
 		 * rate-limiting addition to this calculation and is more resistent to
 		 * future bugs if the remnant mass parametrization changes.
 		 */
-		double initial = Z_PROGENITOR * (m - Kalirai08_remnant_mass(m));
-		if (WEIGHT_INITIAL) initial *= callback_1arg_evaluate(
-			*EXPLODABILITY, m);
+		double initial = (*context.specs).Z_progenitor * (m -
+			Kalirai08_remnant_mass(m));
+		if ((*context.specs).weight_initial) initial *= explodability(
+			context, m);
 
 		unsigned int i;
-		for (i = 0; i < GRIDSIZE; i++) {
+		for (i = 0; i < size; i++) {
 			/* if the mass itself is on the grid, just return that yield */
-			if (m == GRID[i][0]) {
+			if (m == grid[i][0]) {
 				return (
-					callback_1arg_evaluate(*EXPLODABILITY, m) * GRID[i][1] +
-					WIND[i][1] - initial
+					explodability(context, m) * grid[i][1] +
+					wind[i][1] - initial
 				);
 			} else {
 				continue;
@@ -280,16 +442,16 @@ static double interpolate_yield(double m) {
 		}
 
 		/*
-		 * Can't simply call get_bin_number because GRID is 2-dimensional
+		 * Can't simply call get_bin_number because the grid is 2-dimensional
 		 */
-		for (i = 0; i < GRIDSIZE - 1; i++) {
-			if (GRID[i][0] < m && m < GRID[i + 1][0]) {
+		for (i = 0; i < size - 1; i++) {
+			if (grid[i][0] < m && m < grid[i + 1][0]) {
 				return (
-					callback_1arg_evaluate(*EXPLODABILITY, m) *
-					interpolate(GRID[i][0], GRID[i + 1][0], GRID[i][1],
-						GRID[i + 1][1], m) +
-					interpolate(WIND[i][0], WIND[i + 1][0], WIND[i][1],
-						WIND[i + 1][1], m) -
+					explodability(context, m) *
+					interpolate(grid[i][0], grid[i + 1][0], grid[i][1],
+						grid[i + 1][1], m) +
+					interpolate(wind[i][0], wind[i + 1][0], wind[i][1],
+						wind[i + 1][1], m) -
 					initial
 				);
 			} else {
@@ -303,11 +465,11 @@ static double interpolate_yield(double m) {
 		 * yield linearly from the bottom two elements on the grid.
 		 */
 		return (
-			callback_1arg_evaluate(*EXPLODABILITY, m) *
-			interpolate(GRID[GRIDSIZE - 2][0], GRID[GRIDSIZE - 1][0],
-				GRID[GRIDSIZE - 2][1], GRID[GRIDSIZE - 1][1], m) +
-			interpolate(WIND[GRIDSIZE - 2][0], WIND[GRIDSIZE - 1][0],
-				WIND[GRIDSIZE - 2][1], WIND[GRIDSIZE - 1][1], m) -
+			explodability(context, m) *
+			interpolate(grid[size - 2][0], grid[size - 1][0],
+				grid[size - 2][1], grid[size - 1][1], m) +
+			interpolate(wind[size - 2][0], wind[size - 1][0],
+				wind[size - 2][1], wind[size - 1][1], m) -
 			initial
 		);
 	}
@@ -320,16 +482,19 @@ static double interpolate_yield(double m) {
  *
  * Paremeters
  * ==========
- * m: 		A stellar mass in Msun
+ * m: 			A stellar mass in Msun
+ * context: 	A pointer to the YIELD_CONTEXT of the calculation
  *
  * Returns
  * =======
  * The value of y(x) * dN/dm
  */
-static double y_cc_numerator(double m) {
+static double y_cc_numerator(double m, void *context) {
 
 	trace_print();
-	double result = interpolate_yield(m) * imf_evaluate(*IMF, m);
+	YIELD_CONTEXT *ctx = (YIELD_CONTEXT *) context;
+	double result = interpolate_yield(*ctx, m) * imf_evaluate(
+		*(*(*ctx).specs).imf, m);
 	debug_print("result = %.5e\n", result);
 	return result;
 
@@ -341,16 +506,18 @@ static double y_cc_numerator(double m) {
  *
  * Parameters
  * ==========
- * m: 		A stellar mass in Msun
+ * m: 			A stellar mass in Msun
+ * context: 	A pointer to the YIELD_CONTEXT of the calculation
  *
  * Returns
  * =======
  * The value of m * dN/dm
  */
-static double y_cc_denominator(double m) {
+static double y_cc_denominator(double m, void *context) {
 
 	trace_print();
-	double result = m * imf_evaluate(*IMF, m);
+	YIELD_CONTEXT *ctx = (YIELD_CONTEXT *) context;
+	double result = m * imf_evaluate(*(*(*ctx).specs).imf, m);
 	debug_print("result = %.5e\n", result);
 	return result;
 
@@ -8,73 +8,70 @@ extern "C" {
 
 #include "../objects.h"
 
-/*
- * Weight the initial composition of each star by explodability. This ensures
- * that net yields are not reported as negative when the study did not
- * separate wind and explosive yields.
- *
- * Parameters
- * ==========
- * 1 to weight the initial composition by explodability, 0 to not.
- *
- * source: ccsne.c
- */
-extern void weight_initial_by_explodability(unsigned short weight);
+typedef struct ccsne_yield_integral {
 
-/*
- * Set the value of the progenitor stars abundance by mass Z_x for the element
- * x whose net yield is being calculated.
- *
- * Parameters
- * ==========
- * Z: 		The initial abundance Z_x itself
- *
- * source: ccsne.c
- */
-extern void set_Z_progenitor(double Z);
+	/*
+	 * The specifications and results of one IMF-averaged fractional yield of
+	 * an element from core collapse supernovae.
+	 *
+	 * numerator: The integral object for the numerator of the yield. The
+	 * 		bounds, tolerance, method and number of bins must be assigned; the
+	 * 		integrand and its breakpoints are assigned internally.
+	 * denominator: The integral object for the denominator of the yield,
+	 * 		assigned in the same manner.
+	 * imf: The associated IMF object
+	 * explodability: Stellar explodability as a function of mass, or NULL if
+	 * 		all stars above CC_MIN_STELLAR_MASS explode
+	 * path: The directory containing the yield tables for the study,
+	 * 		metallicity and rotational velocity
+	 * element: The symbol of the element in lower-case
+	 * wind: Boolean int describing whether or not to include winds
+	 * Z_progenitor: The abundance by mass Z_x of the element in the
+	 * 		progenitor stars, subtracted from the yields to obtain net yields
+	 * weight_initial: 1 to weight the initial composition by explodability, 0
+	 * 		to not. This ensures that net yields are not reported as negative
+	 * 		when the study did not separate wind and explosive yields.
+	 * numerator_status: The value returned by quad for the numerator (see
+	 * 		integral.h), or 3 if the yield table could not be read
+	 * denominator_status: The same, for the denominator
+	 */
 
-/*
- * Determine the value of the integrated IMF weighted by the mass yield of a
- * given element, up to the normalization of the IMF.
- *
- * Parameters
- * ==========
- * intgrl: 			The integral object for the numerator of the yield
- * imf:				The associated IMF object
- * explodability: 	Stellar explodability as a function of mass
- * path:			The nme of the data file containing the grid
- * wind: 			Boolean int describing whether or not to include winds
- * element: 		The symbol of the element
- *
- * Returns
- * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h).
- *
- * source: ccsne.c
- */
-extern unsigned short IMFintegrated_fractional_yield_numerator(
-	INTEGRAL *intgrl, IMF_ *imf, CALLBACK_1ARG *explodability,
-	char *path, const unsigned short wind, char *element);
+	INTEGRAL *numerator;
+	INTEGRAL *denominator;
+	IMF_ *imf;
+	CALLBACK_1ARG *explodability;
+	char *path;
+	char *element;
+	unsigned short wind;
+	double Z_progenitor;
+	unsigned short weight_initial;
+	unsigned short numerator_status;
+	unsigned short denominator_status;
+
+} CCSNE_YIELD_INTEGRAL;
 
 /*
- * Determine the value of the integrated IMF weighted by stellar mass, up to
- * the normalization of the IMF.
+ * Compute a batch of IMF-averaged fractional yields from CCSNe, distributing
+ * them across a number of threads.
  *
  * Parameters
  * ==========
- * intgrl: 		The integral object for the denominator of the yield
- * imf:			The associated IMF object
+ * yields: 		The specifications of each yield to compute. The results are
+ * 				stored in their numerator and denominator integral objects,
+ * 				and the values returned by quad in their status fields.
+ * n: 			The number of yields to compute
+ * n_threads: 	The number of threads to use. If 1, the yields are computed
+ * 				one at a time by the calling thread.
  *
- * Returns
- * =======
- * 3 on an unrecognized IMF, otherwise the value returned by quad (see
- * quadrature.h)
+ * Notes
+ * =====
+ * Each yield table is read from disk once per batch, no matter how many
+ * yields share it. The results are independent of the number of threads.
  *
  * source: ccsne.c
  */
-extern unsigned short IMFintegrated_fractional_yield_denominator(
-	INTEGRAL *intgrl, IMF_ *imf);
+extern void IMFintegrated_fractional_yields(CCSNE_YIELD_INTEGRAL *yields,
+	unsigned long n, unsigned int n_threads);
 
 #ifdef __cplusplus
 }
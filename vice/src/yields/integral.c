@@ -6,15 +6,63 @@
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
+#include <float.h>
+#include <math.h>
 #include "../yields.h"
 #include "../utils.h"
 #include "../debug.h"
 
+/*
+ * The abscissae and weights of the 21-point Kronrod rule on [-1, 1] and the
+ * weights of the 10-point Gauss rule embedded within it, whose abscissae are
+ * every other Kronrod abscissa starting from the second. Only the
+ * non-negative half is listed, the rules being symmetric. Values are from
+ * QUADPACK (Piessens, de Doncker-Kapenga, Ueberhuber & Kahaner 1983).
+ */
+static const double GK21_XK[11] = {
+	0.995657163025808080735527280689003,
+	0.973906528517171720077964012084452,
+	0.930157491355708226001207180059508,
+	0.865063366688984510732096688423493,
+	0.780817726586416897063717578345042,
+	0.679409568299024406234327365114874,
+	0.562757134668604683339000099272694,
+	0.433395394129247190799265943165784,
+	0.294392862701460198131126603103866,
+	0.148874338981631210884826001129720,
+	0.000000000000000000000000000000000
+};
+static const double GK21_WK[11] = {
+	0.011694638867371874278064396062192,
+	0.032558162307964727478818972459390,
+	0.054755896574351996031381300244580,
+	0.075039674810919952767043140916190,
+	0.093125454583697605535065465083366,
+	0.109387158802297641899210590325805,
+	0.123491976262065851077715228895711,
+	0.134709217311473325928054001771707,
+	0.142775938577060080797094273138717,
+	0.147739104901338491374841515972068,
+	0.149445554002916905664936468389821
+};
+static const double GK21_WG[5] = {
+	0.066671344308688137593568809893332,
+	0.149451349150580593145776339657697,
+	0.219086362515982043995534934228163,
+	0.269266719309996355091226921569469,
+	0.295524224714752870173892994651338
+};
+
 /* ---------- static function comment headers not duplicated here ---------- */
 static double euler(INTEGRAL intgrl, unsigned long N);
 static double trapzd(INTEGRAL intgrl, unsigned long N);
 static double midpt(INTEGRAL intgrl, unsigned long N);
 static double simp(INTEGRAL intgrl, unsigned long N);
+static unsigned long riemann_evaluations(unsigned long method,
+	unsigned long N);
+static unsigned short gauss_kronrod(INTEGRAL *intgrl);
+static unsigned long gk21_partition(INTEGRAL intgrl, double **edges);
+static double gk21(INTEGRAL intgrl, double a, double b, double *error);
 
 
 /*
@@ -31,9 +79,13 @@ static double simp(INTEGRAL intgrl, unsigned long N);
  *
  * Notes & References
  * ==================
- * The methods of numerical quadrature implemented in this function and its
- * subroutines are adopted from Chapter 4 of Numerical Recipes (Press,
- * Teukolsky, Vetterling & Flannery 2007), Cambridge University Press.
+ * The Euler, trapezoid, midpoint and Simpson methods implemented in this
+ * function and its subroutines are adopted from Chapter 4 of Numerical
+ * Recipes (Press, Teukolsky, Vetterling & Flannery 2007), Cambridge
+ * University Press. The adaptive Gauss-Kronrod method follows the QAG
+ * routine of QUADPACK (Piessens, de Doncker-Kapenga, Ueberhuber & Kahaner
+ * 1983), Springer-Verlag. For that method, Nmax is the maximum number of
+ * evaluations of the integrand and Nmin is not used.
  *
  * header: integral.h
  */
@@ -52,6 +104,8 @@ extern unsigned short quad(INTEGRAL *intgrl) {
 	 */
 
 	trace_print();
+	intgrl -> evals = 0ul;
+	if ((*intgrl).method == GK21) return gauss_kronrod(intgrl);
 	unsigned long N = (*intgrl).Nmin / 2l;
 	if (N % 2l != 0l) N += 1l;
 
@@ -91,6 +145,7 @@ extern unsigned short quad(INTEGRAL *intgrl) {
 	do {
 
 		new_int = integrate(*intgrl, N);
+		intgrl -> evals += riemann_evaluations((*intgrl).method, N);
 		if (new_int) {
 			intgrl -> error = absval(old_int / new_int - 1);
 		} else {
@@ -152,7 +207,7 @@ static double euler(INTEGRAL intgrl, unsigned long N) {
 	 */
 	unsigned long i;
 	for (i = 0l; i < N; i++) {
-		eval[i] = intgrl.func(x[i]);
+		eval[i] = intgrl.func(x[i], intgrl.params);
 	}
 	double total = sum(eval, N);
 	debug_print("total = %.5e\n", total);
@@ -193,7 +248,7 @@ static double trapzd(INTEGRAL intgrl, unsigned long N) {
 	 */
 	unsigned long i;
 	for (i = 0l; i <= N; i++) {
-		eval[i] = intgrl.func(x[i]);
+		eval[i] = intgrl.func(x[i], intgrl.params);
 	}
 	double total = sum(eval, N + 1l);
 	total -= 0.5 * (eval[0] + eval[N]);
@@ -235,7 +290,7 @@ static double midpt(INTEGRAL intgrl, unsigned long N) {
 	 */
 	unsigned long i;
 	for (i = 0l; i < N; i++) {
-		eval[i] = intgrl.func(mids[i]);
+		eval[i] = intgrl.func(mids[i], intgrl.params);
 	}
 	double total = sum(eval, N);
 	debug_print("total = %.5e\n", total);
@@ -270,3 +325,236 @@ static double simp(INTEGRAL intgrl, unsigned long N) {
 
 }
 
+
+/*
+ * Determine the number of times the integrand is evaluated by one of the
+ * Riemann sum methods with a given number of bins.
+ *
+ * Parameters
+ * ==========
+ * method: 		The hash-code for the method of integration
+ * N: 			The number of bins
+ *
+ * Returns
+ * =======
+ * The number of evaluations of the integrand
+ */
+static unsigned long riemann_evaluations(unsigned long method,
+	unsigned long N) {
+
+	switch (method) {
+
+		case TRAPEZOID:
+			return N + 1ul;
+
+		case SIMPSON:
+			/* one trapezoid rule sum with N bins and another with N / 2 */
+			return N + N / 2ul + 2ul;
+
+		default:
+			/* Euler's method and the midpoint rule */
+			return N;
+
+	}
+
+}
+
+
+/*
+ * Evaluate an integral with adaptive 21-point Gauss-Kronrod quadrature.
+ *
+ * Parameters
+ * ==========
+ * intgrl: 		The integral object
+ *
+ * Returns
+ * =======
+ * 0 on success, 1 on an error larger than the tolerance
+ *
+ * Notes
+ * =====
+ * The range of integration is first split at each breakpoint, and each
+ * subinterval is integrated with the 21-point Kronrod rule. The difference
+ * between this and the 10-point Gauss rule, which uses every other Kronrod
+ * abscissa, estimates the error. The subinterval with the largest error is
+ * then bisected until the total error falls below the tolerance relative to
+ * the integral or the next bisection would exceed Nmax evaluations of the
+ * integrand. The value and error of every other subinterval are stored, so
+ * the integrand is only evaluated where the integral is not yet converged.
+ */
+static unsigned short gauss_kronrod(INTEGRAL *intgrl) {
+
+	trace_print();
+	double *edges;
+	unsigned long i, n = gk21_partition(*intgrl, &edges);
+	unsigned long capacity = 2ul * n;
+	double *lower = (double *) malloc (capacity * sizeof(double));
+	double *upper = (double *) malloc (capacity * sizeof(double));
+	double *value = (double *) malloc (capacity * sizeof(double));
+	double *error = (double *) malloc (capacity * sizeof(double));
+
+	double result = 0, abserr = 0;
+	for (i = 0ul; i < n; i++) {
+		lower[i] = edges[i];
+		upper[i] = edges[i + 1ul];
+		value[i] = gk21(*intgrl, lower[i], upper[i], &error[i]);
+		result += value[i];
+		abserr += error[i];
+	}
+	intgrl -> evals = 21ul * n;
+	free(edges);
+
+	while (abserr > (*intgrl).tolerance * absval(result) &&
+		(*intgrl).evals + 42ul <= (*intgrl).Nmax) {
+
+		/* bisect the subinterval with the largest error */
+		unsigned long worst = 0ul;
+		for (i = 1ul; i < n; i++) {
+			if (error[i] > error[worst]) worst = i;
+		}
+		double mid = 0.5 * (lower[worst] + upper[worst]);
+		/* the subinterval can't be bisected at this precision */
+		if (mid <= lower[worst] || mid >= upper[worst]) break;
+
+		if (n == capacity) {
+			capacity *= 2ul;
+			lower = (double *) realloc (lower, capacity * sizeof(double));
+			upper = (double *) realloc (upper, capacity * sizeof(double));
+			value = (double *) realloc (value, capacity * sizeof(double));
+			error = (double *) realloc (error, capacity * sizeof(double));
+		} else {}
+
+		lower[n] = mid;
+		upper[n] = upper[worst];
+		value[n] = gk21(*intgrl, lower[n], upper[n], &error[n]);
+		upper[worst] = mid;
+		value[worst] = gk21(*intgrl, lower[worst], upper[worst],
+			&error[worst]);
+		intgrl -> evals += 42ul;
+		n++;
+
+		/* re-sum rather than update to avoid accumulating roundoff */
+		result = sum(value, n);
+		abserr = sum(error, n);
+
+	}
+
+	intgrl -> result = result;
+	intgrl -> iters = n;
+	if (result) {
+		intgrl -> error = abserr / absval(result);
+	} else {
+		/* no relative error if the integral is zero */
+		intgrl -> error = (abserr > 0);
+	}
+	debug_print("result = %.5e\n", (*intgrl).result);
+	debug_print("evals = %lu\n", (*intgrl).evals);
+	free(lower);
+	free(upper);
+	free(value);
+	free(error);
+	return ((*intgrl).error > (*intgrl).tolerance);
+
+}
+
+
+/*
+ * Split the range of integration at the breakpoints of an integral object.
+ *
+ * Parameters
+ * ==========
+ * intgrl: 		The integral object
+ * edges: 		A pointer to fill with the edges of the subintervals, in
+ * 				ascending order and beginning with a and ending with b
+ *
+ * Returns
+ * =======
+ * The number of subintervals, one more than the number of distinct
+ * breakpoints strictly between a and b.
+ */
+static unsigned long gk21_partition(INTEGRAL intgrl, double **edges) {
+
+	unsigned long i, j, n = 1ul;
+	*edges = (double *) malloc ((intgrl.n_breakpoints + 2ul) *
+		sizeof(double));
+	(*edges)[0] = intgrl.a;
+	for (i = 0ul; i < intgrl.n_breakpoints; i++) {
+		double x = intgrl.breakpoints[i];
+		if (x <= intgrl.a || x >= intgrl.b) continue;
+
+		/* insertion sort, skipping repeated values */
+		for (j = n; (*edges)[j - 1ul] > x; j--) {}
+		if ((*edges)[j - 1ul] == x) continue;
+		memmove(*edges + j + 1ul, *edges + j, (n - j) * sizeof(double));
+		(*edges)[j] = x;
+		n++;
+	}
+	(*edges)[n] = intgrl.b;
+	return n;
+
+}
+
+
+/*
+ * Integrate a function over one subinterval with the 21-point Kronrod rule.
+ *
+ * Parameters
+ * ==========
+ * intgrl: 		The integral object
+ * a: 			The lower bound of the subinterval
+ * b: 			The upper bound of the subinterval
+ * error: 		A pointer to store the estimated absolute error in
+ *
+ * Returns
+ * =======
+ * The 21-point Kronrod estimate of the integral over the subinterval
+ *
+ * Notes
+ * =====
+ * The error estimate follows QUADPACK's QK21 routine, scaling the
+ * difference between the Kronrod and Gauss estimates by the variation of
+ * the integrand across the subinterval and bounding it from below by the
+ * roundoff error.
+ */
+static double gk21(INTEGRAL intgrl, double a, double b, double *error) {
+
+	unsigned short i;
+	double center = 0.5 * (a + b);
+	double half = 0.5 * (b - a);
+	double fc = intgrl.func(center, intgrl.params);
+	double fv1[10], fv2[10];
+	double resk = GK21_WK[10] * fc;
+	double resg = 0;
+	double resabs = absval(resk);
+	for (i = 0u; i < 10u; i++) {
+		double dx = half * GK21_XK[i];
+		fv1[i] = intgrl.func(center - dx, intgrl.params);
+		fv2[i] = intgrl.func(center + dx, intgrl.params);
+		resk += GK21_WK[i] * (fv1[i] + fv2[i]);
+		resabs += GK21_WK[i] * (absval(fv1[i]) + absval(fv2[i]));
+		if (i % 2u) resg += GK21_WG[i / 2u] * (fv1[i] + fv2[i]);
+	}
+
+	/* the variation of the integrand about its mean */
+	double mean = 0.5 * resk;
+	double resasc = GK21_WK[10] * absval(fc - mean);
+	for (i = 0u; i < 10u; i++) {
+		resasc += GK21_WK[i] * (absval(fv1[i] - mean) +
+			absval(fv2[i] - mean));
+	}
+
+	double result = resk * half;
+	resabs *= absval(half);
+	resasc *= absval(half);
+	*error = absval((resk - resg) * half);
+	if (resasc && *error) {
+		double scale = pow(200 * *error / resasc, 1.5);
+		*error = resasc * (scale < 1 ? scale : 1);
+	} else {}
+	if (resabs > DBL_MIN / (50 * DBL_EPSILON) &&
+		*error < 50 * DBL_EPSILON * resabs) {
+		*error = 50 * DBL_EPSILON * resabs;
+	} else {}
+	return result;
+
+}
@@ -17,9 +17,10 @@
 
 /* ---------- static function comment headers not duplicated here ---------- */
 static unsigned short test_quad_common(unsigned long method);
-static double test_function(double x);
+static double test_function(double x, void *params);
 static INTEGRAL *get_test_integral(void);
 static unsigned short assess_test(INTEGRAL test);
+static double kinked_test_function(double x, void *params);
 
 
 /*
@@ -86,6 +87,58 @@ extern unsigned short test_quad_simp(void) {
 }
 
 
+/*
+ * Test the numerical quadrature implementation of adaptive 21-point
+ * Gauss-Kronrod quadrature
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: integral.h
+ */
+extern unsigned short test_quad_gk21(void) {
+
+	return test_quad_common(GK21);
+
+}
+
+
+/*
+ * Test the adaptive 21-point Gauss-Kronrod quadrature on a function with a
+ * kink at a breakpoint, which should be integrated to within roundoff error
+ * by splitting the range of integration there once and only once.
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * header: integral.h
+ */
+extern unsigned short test_quad_gk21_breakpoints(void) {
+
+	double breakpoints[3] = {0.5, -1, 0.5};
+	INTEGRAL *test = integral_initialize();
+	test -> func = &kinked_test_function;
+	test -> a = 0;
+	test -> b = 1;
+	test -> tolerance = TEST_INTEGRAL_TOLERANCE;
+	test -> Nmin = 64;
+	test -> Nmax = 2e8;
+	test -> method = GK21;
+	test -> breakpoints = breakpoints;
+	test -> n_breakpoints = 3ul;
+	unsigned short result = !quad(test);
+	result &= (*test).iters == 2ul;
+	result &= (*test).evals == 42ul;
+	result &= absval((*test).result - 1) < 1e-12;
+	test -> breakpoints = NULL;
+	integral_free(test);
+	return result;
+
+}
+
+
 /*
  * Common routine for testing the implementation of a given quadrature routine
  *
@@ -145,9 +198,20 @@ static INTEGRAL *get_test_integral(void) {
  * sin(x) from 0 to pi/2 and ensures that the return value is within the
  * specified tolerance of 1.
  */
-static double test_function(double x) {
+static double test_function(double x, void *params) {
 
 	return sin(x);
 
 }
 
+
+/*
+ * A function with a kink at x = 0.5 -> 4|x - 0.5|. This integrates to 1
+ * between 0 and 1.
+ */
+static double kinked_test_function(double x, void *params) {
+
+	return 4 * absval(x - 0.5);
+
+}
+
@@ -56,6 +56,31 @@ extern unsigned short test_quad_midpt(void);
  */
 extern unsigned short test_quad_simp(void);
 
+/*
+ * Test the numerical quadrature implementation of adaptive 21-point
+ * Gauss-Kronrod quadrature
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: integral.c
+ */
+extern unsigned short test_quad_gk21(void);
+
+/*
+ * Test the adaptive 21-point Gauss-Kronrod quadrature on a function with a
+ * kink at a breakpoint, which should be integrated to within roundoff error
+ * by splitting the range of integration there once and only once.
+ *
+ * Returns
+ * =======
+ * 1 on success, 0 on failure
+ *
+ * source: integral.c
+ */
+extern unsigned short test_quad_gk21_breakpoints(void);
+
 #ifdef __cplusplus
 }
 #endif /* __cplusplus */
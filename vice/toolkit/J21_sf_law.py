@@ -30,6 +30,11 @@ class J21_sf_law:
 		ensured, the star formation law will not be consistent across all
 		zones.
 
+	.. note:: Simulations copy the attributes of this object when they begin
+		and evaluate the star formation law in C, rather than calling this
+		object at every timestep. Subclasses which override ``__call__`` or
+		``molecular`` are instead called as any other function.
+
 	Parameters
 	----------
 	area : real number
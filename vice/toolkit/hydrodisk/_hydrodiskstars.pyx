@@ -93,48 +93,46 @@ will oversample these data.""" % (_N_STAR_PARTICLES_), ScienceWarning)
 		_hydrodiskstars.hydrodiskstars_free(self._hds)
 
 	def __call__(self, zone, tform, time):
+		birth_radius = self.__birth_radius(zone, tform, time)
+		if tform == time:
+			self.__reset_analog(birth_radius, tform)
+			return zone
+		else:
+			return self.__zone(zone, tform, birth_radius, time)
+
+	def batch(self, zone, tform, times, n_particles):
+		r"""
+		Compute the zone numbers of a number of stellar populations born in
+		the same zone at the same time, each with its own analog star
+		particle, at an array of simulation times. Equivalent to calling
+		this object once with the time of formation as the simulation time
+		and then once at each time, for each stellar population.
+		"""
+		if not isinstance(n_particles, int) or n_particles < 0:
+			raise ValueError("Number of particles must be a non-negative \
+integer. Got: %s" % (str(n_particles)))
+		else: pass
+		times = [float(t) for t in times]
+		birth_radius = self.__birth_radius(zone, tform, max(times + [tform]))
+		zones = n_particles * [None]
+		for i in range(n_particles):
+			self.__reset_analog(birth_radius, tform)
+			zones[i] = [zone if t == tform else self.__zone(zone, tform,
+				birth_radius, t) for t in times]
+		return zones
+
+	def __birth_radius(self, zone, tform, time):
+		# type-check the parameters and determine the radius of birth
 		if isinstance(zone, int):
 			if 0 <= zone < self._hds[0].n_rad_bins:
-				birth_radius = (self._hds[0].rad_bins[zone] +
-					self._hds[0].rad_bins[zone + 1]) / 2
 				if (isinstance(tform, numbers.Number) and
 					isinstance(time, numbers.Number)):
 					if time - _END_TIME_ > 1.e-12: warnings.warn("""\
 Simulations of galactic chemical evolution with the hydrodiskstars object for \
 timescales longer than %g Gyr are not supported. This is the maximum range of \
 star particle ages.""" % (_END_TIME_), ScienceWarning)
-					if tform == time:
-						self._analog_idx = (
-							_hydrodiskstars.hydrodiskstars_find_analog(
-								self._hds[0], <double> birth_radius,
-								<double> tform)
-						)
-						return zone
-					else:
-						if self.mode == "linear":
-							bin_ = int(_hydrodiskstars.calczone_linear(
-								self._hds[0], tform, birth_radius, _END_TIME_,
-								self._analog_idx, <double> time))
-						elif self.mode == "sudden":
-							bin_ = int(_hydrodiskstars.calczone_sudden(
-								self._hds[0], self._migration_time,
-								birth_radius, self._analog_idx, <double> time))
-						elif self.mode == "diffusion":
-							bin_ = int(_hydrodiskstars.calczone_diffusive(
-								self._hds[0], tform, birth_radius, _END_TIME_,
-								self._analog_idx, <double> time))
-						else:
-							raise SystemError("Internal Error.")
-						if bin_ != -1:
-							return bin_
-						else:
-							raise ValueError("""\
-Radius out of bin range. Relevant information:
-Analog ID: %d
-Zone of formation: %d
-Time of formation: %.4e Gyr
-Time in simulation: %.4e Gyr""" % (self.analog_data["id"][self.analog_index],
-								zone, tform, time))
+					return (self._hds[0].rad_bins[zone] +
+						self._hds[0].rad_bins[zone + 1]) / 2
 				else:
 					raise TypeError("""Time parameters must be numerical \
 values. Got: (%s, %s)""" % (type(tform), type(time)))
@@ -143,28 +141,56 @@ values. Got: (%s, %s)""" % (type(tform), type(time)))
 		else:
 			raise TypeError("Zone must be of type int. Got: %s" % (type(zone)))
 
+	def __reset_analog(self, birth_radius, tform):
+		# assign a new analog, and a new time of migration if it is sudden
+		self._analog_idx = _hydrodiskstars.hydrodiskstars_find_analog(
+			self._hds[0], <double> birth_radius, <double> tform)
+		if self.mode == "sudden":
+			self._migration_time = _hydrodiskstars.rand_range(tform,
+				_END_TIME_)
+		else: pass
+
+	def __zone(self, zone, tform, birth_radius, time):
+		# the zone number at a given time based on the current analog
+		if self.mode == "linear":
+			bin_ = int(_hydrodiskstars.calczone_linear(
+				self._hds[0], tform, birth_radius, _END_TIME_,
+				self._analog_idx, <double> time))
+		elif self.mode == "sudden":
+			bin_ = int(_hydrodiskstars.calczone_sudden(
+				self._hds[0], self._migration_time,
+				birth_radius, self._analog_idx, <double> time))
+		elif self.mode == "diffusion":
+			bin_ = int(_hydrodiskstars.calczone_diffusive(
+				self._hds[0], tform, birth_radius, _END_TIME_,
+				self._analog_idx, <double> time))
+		else:
+			raise SystemError("Internal Error.")
+		if bin_ != -1:
+			return bin_
+		else:
+			raise ValueError("""\
+Radius out of bin range. Relevant information:
+Analog ID: %d
+Zone of formation: %d
+Time of formation: %.4e Gyr
+Time in simulation: %.4e Gyr""" % (self.analog_data["id"][self.analog_index],
+				zone, tform, time))
+
 	def __update_analog_data(self):
+		# the rows of the star particles in the sample
+		rows = [self._hds[0].rows[i] for i in range(self._hds[0].n_stars)]
 		self._analog_data = dataframe({
-			"id": 		[self._hds[0].ids[i] for i in range(
-				self._hds[0].n_stars)],
-			"tform":	[self._hds[0].birth_times[i] for i in range(
-				self._hds[0].n_stars)],
-			"rform": 	[self._hds[0].birth_radii[i] for i in range(
-				self._hds[0].n_stars)],
-			"rfinal": 	[self._hds[0].final_radii[i] for i in range(
-				self._hds[0].n_stars)],
-			"zform": 	[self._hds[0].zform[i] for i in range(
-				self._hds[0].n_stars)],
-			"zfinal": 	[self._hds[0].zfinal[i] for i in range(
-				self._hds[0].n_stars)],
-			"vrad": 	[self._hds[0].v_rad[i] for i in range(
-				self._hds[0].n_stars)],
-			"vphi": 	[self._hds[0].v_phi[i] for i in range(
-				self._hds[0].n_stars)],
-			"vz": 		[self._hds[0].v_z[i] for i in range(
-				self._hds[0].n_stars)],
-			"decomp": 	[self._hds[0].decomp[i] for i in range(
-				self._hds[0].n_stars)]
+			"id": 		[self._hds[0].ids[i] for i in rows],
+			"tform":	[self._hds[0].birth_times[i] for i in rows],
+			"rform": 	[self._hds[0].birth_radii[i] for i in rows],
+			"rfinal": 	[self._hds[0].final_radii[i] for i in rows],
+			"zform": 	[self._hds[0].zform[i] for i in rows],
+			"zfinal": 	[self._hds[0].zfinal[i] for i in rows],
+			"vrad": 	[self._hds[0].v_rad[i] for i in rows],
+			"vphi": 	[self._hds[0].v_phi[i] for i in rows],
+			"vz": 		[self._hds[0].v_z[i] for i in rows],
+			"decomp": 	[self._hds[0].decomp[i] for i in rows]
 		})
 
 	def object_address(self):
@@ -173,6 +199,13 @@ values. Got: (%s, %s)""" % (type(tform), type(time)))
 		"""
 		return <long> (<void *> self._hds)
 
+	def migration_time(self):
+		"""
+		Returns the time of migration of the current analog in case of sudden
+		migration.
+		"""
+		return self._migration_time
+
 	@property
 	def radial_bins(self):
 		# docstring in python version
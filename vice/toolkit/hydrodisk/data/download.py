@@ -4,6 +4,7 @@ import sys
 import os
 PATH = os.path.dirname(os.path.abspath(__file__))
 NSUBS = int(30) # hard coded into VICE
+CACHE = "subsamples.bin" # hard coded into VICE
 
 
 def download(verbose = True):
@@ -39,6 +40,9 @@ def _h277_remove():
 		for sub in range(NSUBS):
 			filename = "%s/h277/sub%d.dat" % (PATH, sub)
 			if os.path.exists(filename): os.remove(filename)
+		# the binary cache written by the first import
+		filename = "%s/h277/%s" % (PATH, CACHE)
+		if os.path.exists(filename): os.remove(filename)
 		os.rmdir("%s/h277" % (PATH))
 	except (FileNotFoundError, OSError):
 		raise FileNotFoundError("Supplementary data not found.")
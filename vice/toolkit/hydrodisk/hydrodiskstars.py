@@ -2,6 +2,7 @@
 from __future__ import absolute_import
 from ._hydrodiskstars import c_hydrodiskstars
 from . import data
+import numbers
 
 
 class hydrodiskstars:
@@ -64,6 +65,10 @@ class hydrodiskstars:
 			if this attribute is not set to ``None``, multizone simulations
 			will *still* use the approximation denoted by this property.
 
+	batched : bool
+		Whether or not this object may be called with an array of simulation
+		times (see below). ``True`` unless a subclass overrides ``__call__``.
+
 	Calling
 	-------
 	As all stellar migration prescriptions must, this object can be called
@@ -74,14 +79,27 @@ class hydrodiskstars:
 			non-negative.
 		tform : float
 			The time of formation of the stellar population in Gyr.
-		time : float
+		time : float or array-like
 			The simulation time in Gyr (i.e. not the age of the star particle).
 
+	If ``time`` is an array of simulation times, this object returns the zone
+	number of one stellar population at each time as a list, equivalent to
+	calling it at each time in turn. It may then also take the keyword
+	argument ``n``, an array of the indices of several stellar populations
+	born in the same zone at the same time, in which case it returns one such
+	list for each of them, each with its own analog. This is the protocol
+	followed by batched stellar migration prescriptions (see
+	``vice.core.callback.batched``), allowing functions which wrap this
+	object to be batched as well. Multizone simulations using this object
+	directly assign zone histories according to the attribute ``mode`` in C.
+
 	.. note:: The search for analog star particles is ran when the formation
 		time and simulation time are equal. Therefore, calling this object
 		with the second and third parameters equal resets the star particle
 		acting as the analog, and the data for the corresponding star particle
-		can then be accessed via the attribute ``analog_index``.
+		can then be accessed via the attribute ``analog_index``. When called
+		with an array of simulation times, the analog is reset once for each
+		stellar population, and ``analog_index`` refers to that of the last.
 
 	Functions
 	---------
@@ -111,6 +129,12 @@ class hydrodiskstars:
 	>>> import vice
 	>>> vice.toolkit.hydrodisk.data.download()
 
+	The first ``hydrodiskstars`` object constructed following the download
+	also writes the data to a binary file alongside it, which subsequent
+	objects map into memory rather than reading the data again. Objects in
+	different processes on the same machine then share a single copy of the
+	data. If this file can not be written, each object reads the data itself.
+
 	This migration scheme works by assigning each stellar population in the
 	simulation an analog star particle from the hydrodynamical simulation. The
 	analog is randomly drawn from a sample of star particles which formed at
@@ -176,8 +200,13 @@ class hydrodiskstars:
 		else: pass
 		self.__c_version = c_hydrodiskstars(rad_bins, N = N, mode = mode)
 
-	def __call__(self, zone, tform, time):
-		return self.__c_version.__call__(zone, tform, time)
+	def __call__(self, zone, tform, time, n = None):
+		if isinstance(time, numbers.Number):
+			return self.__c_version.__call__(zone, tform, time)
+		elif n is None:
+			return self.__c_version.batch(zone, tform, time, 1)[0]
+		else:
+			return self.__c_version.batch(zone, tform, time, len(n))
 
 	def __enter__(self):
 		# Opens a with statement
@@ -195,6 +224,42 @@ class hydrodiskstars:
 		"""
 		return self.__c_version.object_address()
 
+	def __migration_time(self):
+		r"""
+		Returns the time of migration of the current analog in Gyr, used only
+		in the "sudden" migration mode. For internal usage only.
+		"""
+		return self.__c_version.migration_time()
+
+	@property
+	def batched(self):
+		r"""
+		Type : bool
+
+		Whether or not this object may be called with an array of simulation
+		times, assigning the zone numbers of a stellar population at all
+		times in one call (see ``vice.core.callback.batched``).
+
+		.. versionadded:: 1.4.0
+
+		.. note:: This is ``False`` for subclasses which override the
+			``__call__`` function, as the overridden function may only accept
+			one simulation time. Subclasses whose ``__call__`` function does
+			accept an array of times may declare a class attribute
+			``batched = True``.
+
+		Example Code
+		------------
+		>>> from vice.toolkit.hydrodisk import hydrodiskstars
+		>>> import numpy as np
+		>>> example = hydrodiskstars(np.linspace(0, 20, 81))
+		>>> example.batched
+		True
+		>>> example(10, 4, [4, 5, 6], n = [0, 1])
+		[[10, 11, 11], [10, 9, 9]]
+		"""
+		return type(self).__call__ is hydrodiskstars.__call__
+
 	@property
 	def radial_bins(self):
 		r"""
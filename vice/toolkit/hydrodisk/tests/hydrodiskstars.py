@@ -25,6 +25,7 @@ def test():
 			test_call("linear"),
 			test_call("sudden"),
 			test_call("diffusion"),
+			test_find_analog(),
 			test_decomp_filter()
 		]
 	]
@@ -145,6 +146,35 @@ def test_call(mode):
 	return [msg, test]
 
 
+@unittest
+def test_find_analog():
+	r"""
+	Tests that the analog star particles assigned at formation are born
+	within the widest search window in time and imply a final radius within
+	the radial bins.
+	"""
+	def test():
+		if not _h277_exists(): return None
+		try:
+			_TEST_.radial_bins = _RAD_BINS_
+			tform = _TEST_.analog_data["tform"]
+			rform = _TEST_.analog_data["rform"]
+			rfinal = _TEST_.analog_data["rfinal"]
+			for i in range(len(_RAD_BINS_) - 1):
+				radius = (_RAD_BINS_[i] + _RAD_BINS_[i + 1]) / 2
+				for j in range(0, len(_TEST_TIMES_), 10):
+					_TEST_(i, _TEST_TIMES_[j], _TEST_TIMES_[j])
+					idx = _TEST_.analog_index
+					if idx == -1: continue
+					assert abs(tform[idx] - _TEST_TIMES_[j]) < 0.5
+					final = radius + rfinal[idx] - rform[idx]
+					assert _RAD_BINS_[0] <= final <= _RAD_BINS_[-1]
+		except:
+			return False
+		return True
+	return ["vice.toolkit.hydrodisk.hydrodiskstars.find_analog", test]
+
+
 @unittest
 def test_decomp_filter():
 	r"""
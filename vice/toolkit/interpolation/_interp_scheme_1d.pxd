@@ -14,4 +14,6 @@ cdef extern from "../../src/objects/interp_scheme_1d.h":
 
 cdef extern from "../../src/toolkit/interp_scheme_1d.h":
 	double interp_scheme_1d_evaluate(INTERP_SCHEME_1D is1d, double x)
+	void interp_scheme_1d_evaluate_array(INTERP_SCHEME_1D is1d, const double *x,
+		unsigned long n, double *result) nogil
 
@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import
 import numbers
+import array
 from ...core import _pyutils
 from libc.stdlib cimport malloc
 from . cimport _interp_scheme_1d
@@ -53,12 +54,27 @@ cdef class c_interp_scheme_1d:
 
 
 	def __call__(self, x):
+		cdef const double[::1] xvals
+		cdef double[::1] yvals
 		if isinstance(x, numbers.Number):
 			return _interp_scheme_1d.interp_scheme_1d_evaluate(self._is1d[0],
 				<double> x)
 		else:
-			raise TypeError("""X-coordinate to evaluate interpolation scheme \
-at must be a numerical value. Got: %s""" % (type(x)))
+			# evaluate at every element of an array in one loop in C
+			try:
+				[buffs, shape] = _pyutils.broadcast_double_buffers(x)
+			except TypeError:
+				raise TypeError("""X-coordinate to evaluate interpolation \
+scheme at must be a numerical value or array-like. Got: %s""" % (type(x)))
+			xvals = buffs[0]
+			result = array.array('d', [0.]) * xvals.shape[0]
+			yvals = result
+			if xvals.shape[0]:
+				with nogil:
+					_interp_scheme_1d.interp_scheme_1d_evaluate_array(
+						self._is1d[0], &xvals[0], xvals.shape[0], &yvals[0])
+			else: pass
+			return _pyutils.reshape(result, shape)
 
 
 	def __getitem__(self, idx):
@@ -14,3 +14,5 @@ cdef extern from "../../src/objects/interp_scheme_2d.h":
 
 cdef extern from "../../src/toolkit/interp_scheme_2d.h":
 	double interp_scheme_2d_evaluate(INTERP_SCHEME_2D is2d, double x, double y)
+	void interp_scheme_2d_evaluate_array(INTERP_SCHEME_2D is2d,
+		const double *x, const double *y, unsigned long n, double *result) nogil
@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import
 import numbers
+import array
 from ...core import _pyutils
 from libc.stdlib cimport malloc
 from . cimport _interp_scheme_2d
@@ -69,12 +70,31 @@ must be of the same length as 'xcoords'. Got: (%d, %d).""" % (
 
 
 	def __call__(self, x, y):
+		cdef const double[::1] xvals
+		cdef const double[::1] yvals
+		cdef double[::1] zvals
 		if isinstance(x, numbers.Number) and isinstance(y, numbers.Number):
 			return _interp_scheme_2d.interp_scheme_2d_evaluate(self._is2d[0],
 				<double> x, <double> y)
 		else:
-			raise TypeError("Must be numerical values. Got: (%s, %s)." % (
-				type(x), type(y)))
+			# evaluate at every pair of elements of the broadcast arrays in
+			# one loop in C
+			try:
+				[buffs, shape] = _pyutils.broadcast_double_buffers(x, y)
+			except TypeError:
+				raise TypeError("""Must be numerical values or array-like. \
+Got: (%s, %s).""" % (type(x), type(y)))
+			xvals = buffs[0]
+			yvals = buffs[1]
+			result = array.array('d', [0.]) * xvals.shape[0]
+			zvals = result
+			if xvals.shape[0]:
+				with nogil:
+					_interp_scheme_2d.interp_scheme_2d_evaluate_array(
+						self._is2d[0], &xvals[0], &yvals[0], xvals.shape[0],
+						&zvals[0])
+			else: pass
+			return _pyutils.reshape(result, shape)
 
 
 	@property
@@ -46,20 +46,31 @@ class interp_scheme_1d(c_interp_scheme_1d):
 
 		Parameters:
 
-			- x : real number
+			- x : real number or array-like
 				The x-coordinate to evaluate the interpolation scheme at, in
 				the same units as the attribute ``xcoords``.
 
+				.. versionchanged:: 1.4.0
+					May be array-like (e.g. a NumPy array or any object
+					supporting the buffer protocol), in which case the scheme
+					is evaluated at each element in one loop in C.
+
 		Returns:
 
-			- y : real number
+			- y : real number or array-like
 				The value of the y-coordinate, approximated via the line
 				connecting the two points :math:`(x_1, y_1)` and
 				:math:`(x_2, y_2)` such that :math:`x_1 \leq x \leq x_2`. If
 				``x`` is less than the smallest x-coordinate or larger than
 				the largest one, the result will be determined via linear
 				extrapolation using either the two smallest or two largest
-				elements of the ``xcoords`` attribute.
+				elements of the ``xcoords`` attribute. If ``x`` is
+				array-like, a ``numpy.ndarray`` of the same shape if NumPy is
+				installed, and a ``list`` otherwise.
+
+	.. note:: If the x-coordinates are evenly spaced, evaluating this object
+		at an array of x-coordinates computes the pair of points to
+		interpolate between at each one rather than searching for them.
 
 	Indexing
 	--------
@@ -77,6 +88,8 @@ class interp_scheme_1d(c_interp_scheme_1d):
 	10.0
 	>>> example(4)
 	8.0
+	>>> example([0, 4, 5])
+	array([ 0.,  8., 10.])
 	>>> example[:]
 	[[1.0, 2.0], [2.0, 4.0], [3.0, 6.0]]
 	>>> example.xcoords
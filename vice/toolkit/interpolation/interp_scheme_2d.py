@@ -61,16 +61,22 @@ class interp_scheme_2d(c_interp_scheme_2d):
 
 		Parameters:
 
-			- x : real number
+			- x : real number or array-like
 				The x-coordinate to evaluate the interpolation scheem at, in
 				the same units as the attribute ``xcoords``.
-			- y : real number
+			- y : real number or array-like
 				The y-coordinate to evaluate the interpolation scheme at, in
 				the same units as the attribute ``ycoords``.
 
+			.. versionchanged:: 1.4.0
+				Either or both of ``x`` and ``y`` may be array-like (e.g. a
+				NumPy array or any object supporting the buffer protocol), in
+				which case they are broadcast against one another and the
+				scheme is evaluated at each pair of elements in one loop in C.
+
 		Returns:
 
-			- z : real number
+			- z : real number or array-like
 				The value of the z-coordinate, approximated via bilinear
 				interpolation connecting the points :math:`(x_1, y_1)`,
 				:math:`(x_1, y_2)`, :math:`(x_2, y_1)`, and :math:`(x_2, y_2)`:
@@ -82,6 +88,14 @@ class interp_scheme_2d(c_interp_scheme_2d):
 				one-dimension at constant :math:`x`, then the value of
 				:math:`f(x, y)` is calculated similarly at constant :math:`y`.
 
+				If ``x`` or ``y`` is array-like, a ``numpy.ndarray`` of their
+				broadcast shape if NumPy is installed, and a ``list``
+				otherwise.
+
+	.. note:: If the x- or y-coordinates are evenly spaced, evaluating this
+		object at arrays of coordinates computes the bounding box on that axis
+		at each one rather than searching for it.
+
 	Example Code
 	------------
 	>>> from vice.toolkit.interpolation import interp_scheme_2d
@@ -93,6 +107,10 @@ class interp_scheme_2d(c_interp_scheme_2d):
 	60.0
 	>>> example(3.1, 2.8)
 	7.140000000000001
+	>>> example([0, 10, 3.1], [0, 10, 2.8])
+	array([ 0.  , 60.  ,  7.14])
+	>>> example([1, 2, 3], 4)
+	array([ 6.,  8., 10.])
 	>>> example.xcoords
 	[1, 2, 3]
 	>>> example.ycoords
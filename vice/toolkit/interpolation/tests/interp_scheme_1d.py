@@ -16,6 +16,7 @@ def test():
 			test_initialize(),
 			test_attributes(),
 			test_call(),
+			test_call_array(),
 			test_getitem()
 		]
 	]
@@ -72,6 +73,37 @@ def test_call():
 	return ["vice.toolkit.interpolation.interp_scheme_1d.__call__", test]
 
 
+@unittest
+def test_call_array():
+	r"""
+	vice.toolkit.interpolation.interp_scheme_1d.__call__ [array] unit test
+	"""
+	def test():
+		random.seed()
+		# evenly spaced x-coordinates and randomly spaced x-coordinates
+		xcoords = [list(range(-50, 50)),
+			sorted([200 * random.random() - 100 for _ in range(100)])]
+		status = True
+		for x in xcoords:
+			try:
+				test_ = interp_scheme_1d(x, [random.random() for _ in x])
+			except:
+				return None
+			values = [300 * random.random() - 150 for _ in range(1000)]
+			values += test_.xcoords # evaluate exactly at each x-coordinate
+			try:
+				batch = test_(values)
+			except:
+				return False
+			status &= len(batch) == len(values)
+			status &= all([batch[i] == test_(values[i]) for i in range(
+				len(values))])
+			if not status: break
+		return status
+	return ["vice.toolkit.interpolation.interp_scheme_1d.__call__ [array]",
+		test]
+
+
 @unittest
 def test_getitem():
 	r"""
@@ -24,7 +24,8 @@ def test():
 		[
 			test_initialize(),
 			test_attributes(),
-			test_call()
+			test_call(),
+			test_call_array()
 		]
 	]
 
@@ -97,3 +98,33 @@ def test_call():
 	return ["vice.toolkit.interpolation.interp_scheme_2d.__call__", test]
 
 
+@unittest
+def test_call_array():
+	r"""
+	vice.toolkit.interpolation.interp_scheme_2d.__call__ [array] unit test
+	"""
+	def test():
+		random.seed()
+		# evenly spaced x-coordinates and randomly spaced y-coordinates
+		ycoords = sorted([300 * random.random() - 50 for _ in range(
+			len(_TEST_Y_VALUES_))])
+		try:
+			test_ = interp_scheme_2d(_TEST_X_VALUES_, ycoords, _TEST_Z_VALUES_)
+		except:
+			return None
+		x = [200 * random.random() - 50 for _ in range(1000)]
+		y = [400 * random.random() - 100 for _ in range(1000)]
+		try:
+			batch = test_(x, y)
+			constant_y = test_(x, y[0])
+		except:
+			return False
+		status = len(batch) == len(constant_y) == len(x)
+		status &= all([batch[i] == test_(x[i], y[i]) for i in range(len(x))])
+		status &= all([constant_y[i] == test_(x[i], y[0]) for i in range(
+			len(x))])
+		return status
+	return ["vice.toolkit.interpolation.interp_scheme_2d.__call__ [array]",
+		test]
+
+
@@ -19,6 +19,9 @@ interpolator : ``object``
 	use in the global yield settings.
 settings : ``dataframe``
 	Stores current settings for these yields
+tabulated : ``object``
+	A function of stellar mass and metallicity which simulations evaluate on
+	a grid of metallicities once, rather than at every timestep.
 cristallo11 : yield preset
 	Sets the yields according to the Cristallo et al. (2011, 2015) studies.
 karakas10 : yield preset
@@ -58,12 +61,13 @@ except NameError:
 	__VICE_SETUP__ = False
 
 if not __VICE_SETUP__:
-	__all__ = ["grid", "interpolator", "settings", "test"]
+	__all__ = ["grid", "interpolator", "settings", "tabulated", "test"]
 	__all__ = [str(i) for i in __all__] 	# appease python 2 strings
 
 	from ._grid_reader import yield_grid as grid
 	from .interpolator import interpolator
 	from .settings import settings
+	from .tabulated import tabulated
 	from .tests import test
 
 else:
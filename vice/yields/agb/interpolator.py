@@ -54,16 +54,25 @@ class interpolator(interp_scheme_2d):
 
 		Parameters:
 
-			- mass : real number
+			- mass : real number or array-like
 				The stellar mass of an AGB star in solar masses.
-			- metallicity : real number
+			- metallicity : real number or array-like
 				The metallicity by mass :math:`Z` of the AGB star.
 
+			.. versionchanged:: 1.4.0
+				Either or both of ``mass`` and ``metallicity`` may be
+				array-like, in which case they are broadcast against one
+				another and the yield is interpolated at each pair of
+				elements in one loop in C.
+
 		Returns:
 
-			- y : real number
+			- y : real number or array-like
 				The fractional net yield, estimated via bi-linear
-				interpolation. See `Notes`_ below.
+				interpolation. See `Notes`_ below. If ``mass`` or
+				``metallicity`` is array-like, a ``numpy.ndarray`` of their
+				broadcast shape if NumPy is installed, and a ``list``
+				otherwise.
 
 	.. tip:: This object can be used as a callable object to describe the
 		AGB star yields of any given element. For the base class, it makes
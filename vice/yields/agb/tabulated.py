@@ -0,0 +1,151 @@
+r"""
+Implement the vice.yields.agb.tabulated object, which marks a function of
+stellar mass and metallicity to be evaluated on a grid of metallicities once
+per simulation.
+"""
+
+from __future__ import absolute_import
+
+
+class tabulated:
+
+	r"""
+	A function of stellar mass and metallicity describing the yields of AGB
+	stars which VICE's simulations evaluate only once per simulation on a grid
+	of metallicities, rather than at every timestep.
+
+	**Signature**: vice.yields.agb.tabulated(function, metallicities)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	function : <function>
+		The yield as a function of stellar mass in :math:`M_\odot` (first
+		parameter) and metallicity by mass :math:`Z` (second parameter).
+		Stored as an attribute.
+	metallicities : array-like [elements are real numbers]
+		The metallicities by mass :math:`Z` on which to evaluate ``function``.
+		Must contain at least two values. Stored as an attribute, sorted from
+		least to greatest.
+
+	Attributes
+	----------
+	function : <function>
+		The yield as a function of stellar mass and metallicity.
+	metallicities : ``list`` [elements of type ``float``]
+		The metallicities on which the yield is evaluated.
+
+	Calling
+	-------
+	Calling this object is equivalent to calling the attribute ``function``.
+
+		Parameters:
+			- mass : real number
+				The stellar mass of an AGB star in :math:`M_\odot`.
+			- metallicity : real number
+				The metallicity by mass :math:`Z` of the AGB star.
+
+		Returns:
+			- y : real number
+				The value returned by ``function``.
+
+	Notes
+	-----
+	When assigned as the AGB star yield of an element in
+	``vice.yields.agb.settings``, ``vice.singlezone`` and ``vice.multizone``
+	evaluate ``function`` at the mass of dying stars at each age and at each
+	of the ``metallicities`` once when the simulation begins, once per zone in
+	the case of ``vice.multizone`` in both simple and full mode. Yields at
+	intermediate metallicities are then estimated via linear interpolation,
+	with linear extrapolation off of the two lowest/highest metallicities. This
+	bypasses the cost of calling a python function at every timestep for every
+	previous generation of stars, which otherwise scales quadratically with
+	the number of timesteps, at the expense of interpolating in metallicity.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> def f(m, z):
+	...     return 1.e-3 * m * (z / 0.014)
+	>>> example = vice.yields.agb.tabulated(f, [0.0001, 0.001, 0.01, 0.02])
+	>>> example.metallicities
+	[0.0001, 0.001, 0.01, 0.02]
+	>>> example(2, 0.014)
+	0.002
+	>>> vice.yields.agb.settings['c'] = example
+	"""
+
+	def __init__(self, function, metallicities):
+		self.function = function
+		self.metallicities = metallicities
+
+	def __call__(self, mass, metallicity):
+		return self._function(mass, metallicity)
+
+	@property
+	def function(self):
+		r"""
+		Type : <function>
+
+		The AGB star yield as a function of stellar mass in :math:`M_\odot`
+		(first parameter) and metallicity by mass :math:`Z` (second
+		parameter).
+
+		Example Code
+		------------
+		>>> import vice
+		>>> def f(m, z):
+		...     return 1.e-3 * m * (z / 0.014)
+		>>> example = vice.yields.agb.tabulated(f, [0.001, 0.01])
+		>>> example.function(2, 0.014)
+		0.002
+		"""
+		return self._function
+
+	@function.setter
+	def function(self, value):
+		if callable(value):
+			self._function = value
+		else:
+			raise TypeError("Attribute 'function' must be callable. Got: %s" % (
+				type(value)))
+
+	@property
+	def metallicities(self):
+		r"""
+		Type : ``list`` [elements of type ``float``]
+
+		The metallicities by mass :math:`Z` on which the yield is evaluated.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> def f(m, z):
+		...     return 1.e-3 * m * (z / 0.014)
+		>>> example = vice.yields.agb.tabulated(f, [0.01, 0.001])
+		>>> example.metallicities
+		[0.001, 0.01]
+		"""
+		return self._metallicities
+
+	@metallicities.setter
+	def metallicities(self, value):
+		try:
+			value = sorted([float(_) for _ in value])
+		except TypeError:
+			raise TypeError("""Attribute 'metallicities' must be an array-like \
+object containing real numbers. Got: %s""" % (type(value)))
+		except ValueError:
+			raise TypeError("""Attribute 'metallicities' must contain only \
+real numbers.""")
+		if len(value) < 2:
+			raise ValueError("""Attribute 'metallicities' must contain at least \
+two values. Got: %d""" % (len(value)))
+		elif any([_ < 0 for _ in value]):
+			raise ValueError("Metallicities must be non-negative.")
+		elif len(set(value)) != len(value):
+			raise ValueError("Metallicities must not be repeated.")
+		else:
+			self._metallicities = value
+
@@ -12,6 +12,7 @@ if not __VICE_SETUP__:
 	from . import lookup
 	from . import imports
 	from . import interpolator
+	from . import tabulated
 
 	@moduletest
 	def test():
@@ -22,7 +23,8 @@ if not __VICE_SETUP__:
 			[
 				lookup.test(run = False),
 				imports.test(run = False),
-				interpolator.test()
+				interpolator.test(),
+				tabulated.test()
 			]
 		]
 
@@ -0,0 +1,39 @@
+r"""
+Implements testing of the tabulated object in the parent directory.
+"""
+
+__all__ = ["test"]
+from ..tabulated import tabulated
+from ....testing import unittest
+
+
+@unittest
+def test():
+	r"""
+	vice.yields.agb.tabulated unit test
+	"""
+	def test_():
+		def f(m, z):
+			return 1.e-3 * m * (z / 0.014)
+		try:
+			test_ = tabulated(f, [0.02, 0.0001, 0.001, 0.01])
+		except:
+			return None
+		status = test_.metallicities == [0.0001, 0.001, 0.01, 0.02]
+		for m in [1, 2, 3, 4]:
+			for z in [0.001, 0.014, 0.03]:
+				status &= test_(m, z) == f(m, z)
+		for bad in [[0.01], [0.01, 0.01], [-0.01, 0.01]]:
+			try:
+				tabulated(f, bad)
+				status = False
+			except ValueError:
+				pass
+		try:
+			tabulated(0.01, [0.001, 0.01])
+			status = False
+		except TypeError:
+			pass
+		return status
+	return ["vice.yields.agb.tabulated", test_]
+
@@ -15,11 +15,16 @@ Contents
 --------
 fractional : <function>
 	Calculate an IMF-averaged yield for a given element.
+fractional_batch : <function>
+	Calculate IMF-averaged yields for many elements, studies, metallicities,
+	rotational velocities and explodability models at once.
 table : <function>
 	Obtain the table of mass yields and progenitor masses for a given element
 	from a given study.
 settings : ``dataframe``
 	Stores current settings for these yields.
+cache : object
+	An optional on-disk cache of IMF-averaged yields shared across sessions.
 engines : module
 	Models for massive star explodability as a function of progenitor mass for
 	use in yield calculations.
@@ -64,11 +69,14 @@ except NameError:
 
 if not __VICE_SETUP__:
 
-	__all__ = ["engines", "fractional", "settings", "table", "test"]
+	__all__ = ["cache", "engines", "fractional", "fractional_batch",
+		"settings", "table", "test"]
 	from . import engines
 	from ._yield_integrator import integrate as fractional
+	from ._yield_integrator import integrate_batch as fractional_batch
 	from .grid_reader import table
 	from .settings import settings
+	from .cache import cache
 	from .tests import test
 
 else:
@@ -11,11 +11,18 @@ cdef extern from "../../src/ccsne.h":
 
 
 cdef extern from "../../src/yields/ccsne.h":
-	void weight_initial_by_explodability(unsigned short weight)
-	void set_Z_progenitor(double Z)
-	unsigned short IMFintegrated_fractional_yield_numerator(
-		INTEGRAL *intgrl, IMF_ *imf, CALLBACK_1ARG *explodability,
-		char *path, const unsigned short wind, char *element)
-	extern unsigned short IMFintegrated_fractional_yield_denominator(
-		INTEGRAL *intgrl, IMF_ *imf)
+	ctypedef struct CCSNE_YIELD_INTEGRAL:
+		INTEGRAL *numerator
+		INTEGRAL *denominator
+		IMF_ *imf
+		CALLBACK_1ARG *explodability
+		char *path
+		char *element
+		unsigned short wind
+		double Z_progenitor
+		unsigned short weight_initial
+		unsigned short numerator_status
+		unsigned short denominator_status
+	void IMFintegrated_fractional_yields(CCSNE_YIELD_INTEGRAL *yields,
+		unsigned long n, unsigned int n_threads) nogil
 
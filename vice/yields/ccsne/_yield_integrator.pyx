@@ -19,6 +19,7 @@ from ._errors import _RECOGNIZED_METHODS_
 from ._errors import _RECOGNIZED_STUDIES_
 from ._errors import numeric_check
 from ._errors import string_check
+from .cache import cache
 import math as m
 import warnings
 import numbers
@@ -42,13 +43,14 @@ from ...core.objects cimport _imf
 from ...core._cutils cimport copy_pylist
 from ...core._cutils cimport callback_1arg_setup
 from . cimport _yield_integrator
+from libc.stdlib cimport malloc, free
 _MINIMUM_MASS_ = float(_yield_integrator.CC_MIN_STELLAR_MASS)
 
 
 def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 	explodability = None, wind = True, net = True, IMF = "kroupa",
 	method = "simpson", m_lower = 0.08, m_upper = 100,
-	tolerance = 1e-3, Nmin = 64, Nmax = 2e8):
+	tolerance = 1e-3, Nmin = 64, Nmax = 2e8, evaluations = False):
 	
 	r"""
 	Calculate an IMF-integrated fractional nucleosynthetic yield of a
@@ -57,7 +59,7 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 	**Signature**: vice.yields.ccsne.fractional(element, study = "LC18",
 	MoverH = 0, rotation = 0, explodability = None, wind = True, net = True,
 	IMF = "kroupa", method = "simpson", m_lower = 0.08, m_upper = 100,
-	tolerance = 1e-3, Nmin = 64, Nmax = 2.0e+08)
+	tolerance = 1e-3, Nmin = 64, Nmax = 2.0e+08, evaluations = False)
 
 	Parameters
 	----------
@@ -180,10 +182,22 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 			- "trapezoid"
 			- "midpoint"
 			- "euler"
+			- "gk21"
 
-		.. note:: These methods of quadrature are implemented according to
+		.. note:: All methods except "gk21" are implemented according to
 			Chapter 4 of Press, Teukolsky, Vetterling & Flannery (2007) [10]_.
 
+		.. note:: "gk21" is adaptive 21-point Gauss-Kronrod quadrature
+			following the QAG routine of QUADPACK (Piessens et al. 1983)
+			[13]_. It bisects only the subintervals of the mass range with the
+			largest estimated errors, and it splits the mass range at each
+			mass on the yield grid, where the interpolated yields are not
+			smooth. It typically converges with far fewer evaluations of the
+			IMF and explodability than the other methods.
+
+		.. versionadded:: 1.4.0
+			The "gk21" method.
+
 	m_lower : real number [default : 0.08]
 		The lower mass limit on star formation in :math:`M_\odot`.
 	m_upper : real number [default : 100]
@@ -193,10 +207,18 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 		fractional change between two successive integrations is smaller than
 		this value.
 	Nmin : real number [default : 64]
-		The minimum number of bins in quadrature.
+		The minimum number of bins in quadrature. Not used by the "gk21"
+		method.
 	Nmax : real number [default : 2.0e+08]
 		The maximum number of bins in quadrature. Included as a failsafe
-		against solutions that don't converge numerically.
+		against solutions that don't converge numerically. For the "gk21"
+		method, this is instead the maximum number of evaluations of the
+		integrand.
+	evaluations : bool [default : ``False``]
+		If ``True``, the number of evaluations of the integrands will be
+		returned alongside the yield and its numerical error.
+
+		.. versionadded:: 1.4.0
 
 	Returns
 	-------
@@ -204,6 +226,11 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 		The numerically calculated yield.
 	error : real number
 		The estimated numerical error.
+	n_evals : ``int``
+		The total number of evaluations of the integrands in the numerator and
+		the denominator. Only returned if ``evaluations = True``. Zero if the
+		yield was read from ``vice.yields.ccsne.cache`` or if the study did not
+		report yields for the element.
 
 	Raises
 	------
@@ -319,6 +346,10 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 	>>> y, err = vice.yields.ccsne.fractional("mg", study = "CL13")
 	>>> y
 		0.0009939371276697314
+	>>> y, err, n_evals = vice.yields.ccsne.fractional("o", method = "gk21",
+		evaluations = True)
+	>>> n_evals
+		651
 
 	.. [1] Limongi & Chieffi (2018), ApJS, 237, 13
 	.. [2] Sukhbold et al. (2016), ApJ, 821, 38
@@ -333,8 +364,188 @@ def integrate(element, study = "LC18", MoverH = 0, rotation = 0,
 		Cambridge University Press
 	.. [11] Weinberg, Andrews & Freudenburg (2017), ApJ, 837, 183
 	.. [12] Kalirai et al. (2008), ApJ, 676, 594
+	.. [13] Piessens, de Doncker-Kapenga, Ueberhuber & Kahaner (1983),
+		QUADPACK, Springer-Verlag
+	"""
+
+	specs = _specifications(element, study = study, MoverH = MoverH,
+		rotation = rotation, explodability = explodability, wind = wind,
+		net = net, IMF = IMF, method = method, m_lower = m_lower,
+		m_upper = m_upper, tolerance = tolerance, Nmin = Nmin, Nmax = Nmax)
+	if specs is None:
+		result = [0, float("nan")]
+		n_evals = 0
+	else:
+		computed, n_evals = _compute([specs])
+		result = computed[0]
+		n_evals = n_evals[0]
+	if evaluations:
+		return result + [n_evals]
+	else:
+		return result
+
+
+def integrate_batch(elements, study = "LC18", MoverH = 0, rotation = 0,
+	explodability = None, wind = True, net = True, IMF = "kroupa",
+	method = "simpson", m_lower = 0.08, m_upper = 100,
+	tolerance = 1e-3, Nmin = 64, Nmax = 2e8, n_threads = 1,
+	evaluations = False):
+
+	r"""
+	Calculate IMF-integrated fractional nucleosynthetic yields from
+	core-collapse supernovae for every combination of several elements,
+	studies, metallicities, rotational velocities and explodability models.
+
+	**Signature**: vice.yields.ccsne.fractional_batch(elements,
+	study = "LC18", MoverH = 0, rotation = 0, explodability = None,
+	wind = True, net = True, IMF = "kroupa", method = "simpson",
+	m_lower = 0.08, m_upper = 100, tolerance = 1e-3, Nmin = 64,
+	Nmax = 2.0e+08, n_threads = 1, evaluations = False)
+
+	.. versionadded:: 1.4.0
+
+	Parameters
+	----------
+	elements : ``str`` or array-like [elements of type ``str``]
+		The symbol of each element to calculate yields for.
+	study : ``str`` or array-like [elements of type ``str``]
+		[default : "LC18"]
+		A keyword denoting each study to adopt the yields from.
+	MoverH : real number or array-like [elements are real numbers]
+		[default : 0]
+		Each metallicity [M/H] of the exploding stars.
+	rotation : real number or array-like [elements are real numbers]
+		[default : 0]
+		Each rotational velocity of the exploding stars in km/s.
+	explodability : <function>, ``None``, or array-like [elements are
+		<function> or ``None``] [default : ``None``]
+		Each model for stellar explodability as a function of mass.
+	n_threads : ``int`` [default : 1]
+		The number of threads to distribute the calculations across. The
+		results do not depend on this value.
+
+		.. note:: Custom IMFs and explodability models defined in python can
+			only be called by one thread at a time. Calculations adopting
+			built-in IMFs with ``explodability = None`` see the largest
+			speedup.
+
+	All other parameters are applied to every calculation, and are
+	described in ``vice.yields.ccsne.fractional``.
+
+	Returns
+	-------
+	yields : ``dict``
+		The yield and its estimated numerical error, [y, err], followed by
+		the number of evaluations of the integrands if
+		``evaluations = True``, as would be returned by
+		``vice.yields.ccsne.fractional``, keyed by the tuple
+		(element, study, MoverH, rotation, explodability) as specified.
+		Combinations of a study, [M/H] and rotational velocity for which the
+		study did not report yields are omitted.
+
+	Raises
+	------
+	* TypeError
+		- 	``n_threads`` is not an integer
+	* ValueError
+		- 	``n_threads`` is not positive
+		- 	Any of the reasons ``vice.yields.ccsne.fractional`` would raise a
+			``ValueError`` or ``TypeError``
+	* ScienceWarning
+		- 	Any of the reasons ``vice.yields.ccsne.fractional`` would raise a
+			``ScienceWarning``
+
+	Notes
+	-----
+	The calculations are run in C with the global interpreter lock released.
+	Each yield table is read from disk once per call to this function,
+	however many of the calculations share it.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> yields = vice.yields.ccsne.fractional_batch(["o", "mg", "fe"],
+		study = ["LC18", "S16/W18"], MoverH = [-1, 0], n_threads = 4)
+	>>> len(yields)
+		9
+	>>> yields[("o", "LC18", -1, 0, None)]
+		[0.0049864184248837925, 5.288171683845362e-06]
 	"""
+	if isinstance(n_threads, numbers.Number):
+		if n_threads <= 0:
+			raise ValueError("n_threads must be positive. Got: %g" % (
+				n_threads))
+		elif n_threads % 1:
+			raise ValueError("""n_threads must be interpretable as an \
+integer. Got: %g""" % (n_threads))
+		else: pass
+	else:
+		raise TypeError("n_threads must be an integer. Got: %s" % (
+			type(n_threads)))
+
+	def aslist(value):
+		if isinstance(value, strcomp) or not hasattr(value, "__iter__"):
+			return [value]
+		else:
+			return list(value)
+
+	keys = []
+	specs = []
+	for element in aslist(elements):
+		for study_ in aslist(study):
+			for MoverH_ in aslist(MoverH):
+				for rotation_ in aslist(rotation):
+					for explodability_ in aslist(explodability):
+						try:
+							specs_ = _specifications(element, study = study_,
+								MoverH = MoverH_, rotation = rotation_,
+								explodability = explodability_, wind = wind,
+								net = net, IMF = IMF, method = method,
+								m_lower = m_lower, m_upper = m_upper,
+								tolerance = tolerance, Nmin = Nmin,
+								Nmax = Nmax)
+						except LookupError:
+							continue
+						keys.append((element, study_, MoverH_, rotation_,
+							explodability_))
+						specs.append(specs_)
+
+	computed, n_evals = _compute([_ for _ in specs if _ is not None],
+		n_threads = n_threads)
+	yields = {}
+	for i in range(len(keys)):
+		if specs[i] is None:
+			yields[keys[i]] = [0, float("nan")]
+			if evaluations: yields[keys[i]].append(0)
+		else:
+			yields[keys[i]] = computed.pop(0)
+			if evaluations: yields[keys[i]].append(n_evals.pop(0))
+	return yields
+
 
+def _specifications(element, study = "LC18", MoverH = 0, rotation = 0,
+	explodability = None, wind = True, net = True, IMF = "kroupa",
+	method = "simpson", m_lower = 0.08, m_upper = 100,
+	tolerance = 1e-3, Nmin = 64, Nmax = 2e8):
+	r"""
+	Check the parameters of an IMF-averaged CCSN yield calculation and raise
+	any ScienceWarnings that apply to it.
+
+	Parameters
+	----------
+	See ``integrate``.
+
+	Returns
+	-------
+	specs : ``dict``
+		The parameters of the calculation as they are passed to C, or ``None``
+		if the study did not report yields for the element, in which case the
+		yield is zero.
+
+	Raises
+	------
+	See ``integrate``.
+	"""
 	# Type checking errors
 	if not isinstance(element, strcomp):
 		raise TypeError("First argument must be of type string. Got: %s" % (
@@ -381,17 +592,15 @@ smaller than maximum number of bins.""")
 
 	"""
 	Explodability is either None of a callable function with one parameter.
+	None is passed to C as a NULL pointer, in which case everything explodes
+	without calling python.
 	"""
-	cdef CALLBACK_1ARG *explodability_cb = callback_1arg_initialize()
 	if explodability is None:
-		# assume everything explodes
-		def uniform(m):
-			return 1.0
-		uniform_explodability = callback1_nan_inf(uniform)
-		callback_1arg_setup(explodability_cb, uniform_explodability)
+		exp_cb = None
 	elif callable(explodability):
 		exp_cb = callback1_nan_inf(explodability)
-		callback_1arg_setup(explodability_cb, exp_cb)
+		if _pyutils.arg_count(exp_cb) != 1: raise TypeError("""Function must \
+accept exactly one positional argument.""")
 		if study.upper() in ["LC18", "S16/N20", "S16/W18"]: warnings.warn("""\
 The %s yields are already reported under a given black hole landscape. Stellar \
 explodability is over-specified in this calculation.""" % (
@@ -409,7 +618,7 @@ object. Got: %s""" % (type(explodability)))
 		imf_cb = callback1_nan_inf_positive(IMF)
 	else:
 		imf_cb = IMF
-	cdef IMF_ *imf_obj = imf_object(imf_cb, m_lower, m_upper)
+	_imf.imf_free(imf_object(imf_cb, m_lower, m_upper)) # raises on bad input
 
 	"""
 	Science Warnings
@@ -497,7 +706,7 @@ For this reason, this calculation can only run including the wind yield.""" % (
 can be approximated as zero at this metallicity. Users may exercise their \
 own discretion by modifying their CCSN yield settings directly.""" % (
 			_NAMES_[study.upper()], element), ScienceWarning)
-		return [0, float("nan")]
+		return None
 	else:
 		pass
 
@@ -505,78 +714,211 @@ own discretion by modifying their CCSN yield settings directly.""" % (
 		zprog = initial_abundance(
 			"%syields/ccsne/%s/FeH%s/birth_composition.dat" % (
 				_DIRECTORY_, study.upper(), MoverHstr), element.lower())
-		_yield_integrator.set_Z_progenitor(zprog)
 		if study.upper() not in ["S16/W18", "S16/W18F", "S16/N20", "LC18"]:
-			_yield_integrator.weight_initial_by_explodability(1)
+			weight_initial = 1
 		else:
-			_yield_integrator.weight_initial_by_explodability(0)
+			weight_initial = 0
 		if study.upper() == "WW95": warnings.warn("""\
 Woosley & Weaver (1995) did not report their birth abundances. VICE cannot \
 compute net yields for this study, only reporting gross yields.""",
 			ScienceWarning)
 	else:
-		_yield_integrator.set_Z_progenitor(0)
-		_yield_integrator.weight_initial_by_explodability(0)
+		zprog = 0
+		weight_initial = 0
 		if study.upper() == "NKT13": warnings.warn("""\
 Nomoto, Kobayashi & Tominaga (2013) reported net mass yields in their model \
 core collapse supernova ejecta. VICE cannot compute gross yields for this \
 study, only reporting net yields.""")
 
-	# Compute the yield
-	cdef INTEGRAL *num = _integral.integral_initialize()
-	num[0].a = m_lower
-	num[0].b = m_upper
-	num[0].tolerance = tolerance
-	num[0].method = <unsigned long> sum([ord(i) for i in method.lower()])
-	num[0].Nmax = <unsigned long> Nmax
-	num[0].Nmin = <unsigned long> Nmin
-	try:
-		x = _yield_integrator.IMFintegrated_fractional_yield_numerator(num,
-			imf_obj, explodability_cb, path.encode("latin-1"),
-			int(wind), element.lower().encode("latin-1"))
-		if x == 1:
-			warnings.warn("""Yield-weighted IMF integration did not converge \
-for element: %s. Estimated fractional error: %.2e""" % (element.lower(),
-				num[0].error), ScienceWarning)
-		elif x:
-			raise SystemError("Internal Error")
-		else:
-			pass
-	finally:
-		numerator = [num[0].result, num[0].error, num[0].iters]
-		_integral.integral_free(num)
-		callback_1arg_free(explodability_cb)
-
-
-	cdef INTEGRAL *den = _integral.integral_initialize()
-	den[0].a = m_lower
-	den[0].b = m_upper
-	den[0].tolerance = tolerance
-	den[0].method = <unsigned long> sum([ord(i) for i in method.lower()])
-	den[0].Nmax = <unsigned long> Nmax
-	den[0].Nmin = <unsigned long> Nmin
+	return {
+		"element": element.lower(),
+		"study": study.upper(),
+		"MoverH": MoverH,
+		"rotation": rotation,
+		"path": path,
+		"wind": int(wind),
+		"Z_progenitor": zprog,
+		"weight_initial": weight_initial,
+		"IMF": imf_cb,
+		"explodability": exp_cb,
+		"m_lower": m_lower,
+		"m_upper": m_upper,
+		"tolerance": tolerance,
+		"method": method.lower(),
+		"Nmin": Nmin,
+		"Nmax": Nmax
+	}
+
+
+def _compute(specs, n_threads = 1):
+	r"""
+	Compute IMF-averaged CCSN yields, reading those which are available from
+	and writing those which converged to ``vice.yields.ccsne.cache``.
+
+	Parameters
+	----------
+	specs : ``list``
+		The specifications of each yield, as returned by ``_specifications``.
+	n_threads : ``int`` [default : 1]
+		The number of threads to distribute the calculations across.
+
+	Returns
+	-------
+	yields : ``list``
+		The yield and its estimated numerical error, [y, err], for each
+		element of ``specs``.
+	n_evals : ``list``
+		The number of evaluations of the integrands for each element of
+		``specs``, zero for those read from the cache.
+	"""
+	yields = [cache._lookup(_) for _ in specs]
+	n_evals = len(specs) * [0]
+	missing = [i for i in range(len(specs)) if yields[i] is None]
+	computed, converged, evals = _integrate([specs[i] for i in missing],
+		n_threads = n_threads)
+	for i in range(len(missing)):
+		yields[missing[i]] = computed[i]
+		n_evals[missing[i]] = evals[i]
+		if converged[i]: cache._store(specs[missing[i]], computed[i])
+	return [yields, n_evals]
+
+
+def _integrate(specs, n_threads = 1):
+	r"""
+	Compute IMF-averaged CCSN yields in C.
+
+	Parameters
+	----------
+	specs : ``list``
+		The specifications of each yield, as returned by ``_specifications``.
+	n_threads : ``int`` [default : 1]
+		The number of threads to distribute the calculations across.
+
+	Returns
+	-------
+	yields : ``list``
+		The yield and its estimated numerical error, [y, err], for each
+		element of ``specs``.
+	converged : ``list``
+		Whether or not both integrals converged for each element of
+		``specs``.
+	n_evals : ``list``
+		The total number of evaluations of the integrands in the numerator
+		and denominator for each element of ``specs``.
+
+	Raises
+	------
+	* ScienceWarning
+		- 	Numerical quadrature did not converge within the maximum number
+			of allowed quadrature bins to within the specified tolerance.
+	"""
+	cdef unsigned long i, n = len(specs)
+	cdef unsigned int threads = <unsigned int> n_threads
+	cdef CCSNE_YIELD_INTEGRAL *yields = <CCSNE_YIELD_INTEGRAL *> malloc (
+		max(n, 1) * sizeof(CCSNE_YIELD_INTEGRAL))
+	for i in range(n):
+		yields[i].numerator = NULL
+		yields[i].denominator = NULL
+		yields[i].imf = NULL
+		yields[i].explodability = NULL
+
+	# The C strings point into these bytes objects, which must outlive the
+	# calculation
+	strings = []
+	results = []
+	converged = []
+	n_evals = []
 	try:
-		x = _yield_integrator.IMFintegrated_fractional_yield_denominator(den,
-			imf_obj)
-		if x == 1:
-			warnings.warn("""Mass-weighted IMF integration did not converge. \
-Estimated fractional error: %.2e""" % (den[0].error), ScienceWarning)
-		elif x:
-			raise SystemError("Internal Error")
-		else:
-			pass
+		for i in range(n):
+			yields[i].numerator = _integral.integral_initialize()
+			yields[i].denominator = _integral.integral_initialize()
+			setup_integral(yields[i].numerator, specs[i])
+			setup_integral(yields[i].denominator, specs[i])
+			yields[i].imf = imf_object(specs[i]["IMF"], specs[i]["m_lower"],
+				specs[i]["m_upper"])
+			if specs[i]["explodability"] is not None:
+				yields[i].explodability = callback_1arg_initialize()
+				callback_1arg_setup(yields[i].explodability,
+					specs[i]["explodability"])
+			else: pass
+			path = specs[i]["path"].encode("latin-1")
+			element = specs[i]["element"].encode("latin-1")
+			strings.extend([path, element])
+			yields[i].path = path
+			yields[i].element = element
+			yields[i].wind = <unsigned short> specs[i]["wind"]
+			yields[i].Z_progenitor = specs[i]["Z_progenitor"]
+			yields[i].weight_initial = <unsigned short> specs[i][
+				"weight_initial"]
+
+		with nogil:
+			_yield_integrator.IMFintegrated_fractional_yields(yields, n,
+				threads)
+
+		for i in range(n):
+			if yields[i].numerator_status == 1:
+				warnings.warn("""Yield-weighted IMF integration did not \
+converge for element: %s. Estimated fractional error: %.2e after %d \
+evaluations of the integrand.""" % (specs[i]["element"],
+					yields[i].numerator[0].error,
+					yields[i].numerator[0].evals), ScienceWarning)
+			elif yields[i].numerator_status:
+				raise SystemError("Internal Error")
+			else: pass
+			if yields[i].denominator_status == 1:
+				warnings.warn("""Mass-weighted IMF integration did not \
+converge. Estimated fractional error: %.2e after %d evaluations of the \
+integrand.""" % (yields[i].denominator[0].error,
+					yields[i].denominator[0].evals), ScienceWarning)
+			elif yields[i].denominator_status:
+				raise SystemError("Internal Error")
+			else: pass
+
+			numerator = [yields[i].numerator[0].result,
+				yields[i].numerator[0].error]
+			denominator = [yields[i].denominator[0].result,
+				yields[i].denominator[0].error]
+			y = numerator[0] / denominator[0]
+			errnum = numerator[1] * numerator[0]
+			errden = denominator[1] * denominator[0]
+			err = m.sqrt(errnum**2 / denominator[0]**2 + numerator[0]**2 /
+				denominator[0]**4 * errden**2)
+			results.append([y, err])
+			converged.append(not (yields[i].numerator_status or
+				yields[i].denominator_status))
+			n_evals.append(yields[i].numerator[0].evals +
+				yields[i].denominator[0].evals)
 	finally:
-		denominator = [den[0].result, den[0].error, den[0].iters]
-		_integral.integral_free(den)
-		_imf.imf_free(imf_obj)
+		for i in range(n):
+			_integral.integral_free(yields[i].numerator)
+			_integral.integral_free(yields[i].denominator)
+			if yields[i].imf is not NULL: _imf.imf_free(yields[i].imf)
+			if yields[i].explodability is not NULL:
+				callback_1arg_free(yields[i].explodability)
+			else: pass
+		free(yields)
+
+	return [results, converged, n_evals]
 
-	y = numerator[0] / denominator[0]
-	errnum = numerator[1] * numerator[0]
-	errden = denominator[1] * denominator[0]
-	err = m.sqrt(errnum**2 / denominator[0]**2 + numerator[0]**2 /
-		denominator[0]**4 * errden**2)
 
-	return [y, err]
+cdef void setup_integral(INTEGRAL *intgrl, specs):
+	r"""
+	Assign the bounds, tolerance and method of quadrature of an integral
+	object for an IMF-averaged CCSN yield.
+
+	Parameters
+	----------
+	intgrl : INTEGRAL *
+		The integral object for the numerator or denominator of the yield
+	specs : ``dict``
+		The specifications of the yield, as returned by ``_specifications``.
+	"""
+	intgrl[0].a = specs["m_lower"]
+	intgrl[0].b = specs["m_upper"]
+	intgrl[0].tolerance = specs["tolerance"]
+	intgrl[0].method = <unsigned long> sum([ord(i) for i in specs["method"]])
+	intgrl[0].Nmax = <unsigned long> specs["Nmax"]
+	intgrl[0].Nmin = <unsigned long> specs["Nmin"]
 
 
 def initial_abundance(filename, element):
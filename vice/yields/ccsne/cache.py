@@ -0,0 +1,400 @@
+r"""
+This file implements the ``vice.yields.ccsne.cache`` on-disk cache of
+IMF-averaged CCSN yields.
+"""
+
+from __future__ import absolute_import
+__all__ = ["cache"]
+from ..._globals import _VERSION_ERROR_
+import numbers
+import tempfile
+import hashlib
+import json
+import sys
+import os
+if sys.version_info[:2] == (2, 7):
+	strcomp = basestring
+elif sys.version_info[:2] >= (3, 5):
+	strcomp = str
+else:
+	_VERSION_ERROR_()
+
+# The suffix of the file storing each yield in the cache directory
+_SUFFIX_ = ".vice-yield.json"
+
+
+class cache:
+
+	r"""
+	The on-disk cache of IMF-averaged CCSN yields.
+
+	**Signature**: vice.yields.ccsne.cache
+
+	.. versionadded:: 1.4.0
+
+	When enabled, each yield calculated by ``vice.yields.ccsne.fractional``
+	or ``vice.yields.ccsne.fractional_batch`` is stored in its own file in
+	the directory ``directory``, named for a hash of every parameter of the
+	calculation and the version of VICE. Later calculations with the same
+	parameters, including those run by other processes and those run when
+	importing yield presets such as ``vice.yields.ccsne.LC18``, read the
+	yield and its numerical error from this file rather than integrating
+	again.
+
+	Attributes
+	----------
+	enabled : ``bool`` [default : ``False``]
+		Whether or not yields are read from and written to the cache.
+	directory : ``str``
+		The directory storing the cache.
+	max_size : real number [default : 1.0e+07]
+		The maximum size of the cache in bytes.
+	size : ``int``
+		The current size of the cache in bytes.
+
+	Functions
+	---------
+	- clear
+
+	.. note:: If the environment variable ``VICE_YIELD_CACHE`` is set, the
+		cache is enabled when VICE is imported, with its value as the
+		directory. Otherwise, the directory defaults to ``vice/yields`` in
+		the user's cache directory (``$XDG_CACHE_HOME`` or ``~/.cache``).
+
+	Notes
+	-----
+	A yield is only cached if it can be identified by its parameters. This is
+	the case for the built-in IMFs and for custom IMFs and explodability
+	models which interpolate a table, i.e. instances of
+	``vice.toolkit.interpolation.interp_scheme_1d`` and of
+	``vice.yields.ccsne.engines.engine`` which do not override
+	``__call__``. The table itself is hashed into the parameters. Yields
+	calculated with any other python function are not cached, nor are those
+	whose numerical integration did not converge.
+
+	When the cache grows beyond ``max_size``, the yields which were least
+	recently used are deleted. Each yield is written to a temporary file
+	which then replaces its entry in one step, so any number of processes may
+	share the same directory.
+
+	Example Code
+	------------
+	>>> import vice
+	>>> vice.yields.ccsne.cache.enabled = True
+	>>> vice.yields.ccsne.cache.directory = "./yield-cache"
+	>>> vice.yields.ccsne.fractional("o") # integrated and stored
+		[0.003739422106948757, 4.788433469721248e-06]
+	>>> vice.yields.ccsne.fractional("o") # read from the cache
+		[0.003739422106948757, 4.788433469721248e-06]
+	>>> vice.yields.ccsne.cache.size
+		367
+	>>> vice.yields.ccsne.cache.clear()
+	>>> vice.yields.ccsne.cache.size
+		0
+	"""
+
+	def __init__(self):
+		directory = os.environ.get("VICE_YIELD_CACHE", "")
+		self.enabled = bool(directory)
+		if not directory: directory = os.path.join(
+			os.environ.get("XDG_CACHE_HOME",
+				os.path.join(os.path.expanduser("~"), ".cache")),
+			"vice", "yields")
+		self.directory = directory
+		self.max_size = 1.e7
+
+	def __repr__(self):
+		return "vice.yields.ccsne.cache{\n%s\n}" % ("\n".join([
+			"    %s: %s" % (key, getattr(self, key)) for key in [
+				"enabled", "directory", "max_size", "size"]]))
+
+	@property
+	def enabled(self):
+		r"""
+		Type : ``bool``
+
+		Default : ``False``
+
+		Whether or not yields are read from and written to the cache.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.yields.ccsne.cache.enabled
+			False
+		>>> vice.yields.ccsne.cache.enabled = True
+		"""
+		return self._enabled
+
+	@enabled.setter
+	def enabled(self, value):
+		if isinstance(value, numbers.Number) or isinstance(value, bool):
+			self._enabled = bool(value)
+		else:
+			raise TypeError("""Attribute 'enabled' must be interpretable as a \
+boolean. Got: %s""" % (type(value)))
+
+	@property
+	def directory(self):
+		r"""
+		Type : ``str``
+
+		The directory storing the cache. It is created when the first yield
+		is stored.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.yields.ccsne.cache.directory = "./yield-cache"
+		"""
+		return self._directory
+
+	@directory.setter
+	def directory(self, value):
+		if isinstance(value, strcomp):
+			self._directory = os.path.abspath(os.path.expanduser(value))
+		else:
+			raise TypeError("Attribute 'directory' must be a string. Got: %s" % (
+				type(value)))
+
+	@property
+	def max_size(self):
+		r"""
+		Type : real number
+
+		Default : 1.0e+07
+
+		The maximum size of the cache in bytes. When a yield is stored and the
+		cache grows beyond this size, the yields which were least recently
+		used are deleted.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.yields.ccsne.cache.max_size = 1.e6
+		"""
+		return self._max_size
+
+	@max_size.setter
+	def max_size(self, value):
+		if isinstance(value, numbers.Number):
+			if value >= 0:
+				self._max_size = float(value)
+			else:
+				raise ValueError("""Attribute 'max_size' must be non-negative. \
+Got: %g""" % (value))
+		else:
+			raise TypeError("""Attribute 'max_size' must be a real number. \
+Got: %s""" % (type(value)))
+
+	@property
+	def size(self):
+		r"""
+		Type : ``int``
+
+		The current size of the cache in bytes.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.yields.ccsne.cache.size
+			0
+		"""
+		return sum([_[2] for _ in self._entries()])
+
+	def clear(self):
+		r"""
+		Delete every yield stored in the cache.
+
+		**Signature**: vice.yields.ccsne.cache.clear()
+
+		.. note:: Only the files storing yields are deleted. Any other files in
+			``directory`` are left alone.
+
+		Example Code
+		------------
+		>>> import vice
+		>>> vice.yields.ccsne.cache.clear()
+		"""
+		for path, mtime, size in self._entries():
+			try:
+				os.remove(path)
+			except OSError:
+				pass # another process already deleted it
+
+	def _lookup(self, specs):
+		r"""
+		Read a yield from the cache.
+
+		Parameters
+		----------
+		specs : ``dict``
+			The specifications of the yield (see ``_specifications`` in
+			vice/yields/ccsne/_yield_integrator.pyx).
+
+		Returns
+		-------
+		result : ``list`` or ``None``
+			The yield and its numerical error, [y, err], or ``None`` if the
+			cache is disabled, the yield cannot be cached, or it has not been
+			stored.
+		"""
+		if not self.enabled: return None
+		key = self._key(specs)
+		if key is None: return None
+		path = self._path(key)
+		try:
+			with open(path, 'r') as f:
+				entry = json.load(f)
+		except (OSError, IOError, ValueError):
+			return None
+		if entry.get("key") != key: return None # hash collision
+		try:
+			os.utime(path, None) # mark as recently used
+		except OSError:
+			pass
+		return [float(_) for _ in entry["result"]]
+
+	def _store(self, specs, result):
+		r"""
+		Write a yield to the cache, deleting the least recently used yields
+		should the cache grow beyond its maximum size.
+
+		Parameters
+		----------
+		specs : ``dict``
+			The specifications of the yield.
+		result : ``list``
+			The yield and its numerical error, [y, err].
+		"""
+		if not self.enabled: return
+		key = self._key(specs)
+		if key is None: return
+		try:
+			if not os.path.exists(self.directory): os.makedirs(self.directory)
+		except OSError:
+			pass # another process created it first
+		fd, tmp = tempfile.mkstemp(dir = self.directory, suffix = ".tmp")
+		try:
+			with os.fdopen(fd, 'w') as f:
+				json.dump({"key": key, "result": list(result)}, f)
+			os.replace(tmp, self._path(key))
+		except:
+			if os.path.exists(tmp): os.remove(tmp)
+			raise
+		self._evict()
+
+	def _evict(self):
+		r"""
+		Delete the least recently used yields until the cache is no larger
+		than its maximum size.
+		"""
+		entries = self._entries()
+		size = sum([_[2] for _ in entries])
+		if size > self.max_size:
+			for path, mtime, nbytes in sorted(entries, key = lambda _: _[1]):
+				try:
+					os.remove(path)
+				except OSError:
+					pass # another process already deleted it
+				size -= nbytes
+				if size <= self.max_size: break
+		else: pass
+
+	def _entries(self):
+		r"""
+		Obtain the path, modification time and size in bytes of each yield
+		stored in the cache.
+		"""
+		entries = []
+		try:
+			names = os.listdir(self.directory)
+		except OSError:
+			return entries
+		for name in names:
+			if name.endswith(_SUFFIX_):
+				path = os.path.join(self.directory, name)
+				try:
+					stat = os.stat(path)
+				except OSError:
+					continue # deleted by another process
+				entries.append((path, stat.st_mtime, stat.st_size))
+		return entries
+
+	def _path(self, key):
+		r"""
+		Obtain the name of the file storing the yield with a given key.
+		"""
+		digest = hashlib.sha256(json.dumps(key,
+			sort_keys = True).encode("utf-8")).hexdigest()
+		return os.path.join(self.directory, digest + _SUFFIX_)
+
+	@staticmethod
+	def _key(specs):
+		r"""
+		Obtain the parameters identifying a yield, or ``None`` if it cannot be
+		cached.
+		"""
+		from ...version import version
+		imf = _function_key(specs["IMF"])
+		explodability = _function_key(specs["explodability"])
+		if imf is None or explodability is None: return None
+		return {
+			"version": str(version),
+			"element": specs["element"],
+			"study": specs["study"],
+			"MoverH": float(specs["MoverH"]),
+			"rotation": float(specs["rotation"]),
+			"wind": int(specs["wind"]),
+			"Z_progenitor": float(specs["Z_progenitor"]),
+			"weight_initial": int(specs["weight_initial"]),
+			"IMF": imf,
+			"explodability": explodability,
+			"m_lower": float(specs["m_lower"]),
+			"m_upper": float(specs["m_upper"]),
+			"method": specs["method"],
+			"tolerance": float(specs["tolerance"]),
+			"Nmin": float(specs["Nmin"]),
+			"Nmax": float(specs["Nmax"])
+		}
+
+
+def _function_key(value):
+	r"""
+	Identify an IMF or explodability model for the cache.
+
+	Parameters
+	----------
+	value : ``str``, ``None``, or <function>
+		The IMF or explodability model as passed to C. Functions are assumed
+		to be wrapped by one of the callback1 classes at
+		vice/core/callback.py.
+
+	Returns
+	-------
+	key : ``str`` or ``None``
+		The name of a built-in IMF, "none" if ``value`` is ``None``, or the
+		class and a hash of the table of a tabulated function. ``None`` if
+		``value`` is any other function.
+	"""
+	from ...toolkit.interpolation.interp_scheme_1d import interp_scheme_1d
+	from .engines.engine import engine
+	if value is None:
+		return "none"
+	elif isinstance(value, strcomp):
+		return value.lower()
+	else:
+		value = getattr(value, "function", value)
+		if not isinstance(value, interp_scheme_1d): return None
+		# the class which implements __call__ must be a known one
+		for cls in type(value).__mro__:
+			if "__call__" in cls.__dict__: break
+		if cls is not engine and not issubclass(interp_scheme_1d, cls):
+			return None
+		table = json.dumps([list(value.xcoords), list(value.ycoords)])
+		return "%s.%s:%s" % (cls.__module__, cls.__name__,
+			hashlib.sha256(table.encode("utf-8")).hexdigest())
+
+
+cache = cache()
+
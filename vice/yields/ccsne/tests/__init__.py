@@ -12,6 +12,7 @@ if not __VICE_SETUP__:
 	from ....testing.unittest import _unittest as unittest
 	from .. import engines
 	from . import grid_reader
+	from . import cache
 	from . import integrator
 	from . import imports
 
@@ -67,6 +68,9 @@ if not __VICE_SETUP__:
 		except:
 			tests.append(unittest("vice.yields.ccsne.WW95", lambda: None))
 		tests.append(integrator.test(run = False))
+		tests.append(integrator.test_batch())
+		tests.append(integrator.test_evaluations())
+		tests.append(cache.test_cache())
 		return ["vice.yields.ccsne", tests]
 
 else:
@@ -0,0 +1,61 @@
+"""
+Test the on-disk yield cache at vice/yields/ccsne/cache.py
+"""
+
+from __future__ import absolute_import
+__all__ = ["test_cache"]
+from ....toolkit.interpolation import interp_scheme_1d
+from ....testing import unittest
+from .._yield_integrator import integrate as fractional
+from .._yield_integrator import _specifications
+from ..cache import cache
+import tempfile
+import warnings
+import shutil
+
+
+@unittest
+def test_cache():
+	"""
+	vice.yields.ccsne.cache unit test
+	"""
+	def test():
+		"""
+		Test that yields are stored in and read from the cache, that yields
+		calculated with arbitrary python functions are not stored, and that
+		the cache can be cleared and is bounded in size.
+		"""
+		settings = [cache.enabled, cache.directory, cache.max_size]
+		directory = tempfile.mkdtemp()
+		try:
+			cache.enabled = True
+			cache.directory = directory
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore")
+				expected = fractional("o", tolerance = 1.e-2)
+				success = len(cache._entries()) == 1
+				success &= fractional("o", tolerance = 1.e-2) == expected
+				# overwriting the stored yield shows that it is read back
+				cache._store(_specifications("o", tolerance = 1.e-2),
+					[1., 0.])
+				success &= fractional("o", tolerance = 1.e-2) == [1., 0.]
+				fractional("o", tolerance = 1.e-2, IMF = lambda m: m**-2.3)
+				success &= len(cache._entries()) == 1
+				fractional("o", tolerance = 1.e-2, IMF = interp_scheme_1d(
+					[0.08, 1, 100], [1, 1, 1.e-4]))
+				success &= len(cache._entries()) == 2
+				success &= cache.size > 0
+				cache.max_size = cache.size - 1
+				fractional("fe", tolerance = 1.e-2)
+				success &= 0 < len(cache._entries()) < 3
+				success &= cache.size <= cache.max_size
+				cache.clear()
+				success &= cache.size == 0
+				success &= fractional("o", tolerance = 1.e-2) == expected
+		except:
+			return False
+		finally:
+			cache.enabled, cache.directory, cache.max_size = settings
+			shutil.rmtree(directory, ignore_errors = True)
+		return success
+	return ["vice.yields.ccsne.cache", test]
@@ -3,13 +3,15 @@ Test the CCSNe yield integrator at vice/yields/ccnse/_yield_integrator.pyx
 """
 
 from __future__ import absolute_import
-__all__ = ["test" ]
+__all__ = ["test", "test_batch"]
 from ...._globals import _RECOGNIZED_ELEMENTS_
 from .._yield_integrator import integrate as fractional
+from .._yield_integrator import integrate_batch as fractional_batch
 from .._errors import _RECOGNIZED_STUDIES_ as _STUDY_
 from .._errors import _NAMES_
 from .._errors import _MOVERH_
 from .._errors import _ROTATION_
+from ..cache import cache
 from ....testing import moduletest
 from ....testing import unittest
 from ....testing import generator
@@ -126,3 +128,77 @@ def test():
 						**params)())
 	return ["vice.yields.ccsne.fractional", trials]
 
+
+@unittest
+def test_batch():
+	"""
+	Test the batch yield integration function against the yields calculated
+	one at a time
+	"""
+	def test():
+		elements = ["he", "o", "fe", "au"]
+		studies = ["LC18", "S16/W18"]
+		MoverH = [-1, 0]
+		explodability = [None, lambda m: float(m < 25)]
+		try:
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore")
+				batch = fractional_batch(elements, study = studies,
+					MoverH = MoverH, explodability = explodability,
+					n_threads = 3)
+				success = True
+				for elem in elements:
+					for study in studies:
+						for feh in MoverH:
+							for explodability_ in explodability:
+								key = (elem, study, feh, 0, explodability_)
+								# S16/W18 only reported yields at [M/H] = 0
+								if study == "S16/W18" and feh == -1:
+									success &= key not in batch
+									continue
+								expected = fractional(elem, study = study,
+									MoverH = feh,
+									explodability = explodability_)
+								actual = batch[key]
+								if math.isnan(expected[1]):
+									success &= actual[0] == expected[0]
+									success &= math.isnan(actual[1])
+								else:
+									success &= actual == expected
+		except:
+			return False
+		return success
+	return ["vice.yields.ccsne.fractional_batch", test]
+
+
+@unittest
+def test_evaluations():
+	"""
+	Test that the number of evaluations of the integrands is returned only
+	when requested and leaves the yield and its error unchanged
+	"""
+	def test():
+		enabled = cache.enabled
+		cache.enabled = False
+		try:
+			with warnings.catch_warnings():
+				warnings.simplefilter("ignore")
+				success = True
+				for method in ["simpson", "gk21"]:
+					expected = fractional("o", method = method)
+					actual = fractional("o", method = method,
+						evaluations = True)
+					success &= len(expected) == 2
+					success &= len(actual) == 3
+					success &= actual[:2] == expected
+					success &= isinstance(actual[2], int) and actual[2] > 0
+					batch = fractional_batch(["o", "au"], method = method,
+						evaluations = True)
+					success &= batch[("o", "LC18", 0, 0, None)] == actual
+					success &= batch[("au", "LC18", 0, 0, None)][2] == 0
+		except:
+			return False
+		finally:
+			cache.enabled = enabled
+		return success
+	return ["vice.yields.ccsne.fractional", test]
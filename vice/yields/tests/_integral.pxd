@@ -5,4 +5,6 @@ cdef extern from "../../src/yields/tests/integral.h":
 	unsigned short test_quad_trapzd()
 	unsigned short test_quad_midpt()
 	unsigned short test_quad_simp()
+	unsigned short test_quad_gk21()
+	unsigned short test_quad_gk21_breakpoints()
 
@@ -6,7 +6,9 @@ __all__ = [
 	"test_euler",
 	"test_trapezoid",
 	"test_midpoint",
-	"test_simpson"
+	"test_simpson",
+	"test_gk21",
+	"test_gk21_breakpoints"
 ]
 from ...testing import moduletest
 from ...testing import unittest
@@ -23,7 +25,9 @@ def test():
 			test_euler(),
 			test_trapezoid(),
 			test_midpoint(),
-			test_simpson()
+			test_simpson(),
+			test_gk21(),
+			test_gk21_breakpoints()
 		]
 	]
 
@@ -63,3 +67,23 @@ def test_simpson():
 	return ["vice.src.yields.integral [method :: simpson]",
 		_integral.test_quad_simp]
 
+
+@unittest
+def test_gk21():
+	"""
+	Tests the adaptive Gauss-Kronrod integration routine at
+	vice/src/yields/integral.c
+	"""
+	return ["vice.src.yields.integral [method :: gk21]",
+		_integral.test_quad_gk21]
+
+
+@unittest
+def test_gk21_breakpoints():
+	"""
+	Tests the adaptive Gauss-Kronrod integration routine at
+	vice/src/yields/integral.c on a function with a kink at a breakpoint
+	"""
+	return ["vice.src.yields.integral [method :: gk21, breakpoints]",
+		_integral.test_quad_gk21_breakpoints]
+